@@ -43,6 +43,10 @@ async def upgrade_subscription(tier: str, db: AsyncSession = Depends(get_session
     db.add(current_user)
     await db.commit()
     
+    # Limit checks read the tier from a cache
+    from app.core.billing import billing_manager
+    await billing_manager.invalidate_tier(current_user.id)
+    
     return {
         "status": "success",
         "message": f"Upgraded to {tier.capitalize()} plan",
@@ -67,17 +71,14 @@ async def get_usage(workspace_id: str, db: AsyncSession = Depends(get_session),
     if not owner:
         raise HTTPException(status_code=404, detail="Owner not found")
 
-    # 2. Get current month usage
-    usage = await billing_manager.get_or_create_usage(db, workspace_id)
+    # 2. Get current month usage (live counters, ahead of the reconciled UsageRecord)
+    usage = await billing_manager.get_usage(workspace_id)
     
     # 3. Get limits
     tier_info = tier_manager.get_tier_info(owner.tier)
     
     return {
-        "month": usage.month,
-        "tasks_executed": usage.tasks_executed,
-        "ai_tokens_used": usage.ai_tokens_used,
-        "estimated_cost": usage.estimated_cost,
+        **usage,
         "task_limit": tier_info["limits"].get("max_tasks_per_month", 0),
         "token_limit": tier_info["limits"].get("max_tokens_per_month", 0),
         "tier": owner.tier
@@ -2,7 +2,7 @@ import os
 import sys
 import json
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Dict, Any, Optional
 
 # Fix for Windows symlink permission error in HuggingFace Hub
 os.environ["HF_HUB_DISABLE_SYMLINKS"] = "1"
@@ -24,7 +24,7 @@ if vendor_path not in sys.path:
 if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
-from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect, Request, Depends
+from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect, Request, Depends, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import ORJSONResponse
@@ -70,6 +70,18 @@ async def startup_event():
     except Exception as e:
         print(f"ERROR: Database initialization failed: {e}")
 
+    # Start write-behind execution recorder
+    from app.core.execution_recorder import execution_recorder
+    await execution_recorder.start()
+    
+    # Shared outbound HTTP connection pools
+    from app.core.http_client import http_client
+    await http_client.start()
+
+    # Node registry manifest: node modules are imported on first use instead of scanned
+    from app.nodes.registry import NodeRegistry
+    NodeRegistry.load_manifest(validate=settings.NODE_MANIFEST_VALIDATE)
+
     # Initialize Redis for Pub/Sub and Arq for task queuing
     try:
         app.state.redis = aioredis.from_url(settings.REDIS_URL, decode_responses=True)
@@ -90,6 +102,38 @@ async def startup_event():
         from app.core.cache import cache_manager
         await cache_manager.init_redis(app.state.redis)
         
+        # Initialize single-flight coalescing for cacheable nodes
+        from app.core.single_flight import single_flight
+        await single_flight.init_redis(app.state.redis)
+        
+        # Debugger control plane (breakpoints + commands over pub/sub)
+        from app.core.debugger import debugger
+        await debugger.init_redis(app.state.redis)
+        
+        # Jobs carry a definition reference; the graph is published once per version
+        from app.core.workflow_store import workflow_store
+        await workflow_store.init_redis(app.state.redis)
+        
+        # Per-workspace fair-share queues in front of ARQ (dispatched by the workers)
+        from app.core.fair_queue import fair_queue
+        await fair_queue.init_redis(app.state.redis, app.state.redis_pool)
+        
+        # Split In Batches cursors (shared with the workers)
+        from app.core.batch_cursor import batch_cursors
+        await batch_cursors.init_redis(app.state.redis)
+        
+        # Distributed Parallel Map (shards run on the workers)
+        from app.core.map_reduce import map_reduce
+        await map_reduce.init_redis(app.state.redis)
+        
+        # Durable timer stats (the workers fire the timers)
+        from app.core.timers import timer_service
+        await timer_service.init_redis(app.state.redis)
+        
+        # Share the webhook routing index through Redis
+        from app.core.webhook_index import webhook_index
+        await webhook_index.init_redis(app.state.redis)
+        
         # Initialize analytics tracker
         from app.core.analytics import analytics_tracker
         await analytics_tracker.init_redis(app.state.redis)
@@ -98,9 +142,15 @@ async def startup_event():
         from app.core.circuit_breaker import circuit_breaker
         await circuit_breaker.init_redis(app.state.redis)
         
+        # Usage metering in Redis, reconciled to Postgres in bulk
+        from app.core.billing import billing_manager
+        await billing_manager.init_redis(app.state.redis)
+        await billing_manager.start()
+        
         # Start background listener for Redis Pub/Sub
         asyncio.create_task(listen_to_redis_updates())
-        # Start Scheduler
+        # Start Scheduler (every replica competes for the leader lease; only the leader dispatches)
+        await scheduler.init_redis(app.state.redis, app.state.redis_pool)
         asyncio.create_task(scheduler.start())
         print("OK: Workflow Scheduler started")
 
@@ -108,6 +158,57 @@ async def startup_event():
     except Exception as e:
         print(f"ERROR: Failed to connect to Redis: {e}")
 
+    # Build the webhook routing index (works in-process when Redis is unavailable)
+    from app.core.webhook_index import webhook_index
+    await webhook_index.rebuild()
+
+    # GC for large inter-node payloads (no Redis needed)
+    from app.core.payload_store import payload_store
+    await payload_store.start()
+    
+    # Warm code sandbox workers (pre-forked, recycled)
+    from app.core.sandbox import sandbox_pool
+    await sandbox_pool.start()
+    
+    # Persistent Node.js workers for the JavaScript Code node
+    from app.core.js_runtime import js_runtime
+    await js_runtime.start()
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    # Flush buffered execution records before the process exits
+    from app.core.execution_recorder import execution_recorder
+    await execution_recorder.stop()
+    
+    # Write out locally aggregated analytics
+    from app.core.analytics import analytics_tracker
+    await analytics_tracker.stop()
+    
+    from app.core.single_flight import single_flight
+    await single_flight.stop()
+    
+    from app.core.debugger import debugger
+    await debugger.stop()
+    
+    # Write unreconciled usage deltas to Postgres
+    from app.core.billing import billing_manager
+    await billing_manager.stop()
+    
+    # Hand the scheduler lease over right away instead of letting it expire
+    await scheduler.stop()
+    
+    from app.core.payload_store import payload_store
+    await payload_store.stop()
+    
+    from app.core.sandbox import sandbox_pool
+    await sandbox_pool.stop()
+    
+    from app.core.js_runtime import js_runtime
+    await js_runtime.stop()
+    
+    from app.core.http_client import http_client
+    await http_client.close()
+
 async def listen_to_redis_updates():
     """Listens to all workflow updates from workers and broadcasts them to WebSockets."""
     pubsub = app.state.redis.pubsub()
@@ -118,7 +219,7 @@ async def listen_to_redis_updates():
             if message["type"] == "pmessage":
                 try:
                     data = json.loads(message["data"])
-                    await manager.broadcast_all(data)
+                    await manager.publish(data)
                 except Exception as e:
                     print(f"Error parsing/broadcasting Redis message: {e}")
     except Exception as e:
@@ -185,46 +286,7 @@ app.include_router(credentials_router, prefix="/credentials", tags=["credentials
 app.include_router(templates_router, prefix="/templates", tags=["templates"])
 app.include_router(docs_router, prefix="/docs", tags=["documentation"])
 
-class ConnectionManager:
-    def __init__(self):
-        # Room-based connections: {workflow_id: [WebSocket]}
-        self.rooms: Dict[str, List[WebSocket]] = {}
-        # User presence: {workflow_id: {user_id: {name, color, cursor}}}
-        self.presence: Dict[str, Dict[str, Any]] = {}
-
-    async def connect(self, websocket: WebSocket, workflow_id: str = "global"):
-        await websocket.accept()
-        if workflow_id not in self.rooms:
-            self.rooms[workflow_id] = []
-        self.rooms[workflow_id].append(websocket)
-
-    def disconnect(self, websocket: WebSocket, workflow_id: str = "global"):
-        if workflow_id in self.rooms and websocket in self.rooms[workflow_id]:
-            self.rooms[workflow_id].remove(websocket)
-
-    async def broadcast(self, message: dict, workflow_id: str = "global"):
-        targets = self.rooms.get(workflow_id, [])
-        for connection in targets:
-            try:
-                await connection.send_json(message)
-            except Exception:
-                pass
-
-    async def send_to_user(self, websocket: WebSocket, message: dict):
-        try:
-            await websocket.send_json(message)
-        except Exception:
-            pass
-
-    async def broadcast_all(self, message: dict):
-        for room_connections in self.rooms.values():
-            for connection in room_connections:
-                try:
-                    await connection.send_json(message)
-                except Exception:
-                    pass
-                
-manager = ConnectionManager()
+from app.core.realtime import manager
 
 @app.websocket("/ws/{workflow_id}")
 async def websocket_endpoint(websocket: WebSocket, workflow_id: str):
@@ -234,8 +296,12 @@ async def websocket_endpoint(websocket: WebSocket, workflow_id: str):
             data = await websocket.receive_text()
             message = json.loads(data)
             
+            # Follow a job's execution events from this socket
+            if message.get("type") == "subscribe" and message.get("job_id"):
+                manager.subscribe_job(websocket, workflow_id, message["job_id"])
+
             # Handle collaboration messages (cursors, selection)
-            if message.get("type") in ["cursor", "select", "node_moving"]:
+            elif message.get("type") in ["cursor", "select", "node_moving"]:
                 # Broadcast to other users in the same room
                 await manager.broadcast({
                     "type": f"collaboration_{message['type']}",
@@ -276,7 +342,8 @@ async def get_system_stats(db: AsyncSession = Depends(get_session)):
                 "active": worker_health.get("workers", {}).get("active", 0),
                 "status": worker_health.get("status", "unknown"),
                 "queue_depth": worker_health.get("queues", {}).get("total_pending", 0)
-            }
+            },
+            "realtime": manager.get_stats()
         }
     except Exception as e:
         return {"status": "error", "message": str(e)}
@@ -328,16 +395,26 @@ async def resume_workflow(execution_id: str, start_node_id: str, current_user: U
         await rate_limiter.acquire(current_user.id, workspace_id, job_id)
             
         # 4. Queue resumption task
-        await app.state.redis_pool.enqueue_job(
+        from app.core.workflow_store import workflow_store
+        definition_hash = await workflow_store.publish(data["graph"])
+        from app.core.fair_queue import fair_queue
+        await fair_queue.submit(
             'run_workflow_task',
-            graph_data=data["graph"],
-            message=data.get("message", ""),
-            job_id=job_id,
-            start_node_id=start_node_id,
-            initial_outputs=data.get("context_summary", {}),
-            user_id=current_user.id,
+            dict(
+                workflow_id=data["graph"].get("id"),
+                definition_hash=definition_hash,
+                message=data.get("message", ""),
+                job_id=job_id,
+                start_node_id=start_node_id,
+                initial_outputs=data.get("context_summary", {}),
+                user_id=current_user.id,
+                workspace_id=workspace_id,
+                queue="default"
+            ),
             workspace_id=workspace_id,
-            queue="default"
+            user_id=current_user.id,
+            tier=current_user.tier,
+            lane="interactive"
         )
         
         return {"job_id": job_id, "status": "resuming"}
@@ -436,9 +513,9 @@ async def test_credential(cred_id: str, workspace_id: Optional[str] = None, curr
         cred_type = cred_obj["type"]
         data = cred_obj["data"]
 
+        from app.core.http_client import http_client
         if cred_type == "discord":
-            import aiohttp
-            async with aiohttp.ClientSession() as session:
+            async with http_client.session() as session:
                 payload = {"content": " Studio Credential Test Successful!"}
                 async with session.post(data.get("webhook_url"), json=payload) as resp:
                     if resp.status < 400:
@@ -446,9 +523,8 @@ async def test_credential(cred_id: str, workspace_id: Optional[str] = None, curr
                     return {"status": "error", "message": f"Discord Error: {resp.status}"}
                     
         elif cred_type == "telegram":
-            import aiohttp
             token = data.get("bot_token")
-            async with aiohttp.ClientSession() as session:
+            async with http_client.session() as session:
                 async with session.get(f"https://api.telegram.org/bot{token}/getMe") as resp:
                     res_data = await resp.json()
                     if res_data.get("ok"):
@@ -465,7 +541,23 @@ async def test_credential(cred_id: str, workspace_id: Optional[str] = None, curr
 async def get_cache_stats(current_user: User = Depends(get_current_user)):
     """Get cache statistics including hit rate and total requests."""
     from app.core.cache import cache_manager
-    return cache_manager.get_stats()
+    from app.core.single_flight import single_flight
+    from app.core.node_pool import node_pool
+    from app.core.payload_store import payload_store
+    from app.core.workflow_store import workflow_store
+    return {
+        **cache_manager.get_stats(),
+        "single_flight": single_flight.get_stats(),
+        "node_pool": node_pool.get_stats(),
+        "payload_store": payload_store.get_stats(),
+        "workflow_store": workflow_store.get_stats()
+    }
+
+@app.get("/http/stats")
+async def get_http_stats(current_user: User = Depends(get_current_user)):
+    """Get outbound HTTP pool utilisation and connection reuse per host."""
+    from app.core.http_client import http_client
+    return http_client.get_stats()
 
 @app.post("/cache/invalidate")
 async def invalidate_cache(pattern: Optional[str] = None, current_user: User = Depends(get_current_user)):
@@ -521,10 +613,23 @@ async def get_workflow_analytics(days: int = 7, current_user: User = Depends(get
     return await analytics_tracker.get_workflow_stats(days)
 
 @app.get("/analytics/performance")
-async def get_performance_insights(current_user: User = Depends(get_current_user)):
-    """Get performance insights including slowest nodes and failure rates."""
-    from app.core.analytics import analytics_tracker
-    return await analytics_tracker.get_performance_insights()
+async def get_performance_insights(window: str = "1h", current_user: User = Depends(get_current_user)):
+    """Get performance insights: latency percentiles (p50/p90/p99/max) over a sliding window, slowest nodes and failure rates."""
+    from app.core.analytics import analytics_tracker, LATENCY_WINDOWS
+    if window not in LATENCY_WINDOWS:
+        raise HTTPException(status_code=400, detail=f"Invalid window. Use one of: {', '.join(LATENCY_WINDOWS)}")
+    return await analytics_tracker.get_performance_insights(window)
+
+@app.get("/analytics/latency/{scope}")
+async def get_latency_percentiles(scope: str, window: str = "1h", limit: int = 20, current_user: User = Depends(get_current_user)):
+    """Latency percentiles per node type, workflow or workspace over a sliding window."""
+    from app.core.analytics import analytics_tracker, LATENCY_WINDOWS, LATENCY_SCOPES
+    if scope not in LATENCY_SCOPES:
+        raise HTTPException(status_code=400, detail=f"Invalid scope. Use one of: {', '.join(LATENCY_SCOPES)}")
+    if window not in LATENCY_WINDOWS:
+        raise HTTPException(status_code=400, detail=f"Invalid window. Use one of: {', '.join(LATENCY_WINDOWS)}")
+    series = await analytics_tracker.get_latency_percentiles(scope, window, limit)
+    return {"scope": scope, "window": window, "series": series}
 
 @app.get("/analytics/costs")
 async def get_cost_analysis(days: int = 30, current_user: User = Depends(get_current_user)):
@@ -553,37 +658,31 @@ async def reset_circuit(node_type: str, current_user: User = Depends(get_current
     return {"status": "success", "message": f"Circuit breaker reset for {node_type}"}
 
 @app.get("/nodes")
-def get_node_library():
-    """Returns the JSON library for the sidebar. Optimized to ensure essential nodes exist."""
+def get_node_library(request: Request):
+    """Returns the JSON library for the sidebar (cached, pre-compressed, ETag revalidation)."""
+    from app.core.node_library import node_library
     try:
-        lib_path = os.path.join(project_root, "backend", "data", "node_library.json")
-        if os.path.exists(lib_path):
-            with open(lib_path, "r", encoding="utf-8") as f:
-                lib = json.load(f)
-                
-                # Merge migrated nodes from external file
-                migrated_path = os.path.join(project_root, "backend", "data", "migrated_nodes.json")
-                if os.path.exists(migrated_path):
-                    try:
-                        with open(migrated_path, "r", encoding="utf-8") as mf:
-                            migrated_lib = json.load(mf)
-                            for cat, nodes in migrated_lib.items():
-                                if cat in lib:
-                                    lib[cat].extend(nodes)
-                                else:
-                                    lib[cat] = nodes
-                    except Exception as me:
-                        print(f"Warning: Failed to load migrated nodes: {me}")
-
-                return lib
-        return {}
+        body, encoding, etag = node_library.encoded(request.headers.get("accept-encoding", ""))
     except Exception as e:
         print(f"Error loading nodes: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+    headers = {"ETag": etag, "Cache-Control": "no-cache", "Vary": "Accept-Encoding"}
+    if node_library.is_not_modified(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    if encoding:
+        headers["Content-Encoding"] = encoding
+    return Response(content=body, media_type="application/json", headers=headers)
+
 @app.get("/library")
-def get_library_alias():
-    return get_node_library()
+def get_library_alias(request: Request):
+    return get_node_library(request)
+
+@app.get("/nodes/search")
+def search_nodes(q: str = "", offset: int = 0, limit: int = 20):
+    """Ranked, paged search over the node library (id, name, label, category, description)."""
+    from app.core.node_library import node_library
+    return node_library.search(q, offset=max(0, offset), limit=max(1, min(limit, 100)))
 
 @app.get("/logs")
 async def get_audit_logs(limit: int = 50, db: AsyncSession = Depends(get_session), current_user: User = Depends(get_current_user)):
@@ -638,6 +737,9 @@ async def save_workflow_snapshot(workflow_data: Dict[str, Any], workspace_id: Op
             )
             db.add(workflow)
             await db.flush()
+            created_workflow = workflow
+        else:
+            created_workflow = None
         
         # Save version
         version = WorkflowVersion(
@@ -646,6 +748,10 @@ async def save_workflow_snapshot(workflow_data: Dict[str, Any], workspace_id: Op
         )
         db.add(version)
         await db.commit()
+        
+        if created_workflow:
+            from app.core.webhook_index import webhook_index
+            await webhook_index.update_workflow(created_workflow)
             
         return {"status": "success", "version_id": version.id}
     except Exception as e:
@@ -789,6 +895,15 @@ async def save_workflow(request: SaveRequest, workspace_id: Optional[str] = None
             db.add(workflow)
             
         await db.commit()
+
+        # Drop compiled plans of the previous definition
+        from app.core.execution_plan import plan_cache
+        plan_cache.invalidate(workflow.id)
+
+        # Re-index webhook triggers of the new definition
+        from app.core.webhook_index import webhook_index
+        await webhook_index.update_workflow(workflow)
+
         await audit_logger.log(
             action="workflow_save", 
             user_id=current_user.id, 
@@ -957,7 +1072,7 @@ async def run_workflow(execution: ExecutionRequest, current_user: User = Depends
                 graph_data, 
                 execution.message, 
                 broadcaster=broadcast_event,
-                context={"user_id": current_user.id, "execution_id": job_id}
+                context={"user_id": current_user.id, "execution_id": job_id, "debug_mode": execution.debug_mode}
             )
             await audit_logger.log(
                 action="workflow_run_sync", 
@@ -1019,14 +1134,29 @@ async def run_workflow_async(execution: ExecutionRequest, current_user: User = D
         # Extract workspace_id if present in request
         workspace_id = getattr(execution, "workspace_id", None)
 
-        await app.state.redis_pool.enqueue_job(
+        # Publish the definition once; the job only references it
+        from app.core.workflow_store import workflow_store
+        definition_hash = await workflow_store.publish(graph_data)
+
+        # Fair share per workspace; interactive runs are dispatched ahead of bulk traffic
+        from app.core.fair_queue import fair_queue
+        await fair_queue.submit(
             'run_workflow_task',
-            graph_data=graph_data,
-            message=execution.message,
-            job_id=job_id,
-            user_id=current_user.id,
+            dict(
+                workflow_id=graph_data.get("id") or execution.workflow_id,
+                definition_hash=definition_hash,
+                message=execution.message,
+                job_id=job_id,
+                user_id=current_user.id,
+                workspace_id=workspace_id,
+                room=execution.workflow_id or graph_data.get("id"),
+                debug_mode=execution.debug_mode
+            ),
             workspace_id=workspace_id,
-            _queue_name=queue_name
+            user_id=current_user.id,
+            tier=current_user.tier,
+            lane="interactive",
+            queue_name=queue_name
         )
         
         await audit_logger.log(
@@ -1062,28 +1192,18 @@ async def webhook_receiver(webhook_id: str, request: Request, db: AsyncSession =
         headers = {k: v for k, v in request.headers.items()}
         query_params = dict(request.query_params)
 
-        # 2. Find matching workflow
-        from app.db.models import Workspace
-        result = await db.execute(select(Workflow, Workspace).join(Workspace))
-        rows = result.all()
-        
-        target_workflow = None
-        target_owner_id = None
-        for wf, ws in rows:
-            definition = wf.definition or {}
-            nodes = definition.get("nodes", [])
-            for node in nodes:
-                node_data = node.get("data", {})
-                if node_data.get("id") == "webhook_trigger":
-                    # Check if node config matches the id
-                    if node_data.get("webhook_id") == webhook_id or node_data.get("webhook_slug") == webhook_id:
-                        target_workflow = wf
-                        target_owner_id = ws.owner_id
-                        break
-            if target_workflow: break
+        # 2. Resolve the route (single index lookup) and load its workflow
+        from app.core.webhook_index import webhook_index
+        route = await webhook_index.lookup(webhook_id)
+        if not route:
+            raise HTTPException(status_code=404, detail="Webhook ID not found or not active.")
 
+        target_workflow = await db.get(Workflow, route["workflow_id"])
         if not target_workflow:
+            # Workflow was deleted: drop its stale routes
+            await webhook_index.remove_workflow(route["workflow_id"])
             raise HTTPException(status_code=404, detail="Webhook ID not found or not active.")
+        target_owner_id = route["owner_id"]
 
         # 3. Trigger Workflow (Async)
         job_id = str(uuid.uuid4())
@@ -1092,22 +1212,37 @@ async def webhook_receiver(webhook_id: str, request: Request, db: AsyncSession =
         # Fallback to defaults
         queue_name = "us-east-1-default"
         
-        await app.state.redis_pool.enqueue_job(
+        from app.core.workflow_store import workflow_store
+        definition_hash = await workflow_store.publish_workflow(target_workflow)
+        
+        # Bulk lane: a burst of webhooks only gets its workspace's share of the workers
+        from app.core.fair_queue import fair_queue
+        from app.core.billing import billing_manager
+        from arq.constants import default_queue_name
+        await fair_queue.submit(
             'run_workflow_task',
-            graph_data=target_workflow.definition,
-            message=f"Webhook {webhook_id} triggered",
-            job_id=job_id,
-            user_id=target_owner_id,
-            initial_outputs={
-                # We seed the webhook trigger node's output directly
-                # Find the node ID of the webhook trigger to map its output
-                next(n["id"] for n in target_workflow.definition["nodes"] if n.get("data", {}).get("id") == "webhook_trigger"): {
-                    "body": body,
-                    "headers": headers,
-                    "query_params": query_params,
-                    "received_at": datetime.utcnow().isoformat()
+            dict(
+                workflow_id=target_workflow.id,
+                definition_hash=definition_hash,
+                message=f"Webhook {webhook_id} triggered",
+                job_id=job_id,
+                user_id=target_owner_id,
+                room=target_workflow.id,
+                initial_outputs={
+                    # We seed the webhook trigger node's output directly
+                    route["node_id"]: {
+                        "body": body,
+                        "headers": headers,
+                        "query_params": query_params,
+                        "received_at": datetime.utcnow().isoformat()
+                    }
                 }
-            }
+            ),
+            workspace_id=target_workflow.workspace_id,
+            user_id=target_owner_id,
+            tier=await billing_manager.get_tier(target_workflow.workspace_id),
+            lane="bulk",
+            queue_name=default_queue_name
         )
         
         await audit_logger.log(
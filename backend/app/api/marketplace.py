@@ -106,4 +106,7 @@ async def clone_template(
     db.add(new_workflow)
     
     await db.commit()
+
+    from app.core.webhook_index import webhook_index
+    await webhook_index.update_workflow(new_workflow)
     return {"status": "success", "workflow_id": new_workflow.id}
@@ -5,6 +5,8 @@ from sqlmodel import select
 from app.db.session import get_session
 from app.db.models import Schedule, Workflow, User
 from app.api.auth import get_current_user
+from app.core.cron import parse_cron
+from app.core.scheduler import scheduler
 from datetime import datetime
 
 router = APIRouter()
@@ -24,19 +26,27 @@ async def create_schedule(
     
     if not workflow:
         raise HTTPException(status_code=404, detail="Workflow not found")
+
+    cron = request.get("cron", "@daily")
+    try:
+        next_run_at = parse_cron(cron).next(datetime.utcnow())
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
         
     new_schedule = Schedule(
         workflow_id=workflow_id,
         workspace_id=workflow.workspace_id,
         user_id=current_user.id,
         name=request.get("name", f"Schedule for {workflow.name}"),
-        cron=request.get("cron", "@daily"),
-        enabled=True
+        cron=cron,
+        enabled=True,
+        next_run_at=next_run_at
     )
     
     db.add(new_schedule)
     await db.commit()
     await db.refresh(new_schedule)
+    await scheduler.publish_change(new_schedule.id)
     return new_schedule
 
 @router.get("/list")
@@ -68,6 +78,7 @@ async def delete_schedule(
         
     await db.delete(schedule)
     await db.commit()
+    await scheduler.publish_change(schedule_id)
     return {"status": "success"}
 
 @router.post("/{schedule_id}/toggle")
@@ -86,6 +97,13 @@ async def toggle_schedule(
         
     schedule.enabled = enabled
     schedule.updated_at = datetime.utcnow()
+    if enabled:
+        # Resume from now rather than replaying runs missed while disabled
+        try:
+            schedule.next_run_at = parse_cron(schedule.cron).next(schedule.updated_at)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
     db.add(schedule)
     await db.commit()
+    await scheduler.publish_change(schedule_id)
     return {"status": "success", "enabled": enabled}
@@ -102,6 +102,9 @@ async def clone_template_to_workspace(
     
     await db.commit()
     await db.refresh(new_workflow)
+
+    from app.core.webhook_index import webhook_index
+    await webhook_index.update_workflow(new_workflow)
     
     return {
         "status": "success",
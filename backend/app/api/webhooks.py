@@ -32,30 +32,17 @@ async def handle_incoming_webhook(
     result = await db.execute(select(WebhookEndpoint).where(WebhookEndpoint.id == webhook_id))
     endpoint = result.scalar_one_or_none()
     
-    # Fallback/Optimization: If not in Master table, we scan workflows later
-    # but we need the security config NOW to verify the signature.
+    # Workflow trigger routes come from the maintained index (single key lookup)
+    from app.core.webhook_index import webhook_index
+    route = await webhook_index.lookup(webhook_id)
+
+    # Security config: Master table first, then the trigger node's own settings
     security_config = {
-        "secret": endpoint.secret if endpoint else None,
-        "verification_type": endpoint.verification_type if endpoint else "generic",
-        "workspace_id": endpoint.workspace_id if endpoint else None
+        "secret": endpoint.secret if endpoint else (route or {}).get("secret"),
+        "verification_type": endpoint.verification_type if endpoint else (route or {}).get("verification_type", "generic"),
+        "workspace_id": endpoint.workspace_id if endpoint else (route or {}).get("workspace_id")
     }
 
-    # If endpoint not in DB, we search all workflows to find the matching node and its security
-    if not endpoint:
-        wf_result = await db.execute(select(Workflow))
-        all_workflows = wf_result.scalars().all()
-        for wf in all_workflows:
-            nodes = wf.definition.get("nodes", [])
-            for node in nodes:
-                node_data = node.get("data", {})
-                if (node.get("type") == "webhook_trigger" or node_data.get("id") == "webhook_trigger") \
-                   and node_data.get("webhook_id") == webhook_id:
-                    security_config["secret"] = node_data.get("secret")
-                    security_config["verification_type"] = node_data.get("verification_type", "generic")
-                    security_config["workspace_id"] = wf.workspace_id
-                    break
-            if security_config["secret"]: break
-
     if not endpoint and not security_config["workspace_id"]:
         raise HTTPException(status_code=404, detail="Webhook ID not found")
 
@@ -128,23 +115,15 @@ async def handle_incoming_webhook(
     # 5. FIND AND TRIGGER ASSOCIATED WORKFLOW
     execution_id = str(uuid.uuid4())
     triggered_workflow_id = None
-    from app.db.models import Workflow
+    wf = None
     
-    # Search all workflows in the workspace
-    workflow_result = await db.execute(select(Workflow).where(Workflow.workspace_id == security_config["workspace_id"]))
-    workflows = workflow_result.scalars().all()
-
-    for wf in workflows:
-        nodes = wf.definition.get("nodes", [])
-        for node in nodes:
-            node_data = node.get("data", {})
-            # Look for matching webhook_id in any node with 'webhook_trigger' as id or type
-            if (node_data.get("id") == "webhook_trigger" or node.get("type") == "webhook_trigger") \
-               and node_data.get("webhook_id") == endpoint.id: # Or just match by endpoint ID
-                triggered_workflow_id = wf.id
-                break
-        if triggered_workflow_id:
-            break
+    if route and route["workspace_id"] == security_config["workspace_id"]:
+        wf = await db.get(Workflow, route["workflow_id"])
+        if wf:
+            triggered_workflow_id = wf.id
+        else:
+            # Workflow was deleted: drop its stale routes
+            await webhook_index.remove_workflow(route["workflow_id"])
 
     if triggered_workflow_id:
         # Trigger execution in background (Fire and Forget for the HTTP caller)
@@ -161,7 +140,7 @@ async def handle_incoming_webhook(
                     "webhook_payload": payload,
                     "webhook_headers": headers,
                     "execution_id": execution_id,
-                    "workspace_id": endpoint.workspace_id
+                    "workspace_id": security_config["workspace_id"]
                 }
             )
         )
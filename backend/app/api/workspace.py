@@ -251,6 +251,7 @@ async def import_workspace_bundle(
     db.add(membership)
 
     # 3. Restore Workflows
+    restored_workflows = []
     for wf_data in bundle.get("workflows", []):
         wf = Workflow(
             name=wf_data["name"],
@@ -260,6 +261,7 @@ async def import_workspace_bundle(
             user_id=current_user.id
         )
         db.add(wf)
+        restored_workflows.append(wf)
 
     # 4. Restore Templates
     from app.db.models import Template
@@ -278,6 +280,11 @@ async def import_workspace_bundle(
     await db.commit()
     await db.refresh(new_ws)
 
+    # Index webhook triggers of the imported workflows
+    from app.core.webhook_index import webhook_index
+    for wf in restored_workflows:
+        await webhook_index.update_workflow(wf, owner_id=current_user.id)
+
     return {
         "status": "success",
         "workspace_id": new_ws.id,
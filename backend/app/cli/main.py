@@ -92,6 +92,40 @@ class {class_name}(BaseNode):
     
     typer.secho(f" Successfully scaffolded {name} at ./{output_path}", fg=typer.colors.GREEN)
 
+@node_app.command("manifest")
+def build_manifest(
+    output: Optional[str] = typer.Option(None, help="Manifest path (defaults to settings.NODE_MANIFEST_PATH)"),
+    check: bool = typer.Option(False, "--check", help="Only verify that the existing manifest is up to date")
+):
+    """
+    Build the node registry manifest (node_id -> module/class) used for lazy node loading.
+    """
+    backend_root = str(Path(__file__).resolve().parents[2])
+    if backend_root not in sys.path:
+        sys.path.insert(0, backend_root)
+    from app.nodes.registry import NodeRegistry
+
+    path = output or NodeRegistry.manifest_path()
+    if check:
+        try:
+            with open(path, "r") as f:
+                manifest = json.load(f)
+        except Exception as e:
+            typer.secho(f" Error: Cannot read manifest at {path}: {e}", fg=typer.colors.RED)
+            raise typer.Exit(1)
+        changed = NodeRegistry.validate_manifest(manifest)
+        if changed:
+            typer.secho(f" Manifest is stale: {len(changed)} node files changed.", fg=typer.colors.YELLOW)
+            for rel_file in changed[:20]:
+                typer.echo(f"   {rel_file}")
+            raise typer.Exit(1)
+        typer.secho(f" Manifest is up to date ({len(manifest.get('nodes', {}))} nodes).", fg=typer.colors.GREEN)
+        return
+
+    typer.echo(" Scanning app/nodes...")
+    manifest = NodeRegistry.build_manifest(path)
+    typer.secho(f" Wrote {len(manifest['nodes'])} nodes from {len(manifest['files'])} files to {path}", fg=typer.colors.GREEN)
+
 @workflow_app.command("check")
 def check_workflow(path: str):
     """
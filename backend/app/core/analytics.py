@@ -2,22 +2,147 @@ import redis.asyncio as aioredis
 from typing import Dict, Any, Optional, List
 from datetime import datetime, timedelta
 from collections import defaultdict
+import asyncio
 import json
+import time
+from app.core.config import settings
+from app.core.latency import LatencySketch, MAX_FIELD, SUM_FIELD
+
+# One latency sketch hash per series and time bucket: scope (node/workflow/workspace),
+# resolution (m = minute, h = hour), bucket start (epoch seconds), series name
+LATENCY_KEY = "analytics:latency:{}:{}:{}:{}"
+# Sorted set of series names per scope, scored by last update time
+LATENCY_SERIES_KEY = "analytics:latency_series:{}"
+LATENCY_SCOPES = ("node", "workflow", "workspace", "queue_wait")
+
+# window -> (resolution, bucket seconds, buckets); windows slide at bucket granularity
+LATENCY_WINDOWS = {
+    "5m": ("m", 60, 5),
+    "15m": ("m", 60, 15),
+    "1h": ("m", 60, 60),
+    "6h": ("h", 3600, 6),
+    "24h": ("h", 3600, 24),
+    "7d": ("h", 3600, 168),
+}
+
+# Keeps the larger of the stored and the given maximum
+SET_MAX_SCRIPT = """
+local current = tonumber(redis.call('HGET', KEYS[1], ARGV[2]) or '-1')
+if tonumber(ARGV[1]) > current then
+    redis.call('HSET', KEYS[1], ARGV[2], ARGV[1])
+end
+return 1
+"""
 
 class AnalyticsTracker:
     """
     Usage analytics and insights system.
     Tracks execution patterns, node usage, errors, and performance metrics.
+    Node events are aggregated in-process and flushed to Redis in a single
+    pipeline every ANALYTICS_FLUSH_INTERVAL seconds (or ANALYTICS_FLUSH_MAX_EVENTS events).
+    Durations go into per-minute latency sketches (node type, workflow and
+    workspace) whose buckets are added into per-minute and per-hour Redis
+    hashes, so every worker's samples merge and percentiles can be read
+    over sliding windows (see LATENCY_WINDOWS).
     """
     
     def __init__(self):
         self.redis: Optional[aioredis.Redis] = None
+        self.flush_interval = settings.ANALYTICS_FLUSH_INTERVAL
+        self.flush_max_events = settings.ANALYTICS_FLUSH_MAX_EVENTS
+        self.flush_task: Optional[asyncio.Task] = None
+        self._reset_buffers()
+    
+    def _reset_buffers(self):
+        self._node_usage: Dict[str, int] = defaultdict(int)
+        self._node_status: Dict[tuple, int] = defaultdict(int)  # (node_type, status) -> count
+        self._cache_hits: Dict[str, int] = defaultdict(int)
+        # (scope, name, minute start) -> sketch
+        self._latency: Dict[tuple, LatencySketch] = {}
+        self._pending_events = 0
     
     async def init_redis(self, redis_client: aioredis.Redis):
         """Initialize with the app's Redis instance."""
         self.redis = redis_client
+        self._set_max = redis_client.register_script(SET_MAX_SCRIPT)
         print(" Analytics Tracker initialized")
     
+    def _ensure_flusher(self):
+        """Lazily starts the periodic flush on the running event loop."""
+        if self.flush_task and not self.flush_task.done():
+            return
+        self.flush_task = asyncio.create_task(self._flush_loop())
+    
+    async def _flush_loop(self):
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
+    
+    async def flush(self):
+        """Writes all locally aggregated node events in one pipelined round-trip."""
+        if not self.redis or not self._pending_events:
+            return
+        
+        node_usage, node_status = self._node_usage, self._node_status
+        cache_hits, latency = self._cache_hits, self._latency
+        self._reset_buffers()
+        
+        try:
+            pipe = self.redis.pipeline(transaction=False)
+            for node_type, count in node_usage.items():
+                pipe.hincrby("analytics:node_usage", node_type, count)
+            for (node_type, status_key), count in node_status.items():
+                pipe.hincrby(f"analytics:node_status:{node_type}", status_key, count)
+            for node_type, count in cache_hits.items():
+                pipe.hincrby("analytics:cache_hits", node_type, count)
+            now = time.time()
+            for (scope, name, minute), sketch in latency.items():
+                hour = minute - minute % 3600
+                for key, ttl in (
+                    (LATENCY_KEY.format(scope, "m", minute, name), settings.ANALYTICS_LATENCY_MINUTE_TTL),
+                    (LATENCY_KEY.format(scope, "h", hour, name), settings.ANALYTICS_LATENCY_HOUR_TTL)
+                ):
+                    for field, count in sketch.fields():
+                        pipe.hincrby(key, field, count)
+                    pipe.hincrbyfloat(key, SUM_FIELD, sketch.total)
+                    self._set_max(keys=[key], args=[sketch.max, MAX_FIELD], client=pipe)
+                    pipe.expire(key, ttl)
+                pipe.zadd(LATENCY_SERIES_KEY.format(scope), {name: now})
+            if latency:
+                for scope in LATENCY_SCOPES:
+                    pipe.zremrangebyscore(LATENCY_SERIES_KEY.format(scope), 0, now - settings.ANALYTICS_LATENCY_HOUR_TTL)
+            await pipe.execute()
+        except Exception as e:
+            print(f" Analytics flush error: {e}")
+    
+    async def stop(self):
+        """Stops the periodic flush and writes whatever is still buffered."""
+        if self.flush_task:
+            self.flush_task.cancel()
+            try:
+                await self.flush_task
+            except asyncio.CancelledError:
+                pass
+            self.flush_task = None
+        await self.flush()
+    
+    def _record_latency(self, scope: str, name: Optional[str], duration: Optional[float]):
+        if not name or duration is None:
+            return
+        key = (scope, name, int(time.time()) // 60 * 60)
+        sketch = self._latency.get(key)
+        if sketch is None:
+            sketch = self._latency[key] = LatencySketch()
+        sketch.add(duration)
+    
+    def track_queue_wait(self, tenant: str, wait: float):
+        """Seconds a job waited in its tenant's fair-share queue before reaching ARQ."""
+        if not self.redis:
+            return
+        self._record_latency("queue_wait", tenant, wait)
+        self._pending_events += 1
+        self._ensure_flusher()
+    
     async def track_workflow_execution(
         self, 
         user_id: str, 
@@ -44,21 +169,27 @@ class AnalyticsTracker:
                 "timestamp": datetime.utcnow().isoformat()
             }
             
+            pipe = self.redis.pipeline(transaction=False)
+            
             # Store in time-series list (last 1000 events)
-            await self.redis.lpush("analytics:workflow_executions", json.dumps(event))
-            await self.redis.ltrim("analytics:workflow_executions", 0, 999)
+            pipe.lpush("analytics:workflow_executions", json.dumps(event))
+            pipe.ltrim("analytics:workflow_executions", 0, 999)
             
             # Increment counters
             today = datetime.utcnow().strftime("%Y-%m-%d")
-            await self.redis.hincrby(f"analytics:daily:{today}", f"workflow_{status}", 1)
+            pipe.hincrby(f"analytics:daily:{today}", f"workflow_{status}", 1)
             
-            if status == "completed" and duration:
-                # Track execution time
-                await self.redis.lpush(f"analytics:durations:{workflow_id}", duration)
-                await self.redis.ltrim(f"analytics:durations:{workflow_id}", 0, 99)
+            await pipe.execute()
             
         except Exception as e:
             print(f" Analytics tracking error: {e}")
+        
+        if status != "started" and duration is not None:
+            # End-to-end latency, sketched like node durations
+            self._record_latency("workflow", workflow_id, duration)
+            self._record_latency("workspace", workspace_id, duration)
+            self._pending_events += 1
+            self._ensure_flusher()
     
     async def track_node_execution(
         self,
@@ -74,24 +205,25 @@ class AnalyticsTracker:
         if not self.redis:
             return
         
-        try:
-            # Increment node usage counter
-            await self.redis.hincrby("analytics:node_usage", node_type, 1)
-            
-            # Track success/failure
-            status_key = "success" if success else "failure"
-            await self.redis.hincrby(f"analytics:node_status:{node_type}", status_key, 1)
-            
-            # Track cache hits
-            if cached:
-                await self.redis.hincrby("analytics:cache_hits", node_type, 1)
-            
-            # Track execution time
-            await self.redis.lpush(f"analytics:node_durations:{node_type}", duration)
-            await self.redis.ltrim(f"analytics:node_durations:{node_type}", 0, 99)
-            
-        except Exception as e:
-            print(f" Node analytics error: {e}")
+        # Aggregated locally; no Redis round-trip on the node's hot path
+        self._node_usage[node_type] += 1
+        
+        # Track success/failure
+        status_key = "success" if success else "failure"
+        self._node_status[(node_type, status_key)] += 1
+        
+        # Track cache hits
+        if cached:
+            self._cache_hits[node_type] += 1
+        
+        # Track execution time
+        self._record_latency("node", node_type, duration)
+        
+        self._pending_events += 1
+        if self._pending_events >= self.flush_max_events:
+            await self.flush()
+        else:
+            self._ensure_flusher()
     
     async def track_api_call(
         self,
@@ -108,18 +240,20 @@ class AnalyticsTracker:
         try:
             today = datetime.utcnow().strftime("%Y-%m-%d")
             
+            pipe = self.redis.pipeline(transaction=False)
+            
             # Increment API call counter
-            await self.redis.hincrby(f"analytics:api_calls:{today}", api_type, 1)
+            pipe.hincrby(f"analytics:api_calls:{today}", api_type, 1)
             
             # Track tokens (for LLMs)
             if tokens:
-                await self.redis.hincrby(f"analytics:tokens:{today}", api_type, tokens)
+                pipe.hincrby(f"analytics:tokens:{today}", api_type, tokens)
             
             # Track costs
             if cost:
-                current = await self.redis.hget(f"analytics:costs:{today}", api_type) or "0"
-                new_cost = float(current) + cost
-                await self.redis.hset(f"analytics:costs:{today}", api_type, str(new_cost))
+                pipe.hincrbyfloat(f"analytics:costs:{today}", api_type, cost)
+            
+            await pipe.execute()
             
         except Exception as e:
             print(f" API tracking error: {e}")
@@ -130,6 +264,7 @@ class AnalyticsTracker:
             return []
         
         try:
+            await self.flush()
             usage = await self.redis.hgetall("analytics:node_usage")
             
             # Convert to list and sort
@@ -190,58 +325,152 @@ class AnalyticsTracker:
             print(f" Error getting workflow stats: {e}")
             return {}
     
-    async def get_performance_insights(self) -> Dict[str, Any]:
-        """Get performance insights and bottlenecks."""
-        if not self.redis:
+    @staticmethod
+    def _window_buckets(window: str) -> List[tuple]:
+        """(resolution, bucket start) of every bucket inside a sliding window, newest first."""
+        resolution, size, count = LATENCY_WINDOWS[window]
+        current = int(time.time()) // size * size
+        return [(resolution, current - i * size) for i in range(count)]
+    
+    @staticmethod
+    def _window_seconds(window: str) -> int:
+        _, size, count = LATENCY_WINDOWS[window]
+        return size * count
+    
+    def _queue_sketch_reads(self, pipe, scope: str, names: List[str], buckets: List[tuple]):
+        for name in names:
+            for resolution, start in buckets:
+                pipe.hgetall(LATENCY_KEY.format(scope, resolution, start, name))
+    
+    @staticmethod
+    def _merge_sketch_reads(replies: List[Any], offset: int, names: List[str], buckets: List[tuple]) -> Dict[str, LatencySketch]:
+        sketches = {}
+        for name in names:
+            sketch = LatencySketch()
+            for fields in replies[offset:offset + len(buckets)]:
+                if fields:
+                    sketch.merge_fields(fields)
+            offset += len(buckets)
+            sketches[name] = sketch
+        return sketches
+    
+    async def get_latency_percentiles(self, scope: str, window: str = "1h", limit: int = 20) -> List[Dict[str, Any]]:
+        """p50/p90/p99/max per series of a scope (node/workflow/workspace), slowest p99 first."""
+        if not self.redis or scope not in LATENCY_SCOPES or window not in LATENCY_WINDOWS:
+            return []
+        
+        try:
+            await self.flush()
+            names = await self.redis.zrangebyscore(
+                LATENCY_SERIES_KEY.format(scope), time.time() - self._window_seconds(window), "+inf"
+            )
+            names = [n.decode() if isinstance(n, bytes) else n for n in names]
+            buckets = self._window_buckets(window)
+            pipe = self.redis.pipeline(transaction=False)
+            self._queue_sketch_reads(pipe, scope, names, buckets)
+            sketches = self._merge_sketch_reads(await pipe.execute(), 0, names, buckets)
+            
+            series = [{"name": name, **sketch.summary()} for name, sketch in sketches.items() if sketch.count]
+            series.sort(key=lambda x: x["p99"], reverse=True)
+            return series[:limit]
+            
+        except Exception as e:
+            print(f" Error getting latency percentiles: {e}")
+            return []
+    
+    async def get_performance_insights(self, window: str = "1h") -> Dict[str, Any]:
+        """
+        Get performance insights and bottlenecks.
+        Latency is reported as p50/p90/p99/max (seconds) over the sliding window;
+        failure and cache rates are all-time.
+        """
+        if not self.redis or window not in LATENCY_WINDOWS:
             return {}
         
         try:
             insights = {
+                "window": window,
                 "slowest_nodes": [],
                 "most_failed_nodes": [],
+                "slowest_workflows": [],
+                "slowest_workspaces": [],
                 "cache_efficiency": {}
             }
             
-            # Get all node types
-            node_usage = await self.redis.hgetall("analytics:node_usage")
+            await self.flush()
+            since = time.time() - self._window_seconds(window)
+            buckets = self._window_buckets(window)
+            
+            # 1. Node counters and the series active in the window
+            pipe = self.redis.pipeline(transaction=False)
+            pipe.hgetall("analytics:node_usage")
+            pipe.hgetall("analytics:cache_hits")
+            pipe.zrangebyscore(LATENCY_SERIES_KEY.format("workflow"), since, "+inf")
+            pipe.zrangebyscore(LATENCY_SERIES_KEY.format("workspace"), since, "+inf")
+            node_usage, cache_hits_all, workflow_ids, workspace_ids = await pipe.execute()
+            node_types = list(node_usage.keys())
+            
+            # 2. Status counters and every sketch bucket in one round-trip
+            pipe = self.redis.pipeline(transaction=False)
+            for node_type in node_types:
+                pipe.hgetall(f"analytics:node_status:{node_type}")
+            self._queue_sketch_reads(pipe, "node", node_types, buckets)
+            self._queue_sketch_reads(pipe, "workflow", workflow_ids, buckets)
+            self._queue_sketch_reads(pipe, "workspace", workspace_ids, buckets)
+            replies = await pipe.execute()
+            
+            offset = len(node_types)
+            node_sketches = self._merge_sketch_reads(replies, offset, node_types, buckets)
+            offset += len(node_types) * len(buckets)
+            workflow_sketches = self._merge_sketch_reads(replies, offset, workflow_ids, buckets)
+            offset += len(workflow_ids) * len(buckets)
+            workspace_sketches = self._merge_sketch_reads(replies, offset, workspace_ids, buckets)
             
             # Analyze each node
             node_performance = []
-            for node_type in node_usage.keys():
-                # Get average duration
-                durations = await self.redis.lrange(f"analytics:node_durations:{node_type}", 0, -1)
-                if durations:
-                    avg_duration = sum(float(d) for d in durations) / len(durations)
-                else:
-                    avg_duration = 0
+            for i, node_type in enumerate(node_types):
+                status = replies[i]
+                latency = node_sketches[node_type].summary()
                 
                 # Get success/failure counts
-                status = await self.redis.hgetall(f"analytics:node_status:{node_type}")
                 success = int(status.get("success", 0))
                 failure = int(status.get("failure", 0))
                 total = success + failure
                 failure_rate = (failure / total * 100) if total > 0 else 0
                 
                 # Get cache hits
-                cache_hits = int(await self.redis.hget("analytics:cache_hits", node_type) or 0)
+                cache_hits = int(cache_hits_all.get(node_type) or 0)
                 cache_rate = (cache_hits / total * 100) if total > 0 else 0
                 
                 node_performance.append({
                     "node_type": node_type,
-                    "avg_duration": round(avg_duration, 2),
+                    "avg_duration": latency["mean"],
+                    "p50": latency["p50"],
+                    "p90": latency["p90"],
+                    "p99": latency["p99"],
+                    "max": latency["max"],
+                    "window_executions": latency["count"],
                     "failure_rate": round(failure_rate, 2),
                     "cache_rate": round(cache_rate, 2),
                     "total_executions": total
                 })
             
-            # Sort by duration (slowest first)
-            node_performance.sort(key=lambda x: x["avg_duration"], reverse=True)
-            insights["slowest_nodes"] = node_performance[:10]
+            # Sort by tail latency (slowest first)
+            node_performance.sort(key=lambda x: x["p99"], reverse=True)
+            insights["slowest_nodes"] = [n for n in node_performance if n["window_executions"]][:10]
             
             # Sort by failure rate
             node_performance.sort(key=lambda x: x["failure_rate"], reverse=True)
             insights["most_failed_nodes"] = [n for n in node_performance[:10] if n["failure_rate"] > 0]
             
+            for key, id_field, sketches in (
+                ("slowest_workflows", "workflow_id", workflow_sketches),
+                ("slowest_workspaces", "workspace_id", workspace_sketches)
+            ):
+                series = [{id_field: name, **sketch.summary()} for name, sketch in sketches.items() if sketch.count]
+                series.sort(key=lambda x: x["p99"], reverse=True)
+                insights[key] = series[:10]
+            
             return insights
             
         except Exception as e:
@@ -0,0 +1,225 @@
+import time
+import orjson
+import redis.asyncio as aioredis
+from typing import Any, AsyncIterator, Dict, List, Optional, Set
+from app.core.config import settings
+from app.core.payload_store import LazyPayload, materialize
+
+CURSOR_KEY = "batch:cursor:{}:{}"  # execution, node -> {index, total, batch, batch_size}
+ITEMS_KEY = "batch:items:{}:{}"  # execution, node -> list of items not handed out yet
+EXECUTION_KEY = "batch:execution:{}"  # execution -> set of its cursor nodes (cleanup)
+
+# Hands out the next batch and advances the cursor in one step; consumed items are
+# popped, so Redis memory shrinks as the loop progresses.
+# KEYS: cursor hash, items list
+# ARGV: batch size, ttl (ms)
+NEXT_BATCH_SCRIPT = """
+local cursor = redis.call('HMGET', KEYS[1], 'index', 'total', 'batch')
+if not cursor[1] then
+    return false
+end
+local index, total, batch = tonumber(cursor[1]), tonumber(cursor[2]), tonumber(cursor[3])
+if index >= total then
+    redis.call('DEL', KEYS[1], KEYS[2])
+    return {index, total, batch, {}}
+end
+local items = redis.call('LPOP', KEYS[2], ARGV[1]) or {}
+index = index + #items
+batch = batch + 1
+redis.call('HSET', KEYS[1], 'index', index, 'batch', batch)
+redis.call('PEXPIRE', KEYS[1], ARGV[2])
+redis.call('PEXPIRE', KEYS[2], ARGV[2])
+return {index, total, batch, items}
+"""
+
+
+def _encode_default(value: Any) -> Any:
+    if isinstance(value, LazyPayload):
+        return value.materialize()
+    return str(value)
+
+
+async def _iter_items(items: Any) -> AsyncIterator[Any]:
+    """Items of a list, iterator, generator or async generator (anything else is one item)."""
+    items = materialize(items)
+    if hasattr(items, "__aiter__"):
+        async for item in items:
+            yield item
+    elif hasattr(items, "__iter__") and not isinstance(items, (str, bytes, dict)):
+        for item in items:
+            yield item
+    elif items:
+        yield items
+
+
+class BatchCursor:
+    """Position of one Split In Batches loop after handing out a batch."""
+
+    __slots__ = ("items", "index", "total", "batch", "batch_size")
+
+    def __init__(self, items: List[Any], index: int, total: int, batch: int, batch_size: int):
+        self.items = items
+        self.index = index
+        self.total = total
+        self.batch = batch
+        self.batch_size = batch_size
+
+    @property
+    def completed(self) -> bool:
+        return not self.items and self.index >= self.total
+
+    @property
+    def total_batches(self) -> int:
+        return (self.total + self.batch_size - 1) // self.batch_size if self.batch_size > 0 else 0
+
+
+class BatchCursorStore:
+    """
+    Iteration state for Split In Batches loops, keyed by (execution, node).
+    On the first batch the item source (list, generator or async stream) is
+    spilled into a Redis list in BATCH_CURSOR_SPILL_CHUNK-sized pushes; each
+    later call pops exactly one batch, so a worker only ever holds the
+    current batch and successive batches may run on different workers.
+    Cursors expire after BATCH_CURSOR_TTL idle seconds (abandoned runs) and
+    are dropped as soon as the loop completes or the execution finishes.
+    Without Redis the state stays in this process (same TTL).
+    """
+
+    def __init__(self):
+        self.redis: Optional[aioredis.Redis] = None
+        # Local fallback: (execution, node) -> {"items", "index", "total", "batch", "batch_size", "expires_at"}
+        self._local: Dict[tuple, Dict[str, Any]] = {}
+        # Executions that opened a cursor in this process (release_execution skips the rest)
+        self._executions: Set[str] = set()
+        self.stats = {
+            "opened": 0,
+            "spilled_items": 0,
+            "batches": 0,
+            "completed": 0,
+            "expired": 0
+        }
+
+    async def init_redis(self, redis_client: aioredis.Redis):
+        """Initialize with the app's Redis instance."""
+        self.redis = redis_client
+        self._next_batch = redis_client.register_script(NEXT_BATCH_SCRIPT)
+
+    async def next_batch(self, execution_id: str, node_id: str, items: Any, batch_size: int) -> BatchCursor:
+        """
+        Next batch of the loop at `node_id`. `items` is only read when the loop
+        has no cursor yet; after the last batch the returned cursor is `completed`.
+        """
+        self.stats["batches"] += 1
+        if not self.redis:
+            return await self._next_local(execution_id, node_id, items, batch_size)
+
+        self._executions.add(execution_id)
+        keys = [CURSOR_KEY.format(execution_id, node_id), ITEMS_KEY.format(execution_id, node_id)]
+        ttl_ms = settings.BATCH_CURSOR_TTL * 1000
+        result = await self._next_batch(keys=keys, args=[batch_size, ttl_ms])
+        if not result:
+            await self._open(execution_id, node_id, items, batch_size)
+            result = await self._next_batch(keys=keys, args=[batch_size, ttl_ms])
+
+        index, total, batch, raw_items = result
+        cursor = BatchCursor([orjson.loads(item) for item in raw_items], int(index), int(total), int(batch), batch_size)
+        if cursor.completed:
+            await self._finish(execution_id, node_id)
+        return cursor
+
+    async def _open(self, execution_id: str, node_id: str, items: Any, batch_size: int):
+        """Spills the item source into Redis chunk by chunk and creates the cursor."""
+        cursor_key, items_key = CURSOR_KEY.format(execution_id, node_id), ITEMS_KEY.format(execution_id, node_id)
+        await self.redis.delete(items_key)
+
+        total = 0
+        chunk: List[bytes] = []
+        async for item in _iter_items(items):
+            chunk.append(orjson.dumps(item, default=_encode_default))
+            if len(chunk) >= settings.BATCH_CURSOR_SPILL_CHUNK:
+                await self.redis.rpush(items_key, *chunk)
+                total += len(chunk)
+                chunk = []
+        if chunk:
+            await self.redis.rpush(items_key, *chunk)
+            total += len(chunk)
+
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.hset(cursor_key, mapping={"index": 0, "total": total, "batch": 0, "batch_size": batch_size})
+            pipe.expire(cursor_key, settings.BATCH_CURSOR_TTL)
+            pipe.expire(items_key, settings.BATCH_CURSOR_TTL)
+            pipe.sadd(EXECUTION_KEY.format(execution_id), node_id)
+            pipe.expire(EXECUTION_KEY.format(execution_id), settings.BATCH_CURSOR_TTL)
+            await pipe.execute()
+        self.stats["opened"] += 1
+        self.stats["spilled_items"] += total
+
+    async def _next_local(self, execution_id: str, node_id: str, items: Any, batch_size: int) -> BatchCursor:
+        now = time.monotonic()
+        self._prune_local(now)
+        key = (execution_id, node_id)
+        state = self._local.get(key)
+        if state is None:
+            state = {"items": [item async for item in _iter_items(items)], "index": 0, "batch": 0, "batch_size": batch_size}
+            state["total"] = len(state["items"])
+            self._local[key] = state
+            self._executions.add(execution_id)
+            self.stats["opened"] += 1
+        state["expires_at"] = now + settings.BATCH_CURSOR_TTL
+
+        start = state["index"]
+        if start >= state["total"]:
+            del self._local[key]
+            self.stats["completed"] += 1
+            return BatchCursor([], start, state["total"], state["batch"], state["batch_size"])
+
+        end = min(start + batch_size, state["total"])
+        batch = state["items"][start:end]
+        # Release handed-out items as we go
+        state["items"][start:end] = [None] * (end - start)
+        state["index"] = end
+        state["batch"] += 1
+        return BatchCursor(batch, end, state["total"], state["batch"], state["batch_size"])
+
+    def _prune_local(self, now: float):
+        expired = [key for key, state in self._local.items() if state["expires_at"] <= now]
+        for key in expired:
+            del self._local[key]
+        self.stats["expired"] += len(expired)
+
+    async def _finish(self, execution_id: str, node_id: str):
+        self.stats["completed"] += 1
+        await self.redis.srem(EXECUTION_KEY.format(execution_id), node_id)
+
+    async def reset(self, execution_id: str, node_id: str):
+        """Drops a loop's cursor so the next call starts over with fresh items."""
+        self._local.pop((execution_id, node_id), None)
+        if self.redis:
+            await self.redis.delete(CURSOR_KEY.format(execution_id, node_id), ITEMS_KEY.format(execution_id, node_id))
+            await self.redis.srem(EXECUTION_KEY.format(execution_id), node_id)
+
+    async def release_execution(self, execution_id: Optional[str]):
+        """Drops every cursor of a finished execution (loops exited early or failed)."""
+        if not execution_id or execution_id not in self._executions:
+            return
+        self._executions.discard(execution_id)
+        for key in [key for key in self._local if key[0] == execution_id]:
+            del self._local[key]
+        if not self.redis:
+            return
+        try:
+            execution_key = EXECUTION_KEY.format(execution_id)
+            node_ids = await self.redis.smembers(execution_key)
+            keys = [execution_key]
+            for node_id in node_ids:
+                node_id = node_id.decode() if isinstance(node_id, bytes) else node_id
+                keys += [CURSOR_KEY.format(execution_id, node_id), ITEMS_KEY.format(execution_id, node_id)]
+            await self.redis.delete(*keys)
+        except Exception as e:
+            print(f" Batch cursor cleanup failed for {execution_id}: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {**self.stats, "local_cursors": len(self._local), "backend": "redis" if self.redis else "memory"}
+
+
+batch_cursors = BatchCursorStore()
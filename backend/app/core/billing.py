@@ -1,20 +1,144 @@
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from sqlmodel import select
+from sqlalchemy import tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.db.session import async_session
 from app.db.models import UsageRecord, Workspace, User
 from app.core.tier_manager import tier_manager
+from app.core.config import settings
+import redis.asyncio as aioredis
 import asyncio
+import uuid
+
+USAGE_KEY = "billing:usage:{}|{}"  # workspace_id, month
+USAGE_KEY_PREFIX = "billing:usage:"
+DIRTY_KEY = "billing:dirty"  # "workspace_id|month" members with unreconciled deltas
+TIER_KEY = "billing:tier:{}"
+RECONCILE_LOCK_KEY = "billing:reconcile:lock"
+NO_TIER = "-"  # Cached marker for workspaces without an owner (never limited)
+
+
+class BillingLimitExceeded(Exception):
+    """Raised by the engine when the workspace has used up its monthly tasks."""
+
+
+# Counters live in one hash per workspace-month: running totals (tasks, tokens, cost)
+# plus the deltas not yet written to Postgres (d_tasks, d_tokens, d_cost).
+# A hash is only counted into once it has been seeded from its UsageRecord.
+# KEYS: usage hash, dirty set
+# ARGV: tasks, tokens, cost, ttl, dirty member
+INCREMENT_SCRIPT = """
+if redis.call('HEXISTS', KEYS[1], 'seeded') == 0 then
+    return 0
+end
+redis.call('HINCRBY', KEYS[1], 'tasks', ARGV[1])
+redis.call('HINCRBY', KEYS[1], 'd_tasks', ARGV[1])
+redis.call('HINCRBY', KEYS[1], 'tokens', ARGV[2])
+redis.call('HINCRBY', KEYS[1], 'd_tokens', ARGV[2])
+redis.call('HINCRBYFLOAT', KEYS[1], 'cost', ARGV[3])
+redis.call('HINCRBYFLOAT', KEYS[1], 'd_cost', ARGV[3])
+redis.call('EXPIRE', KEYS[1], ARGV[4])
+redis.call('SADD', KEYS[2], ARGV[5])
+return 1
+"""
+
+# First writer wins; later seeds (from a possibly older DB read) are ignored.
+# KEYS: usage hash
+# ARGV: tasks, tokens, cost, ttl
+SEED_SCRIPT = """
+if redis.call('HEXISTS', KEYS[1], 'seeded') == 0 then
+    redis.call('HSET', KEYS[1], 'tasks', ARGV[1], 'tokens', ARGV[2], 'cost', ARGV[3], 'seeded', 1)
+    redis.call('EXPIRE', KEYS[1], ARGV[4])
+end
+return redis.call('HMGET', KEYS[1], 'tasks', 'tokens', 'cost')
+"""
+
+# Takes up to ARGV[1] dirty workspace-months and resets their deltas atomically.
+# KEYS: dirty set
+# ARGV: batch size, usage key prefix
+# Returns a flat list: member, d_tasks, d_tokens, d_cost, ...
+CLAIM_DELTAS_SCRIPT = """
+local out = {}
+local members = redis.call('SPOP', KEYS[1], ARGV[1])
+for _, member in ipairs(members) do
+    local key = ARGV[2] .. member
+    if redis.call('EXISTS', key) == 1 then
+        local d = redis.call('HMGET', key, 'd_tasks', 'd_tokens', 'd_cost')
+        redis.call('HSET', key, 'd_tasks', 0, 'd_tokens', 0, 'd_cost', 0)
+        table.insert(out, member)
+        table.insert(out, d[1] or '0')
+        table.insert(out, d[2] or '0')
+        table.insert(out, d[3] or '0')
+    end
+end
+return out
+"""
+
+RELEASE_LOCK_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+def _month() -> str:
+    return datetime.utcnow().strftime("%Y-%m")
+
 
 class BillingManager:
     """
     Manages usage tracking, tier limits, and billing calculations.
+    Usage is metered in Redis: each successful node is a single atomic
+    increment of the workspace-month counters, and limit checks read the
+    counters and the cached tier in one round-trip. A background reconciler
+    writes the accumulated deltas to UsageRecord in bulk every
+    BILLING_RECONCILE_INTERVAL seconds. Without Redis, usage is written to
+    Postgres directly as before.
     """
-    
+
+    def __init__(self):
+        self.redis: Optional[aioredis.Redis] = None
+        self.instance_id = str(uuid.uuid4())
+        self.reconcile_task: Optional[asyncio.Task] = None
+        self.stats = {
+            "increments": 0,
+            "seeds": 0,
+            "reconciled": 0,
+            "reconcile_errors": 0
+        }
+
+    async def init_redis(self, redis_client: aioredis.Redis):
+        """Initialize with the app's Redis instance."""
+        self.redis = redis_client
+        self._increment = redis_client.register_script(INCREMENT_SCRIPT)
+        self._seed = redis_client.register_script(SEED_SCRIPT)
+        self._claim_deltas = redis_client.register_script(CLAIM_DELTAS_SCRIPT)
+        self._release_lock = redis_client.register_script(RELEASE_LOCK_SCRIPT)
+
+    async def start(self):
+        """Starts the periodic reconciler (called by API/worker startup)."""
+        if not self.redis or (self.reconcile_task and not self.reconcile_task.done()):
+            return
+        self.reconcile_task = asyncio.create_task(self._reconcile_loop())
+        print(f" Billing reconciler started (interval: {settings.BILLING_RECONCILE_INTERVAL}s)")
+
+    async def stop(self):
+        """Stops the reconciler and flushes the pending deltas once more."""
+        if not self.reconcile_task:
+            return
+        self.reconcile_task.cancel()
+        try:
+            await self.reconcile_task
+        except asyncio.CancelledError:
+            pass
+        self.reconcile_task = None
+        await self.reconcile()
+
     async def get_or_create_usage(self, db: AsyncSession, workspace_id: str) -> UsageRecord:
         """Retrieves or initializes the usage record for the current month."""
-        month = datetime.utcnow().strftime("%Y-%m")
+        month = _month()
         result = await db.execute(
             select(UsageRecord).where(
                 UsageRecord.workspace_id == workspace_id,
@@ -22,7 +146,7 @@ class BillingManager:
             )
         )
         usage = result.scalar_one_or_none()
-        
+
         if not usage:
             usage = UsageRecord(workspace_id=workspace_id, month=month)
             db.add(usage)
@@ -39,14 +163,46 @@ class BillingManager:
                     )
                 )
                 usage = result.scalar_one_or_none()
-            
+
         return usage
 
+    async def _seed_counters(self, workspace_id: str, month: str) -> Tuple[int, int, float]:
+        """Loads the month's UsageRecord into Redis (unless another process already did)."""
+        async with async_session() as db:
+            result = await db.execute(
+                select(UsageRecord).where(
+                    UsageRecord.workspace_id == workspace_id,
+                    UsageRecord.month == month
+                )
+            )
+            usage = result.scalars().first()
+        values = (usage.tasks_executed, usage.ai_tokens_used, usage.estimated_cost) if usage else (0, 0, 0.0)
+        self.stats["seeds"] += 1
+        tasks, tokens, cost = await self._seed(
+            keys=[USAGE_KEY.format(workspace_id, month)],
+            args=[*values, settings.BILLING_USAGE_TTL]
+        )
+        return int(tasks), int(tokens), float(cost)
+
     async def track_usage(self, workspace_id: str, tasks: int = 0, tokens: int = 0, cost: float = 0.0):
         """Asynchronously increments usage metrics for a workspace."""
         if not workspace_id:
             return
-            
+
+        if self.redis:
+            month = _month()
+            member = f"{workspace_id}|{month}"
+            args = [tasks, tokens, cost, settings.BILLING_USAGE_TTL, member]
+            try:
+                keys = [USAGE_KEY.format(workspace_id, month), DIRTY_KEY]
+                if not await self._increment(keys=keys, args=args):
+                    await self._seed_counters(workspace_id, month)
+                    await self._increment(keys=keys, args=args)
+                self.stats["increments"] += 1
+                return
+            except Exception as e:
+                print(f" Billing metering error, writing usage directly: {e}")
+
         async with async_session() as db:
             usage = await self.get_or_create_usage(db, workspace_id)
             usage.tasks_executed += tasks
@@ -56,6 +212,87 @@ class BillingManager:
             db.add(usage)
             await db.commit()
 
+    async def _load_tier(self, workspace_id: str) -> str:
+        """Owner tier of a workspace from the DB, cached in Redis for BILLING_TIER_CACHE_TTL."""
+        async with async_session() as db:
+            res = await db.execute(
+                select(Workspace.id, User.tier).join(User, Workspace.owner_id == User.id).where(Workspace.id == workspace_id)
+            )
+            row = res.first()
+        # Missing workspace or owner: never limited (same as the DB check)
+        tier = (row.tier or "free") if row else NO_TIER
+        await self.redis.set(TIER_KEY.format(workspace_id), tier, ex=settings.BILLING_TIER_CACHE_TTL)
+        return tier
+
+    async def get_tier(self, workspace_id: str) -> str:
+        """Owner tier of a workspace from the tier cache ("free" when unknown)."""
+        if self.redis:
+            try:
+                tier = await self.redis.get(TIER_KEY.format(workspace_id))
+                if tier is None:
+                    tier = await self._load_tier(workspace_id)
+                elif isinstance(tier, bytes):
+                    tier = tier.decode()
+                return "free" if tier == NO_TIER else tier
+            except Exception as e:
+                print(f" Billing tier cache error: {e}")
+
+        async with async_session() as db:
+            res = await db.execute(
+                select(User.tier).join(Workspace, Workspace.owner_id == User.id).where(Workspace.id == workspace_id)
+            )
+            return res.scalar_one_or_none() or "free"
+
+    async def invalidate_tier(self, user_id: str):
+        """Drops the cached tier of every workspace owned by a user (call after tier changes)."""
+        if not self.redis:
+            return
+        async with async_session() as db:
+            res = await db.execute(select(Workspace.id).where(Workspace.owner_id == user_id))
+            workspace_ids = res.scalars().all()
+        if workspace_ids:
+            await self.redis.delete(*[TIER_KEY.format(ws_id) for ws_id in workspace_ids])
+
+    async def get_usage(self, workspace_id: str) -> Dict[str, Any]:
+        """Current month's usage, including increments not yet reconciled to Postgres."""
+        month = _month()
+        if self.redis:
+            try:
+                tasks, tokens, cost, seeded = await self.redis.hmget(
+                    USAGE_KEY.format(workspace_id, month), "tasks", "tokens", "cost", "seeded"
+                )
+                if seeded:
+                    tasks, tokens, cost = int(tasks or 0), int(tokens or 0), float(cost or 0)
+                else:
+                    tasks, tokens, cost = await self._seed_counters(workspace_id, month)
+                return {"month": month, "tasks_executed": tasks, "ai_tokens_used": tokens, "estimated_cost": cost}
+            except Exception as e:
+                print(f" Billing counter read error: {e}")
+
+        async with async_session() as db:
+            usage = await self.get_or_create_usage(db, workspace_id)
+            return {
+                "month": usage.month,
+                "tasks_executed": usage.tasks_executed,
+                "ai_tokens_used": usage.ai_tokens_used,
+                "estimated_cost": usage.estimated_cost
+            }
+
+    def _within_limits(self, workspace_id: str, tier: str, tasks: int, tokens: int) -> bool:
+        # Check Task Limit
+        task_limit = tier_manager.get_limit(tier, "max_tasks_per_month")
+        if task_limit != -1 and tasks >= task_limit:
+            print(f"⚠️ TASK LIMIT EXCEEDED: Workspace {workspace_id} ({tasks}/{task_limit})")
+            return False
+
+        # Check Token Limit
+        token_limit = tier_manager.get_limit(tier, "max_tokens_per_month")
+        if token_limit != -1 and tokens >= token_limit:
+            print(f"⚠️ TOKEN LIMIT EXCEEDED: Workspace {workspace_id} ({tokens}/{token_limit})")
+            return False
+
+        return True
+
     async def check_limits(self, workspace_id: str) -> bool:
         """
         Verifies if a workspace is still within its monthly quota using TierManager.
@@ -63,37 +300,139 @@ class BillingManager:
         """
         if not workspace_id:
             return True
-            
+
+        if self.redis:
+            month = _month()
+            try:
+                # Counters and cached tier in one round-trip
+                pipe = self.redis.pipeline(transaction=False)
+                pipe.hmget(USAGE_KEY.format(workspace_id, month), "tasks", "tokens", "seeded")
+                pipe.get(TIER_KEY.format(workspace_id))
+                (tasks, tokens, seeded), tier = await pipe.execute()
+
+                if tier is None:
+                    tier = await self._load_tier(workspace_id)
+                elif isinstance(tier, bytes):
+                    tier = tier.decode()
+                if tier == NO_TIER:
+                    return True
+                if seeded:
+                    tasks, tokens = int(tasks or 0), int(tokens or 0)
+                else:
+                    tasks, tokens, _ = await self._seed_counters(workspace_id, month)
+                return self._within_limits(workspace_id, tier, tasks, tokens)
+            except Exception as e:
+                print(f" Billing counter read error, checking limits in DB: {e}")
+
         async with async_session() as db:
             # 1. Fetch workspace to find owner
             res = await db.execute(select(Workspace).where(Workspace.id == workspace_id))
             workspace = res.scalar_one_or_none()
             if not workspace:
                 return True
-                
+
             # 2. Fetch owner to check their tier
             res = await db.execute(select(User).where(User.id == workspace.owner_id))
             owner = res.scalar_one_or_none()
             if not owner:
                 return True
-                
+
             tier = owner.tier or "free"
-            
+
             # 3. Compare with current month's usage
             usage = await self.get_or_create_usage(db, workspace_id)
-            
-            # Check Task Limit
-            task_limit = tier_manager.get_limit(tier, "max_tasks_per_month")
-            if task_limit != -1 and usage.tasks_executed >= task_limit:
-                print(f"⚠️ TASK LIMIT EXCEEDED: Workspace {workspace_id} ({usage.tasks_executed}/{task_limit})")
-                return False
-                
-            # Check Token Limit
-            token_limit = tier_manager.get_limit(tier, "max_tokens_per_month")
-            if token_limit != -1 and usage.ai_tokens_used >= token_limit:
-                print(f"⚠️ TOKEN LIMIT EXCEEDED: Workspace {workspace_id} ({usage.ai_tokens_used}/{token_limit})")
-                return False
-                
-            return True
+            return self._within_limits(workspace_id, tier, usage.tasks_executed, usage.ai_tokens_used)
+
+    async def _reconcile_loop(self):
+        while True:
+            await asyncio.sleep(settings.BILLING_RECONCILE_INTERVAL)
+            await self.reconcile()
+
+    async def reconcile(self) -> int:
+        """
+        Flushes the metered deltas to UsageRecord in bulk.
+        One process at a time (Redis lock); returns the number of workspace-months written.
+        """
+        if not self.redis:
+            return 0
+
+        lock_ttl = max(int(settings.BILLING_RECONCILE_INTERVAL * 2), 30)
+        try:
+            if not await self.redis.set(RECONCILE_LOCK_KEY, self.instance_id, nx=True, ex=lock_ttl):
+                return 0
+        except Exception as e:
+            print(f" Billing reconcile error: {e}")
+            return 0
+
+        written = 0
+        try:
+            while True:
+                claimed = await self._claim_deltas(
+                    keys=[DIRTY_KEY],
+                    args=[settings.BILLING_RECONCILE_BATCH_SIZE, USAGE_KEY_PREFIX]
+                )
+                if not claimed:
+                    break
+                deltas: Dict[Tuple[str, str], Tuple[int, int, float]] = {}
+                for i in range(0, len(claimed), 4):
+                    member = claimed[i].decode() if isinstance(claimed[i], bytes) else claimed[i]
+                    workspace_id, month = member.split("|", 1)
+                    deltas[(workspace_id, month)] = (int(claimed[i + 1]), int(claimed[i + 2]), float(claimed[i + 3]))
+                try:
+                    await self._apply_deltas(deltas)
+                except Exception as e:
+                    self.stats["reconcile_errors"] += 1
+                    print(f" Billing reconcile error, deltas kept for the next pass: {e}")
+                    await self._restore_deltas(deltas)
+                    break
+                written += len(deltas)
+                if len(claimed) // 4 < settings.BILLING_RECONCILE_BATCH_SIZE:
+                    break
+        except Exception as e:
+            print(f" Billing reconcile error: {e}")
+        finally:
+            try:
+                await self._release_lock(keys=[RECONCILE_LOCK_KEY], args=[self.instance_id])
+            except Exception:
+                pass
+
+        self.stats["reconciled"] += written
+        return written
+
+    async def _apply_deltas(self, deltas: Dict[Tuple[str, str], Tuple[int, int, float]]):
+        now = datetime.utcnow()
+        async with async_session() as db:
+            result = await db.execute(
+                select(UsageRecord).where(tuple_(UsageRecord.workspace_id, UsageRecord.month).in_(list(deltas)))
+            )
+            records = {(r.workspace_id, r.month): r for r in result.scalars().all()}
+            for (workspace_id, month), (tasks, tokens, cost) in deltas.items():
+                usage = records.get((workspace_id, month))
+                if not usage:
+                    usage = UsageRecord(workspace_id=workspace_id, month=month)
+                    records[(workspace_id, month)] = usage
+                usage.tasks_executed += tasks
+                usage.ai_tokens_used += tokens
+                usage.estimated_cost += cost
+                usage.updated_at = now
+                db.add(usage)
+            await db.commit()
+
+    async def _restore_deltas(self, deltas: Dict[Tuple[str, str], Tuple[int, int, float]]):
+        """Puts claimed deltas back (totals were never reset, only the deltas)."""
+        try:
+            pipe = self.redis.pipeline(transaction=False)
+            for (workspace_id, month), (tasks, tokens, cost) in deltas.items():
+                key = USAGE_KEY.format(workspace_id, month)
+                pipe.hincrby(key, "d_tasks", tasks)
+                pipe.hincrby(key, "d_tokens", tokens)
+                pipe.hincrbyfloat(key, "d_cost", cost)
+                pipe.sadd(DIRTY_KEY, f"{workspace_id}|{month}")
+            await pipe.execute()
+        except Exception as e:
+            print(f" Billing: failed to restore unreconciled deltas: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {**self.stats, "reconciler_running": bool(self.reconcile_task and not self.reconcile_task.done())}
 
 billing_manager = BillingManager()
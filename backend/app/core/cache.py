@@ -1,86 +1,222 @@
 import redis.asyncio as aioredis
+import fnmatch
+import gzip
 import hashlib
-import json
-from typing import Any, Optional, Dict
+import orjson
+from collections import OrderedDict, defaultdict
+from typing import Any, Optional, Dict, Tuple
 from app.core.config import settings
+from app.core.payload_store import LazyPayload
 import time
 
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# 1-byte header on L2 values; anything else is a legacy plain-JSON entry
+FORMAT_RAW = b"\x01"
+FORMAT_GZIP = b"\x02"
+FORMAT_ZSTD = b"\x03"
+
+# Execution-control keys that never change a node's output
+NON_CACHE_CONFIG_KEYS = ("retry_count", "timeout", "cacheable", "cache_ttl")
+
+
+def _key_default(value: Any) -> str:
+    """Key encoding for non-JSON inputs; stored payloads hash by digest without being read."""
+    if isinstance(value, LazyPayload):
+        return value.uri
+    return str(value)
+
+
+class L1Cache:
+    """
+    Bounded in-process LRU with per-entry TTL.
+    Entries hold serialized bytes and are evicted by total byte size, so a few
+    large results cannot crowd memory. Values are deserialized on every hit,
+    which gives callers their own copy to mutate.
+    """
+
+    def __init__(self, max_bytes: int, max_entry_bytes: int):
+        self.max_bytes = max_bytes
+        self.max_entry_bytes = max_entry_bytes
+        self.bytes = 0
+        self.evictions = 0
+        # key -> (expires_at, payload)
+        self._entries: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[bytes]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, payload = entry
+        if expires_at < time.monotonic():
+            self._remove(key)
+            return None
+        self._entries.move_to_end(key)
+        return payload
+
+    def set(self, key: str, payload: bytes, ttl: float) -> bool:
+        size = len(payload)
+        if size > self.max_entry_bytes or size > self.max_bytes or ttl <= 0:
+            return False
+        self._remove(key)
+        self._entries[key] = (time.monotonic() + ttl, payload)
+        self.bytes += size
+        while self.bytes > self.max_bytes:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+        return True
+
+    def _remove(self, key: str):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.bytes -= len(entry[1])
+
+    def invalidate(self, pattern: str) -> int:
+        keys = [k for k in self._entries if fnmatch.fnmatchcase(k, pattern)]
+        for key in keys:
+            self._remove(key)
+        return len(keys)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
 class CacheManager:
     """
-    Intelligent Redis-backed cache for node execution results.
+    Two-tier cache for node execution results.
+    L1 is a per-process LRU (byte-bounded, short TTL) consulted first; L2 is
+    Redis, shared across API and workers, holding orjson payloads that are
+    compressed above CACHE_COMPRESSION_MIN_BYTES.
     Reduces redundant API calls and speeds up workflow execution.
     """
     
     def __init__(self):
         self.redis: Optional[aioredis.Redis] = None
-        self.stats = {
-            "hits": 0,
-            "misses": 0,
-            "writes": 0
-        }
+        self.l1 = L1Cache(settings.CACHE_L1_MAX_BYTES, settings.CACHE_L1_MAX_ENTRY_BYTES)
+        self.compression = settings.CACHE_COMPRESSION
+        if self.compression == "zstd" and zstandard is None:
+            self.compression = "gzip"
+        self._zstd_compressor = zstandard.ZstdCompressor(level=3) if zstandard else None
+        self._zstd_decompressor = zstandard.ZstdDecompressor() if zstandard else None
+        self.reset_stats()
     
     async def init_redis(self, redis_client: aioredis.Redis):
-        """Initialize with the app's Redis instance."""
-        self.redis = redis_client
-        print(f" Cache Manager initialized (TTL: {settings.CACHE_TTL}s)")
+        """
+        Initialize with the app's Redis instance.
+        The shared client decodes responses to str, so cache payloads use a
+        binary client on the same connection settings.
+        """
+        pool = redis_client.connection_pool
+        connection_kwargs = {**pool.connection_kwargs, "decode_responses": False}
+        self.redis = aioredis.Redis(
+            connection_pool=aioredis.ConnectionPool(connection_class=pool.connection_class, **connection_kwargs)
+        )
+        print(f" Cache Manager initialized (TTL: {settings.CACHE_TTL}s, L1: {settings.CACHE_L1_MAX_BYTES // (1024 * 1024)}MB, compression: {self.compression})")
     
     def _generate_cache_key(self, node_type: str, input_data: Any, config: Dict[str, Any]) -> str:
         """
         Generate deterministic cache key based on node type, input, and config.
-        Uses SHA256 hash for consistent key generation.
+        Hashes a sorted orjson encoding (falls back to str() for exotic inputs).
         """
-        # Create a deterministic string representation
-        cache_input = {
-            "node_type": node_type,
-            "input": str(input_data),
-            "config": {k: v for k, v in (config or {}).items() if k not in ["retry_count", "timeout", "cacheable"]}
-        }
-        
-        # Generate hash
-        cache_str = json.dumps(cache_input, sort_keys=True)
-        hash_key = hashlib.sha256(cache_str.encode()).hexdigest()[:16]
+        cache_config = {k: v for k, v in (config or {}).items() if k not in NON_CACHE_CONFIG_KEYS}
+        try:
+            cache_bytes = orjson.dumps(
+                [node_type, input_data, cache_config],
+                option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+                default=_key_default
+            )
+        except TypeError:
+            cache_bytes = orjson.dumps([node_type, str(input_data), str(cache_config)])
         
+        hash_key = hashlib.blake2b(cache_bytes, digest_size=8).hexdigest()
         return f"cache:node:{node_type}:{hash_key}"
     
-    async def get(self, node_type: str, input_data: Any, config: Dict[str, Any]) -> Optional[Any]:
+    def _is_cacheable(self, config: Dict[str, Any]) -> bool:
+        return settings.ENABLE_RESULT_CACHING and bool(config) and bool(config.get("cacheable", False))
+    
+    def cache_key(self, node_type: str, input_data: Any, config: Dict[str, Any]) -> Optional[str]:
+        """Cache key for a node call, or None if the call is not cacheable."""
+        if not self._is_cacheable(config):
+            return None
+        return self._generate_cache_key(node_type, input_data, config)
+    
+    def _encode(self, payload: bytes) -> bytes:
+        """Wraps an orjson payload for L2, compressing it when large enough."""
+        if len(payload) >= settings.CACHE_COMPRESSION_MIN_BYTES:
+            if self.compression == "zstd":
+                return FORMAT_ZSTD + self._zstd_compressor.compress(payload)
+            if self.compression == "gzip":
+                return FORMAT_GZIP + gzip.compress(payload, compresslevel=5)
+        return FORMAT_RAW + payload
+    
+    def _decode(self, data: bytes) -> bytes:
+        """Returns the orjson payload stored in an L2 value."""
+        header, body = data[:1], data[1:]
+        if header == FORMAT_RAW:
+            return body
+        if header == FORMAT_GZIP:
+            return gzip.decompress(body)
+        if header == FORMAT_ZSTD:
+            if not self._zstd_decompressor:
+                raise ValueError("zstd-compressed cache entry but zstandard is not installed")
+            return self._zstd_decompressor.decompress(body)
+        return data  # Legacy entry written as plain JSON
+    
+    def _l1_ttl(self, config: Dict[str, Any]) -> float:
+        return min(float(config.get("cache_ttl", settings.CACHE_TTL)), settings.CACHE_L1_TTL)
+    
+    async def get(self, node_type: str, input_data: Any, config: Dict[str, Any], cache_key: Optional[str] = None) -> Optional[Any]:
         """
-        Retrieve cached result if available.
+        Retrieve cached result if available (L1 first, then Redis).
         Returns None if cache miss or caching disabled.
         """
-        if not self.redis or not settings.ENABLE_RESULT_CACHING:
-            return None
-        
-        # Check if this node type is cacheable
-        if not config or not config.get("cacheable", False):
+        if not self._is_cacheable(config):
             return None
         
+        node_stats = self.node_stats[node_type]
         try:
-            cache_key = self._generate_cache_key(node_type, input_data, config)
-            cached_data = await self.redis.get(cache_key)
+            cache_key = cache_key or self._generate_cache_key(node_type, input_data, config)
             
-            if cached_data:
+            payload = self.l1.get(cache_key)
+            if payload is not None:
                 self.stats["hits"] += 1
-                result = json.loads(cached_data)
-                print(f" Cache HIT: {node_type} (key: {cache_key[:20]}...)")
-                return result
+                self.stats["l1_hits"] += 1
+                node_stats["l1_hits"] += 1
+                node_stats["bytes_served"] += len(payload)
+                return orjson.loads(payload)
+            
+            if self.redis:
+                cached_data = await self.redis.get(cache_key)
+                if cached_data:
+                    payload = self._decode(cached_data)
+                    result = orjson.loads(payload)
+                    self.stats["hits"] += 1
+                    self.stats["l2_hits"] += 1
+                    node_stats["l2_hits"] += 1
+                    node_stats["bytes_served"] += len(payload)
+                    # Promote to L1
+                    self.l1.set(cache_key, payload, self._l1_ttl(config))
+                    print(f" Cache HIT: {node_type} (key: {cache_key[:20]}...)")
+                    return result
             
             self.stats["misses"] += 1
+            node_stats["misses"] += 1
             return None
             
         except Exception as e:
             print(f" Cache get error: {e}")
             return None
     
-    async def set(self, node_type: str, input_data: Any, config: Dict[str, Any], result: Any):
+    async def set(self, node_type: str, input_data: Any, config: Dict[str, Any], result: Any, cache_key: Optional[str] = None):
         """
-        Store result in cache with TTL.
+        Store result in both tiers with TTL.
         Only caches if node is marked as cacheable and result is serializable.
         """
-        if not self.redis or not settings.ENABLE_RESULT_CACHING:
-            return
-        
-        # Check if this node type is cacheable
-        if not config or not config.get("cacheable", False):
+        if not self._is_cacheable(config):
             return
         
         # Don't cache errors
@@ -88,17 +224,26 @@ class CacheManager:
             return
         
         try:
-            cache_key = self._generate_cache_key(node_type, input_data, config)
+            cache_key = cache_key or self._generate_cache_key(node_type, input_data, config)
             
             # Get custom TTL or use default
             ttl = config.get("cache_ttl", settings.CACHE_TTL)
             
-            # Serialize and store
-            cached_data = json.dumps(result)
-            await self.redis.setex(cache_key, ttl, cached_data)
+            # Serialize once, store in both tiers
+            payload = orjson.dumps(result, option=orjson.OPT_NON_STR_KEYS)
+            self.l1.set(cache_key, payload, self._l1_ttl(config))
+            
+            stored_bytes = len(payload)
+            if self.redis:
+                data = self._encode(payload)
+                stored_bytes = len(data)
+                await self.redis.setex(cache_key, ttl, data)
             
             self.stats["writes"] += 1
-            print(f" Cache SET: {node_type} (TTL: {ttl}s, key: {cache_key[:20]}...)")
+            node_stats = self.node_stats[node_type]
+            node_stats["writes"] += 1
+            node_stats["bytes_written"] += stored_bytes
+            print(f" Cache SET: {node_type} (TTL: {ttl}s, {stored_bytes}B, key: {cache_key[:20]}...)")
             
         except (TypeError, ValueError) as e:
             # Result not serializable, skip caching
@@ -110,12 +255,15 @@ class CacheManager:
         """
         Invalidate cache entries matching pattern.
         If no pattern provided, clears all node caches.
+        Only this process's L1 is cleared; other processes expire theirs within CACHE_L1_TTL.
         """
+        pattern = pattern or "cache:node:*"
+        local_count = self.l1.invalidate(pattern)
+        
         if not self.redis:
-            return
+            return local_count
         
         try:
-            pattern = pattern or "cache:node:*"
             keys = []
             
             async for key in self.redis.scan_iter(match=pattern):
@@ -126,33 +274,59 @@ class CacheManager:
                 print(f" Invalidated {len(keys)} cache entries (pattern: {pattern})")
                 return len(keys)
             
-            return 0
+            return local_count
             
         except Exception as e:
             print(f" Cache invalidation error: {e}")
-            return 0
+            return local_count
     
     async def invalidate_node_type(self, node_type: str):
         """Invalidate all cache entries for a specific node type."""
         return await self.invalidate(f"cache:node:{node_type}:*")
     
     def get_stats(self) -> Dict[str, Any]:
-        """Get cache statistics."""
+        """Get cache statistics, overall and per node type."""
         total_requests = self.stats["hits"] + self.stats["misses"]
         hit_rate = (self.stats["hits"] / total_requests * 100) if total_requests > 0 else 0
         
+        by_node_type = {}
+        for node_type, node_stats in self.node_stats.items():
+            hits = node_stats["l1_hits"] + node_stats["l2_hits"]
+            requests = hits + node_stats["misses"]
+            by_node_type[node_type] = {
+                **node_stats,
+                "hit_rate": round(hits / requests * 100, 2) if requests > 0 else 0
+            }
+        
         return {
             "hits": self.stats["hits"],
             "misses": self.stats["misses"],
             "writes": self.stats["writes"],
+            "l1_hits": self.stats["l1_hits"],
+            "l2_hits": self.stats["l2_hits"],
             "total_requests": total_requests,
             "hit_rate": round(hit_rate, 2),
-            "enabled": settings.ENABLE_RESULT_CACHING
+            "enabled": settings.ENABLE_RESULT_CACHING,
+            "l1": {
+                "entries": len(self.l1),
+                "bytes": self.l1.bytes,
+                "max_bytes": self.l1.max_bytes,
+                "evictions": self.l1.evictions
+            },
+            "compression": self.compression,
+            "by_node_type": by_node_type
         }
     
     def reset_stats(self):
         """Reset statistics counters."""
-        self.stats = {"hits": 0, "misses": 0, "writes": 0}
+        self.stats = {"hits": 0, "misses": 0, "writes": 0, "l1_hits": 0, "l2_hits": 0}
+        self.node_stats: Dict[str, Dict[str, int]] = defaultdict(lambda: {
+            "l1_hits": 0,
+            "l2_hits": 0,
+            "misses": 0,
+            "writes": 0,
+            "bytes_served": 0,
+            "bytes_written": 0
+        })
 
 cache_manager = CacheManager()
-
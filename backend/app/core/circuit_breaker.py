@@ -1,7 +1,63 @@
 from typing import Dict, Optional
 from datetime import datetime, timedelta
+import time
 import redis.asyncio as aioredis
 
+# Each script resolves one breaker decision in a single round-trip.
+# KEYS: state, failures, opened_at, half_open_calls, last_error
+CAN_EXECUTE_SCRIPT = """
+local state = redis.call('GET', KEYS[1])
+local failures = tonumber(redis.call('GET', KEYS[2]) or '0')
+if not state or state == 'closed' then
+    return {1, 'closed', failures}
+end
+if state == 'open' then
+    local opened_at = tonumber(redis.call('GET', KEYS[3]) or '')
+    if not opened_at then
+        -- Missing or legacy ISO timestamp: restart the recovery window from now
+        opened_at = tonumber(ARGV[1])
+        redis.call('SET', KEYS[3], ARGV[1])
+    end
+    if tonumber(ARGV[1]) - opened_at > tonumber(ARGV[2]) then
+        redis.call('SET', KEYS[1], 'half_open')
+        redis.call('SET', KEYS[4], '0')
+        return {1, 'recovering', failures}
+    end
+    return {0, redis.call('GET', KEYS[5]) or 'Unknown error', failures}
+end
+if state == 'half_open' then
+    local calls = tonumber(redis.call('GET', KEYS[4]) or '0')
+    if calls < tonumber(ARGV[3]) then
+        redis.call('INCR', KEYS[4])
+        return {1, 'half_open', failures}
+    end
+    return {0, 'half_open_exhausted', failures}
+end
+return {1, state, failures}
+"""
+
+RECORD_SUCCESS_SCRIPT = """
+redis.call('DEL', KEYS[2])
+local state = redis.call('GET', KEYS[1])
+if state == 'open' or state == 'half_open' then
+    redis.call('SET', KEYS[1], 'closed')
+    redis.call('DEL', KEYS[3])
+    return 1
+end
+return 0
+"""
+
+RECORD_FAILURE_SCRIPT = """
+local failures = redis.call('INCR', KEYS[2])
+if failures >= tonumber(ARGV[2]) and redis.call('GET', KEYS[1]) ~= 'open' then
+    redis.call('SET', KEYS[1], 'open')
+    redis.call('SET', KEYS[3], ARGV[1])
+    redis.call('SETEX', KEYS[5], 3600, ARGV[3])
+    return {failures, 1}
+end
+return {failures, 0}
+"""
+
 class CircuitBreaker:
     """
     Circuit breaker pattern for node execution.
@@ -18,23 +74,38 @@ class CircuitBreaker:
     async def init_redis(self, redis_client: aioredis.Redis):
         """Initialize with the app's Redis instance."""
         self.redis = redis_client
+        self._can_execute = redis_client.register_script(CAN_EXECUTE_SCRIPT)
+        self._record_success = redis_client.register_script(RECORD_SUCCESS_SCRIPT)
+        self._record_failure = redis_client.register_script(RECORD_FAILURE_SCRIPT)
         print(" Circuit Breaker initialized")
     
+    @staticmethod
+    def _keys(node_type: str) -> list:
+        return [
+            f"circuit:state:{node_type}",
+            f"circuit:failures:{node_type}",
+            f"circuit:opened_at:{node_type}",
+            f"circuit:half_open_calls:{node_type}",
+            f"circuit:last_error:{node_type}"
+        ]
+    
+    @staticmethod
+    def _parse_opened_at(value: str) -> datetime:
+        """opened_at is stored as a unix timestamp (older records used ISO strings)."""
+        try:
+            return datetime.utcfromtimestamp(float(value))
+        except ValueError:
+            return datetime.fromisoformat(value)
+    
     async def record_success(self, node_type: str):
         """Record successful execution."""
         if not self.redis:
             return
         
         try:
-            # Reset failure counter
-            await self.redis.delete(f"circuit:failures:{node_type}")
-            
-            # Check if circuit was open/half-open
-            state = await self.redis.get(f"circuit:state:{node_type}")
-            if state in ["open", "half_open"]:
-                # Close the circuit
-                await self.redis.set(f"circuit:state:{node_type}", "closed")
-                await self.redis.delete(f"circuit:opened_at:{node_type}")
+            # Reset failure counter (always: other workers may have recorded failures since our last check) and close the circuit if it was open/half-open
+            recovered = await self._record_success(keys=self._keys(node_type))
+            if int(recovered):
                 print(f" Circuit CLOSED for {node_type} (recovered)")
                 
         except Exception as e:
@@ -46,26 +117,12 @@ class CircuitBreaker:
             return
         
         try:
-            # Increment failure counter
-            failures = await self.redis.incr(f"circuit:failures:{node_type}")
-            
-            # Check if we should open the circuit
-            if failures >= self.failure_threshold:
-                current_state = await self.redis.get(f"circuit:state:{node_type}")
-                
-                if current_state != "open":
-                    # Open the circuit
-                    await self.redis.set(f"circuit:state:{node_type}", "open")
-                    await self.redis.set(
-                        f"circuit:opened_at:{node_type}",
-                        datetime.utcnow().isoformat()
-                    )
-                    await self.redis.setex(
-                        f"circuit:last_error:{node_type}",
-                        3600,  # Keep error for 1 hour
-                        error
-                    )
-                    print(f" Circuit OPENED for {node_type} after {failures} failures")
+            failures, opened = await self._record_failure(
+                keys=self._keys(node_type),
+                args=[time.time(), self.failure_threshold, error]
+            )
+            if int(opened):
+                print(f" Circuit OPENED for {node_type} after {failures} failures")
                     
         except Exception as e:
             print(f" Circuit breaker error (failure): {e}")
@@ -79,37 +136,19 @@ class CircuitBreaker:
             return True, None
         
         try:
-            state = await self.redis.get(f"circuit:state:{node_type}")
+            allowed, info, failures = await self._can_execute(
+                keys=self._keys(node_type),
+                args=[time.time(), self.recovery_timeout, self.half_open_max_calls]
+            )
             
-            if not state or state == "closed":
+            if int(allowed):
+                if info == "recovering":
+                    print(f" Circuit HALF-OPEN for {node_type} (testing recovery)")
                 return True, None
             
-            if state == "open":
-                # Check if recovery timeout has passed
-                opened_at_str = await self.redis.get(f"circuit:opened_at:{node_type}")
-                if opened_at_str:
-                    opened_at = datetime.fromisoformat(opened_at_str)
-                    if datetime.utcnow() - opened_at > timedelta(seconds=self.recovery_timeout):
-                        # Move to half-open state
-                        await self.redis.set(f"circuit:state:{node_type}", "half_open")
-                        await self.redis.set(f"circuit:half_open_calls:{node_type}", "0")
-                        print(f" Circuit HALF-OPEN for {node_type} (testing recovery)")
-                        return True, None
-                
-                # Circuit is still open
-                last_error = await self.redis.get(f"circuit:last_error:{node_type}")
-                return False, f"Circuit breaker open due to repeated failures: {last_error or 'Unknown error'}"
-            
-            if state == "half_open":
-                # Allow limited test calls
-                calls = int(await self.redis.get(f"circuit:half_open_calls:{node_type}") or 0)
-                if calls < self.half_open_max_calls:
-                    await self.redis.incr(f"circuit:half_open_calls:{node_type}")
-                    return True, None
-                else:
-                    return False, "Circuit breaker in half-open state (max test calls reached)"
-            
-            return True, None
+            if info == "half_open_exhausted":
+                return False, "Circuit breaker in half-open state (max test calls reached)"
+            return False, f"Circuit breaker open due to repeated failures: {info}"
             
         except Exception as e:
             print(f" Circuit breaker check error: {e}")
@@ -137,7 +176,7 @@ class CircuitBreaker:
             if state == "open":
                 opened_at_str = await self.redis.get(f"circuit:opened_at:{node_type}")
                 if opened_at_str:
-                    opened_at = datetime.fromisoformat(opened_at_str)
+                    opened_at = self._parse_opened_at(opened_at_str)
                     recovery_at = opened_at + timedelta(seconds=self.recovery_timeout)
                     status["opened_at"] = opened_at.isoformat()
                     status["recovery_at"] = recovery_at.isoformat()
@@ -173,11 +212,7 @@ class CircuitBreaker:
             return
         
         try:
-            await self.redis.delete(f"circuit:state:{node_type}")
-            await self.redis.delete(f"circuit:failures:{node_type}")
-            await self.redis.delete(f"circuit:opened_at:{node_type}")
-            await self.redis.delete(f"circuit:last_error:{node_type}")
-            await self.redis.delete(f"circuit:half_open_calls:{node_type}")
+            await self.redis.delete(*self._keys(node_type))
             print(f" Circuit RESET for {node_type} (manual override)")
             
         except Exception as e:
@@ -1,5 +1,6 @@
 import os
 from pathlib import Path
+from typing import Any, Dict
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from dotenv import load_dotenv
 
@@ -59,5 +60,93 @@ class Settings(BaseSettings):
     WORKER_CONCURRENCY: int = 10  # Jobs per worker process
     CACHE_TTL: int = 300  # Redis cache TTL in seconds
     ENABLE_RESULT_CACHING: bool = True
+    CACHE_L1_MAX_BYTES: int = 64 * 1024 * 1024  # In-process L1 budget (serialized bytes)
+    CACHE_L1_MAX_ENTRY_BYTES: int = 1024 * 1024  # Larger results skip L1
+    CACHE_L1_TTL: int = 60  # L1 entries never outlive this (bounds cross-process staleness)
+    CACHE_COMPRESSION: str = "zstd"  # zstd | gzip | none (L2 payloads)
+    CACHE_COMPRESSION_MIN_BYTES: int = 4096  # Compress L2 payloads at or above this size
+    SINGLE_FLIGHT_LOCK_TTL: int = 60  # Seconds a worker may hold a coalescing lock / followers wait
+    WEBHOOK_INDEX_CACHE_TTL: int = 10  # Seconds a webhook route stays in the in-process cache
+    WEBHOOK_INDEX_CACHE_SIZE: int = 100000  # Max locally cached routes (incl. unknown ids)
+    HTTP_POOL_MAX_CONNECTIONS: int = 200  # Shared outbound HTTP pool size (per process)
+    HTTP_POOL_MAX_PER_HOST: int = 50  # Default concurrent requests per host
+    HTTP_HOST_LIMITS: Dict[str, int] = {}  # Per-host overrides, e.g. {"api.openai.com": 100}
+    HTTP_HOST_TIMEOUTS: Dict[str, float] = {}  # Per-host timeout overrides in seconds
+    HTTP_DEFAULT_TIMEOUT: float = 300.0  # Default total request timeout (aiohttp's own default, which nodes used before pooling)
+    HTTP_KEEPALIVE_TIMEOUT: float = 30.0  # Idle keep-alive connection lifetime
+    HTTP_DNS_CACHE_TTL: int = 300  # Seconds resolved hosts are cached
+    NODE_POOL_ENABLED: bool = True  # Reuse node instances instead of rebuilding them per hop
+    NODE_POOL_MAX_SIZE: int = 2000  # Worker-wide pooled instances of reusable nodes
+    NODE_POOL_MAX_EXECUTIONS: int = 1000  # Executions holding execution-scoped instances
+    NODE_MANIFEST_PATH: str = "data/node_manifest.json"  # Registry manifest (relative to backend/)
+    NODE_MANIFEST_VALIDATE: bool = True  # Check manifest source hashes on startup
+    WS_SEND_QUEUE_SIZE: int = 256  # Frames buffered per WebSocket before it counts as slow
+    WS_SEND_TIMEOUT: float = 5.0  # A single send stalling longer than this drops the socket
+    WS_SLOW_CONSUMER_POLICY: str = "drop"  # drop (skip frames) | close (disconnect slow sockets)
+    WS_COALESCE_INTERVAL: float = 0.05  # Seconds between batched node progress frames (0 disables)
+    WS_COALESCE_MAX_EVENTS: int = 100  # Flush a batch early once it holds this many events
+    NODE_LIBRARY_CHECK_INTERVAL: float = 2.0  # Seconds between node library file change checks
+    DEBUG_BREAKPOINT_TTL: int = 86400  # Seconds breakpoints of an execution are kept
+    PAYLOAD_STORE_URL: str = "outputs/payloads"  # Large inter-node payloads: local dir or fsspec URL (s3://bucket/prefix)
+    PAYLOAD_STORE_OPTIONS: Dict[str, Any] = {}  # fsspec options, e.g. {"client_kwargs": {"endpoint_url": "http://minio:9000"}}
+    PAYLOAD_STORE_THRESHOLD: int = 50000  # Strings longer than this pass between nodes by reference
+    PAYLOAD_STORE_COMPRESSION: str = "zstd"  # zstd | none
+    PAYLOAD_STORE_COMPRESSION_MIN_BYTES: int = 4096  # Compress blobs at or above this size
+    PAYLOAD_STORE_GC_GRACE: int = 7200  # Unreferenced blobs untouched this long are deleted (> WORKFLOW_TIMEOUT)
+    PAYLOAD_STORE_GC_INTERVAL: int = 600  # Seconds between GC passes
+    SANDBOX_POOL_SIZE: int = 4  # Pre-forked code sandbox workers per language
+    SANDBOX_MAX_TASKS_PER_WORKER: int = 500  # Recycle a sandbox worker after this many evaluations
+    SANDBOX_MEMORY_LIMIT_MB: int = 512  # Address-space limit per sandbox worker (0 disables)
+    SANDBOX_CPU_LIMIT: int = 5  # CPU seconds per evaluation (0 disables)
+    SANDBOX_START_METHOD: str = "forkserver"  # forkserver | spawn | fork
+    SANDBOX_CHUNK_BYTES: int = 1024 * 1024  # Sandbox results larger than this are streamed in frames
+    PYTHON_CODE_MEMORY_LIMIT_MB: int = 2048  # Address-space limit per Python Code node worker (0 disables)
+    JS_RUNTIME_NODE_BINARY: str = "node"  # Node.js executable for the JavaScript Code node
+    JS_RUNTIME_POOL_SIZE: int = 4  # Warm single-use Node.js workers per process (max concurrent scripts)
+    JS_RUNTIME_MEMORY_LIMIT_MB: int = 256  # --max-old-space-size per Node.js worker
+    SCHEDULER_LOOKAHEAD: int = 300  # Seconds of upcoming schedule fire times kept in the leader's heap
+    SCHEDULER_BATCH_SIZE: int = 1000  # Rows per scheduler query page
+    SCHEDULER_LEASE_TTL: float = 15.0  # Leader lease; renewed every third of it
+    SCHEDULER_MISFIRE_POLICY: str = "fire_once"  # fire_once | fire_all | skip (runs missed beyond the grace period)
+    SCHEDULER_MISFIRE_GRACE: int = 60  # Seconds late a run may start and still count as on time
+    SCHEDULER_MAX_CATCHUP: int = 10  # Max runs of one schedule dispatched per pass
+    SCHEDULER_QUEUE: str = "default"  # ARQ queue for scheduled runs
+    DEFAULT_EXECUTION_MODE: str = "sequential"  # sequential | dag
+    DAG_MAX_CONCURRENCY: int = 10  # Parallel nodes per execution in DAG mode
+    EXECUTION_RECORDER_BATCH_SIZE: int = 200  # Records per bulk insert
+    EXECUTION_RECORDER_FLUSH_INTERVAL: float = 1.0  # Max seconds a record stays buffered
+    EXECUTION_RECORDER_QUEUE_SIZE: int = 10000  # Bounded buffer (backpressure beyond this)
+    ANALYTICS_FLUSH_INTERVAL: float = 2.0  # Seconds between analytics pipeline flushes
+    ANALYTICS_FLUSH_MAX_EVENTS: int = 1000  # Flush early once this many node events are buffered
+    ANALYTICS_LATENCY_MINUTE_TTL: int = 2 * 3600  # Per-minute latency sketches (windows up to 1h)
+    ANALYTICS_LATENCY_HOUR_TTL: int = 8 * 86400  # Per-hour latency sketches (windows up to 7d)
+    WORKFLOW_STORE_TTL: int = 86400  # Seconds a published definition stays in Redis (> longest queue wait)
+    WORKFLOW_STORE_CACHE_SIZE: int = 256  # Compiled workflow versions kept per process
+    WORKFLOW_STORE_VERSION_SCAN: int = 50  # WorkflowVersions checked when Redis lost a definition
+    FAIR_QUEUE_ENABLED: bool = True  # Per-workspace weighted fair queueing in front of ARQ
+    FAIR_QUEUE_READY_JOBS: int = 20  # Jobs kept waiting in each ARQ queue on top of the running ones
+    FAIR_QUEUE_POLL_INTERVAL: float = 0.05  # Dispatcher idle poll interval in seconds
+    FAIR_QUEUE_LEASE_TTL: float = 10.0  # Dispatcher leader lease; renewed every third of it
+    FAIR_QUEUE_DEDUP_TTL: int = 86400  # Seconds a submitted job id stays reserved
+    WAIT_SUSPEND_MIN_SECONDS: int = 60  # Wait nodes at least this long suspend the run on a durable timer instead of sleeping
+    TIMER_POLL_INTERVAL: float = 1.0  # Seconds between durable timer polls (resume latency)
+    TIMER_BATCH_SIZE: int = 500  # Timers claimed per poll
+    TIMER_CLAIM_TIMEOUT: int = 60  # A claimed timer not handed to the queue within this fires again
+    TIMER_STATE_GRACE: int = 86400  # Suspended state is kept this long past its due time
+    TIMER_RETRY_DELAY: float = 5.0  # First backoff for a resumed run refused by rate/billing limits (doubles per attempt)
+    TIMER_RETRY_MAX_DELAY: float = 300.0  # Backoff cap for refused resumes
+    BATCH_CURSOR_TTL: int = 86400  # Idle seconds before an abandoned Split In Batches cursor (and its spilled items) expires
+    BATCH_CURSOR_SPILL_CHUNK: int = 1000  # Items pushed to Redis per round trip when a loop starts
+    MAP_REDUCE_MIN_ITEMS: int = 200  # Parallel Map mode "auto" (opt-in) shards inputs at least this large across the workers
+    MAP_REDUCE_CHUNK_SIZE: int = 100  # Items per shard (one claim, one heartbeat)
+    MAP_REDUCE_SHARD_CONCURRENCY: int = 10  # Items of a shard in flight at once
+    MAP_REDUCE_MAX_SHARD_JOBS: int = 64  # Shard jobs submitted per map (each drains shards until none are left)
+    MAP_REDUCE_CLAIM_TIMEOUT: int = 300  # A shard without a completed item for this long is handed to another worker
+    MAP_REDUCE_POLL_INTERVAL: float = 0.2  # Parent poll interval for results and stalled shards
+    MAP_REDUCE_TTL: int = 7200  # Safety expiry of a map's Redis keys (> WORKFLOW_TIMEOUT)
+    BILLING_RECONCILE_INTERVAL: float = 30.0  # Seconds between bulk flushes of metered usage to Postgres
+    BILLING_RECONCILE_BATCH_SIZE: int = 1000  # Workspace-months written per reconcile transaction
+    BILLING_TIER_CACHE_TTL: int = 300  # Seconds a workspace's owner tier stays cached in Redis
+    BILLING_USAGE_TTL: int = 40 * 86400  # Redis usage counters outlive their month by this much
 
 settings = Settings()
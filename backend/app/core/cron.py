@@ -0,0 +1,174 @@
+import bisect
+import re
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import List, Optional, Tuple
+
+MACROS = {
+    "@yearly": "0 0 0 1 1 *",
+    "@annually": "0 0 0 1 1 *",
+    "@monthly": "0 0 0 1 * *",
+    "@weekly": "0 0 0 * * 0",
+    "@daily": "0 0 0 * * *",
+    "@midnight": "0 0 0 * * *",
+    "@hourly": "0 0 * * * *",
+    "@minutely": "0 * * * * *",
+}
+
+MONTH_NAMES = {name: i + 1 for i, name in enumerate(
+    ["jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"])}
+DAY_NAMES = {name: i for i, name in enumerate(["sun", "mon", "tue", "wed", "thu", "fri", "sat"])}
+
+# (min, max, names) for second, minute, hour, day of month, month, day of week
+FIELDS = (
+    (0, 59, None),
+    (0, 59, None),
+    (0, 23, None),
+    (1, 31, None),
+    (1, 12, MONTH_NAMES),
+    (0, 7, DAY_NAMES),
+)
+
+_EVERY_RE = re.compile(r"^@every\s+(\d+)\s*([smhd])$")
+_EVERY_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+
+# Give up after this many years without a match (e.g. "0 0 30 2 *")
+MAX_YEARS = 8
+
+
+def _parse_value(token: str, names) -> int:
+    token = token.lower()
+    if names and token in names:
+        return names[token]
+    if not token.isdigit():
+        raise ValueError(f"invalid value '{token}'")
+    return int(token)
+
+
+def _parse_field(spec: str, low: int, high: int, names) -> Tuple[List[int], bool]:
+    """Sorted allowed values of one field, and whether the field is a wildcard."""
+    values = set()
+    wildcard = spec in ("*", "?")
+    for part in spec.split(","):
+        step = 1
+        if "/" in part:
+            part, step_text = part.split("/", 1)
+            if not step_text.isdigit() or int(step_text) == 0:
+                raise ValueError(f"invalid step '{step_text}'")
+            step = int(step_text)
+        if part in ("*", "?"):
+            start, end = low, high
+        elif "-" in part:
+            start_text, end_text = part.split("-", 1)
+            start, end = _parse_value(start_text, names), _parse_value(end_text, names)
+        else:
+            start = _parse_value(part, names)
+            # "a/n" means from a to the end of the range
+            end = high if step > 1 else start
+        if start < low or end > high or start > end:
+            raise ValueError(f"'{spec}' is out of range {low}-{high}")
+        values.update(range(start, end + 1, step))
+    return sorted(values), wildcard
+
+
+class CronExpression:
+    """
+    Cron schedule evaluated in UTC (naive datetimes, like the rest of the app).
+    Accepts 5 fields (minute hour day month weekday), 6 fields with leading
+    seconds for sub-minute schedules, the @yearly/@monthly/@weekly/@daily/
+    @hourly/@minutely macros and "@every <n><s|m|h|d>" intervals.
+    Day of month and day of week follow Vixie cron: when both are
+    restricted, a day matching either one fires.
+    """
+
+    def __init__(self, expression: str):
+        self.expression = expression.strip()
+        self.interval: Optional[int] = None
+        spec = MACROS.get(self.expression.lower(), self.expression)
+
+        every = _EVERY_RE.match(spec.lower())
+        if every:
+            self.interval = int(every.group(1)) * _EVERY_UNITS[every.group(2)]
+            if self.interval <= 0:
+                raise ValueError("@every interval must be positive")
+            return
+
+        parts = spec.split()
+        if len(parts) == 5:
+            parts = ["0"] + parts
+        if len(parts) != 6:
+            raise ValueError(f"Invalid cron expression '{expression}': expected 5 or 6 fields")
+
+        try:
+            parsed = [_parse_field(part, low, high, names) for part, (low, high, names) in zip(parts, FIELDS)]
+        except ValueError as e:
+            raise ValueError(f"Invalid cron expression '{expression}': {e}") from None
+        (self.seconds, _), (self.minutes, _), (self.hours, _), (self.days, dom_any), (self.months, _), (weekdays, dow_any) = parsed
+        # 7 is Sunday too
+        self.weekdays = sorted({d % 7 for d in weekdays})
+        self.dom_any = dom_any
+        self.dow_any = dow_any
+
+    def _day_matches(self, day: datetime) -> bool:
+        dom = day.day in self.days
+        # cron weekdays: 0 = Sunday; datetime.weekday(): 0 = Monday
+        dow = (day.weekday() + 1) % 7 in self.weekdays
+        if self.dom_any and self.dow_any:
+            return True
+        if self.dom_any:
+            return dow
+        if self.dow_any:
+            return dom
+        return dom or dow
+
+    @staticmethod
+    def _next_in(values: List[int], current: int) -> Optional[int]:
+        i = bisect.bisect_left(values, current)
+        return values[i] if i < len(values) else None
+
+    def next(self, after: datetime) -> datetime:
+        """First fire time strictly after `after`."""
+        if self.interval:
+            return after.replace(microsecond=0) + timedelta(seconds=self.interval)
+
+        t = after.replace(microsecond=0) + timedelta(seconds=1)
+        limit = after.year + MAX_YEARS
+        while t.year <= limit:
+            if t.month not in self.months:
+                month = self._next_in(self.months, t.month)
+                if month is None:
+                    t = datetime(t.year + 1, self.months[0], 1)
+                else:
+                    t = datetime(t.year, month, 1)
+                continue
+            if not self._day_matches(t):
+                t = datetime(t.year, t.month, t.day) + timedelta(days=1)
+                continue
+            hour = self._next_in(self.hours, t.hour)
+            if hour is None:
+                t = datetime(t.year, t.month, t.day) + timedelta(days=1)
+                continue
+            if hour != t.hour:
+                t = t.replace(hour=hour, minute=0, second=0)
+            minute = self._next_in(self.minutes, t.minute)
+            if minute is None:
+                t = t.replace(minute=0, second=0) + timedelta(hours=1)
+                continue
+            if minute != t.minute:
+                t = t.replace(minute=minute, second=0)
+            second = self._next_in(self.seconds, t.second)
+            if second is None:
+                t = t.replace(second=0) + timedelta(minutes=1)
+                continue
+            return t.replace(second=second)
+        raise ValueError(f"Cron expression '{self.expression}' never fires")
+
+
+@lru_cache(maxsize=4096)
+def parse_cron(expression: str) -> CronExpression:
+    """Parsed (and cached) cron expression; raises ValueError if invalid."""
+    return CronExpression(expression)
+
+
+def next_fire_time(expression: str, after: datetime) -> datetime:
+    return parse_cron(expression).next(after)
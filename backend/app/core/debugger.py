@@ -0,0 +1,179 @@
+import asyncio
+import orjson
+from typing import Any, Dict, Optional, Set
+import redis.asyncio as aioredis
+from app.core.config import settings
+
+BREAKPOINTS_KEY = "debug:{execution_id}:breakpoints"  # SET of node ids
+COMMANDS_CHANNEL = "debug:{execution_id}:commands"  # set / clear / resume / step
+COMMANDS_PATTERN = "debug:*:commands"
+
+
+class DebugSession:
+    """
+    Debugger state for one execution: the breakpoint set (fetched once) and
+    the nodes currently paused. Commands arrive over pub/sub, so hops that
+    are not paused never touch Redis and resume/step take effect immediately.
+    """
+
+    def __init__(self, execution_id: str, breakpoints: Set[str]):
+        self.execution_id = execution_id
+        self.breakpoints = breakpoints
+        # Pause at the next hop regardless of breakpoints
+        self.stepping = False
+        # node_id -> future resolved by resume/step
+        self._paused: Dict[str, asyncio.Future] = {}
+
+    async def checkpoint(self, node_id: str, broadcaster=None):
+        """Blocks the hop while the debugger holds it at a breakpoint or step."""
+        if node_id not in self.breakpoints and not self.stepping:
+            return
+
+        self.stepping = False
+        print(f" Debugger: Paused at node {node_id}")
+        if broadcaster: await broadcaster("debug_paused", node_id)
+
+        waiter = self._paused.get(node_id)
+        if waiter is None or waiter.done():
+            waiter = asyncio.get_running_loop().create_future()
+            self._paused[node_id] = waiter
+        try:
+            await waiter
+        finally:
+            if self._paused.get(node_id) is waiter:
+                del self._paused[node_id]
+
+        if broadcaster: await broadcaster("debug_resumed", node_id)
+
+    def apply(self, command: Dict[str, Any]):
+        """Applies a command published by the debug API."""
+        action = command.get("action")
+        node_id = command.get("node_id")
+
+        if action == "set" and node_id:
+            self.breakpoints.add(node_id)
+        elif action == "clear" and node_id:
+            self.breakpoints.discard(node_id)
+        elif action == "resume":
+            if node_id:
+                self.breakpoints.discard(node_id)
+                self._release(node_id)
+            else:
+                self.breakpoints.clear()
+                self._release()
+        elif action == "step":
+            # Run the paused node(s), then pause at the next hop
+            self.stepping = True
+            self._release()
+
+    def _release(self, node_id: Optional[str] = None):
+        targets = [node_id] if node_id else list(self._paused)
+        for target in targets:
+            waiter = self._paused.get(target)
+            if waiter and not waiter.done():
+                waiter.set_result(True)
+
+    @property
+    def paused_nodes(self):
+        return list(self._paused)
+
+
+class Debugger:
+    """
+    Debugger control plane shared by the engine (sessions) and app/api/debug.py
+    (commands). One pattern subscription per process dispatches commands to
+    the sessions of executions running here.
+    """
+
+    def __init__(self):
+        self.redis: Optional[aioredis.Redis] = None
+        self.sessions: Dict[str, DebugSession] = {}
+        self._pubsub = None
+        self._listener_task: Optional[asyncio.Task] = None
+
+    async def init_redis(self, redis_client: aioredis.Redis):
+        """Initialize with the app's Redis instance."""
+        self.redis = redis_client
+
+    def _get_redis(self) -> aioredis.Redis:
+        if self.redis is None:
+            self.redis = aioredis.from_url(settings.REDIS_URL, decode_responses=True)
+        return self.redis
+
+    # --- Engine side ---
+
+    async def open_session(self, execution_id: str) -> DebugSession:
+        """Creates the execution's session: subscribes first, then loads breakpoints in one call."""
+        session = DebugSession(execution_id, set())
+        self.sessions[execution_id] = session
+        try:
+            await self._ensure_listener()
+            members = await self._get_redis().smembers(BREAKPOINTS_KEY.format(execution_id=execution_id))
+            session.breakpoints.update(m.decode() if isinstance(m, bytes) else m for m in members)
+        except Exception as e:
+            print(f" Debugger: Failed to load breakpoints for {execution_id}: {e}")
+        return session
+
+    def close_session(self, execution_id: str):
+        session = self.sessions.pop(execution_id, None)
+        if session:
+            # Never leave a hop blocked behind a finished execution
+            session._release()
+
+    async def _ensure_listener(self):
+        if self._listener_task and not self._listener_task.done():
+            return
+        self._pubsub = self._get_redis().pubsub()
+        await self._pubsub.psubscribe(COMMANDS_PATTERN)
+        self._listener_task = asyncio.create_task(self._listen())
+
+    async def _listen(self):
+        try:
+            async for message in self._pubsub.listen():
+                if message["type"] != "pmessage":
+                    continue
+                channel = message["channel"]
+                if isinstance(channel, bytes):
+                    channel = channel.decode()
+                execution_id = channel.split(":", 2)[1]
+                session = self.sessions.get(execution_id)
+                if session:
+                    try:
+                        session.apply(orjson.loads(message["data"]))
+                    except Exception as e:
+                        print(f" Debugger: Bad command on {channel}: {e}")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            print(f" Debugger listener error: {e}")
+
+    async def stop(self):
+        if self._listener_task:
+            self._listener_task.cancel()
+            try:
+                await self._listener_task
+            except asyncio.CancelledError:
+                pass
+            self._listener_task = None
+        if self._pubsub:
+            await self._pubsub.aclose()
+            self._pubsub = None
+
+    # --- API side ---
+
+    async def send_command(self, execution_id: str, action: str, node_id: Optional[str] = None):
+        """Persists the breakpoint change (for executions that start later) and notifies the running session."""
+        key = BREAKPOINTS_KEY.format(execution_id=execution_id)
+        pipe = self._get_redis().pipeline(transaction=True)
+        if action == "set":
+            pipe.sadd(key, node_id)
+            pipe.expire(key, settings.DEBUG_BREAKPOINT_TTL)
+        elif action == "clear" or (action == "resume" and node_id):
+            pipe.srem(key, node_id)
+        elif action == "resume":
+            pipe.delete(key)
+        pipe.publish(COMMANDS_CHANNEL.format(execution_id=execution_id), orjson.dumps({"action": action, "node_id": node_id}))
+        await pipe.execute()
+
+
+debugger = Debugger()
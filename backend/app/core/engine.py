@@ -1,6 +1,6 @@
 import sys
 import os
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 import traceback
 import orjson
 import time
@@ -26,11 +26,17 @@ if agents_dir not in sys.path:
 
 from app.nodes.factory import NodeFactory
 from app.core.validator import validator
+from app.core.execution_plan import plan_cache
+from app.core.node_pool import node_pool
+from app.core.debugger import debugger
+from app.core.config import settings
 from app.core.credentials import cred_manager
-from app.core.storage import storage_manager
+from app.core.payload_store import payload_store, LazyPayload, materialize
 from app.core.dlq import dlq
-from app.db.session import async_session
+from app.core.billing import billing_manager, BillingLimitExceeded
 from app.db.models import Execution, NodeExecution
+from app.core.execution_recorder import execution_recorder
+from app.core.batch_cursor import batch_cursors
 import uuid
 from datetime import datetime
 
@@ -47,7 +53,6 @@ class AgentEngine:
         """
         Loads and executes a node with Resilience (Retry logic), Timeout protection, Intelligent Caching, Analytics, and Circuit Breaker.
         """
-        from app.core.timeout import execute_with_timeout, TimeoutError
         from app.core.cache import cache_manager
         from app.core.analytics import analytics_tracker
         from app.core.circuit_breaker import circuit_breaker
@@ -61,20 +66,42 @@ class AgentEngine:
             return {"error": reason, "error_type": "circuit_breaker"}
         
         # Check cache (if enabled and node is cacheable)
-        cached_result = await cache_manager.get(node_type, input_text, config or {})
-        if cached_result is not None:
-            # Track cache hit
-            node_duration = time.time() - node_start_time
-            await analytics_tracker.track_node_execution(
-                node_type=node_type,
-                user_id=context.get("user_id") if context else None,
-                workspace_id=context.get("workspace_id") if context else None,
-                execution_id=context.get("execution_id") if context else "unknown",
-                duration=node_duration,
-                success=True,
-                cached=True
+        cache_key = cache_manager.cache_key(node_type, input_text, config or {})
+        if cache_key is None:
+            return await self._execute_uncached(node_type, input_text, config, context, node_start_time)
+        
+        cached_result = await cache_manager.get(node_type, input_text, config or {}, cache_key=cache_key)
+        if cached_result is None:
+            # Single-flight: concurrent identical calls (here or on other workers) share one execution
+            from app.core.single_flight import single_flight
+            result, shared = await single_flight.do(
+                cache_key,
+                lambda: self._execute_uncached(node_type, input_text, config, context, node_start_time, cache_key),
+                lambda: cache_manager.get(node_type, input_text, config or {}, cache_key=cache_key)
             )
-            return cached_result
+            if not shared:
+                return result
+            cached_result = result
+        
+        # Track cache hit (or coalesced result)
+        node_duration = time.time() - node_start_time
+        await analytics_tracker.track_node_execution(
+            node_type=node_type,
+            user_id=context.get("user_id") if context else None,
+            workspace_id=context.get("workspace_id") if context else None,
+            execution_id=context.get("execution_id") if context else "unknown",
+            duration=node_duration,
+            success=not (isinstance(cached_result, dict) and "error" in cached_result),
+            cached=True
+        )
+        return cached_result
+
+    async def _execute_uncached(self, node_type: str, input_text: Any, config: Dict[str, Any], context: Dict[str, Any], node_start_time: float, cache_key: Optional[str] = None) -> Any:
+        """Runs the node itself with retries and timeout, then records analytics/circuit state and caches the result."""
+        from app.core.timeout import execute_with_timeout, TimeoutError
+        from app.core.cache import cache_manager
+        from app.core.analytics import analytics_tracker
+        from app.core.circuit_breaker import circuit_breaker
         
         node = await self.node_factory.get_instance(node_type, config, context)
         if not node:
@@ -111,9 +138,10 @@ class AgentEngine:
                         print(f" Self-Healing: {analysis['reason']} (Waiting {delay}s...)")
                         await asyncio.sleep(delay)
                         
-                        # Apply dynamic config patches (e.g., increase timeout)
+                        # Apply dynamic config patches (e.g., increase timeout) to this run only:
+                        # node data is shared through the cached ExecutionPlan
                         if "config_patch" in analysis:
-                            config.update(analysis["config_patch"])
+                            config = {**(config or {}), **analysis["config_patch"]}
                             if "timeout" in analysis["config_patch"]:
                                 node_timeout = analysis["config_patch"]["timeout"]
                         continue
@@ -137,7 +165,7 @@ class AgentEngine:
                 if success:
                     await circuit_breaker.record_success(node_type)
                     # Cache successful result
-                    await cache_manager.set(node_type, input_text, config or {}, result)
+                    await cache_manager.set(node_type, input_text, config or {}, result, cache_key=cache_key)
 
                     token_usage = 0
                     if isinstance(result, dict):
@@ -214,10 +242,326 @@ class AgentEngine:
                 print(f" Node Execution Failed ({node_type}) after {attempt + 1} attempts: {last_error}")
                 return {"error": last_error, "stack_trace": stack_trace}
 
-    async def process_workflow(self, graph_data: Dict[str, Any], message: str, broadcaster=None, execution_id: str = None, start_node_id: str = None, initial_outputs: Dict[str, Any] = None, context: Optional[Dict[str, Any]] = None) -> str:
+    async def _run_hop(self, node: Dict[str, Any], node_input: Any, execution_context: Dict[str, Any], broadcaster=None, context: Optional[Dict[str, Any]] = None, hop_context: Optional[Dict[str, Any]] = None):
+        """
+        Runs a single node of a workflow: broadcasting, debugger breakpoints,
+        execution and persistence. Returns (result, is_error, error_message).
+        `hop_context` lets concurrent hops use their own context copy.
+        """
+        hop_context = hop_context if hop_context is not None else execution_context
+        execution_id = execution_context["execution_id"]
+        node_id = node['id']
+        node_data = node.get('data', {})
+        reg_id = node_data.get('id')
+
+        # Update Context for current hop
+        hop_context["current_node_id"] = node_id
+        hop_context["node_id"] = node_id
+
+        # Broadcast node start
+        if broadcaster:
+            await broadcaster("node_start", node_id, {
+                "input": node_input.preview(500) if isinstance(node_input, LazyPayload) else str(node_input)[:500],
+                "timestamp": time.time()
+            })
+
+        #  DEBUGGER: Pause at breakpoints / while stepping (no Redis call for other hops)
+        debug_session = execution_context.get("debug_session")
+        if debug_session:
+            await debug_session.checkpoint(node_id, broadcaster)
+
+        # --- EXECUTE ---
+        hop_start = time.time()
+        if reg_id == 'chatInput':
+            result = materialize(node_input)
+        else:
+            result = await self.execute_node(reg_id, node_input, config=node_data, context=hop_context)
+        execution_time = time.time() - hop_start
+
+        is_error = False
+        error_message = ""
+        if isinstance(result, dict):
+            if result.get("status") == "error":
+                is_error = True
+                error_message = result.get("error", "Unknown error")
+            elif "error" in result:
+                is_error = True
+                error_message = result["error"]
+
+        # PERSIST NODE EXECUTION (write-behind, flushed in bulk)
+        await execution_recorder.record_node(NodeExecution(
+            execution_id=execution_id,
+            node_id=node_id,
+            node_type=reg_id,
+            input=node_input.describe() if isinstance(node_input, LazyPayload) else node_input,
+            output=result,
+            logs=[],
+            status="success" if not (isinstance(result, dict) and "error" in result) else "error",
+            error=result.get("error") if isinstance(result, dict) else None,
+            stack_trace=result.get("stack_trace") if isinstance(result, dict) else None,
+            execution_time=execution_time
+        ))
+
+        # Store in output history
+        execution_context["node_outputs"][node_id] = result
+
+        # Broadcast node completion
+        if broadcaster:
+            log_output = result.get("data") if isinstance(result, dict) and "data" in result else result
+            await broadcaster("node_end", node_id, {
+                "output": str(log_output)[:1000],
+                "status": "success" if not is_error else "error",
+                "execution_time": execution_time
+            })
+
+        return result, is_error, error_message
+
+    @staticmethod
+    async def _prepare_edge_input(node_id: str, result: Any, edge: Dict[str, Any], execution_id: Optional[str] = None) -> Any:
+        """
+        Derives the input passed along `edge` from the source node's result.
+        Large values are stored in the payload store and passed as a LazyPayload,
+        read only when (and if) the downstream node touches them.
+        """
+        s_handle = edge.get('sourceHandle')
+        next_input = result
+
+        if isinstance(result, dict):
+            # 1. Direct handle match logic
+            if s_handle and s_handle in result:
+                next_input = result[s_handle]
+            # 2. 'data' extraction for standard flow
+            elif "data" in result and getattr(result, "status", None) != "error":
+                next_input = result["data"]
+            # 3. Legacy error fallback
+            elif "error" in result:
+                next_input = result["error"]
+
+        # Pass large outputs by reference (content-addressed, deduplicated)
+        if payload_store.should_store(next_input):
+            next_input = await payload_store.put_async(next_input, execution_id)
+            print(f" Stored large output from {node_id} as {next_input.uri} ({next_input.size} bytes).")
+
+        return next_input
+
+    async def _run_dag(self, plan, start_node: Dict[str, Any], start_input: Any, execution_context: Dict[str, Any], broadcaster=None, context: Optional[Dict[str, Any]] = None, max_concurrency: int = 10):
+        """
+        Concurrent DAG scheduler. Every node starts as soon as all of its upstream
+        edges are resolved (fired or skipped), capped by `max_concurrency`.
+        Nodes with several active inputs (e.g. 'merge_node') receive them as
+        context['inputs'] in edge order. Returns (result, error_msg).
+        """
+        layout = plan.dag_layout(start_node['id'])
+        remaining = dict(layout.indegree)
+        arrived: Dict[str, List[Any]] = {node_id: [] for node_id in layout.reachable}
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        running: Dict[asyncio.Task, str] = {}
+        sink_results: Dict[str, Any] = {}
+        last_result = start_input
+
+        async def run_node(node, node_input, inputs):
+            async with semaphore:
+                hop_context = {**execution_context, "inputs": inputs}
+                return await self._run_hop(node, node_input, execution_context, broadcaster, context, hop_context)
+
+        def launch(node_id: str):
+            inputs = [payload for _, payload in sorted(arrived[node_id], key=lambda item: item[0])]
+            node_input = inputs[0] if len(inputs) == 1 else inputs
+            task = asyncio.create_task(run_node(plan.get_node(node_id), node_input, inputs))
+            running[task] = node_id
+
+        def resolve(edge: Dict[str, Any], payload: Any, active: bool):
+            target = edge.get('target')
+            if target not in remaining:
+                return
+            if active:
+                arrived[target].append((layout.edge_order.get(id(edge), 0), payload))
+            remaining[target] -= 1
+            if remaining[target] == 0:
+                if arrived[target]:
+                    launch(target)
+                else:
+                    # Dead branch: propagate the skip so downstream joins don't wait forever
+                    for out_edge in plan.outgoing(target):
+                        resolve(out_edge, None, False)
+
+        arrived[start_node['id']].append((0, start_input))
+        launch(start_node['id'])
+
+        try:
+            while running:
+                done, _ = await asyncio.wait(list(running), return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    node_id = running.pop(task)
+                    result, is_error, error_message = task.result()
+                    node_data = plan.get_node(node_id).get('data', {})
+
+                    # Handle Critical Failures (unless 'continue_on_fail' is set)
+                    if is_error and not node_data.get("continue_on_fail"):
+                        return result, f"Stopped at {node_data.get('label')}: {error_message}"
+
+                    last_result = result
+                    outgoing = plan.outgoing(node_id)
+                    if not outgoing:
+                        sink_results[node_id] = result
+
+                    for edge, active in plan.route_edges(node_id, result, is_error):
+                        edge_input = await self._prepare_edge_input(node_id, result, edge, execution_context["execution_id"]) if active else None
+                        resolve(edge, edge_input, active)
+        finally:
+            for task in running:
+                task.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+
+        if len(sink_results) == 1:
+            return next(iter(sink_results.values())), None
+        if sink_results:
+            return {node_id: sink_results[node_id] for node_id in plan.node_map if node_id in sink_results}, None
+        return last_result, None
+
+    async def _fail_execution(self, execution_id: str, graph_data: Dict[str, Any], error_msg: str, execution_context: Dict[str, Any], user_id: Optional[str]) -> str:
+        """Captures a failed run to the DLQ, audits it and marks the execution record as failed."""
+        dlq.capture(execution_id, graph_data, error_msg, execution_context)
+
+        # Log Failure
+        from app.core.audit import audit_logger
+        await audit_logger.log(
+            action="workflow_fail",
+            user_id=user_id,
+            details={"execution_id": execution_id, "error": error_msg}
+        )
+
+        # UPDATE EXECUTION RECORD TO FAILED (flushes the execution's pending records)
+        await execution_recorder.finish_execution(
+            execution_id,
+            status="failed",
+            error=error_msg,
+            finished_at=datetime.utcnow()
+        )
+        return error_msg
+
+    async def _release_execution(self, execution_id: str, keep_cursors: bool = False):
+        """
+        Drops what an execution holds in this worker (pooled instances,
+        debugger session, payload refs, batch cursors). Suspended runs keep
+        their batch cursors for the resumed job.
+        """
+        node_pool.release_execution(execution_id)
+        debugger.close_session(execution_id)
+        payload_store.release_execution(execution_id)
+        if not keep_cursors:
+            await batch_cursors.release_execution(execution_id)
+
+    async def run_child(self, graph_data: Dict[str, Any], message: Any, execution_id: str, plan_hash: Optional[str] = None, context: Optional[Dict[str, Any]] = None) -> Tuple[Any, Optional[str]]:
+        """
+        Lightweight sequential run of a sub-graph for map items: no billing or
+        rate-limit checks, audit, analytics events, broadcasts or Execution /
+        NodeExecution rows (the parent execution accounts for the whole map).
+        Returns (result, error_message).
+        """
+        plan = plan_cache.get_plan(graph_data, plan_hash)
+        is_valid, errors = plan.validate(validator)
+        if not is_valid:
+            return None, f"Validation Failed: {' | '.join(errors)}"
+
+        execution_context = {
+            "variables": {"initial_query": message},
+            "node_outputs": {},
+            "execution_id": execution_id,
+            "graph_data": graph_data,
+            "engine": self,
+            **(context or {})
+        }
+        current_node = plan.entry_node
+        current_input = message
+        result = current_input
+        visited = set()
+        try:
+            for _ in range(50):
+                if not current_node: break
+                node_id = current_node['id']
+                if node_id in visited: break
+                visited.add(node_id)
+                node_data = current_node.get('data', {})
+                execution_context["current_node_id"] = node_id
+                execution_context["node_id"] = node_id
+
+                reg_id = node_data.get('id')
+                if reg_id == 'chatInput':
+                    result = materialize(current_input)
+                else:
+                    result = await self.execute_node(reg_id, current_input, config=node_data, context=execution_context)
+                execution_context["node_outputs"][node_id] = result
+
+                if isinstance(result, dict) and not node_data.get("continue_on_fail"):
+                    if result.get("status") == "error" or "error" in result:
+                        return None, f"Stopped at {node_data.get('label')}: {result.get('error', 'Unknown error')}"
+
+                next_edge = plan.resolve_next_edge(node_id, result)
+                if not next_edge: break
+                current_input = await self._prepare_edge_input(node_id, result, next_edge, execution_id)
+                current_node = plan.get_node(next_edge['target'])
+            return materialize(result), None
+        finally:
+            node_pool.release_execution(execution_id)
+            payload_store.release_execution(execution_id)
+
+    async def _suspend_execution(self, node: Dict[str, Any], node_input: Any, result: Dict[str, Any], execution_context: Dict[str, Any], graph_data: Dict[str, Any], message: str, broadcaster=None, context: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Parks a run at a wait node on a durable timer and frees its worker and
+        rate-limit slots. The timer re-enqueues the execution, which restarts at
+        this node with the node outputs gathered so far.
+        """
+        from app.core.timers import timer_service, SUSPENDED_PREFIX
+        from app.core.workflow_store import workflow_store
+        from app.core.rate_limiter import rate_limiter
+        context = context or {}
+        execution_id = execution_context["execution_id"]
+        node_id = node['id']
+        resume_at = float(result["resume_at"])
+
+        # The resumed job feeds the wait node its original input again
+        node_outputs = dict(execution_context["node_outputs"])
+        node_outputs[node_id] = node_input
+        state = {
+            "execution_id": execution_id,
+            "node_id": node_id,
+            "resume_at": resume_at,
+            "suspended_at": time.time(),
+            "wait_info": (result.get("data") or {}).get("wait_info", {}),
+            "message": message,
+            "node_outputs": node_outputs,
+            "workflow_id": context.get("workflow_id") or graph_data.get("id"),
+            "definition_hash": context.get("definition_hash") or await workflow_store.publish(graph_data),
+            "user_id": context.get("user_id"),
+            "workspace_id": context.get("workspace_id"),
+            "room": context.get("room"),
+            "queue_name": context.get("queue_name", "default")
+        }
+        if not context.get("definition_hash"):
+            # Inline graph: nothing in Postgres to fall back on once the published copy expires
+            state["graph"] = graph_data
+        await timer_service.schedule(state)
+
+        resume_iso = datetime.utcfromtimestamp(resume_at).isoformat()
+        if broadcaster:
+            await broadcaster("workflow_suspended", node_id, {"resume_at": resume_iso})
+
+        await execution_recorder.finish_execution(
+            execution_id,
+            status="waiting",
+            output={"waiting_at": node_id, "resume_at": resume_iso}
+        )
+        await rate_limiter.release(context.get("user_id"), context.get("workspace_id"))
+
+        return f"{SUSPENDED_PREFIX} waiting at {node.get('data', {}).get('label') or node_id} until {resume_iso}"
+
+    async def process_workflow(self, graph_data: Dict[str, Any], message: str, broadcaster=None, execution_id: str = None, start_node_id: str = None, initial_outputs: Dict[str, Any] = None, context: Optional[Dict[str, Any]] = None, plan_hash: Optional[str] = None) -> str:
         """
         Core workflow execution engine with Validation and Structured Context.
-        Supports resuming from a specific node.
+        Supports resuming from a specific node. `plan_hash` skips re-hashing
+        definitions that were already compiled (see workflow_store).
         """
         workspace_id = context.get("workspace_id") if context else None
         
@@ -225,7 +569,7 @@ class AgentEngine:
         if not await billing_manager.check_limits(workspace_id):
             error_msg = "Monthly task limit exceeded for this workspace."
             if broadcaster: await broadcaster("error", "billing_limit_exceeded", {"message": error_msg})
-            raise Exception(error_msg)
+            raise BillingLimitExceeded(error_msg)
 
         execution_id = execution_id or str(uuid.uuid4())
         
@@ -233,311 +577,173 @@ class AgentEngine:
         start_time = time.time()
         
         # 0. RATE LIMITING CHECK
-        from app.core.rate_limiter import rate_limiter
+        from app.core.rate_limiter import rate_limiter, RATE_LIMITED_PREFIX
         user_id = context.get("user_id") if context else "anonymous"
         workspace_id = context.get("workspace_id") if context else "default"
         
-        can_run = await rate_limiter.check_user_limit(user_id)
+        can_run = await rate_limiter.try_acquire(user_id, workspace_id, execution_id)
         if not can_run:
-            error_msg = f"Rate Limit Exceeded: Parallel execution limit reached for user {user_id}"
+            error_msg = f"{RATE_LIMITED_PREFIX} Parallel execution limit reached for user {user_id}"
             if broadcaster: await broadcaster("error", "rate_limit_exceeded", {"message": error_msg})
             return error_msg
-            
-        await rate_limiter.acquire(user_id, workspace_id, execution_id)
         
-        # PERSIST INITIAL EXECUTION RECORD
+        # Everything the execution holds in this worker is dropped on every exit (incl. timeouts and cancellation)
+        suspended = False
         try:
-            async with async_session() as session:
-                exec_record = Execution(
+            # PERSIST INITIAL EXECUTION RECORD (write-behind; a run resumed from a durable timer already has one)
+            resumed_timer = context.get("resumed_timer") if context else None
+            if resumed_timer:
+                await execution_recorder.update_execution(execution_id, status="running", finished_at=None)
+            else:
+                await execution_recorder.start_execution(Execution(
                     id=execution_id,
                     workflow_id=graph_data.get("id"),
                     workspace_id=context.get("workspace_id", "default") if context else "default",
                     user_id=context.get("user_id") if context else None,
                     status="running",
                     input={"message": message}
-                )
-                session.add(exec_record)
-                await session.commit()
-        except Exception as e:
-            print(f" Failed to persist initial execution: {e}")
+                ))
 
-        # 1. GRAPH VALIDATION
-        is_valid, errors = validator.validate(graph_data)
-        if not is_valid:
-            error_msg = " | ".join(errors)
-            if broadcaster: await broadcaster("error", "validation_failed", {"message": error_msg})
-            return f"Validation Failed: {error_msg}"
+            # 1. GRAPH VALIDATION (compiled once per workflow version)
+            plan = plan_cache.get_plan(graph_data, plan_hash)
+            is_valid, errors = plan.validate(validator)
+            if not is_valid:
+                error_msg = " | ".join(errors)
+                if broadcaster: await broadcaster("error", "validation_failed", {"message": error_msg})
+                return f"Validation Failed: {error_msg}"
 
-        nodes = graph_data.get("nodes", [])
-        edges = graph_data.get("edges", [])
+            nodes = plan.nodes
         
-        # 2. SEED EXECUTION CONTEXT
-        user_id = context.get("user_id") if context else None
-        execution_context = {
-            "variables": {"initial_query": message},
-            "node_outputs": initial_outputs or {},
-            "graph_metadata": {"node_count": len(nodes)},
-            "execution_id": execution_id,
-            "user_id": user_id,
-            "engine": self
-        }
+            # 2. SEED EXECUTION CONTEXT
+            user_id = context.get("user_id") if context else None
+            execution_context = {
+                "variables": {"initial_query": message},
+                "node_outputs": initial_outputs or {},
+                "graph_metadata": {"node_count": len(nodes)},
+                "execution_id": execution_id,
+                "user_id": user_id,
+                "workspace_id": context.get("workspace_id") if context else None,
+                "queue_name": context.get("queue_name") if context else None,
+                "graph_data": graph_data,
+                "engine": self
+            }
+            if resumed_timer:
+                execution_context["resumed_timer"] = resumed_timer
+            if context and context.get("debug_mode"):
+                # One debugger session per execution (breakpoints + pub/sub commands)
+                execution_context["debug_session"] = await debugger.open_session(execution_id)
 
-        # Auditing
-        from app.core.audit import audit_logger
-        await audit_logger.log(
-            action="workflow_start",
-            user_id=user_id,
-            details={"execution_id": execution_id, "node_count": len(nodes)}
-        )
+            # Auditing
+            from app.core.audit import audit_logger
+            await audit_logger.log(
+                action="workflow_start",
+                user_id=user_id,
+                details={"execution_id": execution_id, "node_count": len(nodes)}
+            )
         
-        # Analytics: Track workflow start
-        from app.core.analytics import analytics_tracker
-        workflow_id = execution_context.get("workflow_id", "unknown")
-        workspace_id = context.get("workspace_id") if context else None
-        await analytics_tracker.track_workflow_execution(
-            user_id=user_id,
-            workspace_id=workspace_id,
-            workflow_id=workflow_id,
-            execution_id=execution_id,
-            status="started"
-        )
+            # Analytics: Track workflow start
+            from app.core.analytics import analytics_tracker
+            workflow_id = (context or {}).get("workflow_id") or graph_data.get("id")
+            workspace_id = context.get("workspace_id") if context else None
+            if not resumed_timer:
+                await analytics_tracker.track_workflow_execution(
+                    user_id=user_id,
+                    workspace_id=workspace_id,
+                    workflow_id=workflow_id,
+                    execution_id=execution_id,
+                    status="started"
+                )
 
-        # 3. Identify Entry Point (Support 'chatInput' or resume node)
-        if start_node_id:
-            current_node = next((n for n in nodes if n['id'] == start_node_id), None)
-            if not current_node: return f"Resume Failed: Node {start_node_id} not found."
-            current_input = execution_context["node_outputs"].get(start_node_id, message)
-        else:
-            current_node = next((n for n in nodes if n.get('data', {}).get('id') == 'chatInput'), nodes[0])
-            current_input = message
-        visited = set()
-        
-        # Safety: Path limit
-        for _ in range(50):
-            node_id = current_node['id']
-            if node_id in visited: break
-            visited.add(node_id)
-            
-            node_data = current_node.get('data', {})
-            reg_id = node_data.get('id')
-            
-            # Update Context for current hop
-            execution_context["current_node_id"] = node_id
-            
-            # Broadcast node start
-            if broadcaster: 
-                await broadcaster("node_start", node_id, {
-                    "input": str(current_input)[:500],
-                    "timestamp": time.time()
-                })
-            
-            #  DEBUGGER: Check for BREAKPOINT
-            if context and context.get("debug_mode"):
-                from app.core.config import settings
-                import redis.asyncio as aioredis
-                r = aioredis.from_url(settings.REDIS_URL, decode_responses=True)
-                
-                # Check if this node_id is marked as a breakpoint
-                is_paused = await r.get(f"breakpoint_{execution_id}_{node_id}")
-                if is_paused:
-                    print(f" Debugger: Paused at node {node_id}")
-                    if broadcaster: await broadcaster("debug_paused", node_id)
-                    
-                    # Wait for resume signal
-                    while await r.get(f"breakpoint_{execution_id}_{node_id}"):
-                        await asyncio.sleep(0.5)
-                        # Check for 'step_over'
-                        if await r.get(f"step_{execution_id}"):
-                            await r.delete(f"step_{execution_id}")
-                            break
-                    
-                    if broadcaster: await broadcaster("debug_resumed", node_id)
-            
-            # --- EXECUTE ---
-            if reg_id == 'chatInput':
-                result = current_input
+            # 3. Identify Entry Point (Support 'chatInput' or resume node)
+            if start_node_id:
+                current_node = plan.get_node(start_node_id)
+                if not current_node: return f"Resume Failed: Node {start_node_id} not found."
+                current_input = execution_context["node_outputs"].get(start_node_id, message)
             else:
-                result = await self.execute_node(reg_id, current_input, config=node_data, context=execution_context)
+                current_node = plan.entry_node
+                current_input = message
 
-            # PERSIST NODE EXECUTION
-            try:
-                async with async_session() as session:
-                    node_exec = NodeExecution(
-                        execution_id=execution_id,
-                        node_id=node_id,
-                        node_type=reg_id,
-                        input=current_input,
-                        output=result,
-                        logs=getattr(node, "metrics", {}).get("logs", []),
-                        status="success" if not (isinstance(result, dict) and "error" in result) else "error",
-                        error=result.get("error") if isinstance(result, dict) else None,
-                        stack_trace=result.get("stack_trace") if isinstance(result, dict) else None,
-                        execution_time=node.metrics.get("execution_time", 0.0) if hasattr(node, "metrics") else 0.0
-                    )
-                    session.add(node_exec)
-                    await session.commit()
-            except Exception as e:
-                print(f" Failed to persist node execution: {e}")
-
-            # Store in output history
-            execution_context["node_outputs"][node_id] = result
-            
-            # Broadcast node completion
-            if broadcaster: 
-                log_output = result.get("data") if isinstance(result, dict) and "data" in result else result
-                await broadcaster("node_end", node_id, {
-                    "output": str(log_output)[:1000],
-                    "status": "success" if not is_error else "error",
-                    "execution_time": node.metrics.get("execution_time", 0.0) if hasattr(node, "metrics") else 0.0
-                })
-            
-            # Handle Critical Failures (unless 'continue_on_fail' is set)
-            is_error = False
-            error_message = ""
-            
-            if isinstance(result, dict):
-                if result.get("status") == "error":
-                    is_error = True
-                    error_message = result.get("error", "Unknown error")
-                elif "error" in result:
-                    is_error = True
-                    error_message = result["error"]
-            
-            if is_error:
-                if not node_data.get("continue_on_fail"):
-                    error_msg = f"Stopped at {node_data.get('label')}: {error_message}"
-                    dlq.capture(execution_id, graph_data, error_msg, execution_context)
-                    
-                    # Log Failure
-                    from app.core.audit import audit_logger
-                    await audit_logger.log(
-                        action="workflow_fail",
-                        user_id=user_id,
-                        details={"execution_id": execution_id, "error": error_msg}
-                    )
-
-                    # UPDATE EXECUTION RECORD TO FAILED
-                    try:
-                        async with async_session() as db:
-                            from sqlmodel import select
-                            statement = select(Execution).where(Execution.id == execution_id)
-                            res = await db.execute(statement)
-                            exec_rec = res.scalar_one_or_none()
-                            if exec_rec:
-                                exec_rec.status = "failed"
-                                exec_rec.error = error_msg
-                                exec_rec.finished_at = datetime.utcnow()
-                                db.add(exec_rec)
-                                await db.commit()
-                    except Exception as e:
-                        print(f" Failed to update failed execution record: {e}")
-
-                    return error_msg
-
-            # --- TRAVERSAL ---
-            # Determine next node based on handle matching or sequential edge
-            next_edges = [e for e in edges if e['source'] == node_id]
-            next_edge = None
-            
-            # Priority: Handle-based routing
-            # 1. Check for explicit handle match (e.g. 'success', 'error', 'data')
-            if isinstance(result, dict):
-                # If we have a status, we might want to follow 'success' or 'error' edges
-                status = result.get("status")
-                
-                # Check for direct handle match in result keys
-                for edge in next_edges:
-                    handle = edge.get('sourceHandle')
-                    if handle and handle in result:
-                        next_edge = edge
-                        break
-                
-                # Special Logic: If status is success, follow 'success' handle if present
-                if not next_edge and status == "success":
-                     next_edge = next((e for e in next_edges if e.get('sourceHandle') == "success"), None)
-                
-                # Special Logic: If status is error (and we continued), follow 'error' handle
-                if not next_edge and status == "error":
-                     next_edge = next((e for e in next_edges if e.get('sourceHandle') == "error"), None)
-
-            # Fallback: First generic edge (no handle or handle='default')
-            if not next_edge:
-                next_edge = next((e for e in next_edges if not e.get('sourceHandle') or e.get('sourceHandle') in ["default", "output"]), None)
-
-            if not next_edge: break
-            
-            next_node_id = next_edge['target']
-            s_handle = next_edge.get('sourceHandle')
-            
-            # Prepare Input for Next Node
-            current_input = result
-            
-            if isinstance(result, dict):
-                # 1. Direct handle match logic
-                if s_handle and s_handle in result:
-                    current_input = result[s_handle]
-                # 2. 'data' extraction for standard flow
-                elif "data" in result and getattr(result, "status", None) != "error":
-                     current_input = result["data"]
-                # 3. Legacy error fallback
-                elif "error" in result:
-                     current_input = result["error"]
-
-            # Threshold for storage by reference (e.g., 50KB)
-            if isinstance(current_input, str) and len(current_input) > 50000:
-                print(f" Storing large output from {node_id} by reference.")
-                current_input = storage_manager.store(current_input)
-
-            # Resolve reference if input is a pointer
-            if storage_manager.is_reference(current_input):
-                 current_input = storage_manager.retrieve(current_input)
-
-            current_node = next((n for n in nodes if n['id'] == next_node_id), None)
-            if not current_node: break
-            
-        # Log Success
-        from app.core.audit import audit_logger
-        workflow_duration = time.time() - start_time
-        await audit_logger.log(
-            action="workflow_success",
-            user_id=user_id,
-            details={
-                "execution_id": execution_id, 
-                "duration": f"{workflow_duration:.2f}s"
-            }
-        )
-        
-        # Analytics: Track workflow completion
-        await analytics_tracker.track_workflow_execution(
-            user_id=user_id,
-            workspace_id=workspace_id,
-            workflow_id=workflow_id,
-            execution_id=execution_id,
-            status="completed",
-            duration=workflow_duration
-        )
+            # 4. Choose scheduling mode ('sequential' single-path walk or concurrent 'dag')
+            wf_settings = graph_data.get("settings") or {}
+            execution_mode = (context or {}).get("execution_mode") or wf_settings.get("execution_mode") or settings.DEFAULT_EXECUTION_MODE
+
+            if execution_mode == "dag":
+                max_concurrency = int((context or {}).get("max_concurrency") or wf_settings.get("max_concurrency") or settings.DAG_MAX_CONCURRENCY)
+                result, error_msg = await self._run_dag(plan, current_node, current_input, execution_context, broadcaster, context, max_concurrency)
+                if error_msg:
+                    return await self._fail_execution(execution_id, graph_data, error_msg, execution_context, user_id)
+            else:
+                # Long waits may park the run on a durable timer (queued runs only; see app.core.timers)
+                from app.core.timers import timer_service
+                execution_context["suspendable"] = bool(context and context.get("suspendable") and timer_service.enabled)
+                visited = set()
+                result = current_input
+
+                # Safety: Path limit
+                for _ in range(50):
+                    node_id = current_node['id']
+                    if node_id in visited: break
+                    visited.add(node_id)
+
+                    node_data = current_node.get('data', {})
+                    result, is_error, error_message = await self._run_hop(current_node, current_input, execution_context, broadcaster, context)
+
+                    if isinstance(result, dict) and result.get("status") == "suspended":
+                        outcome = await self._suspend_execution(current_node, current_input, result, execution_context, graph_data, message, broadcaster, context)
+                        suspended = True
+                        return outcome
+
+                    # Handle Critical Failures (unless 'continue_on_fail' is set)
+                    if is_error and not node_data.get("continue_on_fail"):
+                        error_msg = f"Stopped at {node_data.get('label')}: {error_message}"
+                        return await self._fail_execution(execution_id, graph_data, error_msg, execution_context, user_id)
+
+                    # --- TRAVERSAL ---
+                    # Determine next node based on handle matching or sequential edge
+                    next_edge = plan.resolve_next_edge(node_id, result)
+                    if not next_edge: break
+
+                    current_input = await self._prepare_edge_input(node_id, result, next_edge, execution_id)
+                    current_node = plan.get_node(next_edge['target'])
+                    if not current_node: break
+
+            # Log Success
+            from app.core.audit import audit_logger
+            workflow_duration = time.time() - start_time
+            await audit_logger.log(
+                action="workflow_success",
+                user_id=user_id,
+                details={
+                    "execution_id": execution_id, 
+                    "duration": f"{workflow_duration:.2f}s"
+                }
+            )
         
-        # UPDATE EXECUTION RECORD
-        try:
-            async with async_session() as db:
-                from sqlmodel import select
-                statement = select(Execution).where(Execution.id == execution_id)
-                results = await db.execute(statement)
-                exec_record = results.scalar_one_or_none()
-                if exec_record:
-                    exec_record.status = "completed"
-                    exec_record.output = {"result": str(result)}
-                    exec_record.duration = workflow_duration
-                    exec_record.finished_at = datetime.utcnow()
-                    db.add(exec_record)
-                    await db.commit()
-        except Exception as e:
-            print(f" Failed to update execution record: {e}")
+            # Analytics: Track workflow completion
+            await analytics_tracker.track_workflow_execution(
+                user_id=user_id,
+                workspace_id=workspace_id,
+                workflow_id=workflow_id,
+                execution_id=execution_id,
+                status="completed",
+                duration=workflow_duration
+            )
         
-        # RELEASE RATE LIMIT SLOT
-        await rate_limiter.release(user_id, workspace_id)
+            # UPDATE EXECUTION RECORD (final flush for this execution)
+            await execution_recorder.finish_execution(
+                execution_id,
+                status="completed",
+                output={"result": str(result)},
+                duration=workflow_duration,
+                finished_at=datetime.utcnow()
+            )
+
+            # RELEASE RATE LIMIT SLOT
+            await rate_limiter.release(user_id, workspace_id)
         
-        return str(result)
+            return str(result)
+        finally:
+            await self._release_execution(execution_id, keep_cursors=suspended)
 
 # Instantiate and export the engine
 engine = AgentEngine()
@@ -0,0 +1,228 @@
+import hashlib
+import orjson
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Tuple
+
+# Handles that act as the "generic" output of a node when no routing rule applies
+DEFAULT_HANDLES = ("default", "output")
+
+
+class ExecutionPlan:
+    """
+    Compiled, read-only view of a workflow graph.
+    Built once per workflow version so the engine can resolve nodes and
+    outgoing edges in O(1) instead of rescanning the node/edge lists per hop.
+    """
+
+    def __init__(self, graph_data: Dict[str, Any], definition_hash: str):
+        self.workflow_id: Optional[str] = graph_data.get("id")
+        self.definition_hash = definition_hash
+        self.nodes: List[Dict[str, Any]] = graph_data.get("nodes", []) or []
+        self.edges: List[Dict[str, Any]] = graph_data.get("edges", []) or []
+
+        # node_id -> node
+        self.node_map: Dict[str, Dict[str, Any]] = {}
+        # node_id -> outgoing edges (original order preserved)
+        self.edges_by_source: Dict[str, List[Dict[str, Any]]] = {}
+        # node_id -> incoming edges
+        self.edges_by_target: Dict[str, List[Dict[str, Any]]] = {}
+        # node_id -> [(sourceHandle, edge)] for edges that declare a handle
+        self.handle_routes: Dict[str, List[Tuple[str, Dict[str, Any]]]] = {}
+        # node_id -> {sourceHandle: first edge with that handle}
+        self.handle_index: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        # node_id -> first generic edge (no handle / 'default' / 'output')
+        self.default_routes: Dict[str, Optional[Dict[str, Any]]] = {}
+
+        self.entry_node_id: Optional[str] = None
+        self.validation: Optional[Tuple[bool, List[str]]] = None
+        # start node id -> DagLayout (memoized for DAG scheduling)
+        self._dag_layouts: Dict[str, "DagLayout"] = {}
+
+        self._compile()
+
+    def _compile(self):
+        for node in self.nodes:
+            node_id = node.get("id")
+            if node_id is None or node_id in self.node_map:
+                continue
+            self.node_map[node_id] = node
+            self.edges_by_source[node_id] = []
+            self.edges_by_target[node_id] = []
+            self.handle_routes[node_id] = []
+            self.handle_index[node_id] = {}
+            self.default_routes[node_id] = None
+
+        for edge in self.edges:
+            source = edge.get("source")
+            target = edge.get("target")
+            self.edges_by_source.setdefault(source, []).append(edge)
+            self.edges_by_target.setdefault(target, []).append(edge)
+
+            handle = edge.get("sourceHandle")
+            if handle:
+                self.handle_routes.setdefault(source, []).append((handle, edge))
+                self.handle_index.setdefault(source, {}).setdefault(handle, edge)
+            if (not handle or handle in DEFAULT_HANDLES) and self.default_routes.get(source) is None:
+                self.default_routes[source] = edge
+
+        # Entry point: first 'chatInput' node, otherwise the first node in the graph
+        entry = next((n for n in self.nodes if n.get("data", {}).get("id") == "chatInput"), None)
+        if entry is None and self.nodes:
+            entry = self.nodes[0]
+        self.entry_node_id = entry.get("id") if entry else None
+
+    def get_node(self, node_id: str) -> Optional[Dict[str, Any]]:
+        return self.node_map.get(node_id)
+
+    @property
+    def entry_node(self) -> Optional[Dict[str, Any]]:
+        return self.node_map.get(self.entry_node_id) if self.entry_node_id else None
+
+    def outgoing(self, node_id: str) -> List[Dict[str, Any]]:
+        return self.edges_by_source.get(node_id, [])
+
+    def incoming(self, node_id: str) -> List[Dict[str, Any]]:
+        return self.edges_by_target.get(node_id, [])
+
+    def resolve_next_edge(self, node_id: str, result: Any) -> Optional[Dict[str, Any]]:
+        """
+        Picks the edge to follow after `node_id` produced `result`.
+        Priority: handle present in the result keys, then 'success'/'error'
+        handles based on result status, then the first generic edge.
+        """
+        if isinstance(result, dict):
+            for handle, edge in self.handle_routes.get(node_id, ()):
+                if handle in result:
+                    return edge
+
+            status = result.get("status")
+            if status in ("success", "error"):
+                edge = self.handle_index.get(node_id, {}).get(status)
+                if edge:
+                    return edge
+
+        return self.default_routes.get(node_id)
+
+    def route_edges(self, node_id: str, result: Any, is_error: bool = False) -> List[Tuple[Dict[str, Any], bool]]:
+        """
+        Fan-out routing used by the DAG scheduler: returns every outgoing edge with
+        a flag telling whether it is activated by `result`.
+        Errors follow 'error' handles (or generic edges when none exist); otherwise
+        generic edges always fire and handled edges fire when their handle is a
+        result key or matches the result status.
+        """
+        outgoing = self.outgoing(node_id)
+        status = result.get("status") if isinstance(result, dict) else None
+
+        if is_error:
+            error_edges = [e for e in outgoing if e.get("sourceHandle") == "error"]
+            if error_edges:
+                return [(e, e in error_edges) for e in outgoing]
+            return [(e, not e.get("sourceHandle") or e.get("sourceHandle") in DEFAULT_HANDLES) for e in outgoing]
+
+        routed = []
+        for edge in outgoing:
+            handle = edge.get("sourceHandle")
+            if not handle or handle in DEFAULT_HANDLES:
+                routed.append((edge, True))
+            elif handle == "error":
+                routed.append((edge, False))
+            else:
+                routed.append((edge, isinstance(result, dict) and (handle in result or handle == status)))
+        return routed
+
+    def dag_layout(self, start_node_id: str) -> "DagLayout":
+        """Reachable sub-graph from `start_node_id` with in-degrees, memoized per start node."""
+        layout = self._dag_layouts.get(start_node_id)
+        if layout is None:
+            layout = DagLayout(self, start_node_id)
+            self._dag_layouts[start_node_id] = layout
+        return layout
+
+    def validate(self, validator) -> Tuple[bool, List[str]]:
+        """Runs graph validation once per plan and memoizes the outcome."""
+        if self.validation is None:
+            self.validation = validator.validate({"nodes": self.nodes, "edges": self.edges})
+        return self.validation
+
+
+class DagLayout:
+    """Static scheduling data for a DAG run starting at a given node."""
+    __slots__ = ("start_node_id", "reachable", "indegree", "edge_order")
+
+    def __init__(self, plan: ExecutionPlan, start_node_id: str):
+        self.start_node_id = start_node_id
+        self.reachable = set()
+        stack = [start_node_id]
+        while stack:
+            node_id = stack.pop()
+            if node_id in self.reachable or node_id not in plan.node_map:
+                continue
+            self.reachable.add(node_id)
+            stack.extend(e.get("target") for e in plan.outgoing(node_id))
+
+        # Only edges coming from reachable nodes can ever resolve
+        self.indegree: Dict[str, int] = {node_id: 0 for node_id in self.reachable}
+        # id(edge) -> position among the target's incoming edges (stable fan-in order)
+        self.edge_order: Dict[int, int] = {}
+        for node_id in self.reachable:
+            for position, edge in enumerate(plan.incoming(node_id)):
+                if edge.get("source") in self.reachable:
+                    self.indegree[node_id] += 1
+                    self.edge_order[id(edge)] = position
+        self.indegree[start_node_id] = 0
+
+
+class ExecutionPlanCache:
+    """
+    Process-wide LRU of compiled execution plans keyed by workflow id + definition hash.
+    Shared by the API, ARQ workers and the scheduler since they all run through the engine.
+    """
+
+    def __init__(self, max_size: int = 256):
+        self.max_size = max_size
+        self._plans: "OrderedDict[Tuple[str, str], ExecutionPlan]" = OrderedDict()
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    @staticmethod
+    def definition_hash(graph_data: Dict[str, Any]) -> str:
+        """Stable hash over the executable part of a definition (nodes + edges)."""
+        payload = orjson.dumps(
+            {"nodes": graph_data.get("nodes", []), "edges": graph_data.get("edges", [])},
+            option=orjson.OPT_SORT_KEYS,
+            default=str
+        )
+        return hashlib.sha256(payload).hexdigest()[:16]
+
+    def get_plan(self, graph_data: Dict[str, Any], definition_hash: Optional[str] = None) -> ExecutionPlan:
+        """Returns the cached plan for this definition, compiling it on first use."""
+        definition_hash = definition_hash or self.definition_hash(graph_data)
+        key = (str(graph_data.get("id") or "adhoc"), definition_hash)
+
+        plan = self._plans.get(key)
+        if plan is not None:
+            self._plans.move_to_end(key)
+            self.stats["hits"] += 1
+            return plan
+
+        self.stats["misses"] += 1
+        plan = ExecutionPlan(graph_data, definition_hash)
+        self._plans[key] = plan
+        if len(self._plans) > self.max_size:
+            self._plans.popitem(last=False)
+            self.stats["evictions"] += 1
+        return plan
+
+    def invalidate(self, workflow_id: Optional[str] = None):
+        """Drops all plans, or only the versions of a single workflow."""
+        if workflow_id is None:
+            self._plans.clear()
+            return
+        for key in [k for k in self._plans if k[0] == str(workflow_id)]:
+            del self._plans[key]
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {**self.stats, "size": len(self._plans), "max_size": self.max_size}
+
+
+plan_cache = ExecutionPlanCache()
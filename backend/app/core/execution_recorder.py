@@ -0,0 +1,187 @@
+import asyncio
+import time
+import orjson
+from typing import Any, Dict, List, Optional
+from sqlalchemy import update
+from app.core.config import settings
+from app.core.payload_store import LazyPayload
+from app.db.session import async_session
+from app.db.models import Execution, NodeExecution
+
+# JSON columns of Execution / NodeExecution
+JSON_FIELDS = ("input", "output")
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, LazyPayload):
+        return value.describe()
+    return str(value)
+
+
+def json_safe(value: Any) -> Any:
+    """Plain JSON value for a JSON column (payload handles become descriptors, other objects strings)."""
+    return orjson.loads(orjson.dumps(value, default=_json_default, option=orjson.OPT_NON_STR_KEYS))
+
+
+class ExecutionRecorder:
+    """
+    Write-behind persistence for Execution / NodeExecution records.
+    Node hops enqueue their records instead of committing one row per hop;
+    a background task flushes them in bulk on size or time thresholds and
+    whenever an execution finishes. The queue is bounded so a slow database
+    applies backpressure to the engine instead of growing memory.
+    """
+
+    def __init__(self):
+        self.queue: Optional[asyncio.Queue] = None
+        self.flush_task: Optional[asyncio.Task] = None
+        self.batch_size = settings.EXECUTION_RECORDER_BATCH_SIZE
+        self.flush_interval = settings.EXECUTION_RECORDER_FLUSH_INTERVAL
+        self.max_queue_size = settings.EXECUTION_RECORDER_QUEUE_SIZE
+        self.stats = {
+            "enqueued": 0,
+            "flushed": 0,
+            "flushes": 0,
+            "failed": 0
+        }
+
+    def _ensure_started(self):
+        """Lazily starts the flush loop on the running event loop."""
+        if self.flush_task and not self.flush_task.done():
+            return
+        self.queue = self.queue or asyncio.Queue(maxsize=self.max_queue_size)
+        self.flush_task = asyncio.create_task(self._flush_loop())
+
+    async def start(self):
+        """Starts the background flusher (called by API/worker startup)."""
+        self._ensure_started()
+        print(f" Execution Recorder started (batch: {self.batch_size}, interval: {self.flush_interval}s)")
+
+    async def stop(self):
+        """Stops the flusher after draining everything still buffered."""
+        if not self.flush_task:
+            return
+        await self.queue.put(("stop", None))
+        try:
+            await self.flush_task
+        except asyncio.CancelledError:
+            pass
+        self.flush_task = None
+        print(f" Execution Recorder stopped (flushed {self.stats['flushed']} records)")
+
+    async def _enqueue(self, item: tuple):
+        self._ensure_started()
+        # Blocks when the queue is full -> backpressure on the producing execution
+        await self.queue.put(item)
+        self.stats["enqueued"] += 1
+
+    @staticmethod
+    def _serialize(record: Any) -> Any:
+        # Serialized now so one odd node output can't push a whole batch into the row-by-row fallback
+        for field in JSON_FIELDS:
+            setattr(record, field, json_safe(getattr(record, field)))
+        return record
+
+    async def start_execution(self, record: Execution):
+        """Buffers the initial Execution row."""
+        await self._enqueue(("insert", self._serialize(record)))
+
+    async def record_node(self, record: NodeExecution):
+        """Buffers a NodeExecution row for the next bulk flush."""
+        await self._enqueue(("insert", self._serialize(record)))
+
+    async def update_execution(self, execution_id: str, **values: Any):
+        """Buffers an Execution update for the next bulk flush (e.g. a resumed run going back to running)."""
+        values = {k: json_safe(v) if k in JSON_FIELDS else v for k, v in values.items()}
+        await self._enqueue(("update", (execution_id, values)))
+
+    async def finish_execution(self, execution_id: str, **values: Any):
+        """Buffers the final Execution update and forces a flush of everything pending."""
+        values = {k: json_safe(v) if k in JSON_FIELDS else v for k, v in values.items()}
+        await self._enqueue(("update", (execution_id, values)))
+        await self._enqueue(("flush", None))
+
+    async def _flush_loop(self):
+        inserts: List[Any] = []
+        updates: List[tuple] = []
+        deadline = time.monotonic() + self.flush_interval
+
+        while True:
+            timeout = max(0.0, deadline - time.monotonic())
+            try:
+                kind, payload = await asyncio.wait_for(self.queue.get(), timeout=timeout)
+            except asyncio.TimeoutError:
+                kind, payload = "flush", None
+            except asyncio.CancelledError:
+                # Crash-safe: persist whatever is buffered or still queued before going away
+                while not self.queue.empty():
+                    kind, payload = self.queue.get_nowait()
+                    if kind == "insert":
+                        inserts.append(payload)
+                    elif kind == "update":
+                        updates.append(payload)
+                await self._write(inserts, updates)
+                raise
+
+            if kind == "insert":
+                inserts.append(payload)
+            elif kind == "update":
+                updates.append(payload)
+
+            pending = len(inserts) + len(updates)
+            if kind in ("flush", "stop") or pending >= self.batch_size:
+                if pending:
+                    await self._write(inserts, updates)
+                    inserts, updates = [], []
+                deadline = time.monotonic() + self.flush_interval
+
+            if kind == "stop":
+                return
+
+    async def _write(self, inserts: List[Any], updates: List[tuple]):
+        """Writes one batch in a single transaction, falling back to row-by-row on failure."""
+        if not inserts and not updates:
+            return
+        try:
+            async with async_session() as session:
+                session.add_all(inserts)
+                await session.flush()
+                for execution_id, values in updates:
+                    await session.execute(update(Execution).where(Execution.id == execution_id).values(**values))
+                await session.commit()
+            self.stats["flushed"] += len(inserts) + len(updates)
+            self.stats["flushes"] += 1
+        except Exception as e:
+            print(f" Execution Recorder bulk flush failed ({len(inserts)} rows): {e}. Retrying row by row.")
+            await self._write_individually(inserts, updates)
+
+    async def _write_individually(self, inserts: List[Any], updates: List[tuple]):
+        for record in inserts:
+            try:
+                async with async_session() as session:
+                    session.add(record)
+                    await session.commit()
+                self.stats["flushed"] += 1
+            except Exception as e:
+                self.stats["failed"] += 1
+                print(f" Failed to persist {type(record).__name__}: {e}")
+
+        for execution_id, values in updates:
+            try:
+                async with async_session() as session:
+                    await session.execute(update(Execution).where(Execution.id == execution_id).values(**values))
+                    await session.commit()
+                self.stats["flushed"] += 1
+            except Exception as e:
+                self.stats["failed"] += 1
+                print(f" Failed to update execution record {execution_id}: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "queued": self.queue.qsize() if self.queue else 0,
+            "running": bool(self.flush_task and not self.flush_task.done())
+        }
+
+
+execution_recorder = ExecutionRecorder()
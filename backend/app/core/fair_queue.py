@@ -0,0 +1,400 @@
+import asyncio
+import time
+import uuid
+import orjson
+import redis.asyncio as aioredis
+from arq.constants import in_progress_key_prefix
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+from app.core.config import settings
+from app.core.tier_manager import tier_manager
+
+LEADER_KEY = "fairq:dispatcher"
+TARGETS_KEY = "fairq:targets"  # ARQ queues that have fair sub-queues
+ACTIVE_KEY = "fairq:active:{}:{}"  # target queue, lane -> set of tenants with pending jobs
+QUEUE_KEY = "fairq:q:{}:{}:{}"  # target queue, lane, tenant -> list of jobs
+WEIGHTS_KEY = "fairq:weights"  # tenant -> DRR weight (from its tier)
+DEDUP_KEY = "fairq:dedup:{}"
+
+# Served in this order: interactive runs before bulk (webhook/schedule) traffic
+LANES = ("interactive", "bulk")
+
+# KEYS: tenant queue, active set, weights hash, targets set, dedup key
+# ARGV: job, tenant, weight, target queue, dedup ttl ('' = no dedup)
+SUBMIT_SCRIPT = """
+if ARGV[5] ~= '' then
+    if not redis.call('SET', KEYS[5], '1', 'NX', 'EX', ARGV[5]) then
+        return 0
+    end
+end
+redis.call('RPUSH', KEYS[1], ARGV[1])
+redis.call('SADD', KEYS[2], ARGV[2])
+redis.call('HSET', KEYS[3], ARGV[2], ARGV[3])
+redis.call('SADD', KEYS[4], ARGV[4])
+return 1
+"""
+
+# Pops up to ARGV[1] jobs; a drained tenant leaves the active set atomically with the pop
+# KEYS: tenant queue, active set
+# ARGV: count, tenant
+POP_SCRIPT = """
+local jobs = redis.call('LPOP', KEYS[1], ARGV[1])
+if redis.call('LLEN', KEYS[1]) == 0 then
+    redis.call('SREM', KEYS[2], ARGV[2])
+end
+return jobs or {}
+"""
+
+# Jobs of an ARQ queue that are due and not picked up yet. ARQ keeps a job in the
+# queue zset until it finishes and marks running jobs with an in-progress key
+# (read by name here, so single-instance Redis only, like ARQ itself).
+# KEYS: ARQ queue zset
+# ARGV: now (ms, ARQ's score unit), in-progress key prefix
+READY_COUNT_SCRIPT = """
+local ready = 0
+for _, job_id in ipairs(redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1])) do
+    if redis.call('EXISTS', ARGV[2] .. job_id) == 0 then
+        ready = ready + 1
+    end
+end
+return ready
+"""
+
+RENEW_LEASE_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('PEXPIRE', KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+RELEASE_LEASE_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+def _text(value: Any) -> str:
+    return value.decode() if isinstance(value, bytes) else value
+
+
+def tenant_key(workspace_id: Optional[str], user_id: Optional[str] = None) -> str:
+    """Fair-share unit: the workspace, or the user for runs without one."""
+    if workspace_id:
+        return workspace_id
+    return f"user:{user_id}" if user_id else "anonymous"
+
+
+class FairQueue:
+    """
+    Weighted fair-share dispatcher in front of the ARQ queues.
+    Producers submit jobs into a Redis sub-queue per tenant (workspace) and
+    lane; one dispatcher (Redis leader lease, run by the workers) keeps only
+    FAIR_QUEUE_READY_JOBS jobs waiting in each ARQ queue (running jobs don't
+    count) and refills it with weighted
+    deficit round robin over the tenants, using the tier's queue_weight from
+    TierManager.TIERS. The interactive lane (/run/async, resume) is drained
+    before the bulk lane (webhooks, schedules), so a tenant bursting 50k
+    webhook jobs only ever holds its share of the ready queue.
+    Without Redis, or with FAIR_QUEUE_ENABLED off, jobs go straight to ARQ.
+    """
+
+    def __init__(self):
+        self.redis: Optional[aioredis.Redis] = None
+        self.arq_pool = None
+        self.instance_id = str(uuid.uuid4())
+        self.running = False
+        self.is_leader = False
+        self.dispatch_task: Optional[asyncio.Task] = None
+        # (target, lane) -> tenant round-robin order; (target, lane, tenant) -> deficit
+        self._rounds: Dict[Tuple[str, str], Deque[str]] = {}
+        self._deficits: Dict[Tuple[str, str, str], float] = {}
+        self.stats = {
+            "submitted": 0,
+            "duplicates": 0,
+            "dispatched": 0,
+            "direct": 0,
+            "requeued": 0
+        }
+
+    async def init_redis(self, redis_client: aioredis.Redis, arq_pool=None):
+        """Initialize with the app's Redis instance and the ARQ pool jobs are dispatched to."""
+        self.redis = redis_client
+        self.arq_pool = arq_pool
+        self._submit = redis_client.register_script(SUBMIT_SCRIPT)
+        self._pop = redis_client.register_script(POP_SCRIPT)
+        self._ready_count = redis_client.register_script(READY_COUNT_SCRIPT)
+        self._renew_script = redis_client.register_script(RENEW_LEASE_SCRIPT)
+        self._release_script = redis_client.register_script(RELEASE_LEASE_SCRIPT)
+
+    @property
+    def enabled(self) -> bool:
+        return settings.FAIR_QUEUE_ENABLED and self.redis is not None
+
+    # --- Producers ---
+
+    async def submit(
+        self,
+        function: str,
+        kwargs: Dict[str, Any],
+        workspace_id: Optional[str] = None,
+        user_id: Optional[str] = None,
+        tier: str = "free",
+        lane: str = "interactive",
+        queue_name: str = "default",
+        job_id: Optional[str] = None
+    ) -> bool:
+        """
+        Queues an ARQ job behind the tenant's fair share.
+        `job_id` deduplicates like ARQ's _job_id. Returns False for a duplicate.
+        """
+        if lane not in LANES:
+            raise ValueError(f"Unknown lane '{lane}' (use one of {', '.join(LANES)})")
+
+        if not self.enabled:
+            self.stats["direct"] += 1
+            extra = {"_job_id": job_id} if job_id else {}
+            job = await self.arq_pool.enqueue_job(function, **kwargs, _queue_name=queue_name, **extra)
+            return job is not None
+
+        tenant = tenant_key(workspace_id, user_id)
+        job = orjson.dumps({
+            "function": function,
+            "kwargs": kwargs,
+            "job_id": job_id,
+            "tenant": tenant,
+            "submitted_at": time.time()
+        }, default=str)
+        submitted = await self._submit(
+            keys=[
+                QUEUE_KEY.format(queue_name, lane, tenant),
+                ACTIVE_KEY.format(queue_name, lane),
+                WEIGHTS_KEY,
+                TARGETS_KEY,
+                DEDUP_KEY.format(job_id)
+            ],
+            args=[job, tenant, tier_manager.get_queue_weight(tier), queue_name, settings.FAIR_QUEUE_DEDUP_TTL if job_id else ""]
+        )
+        if not submitted:
+            self.stats["duplicates"] += 1
+            return False
+        self.stats["submitted"] += 1
+        return True
+
+    # --- Dispatcher ---
+
+    async def start(self):
+        """Starts the dispatcher loop (every worker runs it; only the lease holder dispatches)."""
+        if not self.enabled or self.arq_pool is None or self.running:
+            return
+        self.running = True
+        self.dispatch_task = asyncio.create_task(self._dispatch_loop())
+        print(f" Fair queue dispatcher started (ready jobs per queue: {settings.FAIR_QUEUE_READY_JOBS})")
+
+    async def stop(self):
+        self.running = False
+        if self.dispatch_task:
+            self.dispatch_task.cancel()
+            try:
+                await self.dispatch_task
+            except asyncio.CancelledError:
+                pass
+            self.dispatch_task = None
+        if self.is_leader:
+            try:
+                await self._release_script(keys=[LEADER_KEY], args=[self.instance_id])
+            except Exception:
+                pass
+        self.is_leader = False
+
+    async def _hold_lease(self) -> bool:
+        ttl_ms = int(settings.FAIR_QUEUE_LEASE_TTL * 1000)
+        if self.is_leader and await self._renew_script(keys=[LEADER_KEY], args=[self.instance_id, ttl_ms]):
+            return True
+        return bool(await self.redis.set(LEADER_KEY, self.instance_id, nx=True, px=ttl_ms))
+
+    async def _dispatch_loop(self):
+        last_renewal = 0.0
+        while self.running:
+            dispatched = 0
+            try:
+                now = time.monotonic()
+                if now - last_renewal >= settings.FAIR_QUEUE_LEASE_TTL / 3:
+                    leader = await self._hold_lease()
+                    last_renewal = now
+                    if leader != self.is_leader:
+                        # Deficits only make sense to the instance that accrued them
+                        self._rounds.clear()
+                        self._deficits.clear()
+                    self.is_leader = leader
+                if self.is_leader:
+                    dispatched = await self.dispatch_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f" Fair queue dispatch error: {e}")
+            if not dispatched:
+                await asyncio.sleep(settings.FAIR_QUEUE_POLL_INTERVAL)
+
+    async def dispatch_once(self) -> int:
+        """Tops up every ARQ queue to FAIR_QUEUE_READY_JOBS waiting jobs. Returns the number of jobs moved."""
+        targets = [_text(t) for t in await self.redis.smembers(TARGETS_KEY)]
+        if not targets:
+            return 0
+
+        pipe = self.redis.pipeline(transaction=False)
+        for target in targets:
+            self._queue_ready(target, pipe)
+            for lane in LANES:
+                pipe.smembers(ACTIVE_KEY.format(target, lane))
+        replies = await pipe.execute()
+
+        dispatched = 0
+        step = 1 + len(LANES)
+        for i, target in enumerate(targets):
+            ready = replies[i * step]
+            budget = settings.FAIR_QUEUE_READY_JOBS - ready
+            for j, lane in enumerate(LANES):
+                if budget <= 0:
+                    break
+                tenants = [_text(t) for t in replies[i * step + 1 + j]]
+                if not tenants:
+                    self._rounds.pop((target, lane), None)
+                    continue
+                moved = await self._dispatch_lane(target, lane, tenants, budget)
+                budget -= moved
+                dispatched += moved
+        return dispatched
+
+    def _queue_ready(self, target: str, pipe):
+        """Queues the count of waiting (not running or deferred) jobs of an ARQ queue on `pipe`."""
+        self._ready_count(keys=[target], args=[int(time.time() * 1000), in_progress_key_prefix], client=pipe)
+
+    async def _dispatch_lane(self, target: str, lane: str, tenants: List[str], budget: int) -> int:
+        pipe = self.redis.pipeline(transaction=False)
+        for tenant in tenants:
+            pipe.llen(QUEUE_KEY.format(target, lane, tenant))
+        pipe.hmget(WEIGHTS_KEY, tenants)
+        *lengths, weights = await pipe.execute()
+        backlog = dict(zip(tenants, lengths))
+        weights = {t: max(float(w or 1), 1.0) for t, w in zip(tenants, weights)}
+
+        picks = self._plan(target, lane, backlog, weights, budget)
+        if not picks:
+            return 0
+
+        pipe = self.redis.pipeline(transaction=False)
+        for tenant, count in picks.items():
+            self._pop(keys=[QUEUE_KEY.format(target, lane, tenant), ACTIVE_KEY.format(target, lane)], args=[count, tenant], client=pipe)
+        popped = await pipe.execute()
+
+        moved = 0
+        now = time.time()
+        from app.core.analytics import analytics_tracker
+        for tenant, jobs in zip(picks, popped):
+            for raw in jobs:
+                job = orjson.loads(raw)
+                extra = {"_job_id": job["job_id"]} if job.get("job_id") else {}
+                try:
+                    await self.arq_pool.enqueue_job(job["function"], **job["kwargs"], _queue_name=target, **extra)
+                except Exception as e:
+                    # Back to the head of its sub-queue; retried on the next pass
+                    print(f" Fair queue: enqueue to '{target}' failed, requeueing: {e}")
+                    await self.redis.lpush(QUEUE_KEY.format(target, lane, tenant), raw)
+                    await self.redis.sadd(ACTIVE_KEY.format(target, lane), tenant)
+                    self.stats["requeued"] += 1
+                    continue
+                moved += 1
+                analytics_tracker.track_queue_wait(tenant, now - job["submitted_at"])
+        self.stats["dispatched"] += moved
+        return moved
+
+    def _plan(self, target: str, lane: str, backlog: Dict[str, int], weights: Dict[str, float], budget: int) -> Dict[str, int]:
+        """
+        Deficit round robin: each visit credits a tenant its weight in jobs; the
+        turn passes on once the credit is spent. The round order and leftover
+        deficits persist across passes, so a tenant interrupted by a full ready
+        queue resumes its turn next time.
+        """
+        order = self._rounds.setdefault((target, lane), deque())
+        known = set(order)
+        for tenant in backlog:
+            if tenant not in known:
+                order.append(tenant)
+        for tenant in [t for t in order if t not in backlog]:
+            order.remove(tenant)
+            self._deficits.pop((target, lane, tenant), None)
+
+        picks: Dict[str, int] = {}
+        remaining = dict(backlog)
+        while budget > 0 and order and any(remaining.values()):
+            tenant = order[0]
+            key = (target, lane, tenant)
+            if remaining[tenant] <= 0:
+                self._deficits.pop(key, None)
+                order.rotate(-1)
+                continue
+            deficit = self._deficits.get(key, 0.0)
+            if deficit < 1:
+                deficit += weights.get(tenant, 1.0)
+            count = min(int(deficit), remaining[tenant], budget)
+            picks[tenant] = picks.get(tenant, 0) + count
+            remaining[tenant] -= count
+            budget -= count
+            deficit -= count
+            if remaining[tenant] <= 0:
+                # An emptied queue does not bank credit (standard DRR)
+                deficit = 0.0
+            self._deficits[key] = deficit
+            if deficit < 1:
+                order.rotate(-1)
+        return picks
+
+    # --- Metrics ---
+
+    async def get_stats(self) -> Dict[str, Any]:
+        """Per target queue: ready depth, and per lane and tenant: backlog and head-of-line wait."""
+        if not self.enabled:
+            return {"enabled": False, **self.stats}
+
+        targets = sorted(_text(t) for t in await self.redis.smembers(TARGETS_KEY))
+        pipe = self.redis.pipeline(transaction=False)
+        for target in targets:
+            self._queue_ready(target, pipe)
+            for lane in LANES:
+                pipe.smembers(ACTIVE_KEY.format(target, lane))
+        replies = await pipe.execute()
+
+        layout = []
+        pipe = self.redis.pipeline(transaction=False)
+        step = 1 + len(LANES)
+        for i, target in enumerate(targets):
+            for j, lane in enumerate(LANES):
+                for tenant in sorted(_text(t) for t in replies[i * step + 1 + j]):
+                    key = QUEUE_KEY.format(target, lane, tenant)
+                    pipe.llen(key)
+                    pipe.lindex(key, 0)
+                    layout.append((target, lane, tenant))
+        details = await pipe.execute() if layout else []
+
+        now = time.time()
+        queues = {
+            target: {"ready": replies[i * step], "pending": 0, "lanes": {lane: {} for lane in LANES}}
+            for i, target in enumerate(targets)
+        }
+        for k, (target, lane, tenant) in enumerate(layout):
+            depth, head = details[2 * k], details[2 * k + 1]
+            oldest_wait = round(now - orjson.loads(head)["submitted_at"], 3) if head else 0.0
+            queues[target]["lanes"][lane][tenant] = {"depth": depth, "oldest_wait": oldest_wait}
+            queues[target]["pending"] += depth
+
+        return {
+            "enabled": True,
+            "leader": self.is_leader,
+            "queues": queues,
+            **self.stats
+        }
+
+
+fair_queue = FairQueue()
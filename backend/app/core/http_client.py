@@ -0,0 +1,329 @@
+import asyncio
+import time
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+from typing import Any, Dict, Optional
+import aiohttp
+from yarl import URL
+import httpx
+from app.core.config import settings
+
+try:
+    import h2  # noqa: F401 - enables HTTP/2 in httpx
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+
+class HostLimiter:
+    """Per-host concurrency caps (HTTP_HOST_LIMITS overrides HTTP_POOL_MAX_PER_HOST)."""
+
+    def __init__(self):
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+
+    def limit_for(self, host: str) -> int:
+        return int(settings.HTTP_HOST_LIMITS.get(host, settings.HTTP_POOL_MAX_PER_HOST))
+
+    def semaphore(self, host: str) -> asyncio.Semaphore:
+        sem = self._semaphores.get(host)
+        if sem is None:
+            sem = asyncio.Semaphore(self.limit_for(host))
+            self._semaphores[host] = sem
+        return sem
+
+
+class _HostTimeoutSession:
+    """
+    View of the shared aiohttp session that applies HTTP_HOST_TIMEOUTS to
+    requests made without an explicit `timeout` (aiohttp has no per-host hook).
+    """
+
+    def __init__(self, session: aiohttp.ClientSession):
+        self._session = session
+
+    def request(self, method: str, url, **kwargs):
+        if "timeout" not in kwargs and settings.HTTP_HOST_TIMEOUTS:
+            host = URL(url).host if isinstance(url, str) else url.host
+            timeout = settings.HTTP_HOST_TIMEOUTS.get(host)
+            if timeout:
+                kwargs["timeout"] = aiohttp.ClientTimeout(total=timeout)
+        return self._session.request(method, url, **kwargs)
+
+    def get(self, url, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request("POST", url, **kwargs)
+
+    def put(self, url, **kwargs):
+        return self.request("PUT", url, **kwargs)
+
+    def patch(self, url, **kwargs):
+        return self.request("PATCH", url, **kwargs)
+
+    def delete(self, url, **kwargs):
+        return self.request("DELETE", url, **kwargs)
+
+    def head(self, url, **kwargs):
+        return self.request("HEAD", url, **kwargs)
+
+    def options(self, url, **kwargs):
+        return self.request("OPTIONS", url, **kwargs)
+
+    def __getattr__(self, name: str):
+        return getattr(self._session, name)
+
+
+class _PooledTransport(httpx.AsyncBaseTransport):
+    """
+    Wraps the httpx connection pool to apply per-host limits/timeouts and to
+    count new vs. reused connections through httpcore trace events.
+    """
+
+    def __init__(self, inner: httpx.AsyncHTTPTransport, manager: "HttpClientManager"):
+        self.inner = inner
+        self.manager = manager
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        host = request.url.host
+        stats = self.manager.host_stats[host]
+        timeout = settings.HTTP_HOST_TIMEOUTS.get(host)
+        if timeout:
+            request.extensions["timeout"] = {"connect": timeout, "read": timeout, "write": timeout, "pool": timeout}
+
+        async def trace(event_name: str, info: Dict[str, Any]):
+            if event_name == "connection.connect_tcp.complete":
+                stats["new_connections"] += 1
+
+        request.extensions["trace"] = trace
+
+        sem = self.manager.limiter.semaphore(host)
+        await sem.acquire()
+        stats["requests"] += 1
+        stats["in_flight"] += 1
+        try:
+            response = await self.inner.handle_async_request(request)
+        except BaseException:
+            stats["in_flight"] -= 1
+            stats["errors"] += 1
+            sem.release()
+            raise
+
+        # Hold the host slot until the body is consumed/closed
+        stream = response.stream
+        released = False
+
+        async def release():
+            nonlocal released
+            if not released:
+                released = True
+                stats["in_flight"] -= 1
+                sem.release()
+
+        class _ReleasingStream(httpx.AsyncByteStream):
+            async def __aiter__(self):
+                async for chunk in stream:
+                    yield chunk
+
+            async def aclose(self):
+                try:
+                    await stream.aclose()
+                finally:
+                    await release()
+
+        response.stream = _ReleasingStream()
+        return response
+
+    async def aclose(self):
+        await self.inner.aclose()
+
+
+class HttpClientManager:
+    """
+    Process-wide pooled HTTP clients for integration nodes.
+    One aiohttp session and one httpx client per process keep connections
+    alive per host (HTTP/2 for httpx when `h2` is installed), cache DNS,
+    cap concurrency per host and track pool utilisation / connection reuse.
+    Cookies are never stored, since sessions are shared between workflows and tenants.
+    """
+
+    def __init__(self):
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._httpx: Optional[httpx.AsyncClient] = None
+        self._lock: Optional[asyncio.Lock] = None
+        self.limiter = HostLimiter()
+        self.host_stats: Dict[str, Dict[str, int]] = defaultdict(lambda: {
+            "requests": 0,
+            "new_connections": 0,
+            "in_flight": 0,
+            "errors": 0
+        })
+        self.started_at: Optional[float] = None
+
+    async def start(self):
+        """Creates the pools eagerly (called by API/worker startup)."""
+        await self.get_session()
+        await self.get_httpx_client()
+        print(f" HTTP client pool started (max: {settings.HTTP_POOL_MAX_CONNECTIONS}, per host: {settings.HTTP_POOL_MAX_PER_HOST}, http2: {HTTP2_AVAILABLE})")
+
+    async def close(self):
+        """Closes pooled connections (called by API/worker shutdown)."""
+        if self._session and not self._session.closed:
+            await self._session.close()
+        if self._httpx and not self._httpx.is_closed:
+            await self._httpx.aclose()
+        self._session = None
+        self._httpx = None
+        print(" HTTP client pool closed")
+
+    def _get_lock(self) -> asyncio.Lock:
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        return self._lock
+
+    def _trace_config(self) -> aiohttp.TraceConfig:
+        trace = aiohttp.TraceConfig()
+
+        async def on_request_start(session, ctx, params):
+            ctx.host = params.url.host
+            ctx.semaphore = self.limiter.semaphore(ctx.host)
+            await ctx.semaphore.acquire()
+            stats = self.host_stats[ctx.host]
+            stats["requests"] += 1
+            stats["in_flight"] += 1
+
+        async def on_request_done(session, ctx, params):
+            if getattr(ctx, "semaphore", None):
+                self.host_stats[ctx.host]["in_flight"] -= 1
+                ctx.semaphore.release()
+                ctx.semaphore = None
+
+        async def on_request_exception(session, ctx, params):
+            if getattr(ctx, "host", None):
+                self.host_stats[ctx.host]["errors"] += 1
+            await on_request_done(session, ctx, params)
+
+        async def on_connection_create_end(session, ctx, params):
+            if getattr(ctx, "host", None):
+                self.host_stats[ctx.host]["new_connections"] += 1
+
+        trace.on_request_start.append(on_request_start)
+        trace.on_request_end.append(on_request_done)
+        trace.on_request_exception.append(on_request_exception)
+        trace.on_connection_create_end.append(on_connection_create_end)
+        return trace
+
+    async def get_session(self) -> aiohttp.ClientSession:
+        """Shared aiohttp session (created on first use in the running loop)."""
+        if self._session and not self._session.closed:
+            return self._session
+        async with self._get_lock():
+            if self._session is None or self._session.closed:
+                connector = aiohttp.TCPConnector(
+                    limit=settings.HTTP_POOL_MAX_CONNECTIONS,
+                    limit_per_host=settings.HTTP_POOL_MAX_PER_HOST,
+                    ttl_dns_cache=settings.HTTP_DNS_CACHE_TTL,
+                    use_dns_cache=True,
+                    keepalive_timeout=settings.HTTP_KEEPALIVE_TIMEOUT,
+                    enable_cleanup_closed=True
+                )
+                self._session = aiohttp.ClientSession(
+                    connector=connector,
+                    timeout=aiohttp.ClientTimeout(total=settings.HTTP_DEFAULT_TIMEOUT),
+                    cookie_jar=aiohttp.DummyCookieJar(),
+                    trace_configs=[self._trace_config()]
+                )
+                self.started_at = self.started_at or time.time()
+        return self._session
+
+    async def get_httpx_client(self) -> httpx.AsyncClient:
+        """Shared httpx client (HTTP/2 when available)."""
+        if self._httpx and not self._httpx.is_closed:
+            return self._httpx
+        async with self._get_lock():
+            if self._httpx is None or self._httpx.is_closed:
+                limits = httpx.Limits(
+                    max_connections=settings.HTTP_POOL_MAX_CONNECTIONS,
+                    max_keepalive_connections=settings.HTTP_POOL_MAX_CONNECTIONS,
+                    keepalive_expiry=settings.HTTP_KEEPALIVE_TIMEOUT
+                )
+                inner = httpx.AsyncHTTPTransport(http2=HTTP2_AVAILABLE, limits=limits, retries=0)
+                self._httpx = httpx.AsyncClient(
+                    transport=_PooledTransport(inner, self),
+                    timeout=settings.HTTP_DEFAULT_TIMEOUT,
+                    # Reject every cookie: the client is shared across tenants
+                    cookies=CookieJar(policy=DefaultCookiePolicy(allowed_domains=[]))
+                )
+                self.started_at = self.started_at or time.time()
+        return self._httpx
+
+    @asynccontextmanager
+    async def session(self):
+        """
+        Drop-in for `async with aiohttp.ClientSession() as session:` that
+        yields the shared session without closing it on exit
+        (with HTTP_HOST_TIMEOUTS applied).
+        """
+        yield _HostTimeoutSession(await self.get_session())
+
+    @asynccontextmanager
+    async def httpx_client(self):
+        """Drop-in for `async with httpx.AsyncClient() as client:` using the shared pool."""
+        yield await self.get_httpx_client()
+
+    def _pool_stats(self) -> Dict[str, Any]:
+        pool = {"aiohttp": {}, "httpx": {}}
+        try:
+            if self._session and not self._session.closed:
+                connector = self._session.connector
+                pool["aiohttp"] = {
+                    "limit": connector.limit,
+                    "limit_per_host": connector.limit_per_host,
+                    "active": len(connector._acquired),
+                    "idle": sum(len(conns) for conns in connector._conns.values())
+                }
+        except Exception:
+            pass
+        try:
+            if self._httpx and not self._httpx.is_closed:
+                connections = self._httpx._transport.inner._pool.connections
+                idle = sum(1 for c in connections if c.is_idle())
+                pool["httpx"] = {
+                    "limit": settings.HTTP_POOL_MAX_CONNECTIONS,
+                    "active": len(connections) - idle,
+                    "idle": idle,
+                    "http2": HTTP2_AVAILABLE
+                }
+        except Exception:
+            pass
+        return pool
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Pool utilisation plus per-host request and connection reuse counters."""
+        hosts = {}
+        total_requests = total_new = 0
+        for host, stats in self.host_stats.items():
+            reused = max(0, stats["requests"] - stats["new_connections"])
+            hosts[host] = {
+                **stats,
+                "reused_connections": reused,
+                "reuse_rate": round(reused / stats["requests"] * 100, 2) if stats["requests"] else 0,
+                "limit": self.limiter.limit_for(host)
+            }
+            total_requests += stats["requests"]
+            total_new += stats["new_connections"]
+
+        total_reused = max(0, total_requests - total_new)
+        return {
+            "requests": total_requests,
+            "new_connections": total_new,
+            "reused_connections": total_reused,
+            "reuse_rate": round(total_reused / total_requests * 100, 2) if total_requests else 0,
+            "pool": self._pool_stats(),
+            "hosts": hosts,
+            "uptime": round(time.time() - self.started_at, 1) if self.started_at else 0
+        }
+
+
+http_client = HttpClientManager()
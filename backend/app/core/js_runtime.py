@@ -0,0 +1,206 @@
+import asyncio
+import os
+import shutil
+import struct
+from typing import Any, Dict, Optional, Set
+import orjson
+from app.core.config import settings
+
+WORKER_SCRIPT = os.path.join(os.path.dirname(__file__), "js_runtime_worker.js")
+HEADER = struct.Struct(">I")
+# Replies start with a marker so output written around the protocol is caught at once
+REPLY_HEADER = struct.Struct(">4sI")
+REPLY_MARKER = b"JSRT"
+
+
+class _BadFrame(Exception):
+    """The worker's stdout no longer carries protocol frames (the script wrote to it directly)."""
+
+
+class _NodeWorker:
+    """A pre-started `node` process running js_runtime_worker.js (one task, then it exits)."""
+
+    def __init__(self, process: asyncio.subprocess.Process):
+        self.process = process
+
+    @property
+    def alive(self) -> bool:
+        return self.process.returncode is None
+
+    def kill(self):
+        if self.alive:
+            try:
+                self.process.kill()
+            except ProcessLookupError:
+                pass
+
+
+class NodeRuntimePool:
+    """
+    Pool of warm Node.js processes for the JavaScript Code node.
+    Processes are started ahead of time and each runs exactly one task (sent
+    as length-prefixed JSON over stdio), so a call skips the node startup
+    while scripts from different executions and workspaces never share a
+    process: a vm context alone does not isolate them. A used, timed-out or
+    crashed process is replaced in the background. Processes are capped by
+    --max-old-space-size.
+    """
+
+    def __init__(self):
+        self.size = settings.JS_RUNTIME_POOL_SIZE
+        self._idle: Optional[asyncio.Queue] = None
+        self._count = 0
+        self.running = False
+        self._next_id = 0
+        # Background reap-and-respawn tasks, awaited by stop() so no process outlives the pool
+        self._replenishing: Set[asyncio.Task] = set()
+        self.stats = {
+            "tasks": 0,
+            "spawned": 0,
+            "recycled": 0,
+            "timeouts": 0,
+            "crashes": 0,
+            "bad_frames": 0
+        }
+
+    def available(self) -> bool:
+        return shutil.which(settings.JS_RUNTIME_NODE_BINARY) is not None
+
+    def _queue(self) -> asyncio.Queue:
+        if self._idle is None:
+            self._idle = asyncio.Queue()
+        return self._idle
+
+    async def _spawn(self) -> _NodeWorker:
+        # Reserve the slot first so concurrent callers never over-spawn
+        self._count += 1
+        try:
+            process = await asyncio.create_subprocess_exec(
+                settings.JS_RUNTIME_NODE_BINARY,
+                f"--max-old-space-size={settings.JS_RUNTIME_MEMORY_LIMIT_MB}",
+                WORKER_SCRIPT,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE
+            )
+        except BaseException:
+            self._count -= 1
+            raise
+        self.stats["spawned"] += 1
+        return _NodeWorker(process)
+
+    async def start(self):
+        """Starts the pool (called by API/worker startup); a no-op without Node.js."""
+        if not self.available():
+            print(f" JS runtime pool disabled: '{settings.JS_RUNTIME_NODE_BINARY}' not found")
+            return
+        self.running = True
+        queue = self._queue()
+        while self._count < self.size:
+            queue.put_nowait(await self._spawn())
+        print(f" JS runtime pool started ({self.size} node workers)")
+
+    async def stop(self):
+        self.running = False
+        await asyncio.gather(*self._replenishing, return_exceptions=True)
+        queue = self._queue()
+        while not queue.empty():
+            worker = queue.get_nowait()
+            self._count -= 1
+            worker.kill()
+            await worker.process.wait()
+
+    async def _acquire(self) -> _NodeWorker:
+        queue = self._queue()
+        while True:
+            if queue.empty() and self._count < self.size:
+                return await self._spawn()
+            worker = await queue.get()
+            if worker.alive:
+                return worker
+            self._discard(worker)
+
+    def _discard(self, worker: _NodeWorker):
+        worker.kill()
+        self._count -= 1
+        self.stats["recycled"] += 1
+
+    def _retire(self, worker: _NodeWorker):
+        """Drops a used worker and starts its replacement off the request path."""
+        self._discard(worker)
+        task = asyncio.get_running_loop().create_task(self._replace(worker))
+        self._replenishing.add(task)
+        task.add_done_callback(self._replenishing.discard)
+
+    async def _replace(self, worker: _NodeWorker):
+        await worker.process.wait()
+        await self._replenish()
+
+    async def _replenish(self):
+        if self.running and self._count < self.size:
+            try:
+                self._queue().put_nowait(await self._spawn())
+            except Exception as e:
+                print(f" JS runtime pool: failed to start node worker: {e}")
+
+    @staticmethod
+    async def _roundtrip(worker: _NodeWorker, task_id: int, payload: bytes) -> Dict[str, Any]:
+        worker.process.stdin.write(HEADER.pack(len(payload)) + payload)
+        await worker.process.stdin.drain()
+        marker, size = REPLY_HEADER.unpack(await worker.process.stdout.readexactly(REPLY_HEADER.size))
+        if marker != REPLY_MARKER:
+            raise _BadFrame()
+        try:
+            response = orjson.loads(await worker.process.stdout.readexactly(size))
+        except orjson.JSONDecodeError:
+            raise _BadFrame() from None
+        if not isinstance(response, dict) or response.get("id") != task_id:
+            raise _BadFrame()
+        return response
+
+    async def run(self, code: str, inputs: Any, timeout: float = 30) -> Dict[str, Any]:
+        """
+        Runs a JavaScript Code node script. Returns the worker's response:
+        {ok, result, has_result, stdout, error}.
+        Raises FileNotFoundError if Node.js is not installed.
+        """
+        self.stats["tasks"] += 1
+        worker = await self._acquire()
+        self._next_id += 1
+        task_id = self._next_id
+        payload = orjson.dumps({
+            "id": task_id,
+            "code": code,
+            "inputs": inputs,
+            "timeout_ms": int(timeout * 1000)
+        }, default=str)
+        try:
+            response = await asyncio.wait_for(self._roundtrip(worker, task_id, payload), timeout=timeout)
+        except asyncio.TimeoutError:
+            self.stats["timeouts"] += 1
+            self._retire(worker)
+            return {"ok": False, "error": f"Execution timed out after {timeout}s", "stdout": ""}
+        except _BadFrame:
+            self.stats["bad_frames"] += 1
+            self._retire(worker)
+            return {"ok": False, "error": "The script wrote to the worker's stdout directly; use console.log or process.stdout instead", "stdout": ""}
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            # Out of memory (--max-old-space-size) or died mid-task
+            self.stats["crashes"] += 1
+            self._retire(worker)
+            return {"ok": False, "error": "Node.js worker exited during execution (memory limit exceeded?)", "stdout": ""}
+        except BaseException:
+            self._retire(worker)
+            raise
+
+        self._retire(worker)
+        return response
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "workers": self._count,
+            "idle": self._idle.qsize() if self._idle else 0
+        }
+
+
+js_runtime = NodeRuntimePool()
@@ -0,0 +1,145 @@
+// Single-use JavaScript Code node worker (see app/core/js_runtime.py).
+// The pool starts it ahead of time; it runs exactly one task and exits, so no
+// script can leave state behind for another (a vm context is not a boundary:
+// `this.constructor.constructor` reaches the host realm).
+// Protocol over stdio:
+//   request:  4-byte big-endian length + UTF-8 JSON {id, code, inputs, timeout_ms}
+//   response: "JSRT" + 4-byte big-endian length + UTF-8 JSON {id, ok, result, has_result, stdout, error}
+// The marker lets the pool detect a script that wrote to the real stdout.
+'use strict';
+
+const vm = require('vm');
+const util = require('util');
+
+const hostRequire = require;
+const FRAME_MARKER = Buffer.from('JSRT', 'latin1');
+
+// Thrown by process.exit() to end the task with a reply instead of killing the worker silently
+class ProcessExit {
+  constructor(code) {
+    this.code = code;
+  }
+}
+
+function makeConsole(output) {
+  const write = (...args) => { output.text += util.format(...args) + '\n'; };
+  return { log: write, info: write, warn: write, error: write, debug: write };
+}
+
+function makeProcess(output) {
+  const stream = {
+    write(chunk, encoding, callback) {
+      output.text += typeof chunk === 'string' ? chunk : Buffer.from(chunk).toString();
+      const done = typeof encoding === 'function' ? encoding : callback;
+      if (done) process.nextTick(done);
+      return true;
+    },
+  };
+  const hrtime = (previous) => process.hrtime(previous);
+  hrtime.bigint = () => process.hrtime.bigint();
+  return {
+    env: { ...process.env },
+    argv: [process.argv[0], 'javascript_code.js'],
+    platform: process.platform,
+    arch: process.arch,
+    pid: process.pid,
+    version: process.version,
+    versions: { ...process.versions },
+    cwd: () => process.cwd(),
+    uptime: () => process.uptime(),
+    memoryUsage: () => process.memoryUsage(),
+    hrtime,
+    nextTick: (callback, ...args) => process.nextTick(callback, ...args),
+    exit: (code = 0) => {
+      throw new ProcessExit(code);
+    },
+    stdout: stream,
+    stderr: stream,
+  };
+}
+
+function makeRequire(processShim) {
+  return function require(id) {
+    if (id === 'process' || id === 'node:process') return processShim;
+    return hostRequire(id);
+  };
+}
+
+async function runTask(task) {
+  const output = { text: '' };
+  const stdout = () => output.text.replace(/\n$/, '');
+  const processShim = makeProcess(output);
+  const context = vm.createContext({
+    inputs: task.inputs,
+    console: makeConsole(output),
+    process: processShim,
+    require: makeRequire(processShim),
+    Buffer,
+    URL,
+    URLSearchParams,
+    TextEncoder,
+    TextDecoder,
+    setTimeout,
+    clearTimeout,
+    setInterval,
+    clearInterval,
+  });
+  try {
+    const script = new vm.Script(`(async () => {\n${task.code}\n})()`, { filename: 'javascript_code.js', lineOffset: -1 });
+    // `timeout` bounds the synchronous part; the pool kills the worker for async overruns
+    const value = await script.runInContext(context, { timeout: task.timeout_ms || undefined });
+    return {
+      id: task.id,
+      ok: true,
+      has_result: value !== undefined,
+      result: value === undefined ? null : value,
+      stdout: stdout(),
+    };
+  } catch (err) {
+    if (err instanceof ProcessExit) {
+      const code = Number(err.code) || 0;
+      return code === 0
+        ? { id: task.id, ok: true, has_result: false, result: null, stdout: stdout() }
+        : { id: task.id, ok: false, error: `Process exited with code ${code}`, stdout: stdout() };
+    }
+    return {
+      id: task.id,
+      ok: false,
+      error: err && err.stack ? String(err.stack) : String(err),
+      stdout: stdout(),
+    };
+  }
+}
+
+function send(message) {
+  let body;
+  try {
+    body = Buffer.from(JSON.stringify(message), 'utf8');
+  } catch (err) {
+    body = Buffer.from(JSON.stringify({
+      id: message.id, ok: false, error: `Result is not serializable: ${err.message}`, stdout: message.stdout || '',
+    }), 'utf8');
+  }
+  const header = Buffer.alloc(8);
+  FRAME_MARKER.copy(header, 0);
+  header.writeUInt32BE(body.length, 4);
+  // Exit once the reply is flushed: timers the script left behind never run
+  process.stdout.write(Buffer.concat([header, body]), () => process.exit(0));
+}
+
+let buffer = Buffer.alloc(0);
+let started = false;
+
+process.stdin.on('data', (chunk) => {
+  buffer = buffer.length ? Buffer.concat([buffer, chunk]) : chunk;
+  if (started || buffer.length < 4) return;
+  const size = buffer.readUInt32BE(0);
+  if (buffer.length < 4 + size) return;
+  started = true;
+  const task = JSON.parse(buffer.subarray(4, 4 + size).toString('utf8'));
+  runTask(task).then(send);
+});
+
+process.stdin.on('end', () => {
+  if (!started) process.exit(0);
+});
@@ -0,0 +1,126 @@
+import math
+from typing import Dict, Any, Iterable, Tuple
+
+# Quantiles are exact to within this relative error
+RELATIVE_ACCURACY = 0.01
+GAMMA = (1 + RELATIVE_ACCURACY) / (1 - RELATIVE_ACCURACY)
+LOG_GAMMA = math.log(GAMMA)
+
+# Durations (seconds) at or below this land in the zero bucket
+MIN_VALUE = 1e-6
+
+ZERO_FIELD = "z"
+COUNT_FIELD = "n"
+SUM_FIELD = "sum"
+MAX_FIELD = "max"
+BUCKET_PREFIX = "b"
+
+
+def bucket_index(value: float) -> int:
+    return math.ceil(math.log(value) / LOG_GAMMA)
+
+
+def bucket_value(index: int) -> float:
+    """Representative value of a bucket (keeps the relative error symmetric)."""
+    return 2 * GAMMA ** index / (GAMMA + 1)
+
+
+class LatencySketch:
+    """
+    Mergeable latency histogram with logarithmic buckets (DDSketch-style).
+    Each bucket covers values within RELATIVE_ACCURACY of its centre, so
+    any quantile is accurate to ±1% regardless of the distribution, and two
+    sketches merge by adding bucket counts. That makes it safe to aggregate
+    in-process, HINCRBY the buckets into Redis, and merge across workers
+    and time windows.
+    """
+
+    __slots__ = ("buckets", "zero", "count", "total", "max")
+
+    def __init__(self):
+        self.buckets: Dict[int, int] = {}
+        self.zero = 0
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, value: float):
+        if value is None:
+            return
+        value = float(value)
+        if value <= MIN_VALUE:
+            self.zero += 1
+        else:
+            index = bucket_index(value)
+            self.buckets[index] = self.buckets.get(index, 0) + 1
+        self.count += 1
+        self.total += max(value, 0.0)
+        if value > self.max:
+            self.max = value
+
+    def merge(self, other: "LatencySketch"):
+        for index, count in other.buckets.items():
+            self.buckets[index] = self.buckets.get(index, 0) + count
+        self.zero += other.zero
+        self.count += other.count
+        self.total += other.total
+        if other.max > self.max:
+            self.max = other.max
+
+    def quantile(self, q: float) -> float:
+        if not self.count:
+            return 0.0
+        if q >= 1:
+            return self.max
+        rank = q * (self.count - 1)
+        seen = self.zero
+        if rank < seen:
+            return 0.0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if rank < seen:
+                # Never report more than the observed maximum
+                return min(bucket_value(index), self.max)
+        return self.max
+
+    def fields(self) -> Iterable[Tuple[str, int]]:
+        """Integer counter fields (bucket counts + totals) for HINCRBY."""
+        for index, count in self.buckets.items():
+            yield f"{BUCKET_PREFIX}{index}", count
+        if self.zero:
+            yield ZERO_FIELD, self.zero
+        yield COUNT_FIELD, self.count
+
+    def merge_fields(self, fields: Dict[Any, Any]):
+        """Merges a sketch stored as a Redis hash (see fields(), plus sum/max)."""
+        for key, value in fields.items():
+            if isinstance(key, bytes):
+                key = key.decode()
+            if key.startswith(BUCKET_PREFIX):
+                index = int(key[len(BUCKET_PREFIX):])
+                self.buckets[index] = self.buckets.get(index, 0) + int(value)
+            elif key == ZERO_FIELD:
+                self.zero += int(value)
+            elif key == COUNT_FIELD:
+                self.count += int(value)
+            elif key == SUM_FIELD:
+                self.total += float(value)
+            elif key == MAX_FIELD:
+                self.max = max(self.max, float(value))
+
+    @classmethod
+    def from_fields(cls, fields: Dict[Any, Any]) -> "LatencySketch":
+        sketch = cls()
+        sketch.merge_fields(fields)
+        return sketch
+
+    def summary(self, precision: int = 4) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "mean": round(self.total / self.count, precision) if self.count else 0.0,
+            "p50": round(self.quantile(0.5), precision),
+            "p90": round(self.quantile(0.9), precision),
+            "p99": round(self.quantile(0.99), precision),
+            "max": round(self.max, precision)
+        }
+
@@ -0,0 +1,349 @@
+import asyncio
+import time
+import uuid
+import orjson
+import redis.asyncio as aioredis
+from typing import Any, Dict, List, Optional
+from app.core.config import settings
+from app.core.payload_store import LazyPayload, materialize
+
+META_KEY = "mapreduce:{}:meta"  # map -> definition reference, totals and progress counters
+ITEMS_KEY = "mapreduce:{}:items"  # map -> list of encoded items (read by index range per shard)
+PENDING_KEY = "mapreduce:{}:pending"  # map -> shard ids nobody has claimed yet
+CLAIMS_KEY = "mapreduce:{}:claims"  # map -> claimed shard id scored by its heartbeat deadline
+DONE_KEY = "mapreduce:{}:done"  # map -> bitmap of items with a recorded outcome
+EVENTS_KEY = "mapreduce:{}:events"  # map -> item outcomes not yet read by the parent
+
+# Items pushed to Redis per round trip when a map starts
+SPILL_CHUNK = 1000
+
+# Moves a pending shard into the claims set under a heartbeat deadline.
+# KEYS: pending list, claims zset
+# ARGV: deadline, key ttl
+CLAIM_SHARD_SCRIPT = """
+local shard = redis.call('LPOP', KEYS[1])
+if not shard then
+    return false
+end
+redis.call('ZADD', KEYS[2], ARGV[1], shard)
+redis.call('EXPIRE', KEYS[2], ARGV[2])
+return shard
+"""
+
+# Records an item outcome once: a shard re-run after a lost claim cannot report an item twice.
+# KEYS: done bitmap, events list, meta hash
+# ARGV: item index, event, counter field (done | failed), retries used, key ttl
+RECORD_SCRIPT = """
+if redis.call('SETBIT', KEYS[1], ARGV[1], 1) == 1 then
+    return 0
+end
+redis.call('RPUSH', KEYS[2], ARGV[2])
+redis.call('EXPIRE', KEYS[1], ARGV[5])
+redis.call('EXPIRE', KEYS[2], ARGV[5])
+redis.call('HINCRBY', KEYS[3], ARGV[3], 1)
+if tonumber(ARGV[4]) > 0 then
+    redis.call('HINCRBY', KEYS[3], 'retried', ARGV[4])
+end
+return 1
+"""
+
+# Puts shards whose worker stopped heart-beating back in the pending list.
+# KEYS: claims zset, pending list
+# ARGV: now
+REQUEUE_SCRIPT = """
+local expired = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1])
+for _, shard in ipairs(expired) do
+    redis.call('ZREM', KEYS[1], shard)
+    redis.call('RPUSH', KEYS[2], shard)
+end
+return #expired
+"""
+
+
+def _encode_default(value: Any) -> Any:
+    if isinstance(value, LazyPayload):
+        return value.materialize()
+    return str(value)
+
+
+def _text(value: Any) -> str:
+    return value.decode() if isinstance(value, bytes) else value
+
+
+class MapReduce:
+    """
+    Distributed mode of the Parallel Map node.
+    The parent spills the items to Redis, splits them into shards of
+    chunk_size items and submits shard jobs (run_map_shard) through the fair
+    queue. Each job claims shards until none are left and runs every item
+    through engine.run_child (compiled sub-graph, no per-item bookkeeping),
+    retrying failed items. Outcomes are recorded once per item and streamed
+    back to the parent, which places them into an ordered result list. The
+    parent also claims shards itself, so a map always makes progress when
+    the fleet is busy, and shards whose worker stops heart-beating are
+    handed to someone else.
+    """
+
+    def __init__(self):
+        self.redis: Optional[aioredis.Redis] = None
+        self.stats = {
+            "maps": 0,
+            "items": 0,
+            "shards_run": 0,
+            "items_failed": 0,
+            "items_retried": 0,
+            "shards_requeued": 0
+        }
+
+    async def init_redis(self, redis_client: aioredis.Redis):
+        """Initialize with the app's Redis instance (items and results are stored as bytes)."""
+        pool = redis_client.connection_pool
+        connection_kwargs = {**pool.connection_kwargs, "decode_responses": False}
+        self.redis = aioredis.Redis(
+            connection_pool=aioredis.ConnectionPool(connection_class=pool.connection_class, **connection_kwargs)
+        )
+        self._claim_shard = self.redis.register_script(CLAIM_SHARD_SCRIPT)
+        self._record = self.redis.register_script(RECORD_SCRIPT)
+        self._requeue = self.redis.register_script(REQUEUE_SCRIPT)
+
+    @property
+    def available(self) -> bool:
+        """True when shards can be handed to the worker fleet."""
+        from app.core.fair_queue import fair_queue
+        return self.redis is not None and fair_queue.arq_pool is not None
+
+    # --- Parent side ---
+
+    async def run(
+        self,
+        workflow,
+        items: List[Any],
+        context: Optional[Dict[str, Any]] = None,
+        chunk_size: int = 0,
+        max_retries: int = 2
+    ) -> List[Any]:
+        """
+        Maps `items` through a saved sub-workflow across the workers and
+        returns the results in item order. A failed item's slot holds
+        {"error": ..., "item_index": ...}.
+        """
+        from app.core.workflow_store import workflow_store
+        context = context or {}
+        chunk_size = chunk_size or settings.MAP_REDUCE_CHUNK_SIZE
+        total = len(items)
+        if not total:
+            return []
+
+        map_id = str(uuid.uuid4())
+        keys = self._keys(map_id)
+        definition_hash = await workflow_store.publish_workflow(workflow)
+        shard_count = (total + chunk_size - 1) // chunk_size
+
+        # Spill the items chunk by chunk and describe the map
+        for start in range(0, total, SPILL_CHUNK):
+            chunk = items[start:start + SPILL_CHUNK]
+            await self.redis.rpush(keys["items"], *[orjson.dumps(materialize(item), default=_encode_default) for item in chunk])
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.hset(keys["meta"], mapping={
+                "workflow_id": workflow.id,
+                "definition_hash": definition_hash,
+                "total": total,
+                "chunk_size": chunk_size,
+                "max_retries": max_retries,
+                "parent_execution_id": context.get("execution_id") or "",
+                "user_id": context.get("user_id") or "",
+                "workspace_id": context.get("workspace_id") or "",
+                "done": 0,
+                "failed": 0
+            })
+            pipe.rpush(keys["pending"], *range(shard_count))
+            for key in keys.values():
+                pipe.expire(key, settings.MAP_REDUCE_TTL)
+            await pipe.execute()
+
+        self.stats["maps"] += 1
+        self.stats["items"] += total
+        print(f"[PARALLEL-MAP] Map {map_id}: {total} items in {shard_count} shards of {chunk_size}")
+
+        try:
+            await self._submit_shard_jobs(map_id, min(shard_count, settings.MAP_REDUCE_MAX_SHARD_JOBS), context)
+            # Work alongside the fleet: guarantees progress when every worker slot is taken
+            helper = asyncio.create_task(self.run_shards(map_id))
+            try:
+                return await self._collect(map_id, total, context)
+            finally:
+                helper.cancel()
+                try:
+                    await helper
+                except (asyncio.CancelledError, Exception):
+                    pass
+        finally:
+            await self.redis.delete(*keys.values())
+
+    async def _submit_shard_jobs(self, map_id: str, count: int, context: Dict[str, Any], generation: int = 0):
+        from app.core.fair_queue import fair_queue
+        from app.core.billing import billing_manager
+        workspace_id = context.get("workspace_id")
+        tier = await billing_manager.get_tier(workspace_id)
+        for n in range(count):
+            await fair_queue.submit(
+                'run_map_shard',
+                dict(map_id=map_id),
+                workspace_id=workspace_id,
+                user_id=context.get("user_id"),
+                tier=tier,
+                lane="bulk",
+                queue_name=context.get("queue_name") or "default",
+                job_id=f"map-{map_id}-{generation}-{n}"
+            )
+
+    async def _collect(self, map_id: str, total: int, context: Dict[str, Any]) -> List[Any]:
+        """Ordered aggregation of the item outcomes streamed by the shards."""
+        keys = self._keys(map_id)
+        results: List[Any] = [None] * total
+        received = 0
+        generation = 0
+        deadline = time.time() + settings.WORKFLOW_TIMEOUT
+        last_report = time.time()
+
+        while received < total:
+            events = await self.redis.lpop(keys["events"], 1000)
+            if events:
+                for raw in events:
+                    event = orjson.loads(raw)
+                    results[event["i"]] = event["result"] if event["ok"] else {"error": event["error"], "item_index": event["i"]}
+                    received += 1
+                if time.time() - last_report >= 5:
+                    print(f"[PARALLEL-MAP] Map {map_id}: {received}/{total} items")
+                    last_report = time.time()
+                continue
+
+            if time.time() > deadline:
+                raise TimeoutError(f"Parallel map {map_id} timed out with {received}/{total} items done")
+
+            requeued = await self._requeue(keys=[keys["claims"], keys["pending"]], args=[time.time()])
+            if requeued:
+                # A worker died holding shards: send jobs for them
+                generation += 1
+                self.stats["shards_requeued"] += requeued
+                print(f"[PARALLEL-MAP] Map {map_id}: requeued {requeued} stalled shards")
+                await self._submit_shard_jobs(map_id, requeued, context, generation)
+            await asyncio.sleep(settings.MAP_REDUCE_POLL_INTERVAL)
+
+        return results
+
+    # --- Shard side ---
+
+    async def run_shards(self, map_id: str) -> int:
+        """Claims and runs shards of a map until none are pending. Returns how many were run."""
+        from app.core.workflow_store import workflow_store
+        keys = self._keys(map_id)
+        meta = {_text(k): _text(v) for k, v in (await self.redis.hgetall(keys["meta"])).items()}
+        if not meta:
+            return 0  # Finished (or abandoned) map
+        compiled = await workflow_store.resolve(meta["workflow_id"], meta["definition_hash"])
+        context = {
+            "is_parallel_mapped": True,
+            "parent_execution_id": meta["parent_execution_id"] or None,
+            "user_id": meta["user_id"] or None,
+            "workspace_id": meta["workspace_id"] or None
+        }
+
+        shards_run = 0
+        while True:
+            shard = await self._claim_shard(
+                keys=[keys["pending"], keys["claims"]],
+                args=[time.time() + settings.MAP_REDUCE_CLAIM_TIMEOUT, settings.MAP_REDUCE_TTL]
+            )
+            if shard is None:
+                return shards_run
+            await self._run_shard(map_id, int(_text(shard)), meta, compiled, context)
+            shards_run += 1
+            self.stats["shards_run"] += 1
+
+    async def _run_shard(self, map_id: str, shard: int, meta: Dict[str, str], compiled, context: Dict[str, Any]):
+        from app.core.engine import engine
+        keys = self._keys(map_id)
+        chunk_size, total = int(meta["chunk_size"]), int(meta["total"])
+        max_retries = int(meta["max_retries"])
+        start = shard * chunk_size
+        end = min(start + chunk_size, total)
+
+        raw_items = await self.redis.lrange(keys["items"], start, end - 1)
+        # Skip items a previous holder of this shard already reported
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for index in range(start, end):
+                pipe.getbit(keys["done"], index)
+            done_bits = await pipe.execute()
+
+        semaphore = asyncio.Semaphore(settings.MAP_REDUCE_SHARD_CONCURRENCY)
+
+        async def run_item(index: int, raw: bytes):
+            async with semaphore:
+                item = orjson.loads(raw)
+                message = item if isinstance(item, str) else orjson.dumps(item).decode()
+                error = None
+                for attempt in range(max_retries + 1):
+                    try:
+                        result, error = await engine.run_child(
+                            compiled.graph, message, f"{map_id}:{index}", compiled.plan_hash, context
+                        )
+                    except Exception as e:
+                        result, error = None, str(e)
+                    if error is None:
+                        break
+                event = {"i": index, "ok": error is None, "attempts": attempt + 1}
+                if error is None:
+                    event["result"] = result
+                else:
+                    event["error"] = error
+                    self.stats["items_failed"] += 1
+                self.stats["items_retried"] += attempt
+                await self._record(
+                    keys=[keys["done"], keys["events"], keys["meta"]],
+                    args=[index, orjson.dumps(event, default=_encode_default), "done" if error is None else "failed", attempt, settings.MAP_REDUCE_TTL]
+                )
+                # Heartbeat: keep the claim while items keep completing
+                await self.redis.zadd(keys["claims"], {shard: time.time() + settings.MAP_REDUCE_CLAIM_TIMEOUT}, xx=True)
+
+        await asyncio.gather(*[
+            run_item(index, raw)
+            for index, raw, done in zip(range(start, end), raw_items, done_bits)
+            if not done
+        ])
+        await self.redis.zrem(keys["claims"], shard)
+
+    # --- Introspection ---
+
+    async def get_progress(self, map_id: str) -> Optional[Dict[str, Any]]:
+        """Progress counters of a running map (None once it has finished)."""
+        meta = await self.redis.hgetall(META_KEY.format(map_id))
+        if not meta:
+            return None
+        meta = {_text(k): _text(v) for k, v in meta.items()}
+        keys = self._keys(map_id)
+        return {
+            "total": int(meta["total"]),
+            "done": int(meta.get("done", 0)),
+            "failed": int(meta.get("failed", 0)),
+            "retried": int(meta.get("retried", 0)),
+            "pending_shards": await self.redis.llen(keys["pending"]),
+            "running_shards": await self.redis.zcard(keys["claims"])
+        }
+
+    @staticmethod
+    def _keys(map_id: str) -> Dict[str, str]:
+        return {
+            "meta": META_KEY.format(map_id),
+            "items": ITEMS_KEY.format(map_id),
+            "pending": PENDING_KEY.format(map_id),
+            "claims": CLAIMS_KEY.format(map_id),
+            "done": DONE_KEY.format(map_id),
+            "events": EVENTS_KEY.format(map_id)
+        }
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {**self.stats}
+
+
+map_reduce = MapReduce()
@@ -0,0 +1,221 @@
+import bisect
+import gzip
+import hashlib
+import os
+import re
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+import orjson
+from app.core.config import settings
+
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    brotli = None
+    BROTLI_AVAILABLE = False
+
+DATA_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "data"))
+LIBRARY_FILES = ("node_library.json", "migrated_nodes.json")
+
+# Field weights for search ranking (matches in ids/names beat description hits)
+FIELD_WEIGHTS = (("id", 8), ("name", 6), ("label", 6), ("category", 3), ("description", 1))
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+_CAMEL_RE = re.compile(r"([a-z0-9])([A-Z])")
+
+
+def tokenize(text: Any) -> List[str]:
+    """Lowercase alphanumeric tokens; camelCase and snake_case ids are split too."""
+    if not text:
+        return []
+    return _TOKEN_RE.findall(_CAMEL_RE.sub(r"\1 \2", str(text)).lower())
+
+
+class _Snapshot:
+    """One immutable, fully indexed version of the library."""
+
+    def __init__(self, library: Dict[str, List[Dict[str, Any]]], signature: Tuple):
+        self.signature = signature
+        self.library = library
+        self.body = orjson.dumps(library)
+        self.etag = f'"{hashlib.blake2b(self.body, digest_size=16).hexdigest()}"'
+        self.encoded = {
+            "gzip": gzip.compress(self.body, compresslevel=6)
+        }
+        if BROTLI_AVAILABLE:
+            self.encoded["br"] = brotli.compress(self.body, quality=9)
+
+        self.nodes: List[Dict[str, Any]] = []
+        self.by_id: Dict[str, Dict[str, Any]] = {}
+        # token -> {node position: score}
+        postings: Dict[str, Dict[int, int]] = {}
+        for cat_nodes in library.values():
+            for node in cat_nodes:
+                if not isinstance(node, dict):
+                    continue
+                position = len(self.nodes)
+                self.nodes.append(node)
+                node_id = node.get("id")
+                if node_id and node_id not in self.by_id:
+                    self.by_id[node_id] = node
+                for field, weight in FIELD_WEIGHTS:
+                    for token in set(tokenize(node.get(field))):
+                        scores = postings.setdefault(token, {})
+                        scores[position] = scores.get(position, 0) + weight
+        self.postings = postings
+        self.tokens = sorted(postings)
+
+    def match(self, token: str) -> Dict[int, int]:
+        """Nodes matching a query token, as exact token or as a prefix of one."""
+        scores = dict(self.postings.get(token, {}))
+        start = bisect.bisect_right(self.tokens, token)
+        for i in range(start, len(self.tokens)):
+            candidate = self.tokens[i]
+            if not candidate.startswith(token):
+                break
+            for position, score in self.postings[candidate].items():
+                # Prefix hits rank just below exact ones
+                scores[position] = max(scores.get(position, 0), score - 1)
+        return scores
+
+
+class NodeLibrary:
+    """
+    In-memory node library for the sidebar (node_library.json merged with
+    migrated_nodes.json). Parsed once and re-loaded when either file changes;
+    the merged JSON is kept pre-serialized and pre-compressed with a strong
+    ETag, and an id index plus an inverted token index serve lookups and search.
+    """
+
+    def __init__(self, data_dir: str = DATA_DIR):
+        self.data_dir = data_dir
+        self._snapshot: Optional[_Snapshot] = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+        self.stats = {"reloads": 0, "searches": 0, "not_modified": 0}
+
+    def _signature(self) -> Tuple:
+        signature = []
+        for name in LIBRARY_FILES:
+            try:
+                st = os.stat(os.path.join(self.data_dir, name))
+                signature.append((name, st.st_mtime_ns, st.st_size))
+            except OSError:
+                signature.append((name, None, None))
+        return tuple(signature)
+
+    def _load(self, signature: Tuple) -> _Snapshot:
+        library: Dict[str, List[Dict[str, Any]]] = {}
+        lib_path = os.path.join(self.data_dir, LIBRARY_FILES[0])
+        if os.path.exists(lib_path):
+            with open(lib_path, "rb") as f:
+                library = orjson.loads(f.read())
+
+            # Merge migrated nodes from external file
+            migrated_path = os.path.join(self.data_dir, LIBRARY_FILES[1])
+            if os.path.exists(migrated_path):
+                try:
+                    with open(migrated_path, "rb") as mf:
+                        migrated_lib = orjson.loads(mf.read())
+                    for cat, nodes in migrated_lib.items():
+                        library[cat] = [*library.get(cat, []), *nodes]
+                except Exception as me:
+                    print(f"Warning: Failed to load migrated nodes: {me}")
+
+        snapshot = _Snapshot(library, signature)
+        self.stats["reloads"] += 1
+        print(f" Node library loaded ({len(snapshot.nodes)} nodes, {len(snapshot.body) // 1024}KB, etag {snapshot.etag})")
+        return snapshot
+
+    def snapshot(self) -> _Snapshot:
+        """Current library, re-loaded if the files changed (checked at most every NODE_LIBRARY_CHECK_INTERVAL)."""
+        now = time.monotonic()
+        snapshot = self._snapshot
+        if snapshot is not None and now - self._checked_at < settings.NODE_LIBRARY_CHECK_INTERVAL:
+            return snapshot
+
+        with self._lock:
+            self._checked_at = now
+            signature = self._signature()
+            if self._snapshot is None or self._snapshot.signature != signature:
+                try:
+                    self._snapshot = self._load(signature)
+                except Exception as e:
+                    print(f"Error loading node library: {e}")
+                    if self._snapshot is None:
+                        raise
+            return self._snapshot
+
+    def get_library(self) -> Dict[str, List[Dict[str, Any]]]:
+        return self.snapshot().library
+
+    def get_node_info(self, node_id: str) -> Optional[Dict[str, Any]]:
+        """Library entry for a node id (first occurrence across categories)."""
+        try:
+            return self.snapshot().by_id.get(node_id)
+        except Exception:
+            return None
+
+    def encoded(self, accept_encoding: str = "") -> Tuple[bytes, Optional[str], str]:
+        """Pre-serialized body for the client's Accept-Encoding: (body, content_encoding, etag)."""
+        snapshot = self.snapshot()
+        accepted = {part.split(";")[0].strip().lower() for part in (accept_encoding or "").split(",")}
+        for encoding in ("br", "gzip"):
+            if encoding in accepted and encoding in snapshot.encoded:
+                # Strong ETags are per representation, so each encoding gets its own
+                return snapshot.encoded[encoding], encoding, f'{snapshot.etag[:-1]}-{encoding}"'
+        return snapshot.body, None, snapshot.etag
+
+    def is_not_modified(self, if_none_match: Optional[str], etag: str) -> bool:
+        """True if the client's If-None-Match already names this ETag (-> 304)."""
+        if not if_none_match:
+            return False
+        candidates = {c.strip().removeprefix("W/") for c in if_none_match.split(",")}
+        if etag in candidates or "*" in candidates:
+            self.stats["not_modified"] += 1
+            return True
+        return False
+
+    def search(self, query: str, offset: int = 0, limit: int = 20) -> Dict[str, Any]:
+        """Ranked search over id/name/label/category/description; every query token must match."""
+        self.stats["searches"] += 1
+        snapshot = self.snapshot()
+        tokens = tokenize(query)
+        if not tokens:
+            positions = list(range(len(snapshot.nodes)))
+        else:
+            scores: Optional[Dict[int, int]] = None
+            # Rarest token first keeps intersections small
+            for token_scores in sorted((snapshot.match(t) for t in set(tokens)), key=len):
+                if scores is None:
+                    scores = token_scores
+                else:
+                    scores = {p: s + token_scores[p] for p, s in scores.items() if p in token_scores}
+                if not scores:
+                    break
+            scores = scores or {}
+            positions = sorted(scores, key=lambda p: (-scores[p], p))
+
+        return {
+            "query": query,
+            "total": len(positions),
+            "offset": offset,
+            "limit": limit,
+            "results": [snapshot.nodes[p] for p in positions[offset:offset + limit]]
+        }
+
+    def get_stats(self) -> Dict[str, Any]:
+        snapshot = self._snapshot
+        return {
+            **self.stats,
+            "nodes": len(snapshot.nodes) if snapshot else 0,
+            "tokens": len(snapshot.tokens) if snapshot else 0,
+            "bytes": len(snapshot.body) if snapshot else 0,
+            "etag": snapshot.etag if snapshot else None,
+            "brotli": BROTLI_AVAILABLE
+        }
+
+
+node_library = NodeLibrary()
@@ -0,0 +1,120 @@
+import hashlib
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+import orjson
+from app.core.config import settings
+
+PoolKey = Tuple[str, str]
+
+
+class NodeInstancePool:
+    """
+    Reuses node instances instead of resolving the class and re-validating
+    the Pydantic config on every hop.
+    Instances are keyed by node type + config fingerprint. Nodes declaring
+    `reusable = True` (no per-call state) live in a worker-wide LRU shared by
+    all executions; every other node is only shared inside one execution
+    (engine hops, agent precursor lookups, loops revisiting a node) and is
+    dropped when that execution finishes. Those are additionally keyed by
+    node id, so concurrent hops of the same type and config never share an
+    instance (BaseNode.run resets per-call state such as `metrics`).
+    """
+
+    def __init__(self):
+        self.enabled = settings.NODE_POOL_ENABLED
+        self.max_size = settings.NODE_POOL_MAX_SIZE
+        self.max_executions = settings.NODE_POOL_MAX_EXECUTIONS
+        # (node_type, fingerprint) -> instance, LRU ordered
+        self._shared: "OrderedDict[PoolKey, Any]" = OrderedDict()
+        # execution_id -> {(node_id, node_type, fingerprint) -> instance}
+        self._scopes: "OrderedDict[str, Dict[Tuple[str, str, str], Any]]" = OrderedDict()
+        self.stats = {
+            "shared_hits": 0,
+            "scoped_hits": 0,
+            "misses": 0,
+            "evictions": 0
+        }
+
+    @staticmethod
+    def key(node_type: str, config: Optional[Dict[str, Any]]) -> Optional[PoolKey]:
+        """Pool key for a node type + config, or None if the config cannot be fingerprinted."""
+        try:
+            config_bytes = orjson.dumps(
+                config or {},
+                option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+            )
+        except TypeError:
+            return None
+        return node_type, hashlib.blake2b(config_bytes, digest_size=16).hexdigest()
+
+    def get(self, key: Optional[PoolKey], execution_id: Optional[str] = None, node_id: Optional[str] = None) -> Optional[Any]:
+        """Returns a pooled instance for the key (shared first, then this node's execution scope)."""
+        if not self.enabled or key is None:
+            return None
+
+        node = self._shared.get(key)
+        if node is not None:
+            self._shared.move_to_end(key)
+            self.stats["shared_hits"] += 1
+            return node
+
+        scope = self._scopes.get(execution_id) if execution_id and node_id else None
+        if scope:
+            node = scope.get((node_id, *key))
+            if node is not None:
+                self.stats["scoped_hits"] += 1
+                return node
+
+        self.stats["misses"] += 1
+        return None
+
+    def put(self, key: Optional[PoolKey], node: Any, execution_id: Optional[str] = None, shareable: bool = True, node_id: Optional[str] = None):
+        """
+        Pools a freshly built instance. Reusable nodes go to the worker-wide
+        pool (unless `shareable` is False, e.g. workspace-private classes);
+        the rest are kept for `node_id` for the remainder of the execution
+        (without a node id they are not pooled).
+        """
+        if not self.enabled or key is None or node is None:
+            return
+
+        if shareable and getattr(node, "reusable", False):
+            self._shared[key] = node
+            self._shared.move_to_end(key)
+            while len(self._shared) > self.max_size:
+                self._shared.popitem(last=False)
+                self.stats["evictions"] += 1
+            return
+
+        if not execution_id or not node_id:
+            return
+        scope = self._scopes.get(execution_id)
+        if scope is None:
+            scope = self._scopes[execution_id] = {}
+            # Executions that never reported completion must not pin instances forever
+            while len(self._scopes) > self.max_executions:
+                self._scopes.popitem(last=False)
+        scope[(node_id, *key)] = node
+
+    def release_execution(self, execution_id: Optional[str]):
+        """Drops every instance scoped to a finished execution."""
+        if execution_id:
+            self._scopes.pop(execution_id, None)
+
+    def clear(self):
+        self._shared.clear()
+        self._scopes.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        hits = self.stats["shared_hits"] + self.stats["scoped_hits"]
+        total = hits + self.stats["misses"]
+        return {
+            **self.stats,
+            "hit_rate": round(hits / total * 100, 2) if total else 0,
+            "shared_instances": len(self._shared),
+            "active_executions": len(self._scopes),
+            "scoped_instances": sum(len(scope) for scope in self._scopes.values())
+        }
+
+
+node_pool = NodeInstancePool()
@@ -0,0 +1,365 @@
+import asyncio
+import hashlib
+import mmap
+import os
+import time
+from typing import Any, Dict, Iterable, Optional, Set
+import fsspec
+import orjson
+import zstandard
+from app.core.config import settings
+
+# Blob header: [format][kind]
+FORMAT_RAW = b"\x01"
+FORMAT_ZSTD = b"\x03"
+KIND_TEXT = b"s"
+KIND_JSON = b"j"
+HEADER_SIZE = 2
+URI_PREFIX = "payload://"
+
+
+class LazyPayload:
+    """
+    Handle to a stored payload. Passed between nodes instead of the value;
+    it is only read (memory-mapped for local blobs) when something touches it.
+    Attribute access, str(), len(), indexing and iteration materialize it, so
+    nodes written for plain strings keep working.
+    """
+
+    __slots__ = ("digest", "size", "kind", "_store", "_value")
+
+    def __init__(self, store: "PayloadStore", digest: str, size: int, kind: bytes):
+        self._store = store
+        self.digest = digest
+        self.size = size
+        self.kind = kind
+        self._value = None
+
+    @property
+    def uri(self) -> str:
+        return f"{URI_PREFIX}{self.digest}"
+
+    def materialize(self) -> Any:
+        if self._value is None:
+            self._value = self._store.load(self.digest)
+        return self._value
+
+    def preview(self, length: int = 500) -> str:
+        """First characters of the payload without decoding all of it (when possible)."""
+        if self._value is not None:
+            return str(self._value)[:length]
+        return self._store.preview(self.digest, length)
+
+    def describe(self) -> Dict[str, Any]:
+        """JSON-safe descriptor (execution records, logs)."""
+        return {"$payload": self.uri, "size": self.size, "preview": self.preview(200)}
+
+    def __getattr__(self, name: str):
+        # Protocol lookups (copy, pickle) and unset slots must not reach the payload
+        if (name.startswith("__") and name.endswith("__")) or name in LazyPayload.__slots__:
+            raise AttributeError(name)
+        return getattr(self.materialize(), name)
+
+    def __reduce__(self):
+        # The handle travels by digest; the receiving process reads the blob from its own store
+        return _restore_payload, (self.digest, self.size, self.kind)
+
+    def __copy__(self) -> "LazyPayload":
+        payload = LazyPayload(self._store, self.digest, self.size, self.kind)
+        payload._value = self._value
+        return payload
+
+    def __deepcopy__(self, memo) -> "LazyPayload":
+        # Blobs are immutable: a fresh handle re-reads its own copy of the value
+        return LazyPayload(self._store, self.digest, self.size, self.kind)
+
+    def __str__(self) -> str:
+        return str(self.materialize())
+
+    def __repr__(self) -> str:
+        return f"<LazyPayload {self.uri} {self.size}B>"
+
+    def __len__(self) -> int:
+        return len(self.materialize())
+
+    def __bool__(self) -> bool:
+        return self.size > 0
+
+    def __getitem__(self, key):
+        return self.materialize()[key]
+
+    def __iter__(self):
+        return iter(self.materialize())
+
+    def __contains__(self, item) -> bool:
+        return item in self.materialize()
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, LazyPayload):
+            return self.digest == other.digest
+        return self.materialize() == other
+
+    def __hash__(self) -> int:
+        return hash(self.digest)
+
+
+def _restore_payload(digest: str, size: int, kind: bytes) -> LazyPayload:
+    return LazyPayload(payload_store, digest, size, kind)
+
+
+def materialize(value: Any) -> Any:
+    """Resolves a LazyPayload (or a list of node inputs containing them) to plain values."""
+    if isinstance(value, LazyPayload):
+        return value.materialize()
+    if isinstance(value, list) and any(isinstance(v, LazyPayload) for v in value):
+        return [v.materialize() if isinstance(v, LazyPayload) else v for v in value]
+    return value
+
+
+class PayloadStore:
+    """
+    Content-addressed store for large inter-node payloads.
+    Blobs are keyed by their blake2b digest (identical outputs are stored
+    once), zstd-compressed above a size threshold, and live on the local
+    filesystem (read through mmap) or any fsspec backend such as S3/MinIO
+    (PAYLOAD_STORE_URL="s3://bucket/prefix" + PAYLOAD_STORE_OPTIONS).
+    Executions hold references to the blobs they produced; once released,
+    a background GC deletes blobs nobody touched within PAYLOAD_STORE_GC_GRACE.
+    """
+
+    def __init__(self):
+        self.threshold = settings.PAYLOAD_STORE_THRESHOLD
+        self.compression_min = settings.PAYLOAD_STORE_COMPRESSION_MIN_BYTES
+        self.compress = settings.PAYLOAD_STORE_COMPRESSION == "zstd"
+        self.grace = settings.PAYLOAD_STORE_GC_GRACE
+        self.fs, self.root = fsspec.url_to_fs(settings.PAYLOAD_STORE_URL, **settings.PAYLOAD_STORE_OPTIONS)
+        self.local = "file" in (self.fs.protocol if isinstance(self.fs.protocol, tuple) else (self.fs.protocol,))
+        if self.local:
+            self.root = os.path.abspath(self.root)
+        self._compressor = zstandard.ZstdCompressor(level=3)
+        self._decompressor = zstandard.ZstdDecompressor()
+        # digest -> executions referencing it / execution -> digests
+        self._refs: Dict[str, Set[str]] = {}
+        self._by_execution: Dict[str, Set[str]] = {}
+        # digests known to exist (skip existence checks on dedup)
+        self._known: Dict[str, float] = {}
+        self._gc_task: Optional[asyncio.Task] = None
+        self.stats = {
+            "stored": 0,
+            "deduplicated": 0,
+            "bytes_written": 0,
+            "bytes_saved": 0,
+            "loads": 0,
+            "collected": 0
+        }
+
+    def _path(self, digest: str) -> str:
+        return f"{self.root}/{digest[:2]}/{digest}"
+
+    def should_store(self, value: Any) -> bool:
+        return isinstance(value, str) and len(value) > self.threshold
+
+    # --- Write ---
+
+    def put(self, value: Any, execution_id: Optional[str] = None) -> LazyPayload:
+        """Stores a value (deduplicated) and returns a lazy handle referenced by the execution."""
+        return self._reference(*self._store(value), execution_id)
+
+    async def put_async(self, value: Any, execution_id: Optional[str] = None) -> LazyPayload:
+        """put() for the event loop: hashing, compression and blob I/O (local or remote) run in a thread."""
+        stored = await asyncio.to_thread(self._store, value)
+        return self._reference(*stored, execution_id)
+
+    def _store(self, value: Any):
+        """Writes the blob unless it already exists. Returns (digest, size, kind)."""
+        if isinstance(value, str):
+            kind, data = KIND_TEXT, value.encode("utf-8")
+        else:
+            kind, data = KIND_JSON, orjson.dumps(value)
+        digest = hashlib.blake2b(kind + data, digest_size=20).hexdigest()
+        path = self._path(digest)
+
+        if self._exists(digest, path):
+            self.stats["deduplicated"] += 1
+            self.stats["bytes_saved"] += len(data)
+        else:
+            if self.compress and len(data) >= self.compression_min:
+                blob = FORMAT_ZSTD + kind + self._compressor.compress(data)
+            else:
+                blob = FORMAT_RAW + kind + data
+            self._write(path, blob)
+            self.stats["stored"] += 1
+            self.stats["bytes_written"] += len(blob)
+        self._known[digest] = time.time()
+        return digest, len(data), kind
+
+    def _reference(self, digest: str, size: int, kind: bytes, execution_id: Optional[str]) -> LazyPayload:
+        if execution_id:
+            self._refs.setdefault(digest, set()).add(execution_id)
+            self._by_execution.setdefault(execution_id, set()).add(digest)
+        return LazyPayload(self, digest, size, kind)
+
+    def _exists(self, digest: str, path: str) -> bool:
+        known_at = self._known.get(digest)
+        if known_at and time.time() - known_at < self.grace / 2:
+            return True
+        try:
+            if self.local:
+                stat = os.stat(path)
+                if time.time() - stat.st_mtime >= self.grace / 2:
+                    # Re-used blob: renew it so another process's GC keeps it
+                    os.utime(path)
+                return True
+            if not self.fs.exists(path):
+                return False
+            modified = self.fs.modified(path).timestamp()
+            if time.time() - modified >= self.grace / 2:
+                self.fs.pipe_file(path, self.fs.cat_file(path))
+            return True
+        except (FileNotFoundError, OSError):
+            return False
+
+    def _write(self, path: str, blob: bytes):
+        if self.local:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # Write-then-rename so readers never see a partial blob
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(blob)
+            os.replace(tmp_path, path)
+        else:
+            self.fs.pipe_file(path, blob)
+
+    # --- Read ---
+
+    def _open_blob(self, digest: str):
+        """Blob bytes: an mmap for local files, bytes from the fsspec backend otherwise."""
+        path = self._path(digest)
+        if self.local:
+            with open(path, "rb") as f:
+                return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return self.fs.cat_file(path)
+
+    def _decode(self, kind: bytes, data) -> Any:
+        if kind == KIND_JSON:
+            return orjson.loads(data)
+        return str(data, "utf-8")
+
+    def load(self, digest: str) -> Any:
+        self.stats["loads"] += 1
+        blob = self._open_blob(digest)
+        try:
+            fmt, kind = blob[0:1], blob[1:2]
+            with memoryview(blob) as view, view[HEADER_SIZE:] as body:
+                if fmt == FORMAT_ZSTD:
+                    return self._decode(kind, self._decompressor.decompress(body))
+                return self._decode(kind, body)
+        finally:
+            if isinstance(blob, mmap.mmap):
+                blob.close()
+
+    def preview(self, digest: str, length: int = 500) -> str:
+        blob = self._open_blob(digest)
+        try:
+            fmt = blob[0:1]
+            # Up to 4 bytes per character in utf-8
+            if fmt == FORMAT_ZSTD:
+                head = self._decompressor.stream_reader(blob[HEADER_SIZE:]).read(length * 4)
+            else:
+                head = blob[HEADER_SIZE:HEADER_SIZE + length * 4]
+            return head.decode("utf-8", errors="ignore")[:length]
+        finally:
+            if isinstance(blob, mmap.mmap):
+                blob.close()
+
+    # --- Lifetime ---
+
+    def release_execution(self, execution_id: Optional[str]):
+        """Drops an execution's references; unreferenced blobs age out through the GC."""
+        for digest in self._by_execution.pop(execution_id, set()) if execution_id else ():
+            holders = self._refs.get(digest)
+            if holders:
+                holders.discard(execution_id)
+                if not holders:
+                    del self._refs[digest]
+
+    def _blob_paths(self) -> Iterable[str]:
+        if self.local:
+            if not os.path.isdir(self.root):
+                return
+            for shard in os.scandir(self.root):
+                if shard.is_dir():
+                    for entry in os.scandir(shard.path):
+                        yield entry.path
+        else:
+            yield from self.fs.find(self.root)
+
+    def _mtime(self, path: str) -> float:
+        if self.local:
+            return os.stat(path).st_mtime
+        return self.fs.modified(path).timestamp()
+
+    def collect(self) -> int:
+        """One GC pass: renews referenced blobs and deletes unreferenced ones older than the grace period."""
+        now = time.time()
+        removed = 0
+        for path in list(self._blob_paths()):
+            name = path.rsplit("/", 1)[-1].rsplit(os.sep, 1)[-1]
+            try:
+                mtime = self._mtime(path)
+                if name.endswith(".tmp"):
+                    if now - mtime > self.grace:
+                        self.fs.rm_file(path)
+                    continue
+                if name in self._refs:
+                    if now - mtime >= self.grace / 2:
+                        if self.local:
+                            os.utime(path)
+                        else:
+                            self.fs.pipe_file(path, self.fs.cat_file(path))
+                    continue
+                if now - mtime > self.grace:
+                    self.fs.rm_file(path)
+                    self._known.pop(name, None)
+                    removed += 1
+            except (FileNotFoundError, OSError):
+                continue
+        self.stats["collected"] += removed
+        return removed
+
+    async def start(self):
+        """Starts the background GC (called by API/worker startup)."""
+        if self._gc_task and not self._gc_task.done():
+            return
+        self._gc_task = asyncio.create_task(self._gc_loop())
+        print(f" Payload store started ({settings.PAYLOAD_STORE_URL}, threshold: {self.threshold} chars, GC grace: {self.grace}s)")
+
+    async def stop(self):
+        if self._gc_task:
+            self._gc_task.cancel()
+            try:
+                await self._gc_task
+            except asyncio.CancelledError:
+                pass
+            self._gc_task = None
+
+    async def _gc_loop(self):
+        while True:
+            await asyncio.sleep(settings.PAYLOAD_STORE_GC_INTERVAL)
+            try:
+                removed = await asyncio.to_thread(self.collect)
+                if removed:
+                    print(f" Payload store GC removed {removed} blobs")
+            except Exception as e:
+                print(f" Payload store GC error: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "referenced_blobs": len(self._refs),
+            "active_executions": len(self._by_execution),
+            "backend": "local" if self.local else str(self.fs.protocol)
+        }
+
+
+payload_store = PayloadStore()
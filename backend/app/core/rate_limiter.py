@@ -3,6 +3,39 @@ from typing import Optional
 from app.core.config import settings
 import time
 
+# Returned by the engine when a run is refused a slot (same convention as "Validation Failed: ...")
+RATE_LIMITED_PREFIX = "Rate Limit Exceeded:"
+
+# Check-and-increment in one atomic round-trip.
+# KEYS: user counter, workspace counter, execution marker
+# ARGV: user limit (-1 = unlimited), ttl, has_workspace, has_execution, execution marker value
+TRY_ACQUIRE_SCRIPT = """
+local limit = tonumber(ARGV[1])
+if limit >= 0 and tonumber(redis.call('GET', KEYS[1]) or '0') >= limit then
+    return 0
+end
+redis.call('INCR', KEYS[1])
+redis.call('EXPIRE', KEYS[1], ARGV[2])
+if ARGV[3] == '1' then
+    redis.call('INCR', KEYS[2])
+    redis.call('EXPIRE', KEYS[2], ARGV[2])
+end
+if ARGV[4] == '1' then
+    redis.call('SETEX', KEYS[3], ARGV[2], ARGV[5])
+end
+return 1
+"""
+
+# Decrement each counter only while it is positive (never goes negative).
+RELEASE_SCRIPT = """
+for _, key in ipairs(KEYS) do
+    if tonumber(redis.call('GET', key) or '0') > 0 then
+        redis.call('DECR', key)
+    end
+end
+return 1
+"""
+
 class RateLimiter:
     """
     Redis-backed rate limiter for execution control.
@@ -15,6 +48,8 @@ class RateLimiter:
     async def init_redis(self, redis_client: aioredis.Redis):
         """Initialize with the app's Redis instance."""
         self.redis = redis_client
+        self._try_acquire = redis_client.register_script(TRY_ACQUIRE_SCRIPT)
+        self._release = redis_client.register_script(RELEASE_SCRIPT)
     
     async def check_user_limit(self, user_id: str, tier: str = "free", custom_limits: Optional[dict] = None) -> bool:
         """
@@ -69,6 +104,40 @@ class RateLimiter:
         
         return True
     
+    async def try_acquire(
+        self,
+        user_id: str,
+        workspace_id: Optional[str] = None,
+        execution_id: str = None,
+        tier: str = "free",
+        custom_limits: Optional[dict] = None
+    ) -> bool:
+        """
+        Atomic check_user_limit() + acquire() in a single round-trip.
+        Returns True if a slot was acquired, False if the user limit is reached.
+        """
+        if not self.redis:
+            return True
+        
+        from app.core.tier_manager import tier_manager
+        
+        limit = tier_manager.get_concurrent_job_limit(tier, custom_limits)
+        acquired = await self._try_acquire(
+            keys=[
+                f"rate_limit:user:{user_id}:concurrent",
+                f"rate_limit:workspace:{workspace_id}:concurrent",
+                f"execution:{execution_id}:limits"
+            ],
+            args=[
+                limit,
+                settings.WORKFLOW_TIMEOUT,
+                1 if workspace_id else 0,
+                1 if execution_id else 0,
+                f"{user_id}:{workspace_id or 'none'}"
+            ]
+        )
+        return bool(int(acquired))
+    
     async def acquire(self, user_id: str, workspace_id: Optional[str] = None, execution_id: str = None):
         """
         Acquire a rate limit slot for execution.
@@ -77,23 +146,26 @@ class RateLimiter:
         if not self.redis:
             return
         
+        # One pipelined round-trip for all counters
+        pipe = self.redis.pipeline(transaction=True)
         user_key = f"rate_limit:user:{user_id}:concurrent"
-        await self.redis.incr(user_key)
-        await self.redis.expire(user_key, settings.WORKFLOW_TIMEOUT)
+        pipe.incr(user_key)
+        pipe.expire(user_key, settings.WORKFLOW_TIMEOUT)
         
         if workspace_id:
             ws_key = f"rate_limit:workspace:{workspace_id}:concurrent"
-            await self.redis.incr(ws_key)
-            await self.redis.expire(ws_key, settings.WORKFLOW_TIMEOUT)
+            pipe.incr(ws_key)
+            pipe.expire(ws_key, settings.WORKFLOW_TIMEOUT)
         
         # Track execution for cleanup
         if execution_id:
             exec_key = f"execution:{execution_id}:limits"
-            await self.redis.setex(
+            pipe.setex(
                 exec_key, 
                 settings.WORKFLOW_TIMEOUT,
                 f"{user_id}:{workspace_id or 'none'}"
             )
+        await pipe.execute()
     
     async def release(self, user_id: str, workspace_id: Optional[str] = None):
         """
@@ -103,16 +175,10 @@ class RateLimiter:
         if not self.redis:
             return
         
-        user_key = f"rate_limit:user:{user_id}:concurrent"
-        current = await self.redis.get(user_key)
-        if current and int(current) > 0:
-            await self.redis.decr(user_key)
-        
+        keys = [f"rate_limit:user:{user_id}:concurrent"]
         if workspace_id:
-            ws_key = f"rate_limit:workspace:{workspace_id}:concurrent"
-            current = await self.redis.get(ws_key)
-            if current and int(current) > 0:
-                await self.redis.decr(ws_key)
+            keys.append(f"rate_limit:workspace:{workspace_id}:concurrent")
+        await self._release(keys=keys)
     
     async def get_current_usage(self, user_id: str, workspace_id: Optional[str] = None) -> dict:
         """Get current usage stats for monitoring."""
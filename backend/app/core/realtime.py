@@ -0,0 +1,207 @@
+import asyncio
+from typing import Any, Dict, List, Optional, Set, Tuple
+import orjson
+from app.core.config import settings
+
+# High-frequency events that may be merged into one "batch" frame per room
+COALESCED_EVENTS = {"node_start", "node_end", "node_progress"}
+
+
+class _Subscriber:
+    """One WebSocket with its own bounded send queue and sender task."""
+
+    def __init__(self, websocket: Any, room: str):
+        self.websocket = websocket
+        self.room = room
+        self.jobs: Set[str] = set()
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=settings.WS_SEND_QUEUE_SIZE)
+        self.task: Optional[asyncio.Task] = None
+        self.closed = False
+
+
+class ConnectionManager:
+    """
+    Room-targeted WebSocket fan-out.
+    Execution events are routed only to the sockets of their workflow room
+    (plus sockets that subscribed to the job), serialized once and handed to
+    per-socket bounded queues drained concurrently, so one slow editor cannot
+    stall the others. Node progress events are coalesced into batched frames
+    at WS_COALESCE_INTERVAL.
+    """
+
+    def __init__(self):
+        # Room-based connections: {workflow_id: {WebSocket: _Subscriber}}
+        self.rooms: Dict[str, Dict[Any, _Subscriber]] = {}
+        # Job subscriptions: {job_id: {_Subscriber}}
+        self.jobs: Dict[str, Set[_Subscriber]] = {}
+        # User presence: {workflow_id: {user_id: {name, color, cursor}}}
+        self.presence: Dict[str, Dict[str, Any]] = {}
+        # (room, job_id) -> buffered progress events
+        self._pending: Dict[Tuple[Optional[str], Optional[str]], List[dict]] = {}
+        self._flush_task: Optional[asyncio.Task] = None
+        self.stats = {
+            "events": 0,
+            "frames": 0,
+            "batches": 0,
+            "unrouted": 0,
+            "dropped": 0,
+            "slow_closed": 0
+        }
+
+    async def connect(self, websocket: Any, workflow_id: str = "global"):
+        await websocket.accept()
+        subscriber = _Subscriber(websocket, workflow_id)
+        subscriber.task = asyncio.create_task(self._sender(subscriber))
+        self.rooms.setdefault(workflow_id, {})[websocket] = subscriber
+
+    def disconnect(self, websocket: Any, workflow_id: str = "global"):
+        room = self.rooms.get(workflow_id)
+        subscriber = room.pop(websocket, None) if room else None
+        if room is not None and not room:
+            self.rooms.pop(workflow_id, None)
+        if subscriber:
+            self._drop_subscriber(subscriber)
+
+    def _drop_subscriber(self, subscriber: _Subscriber):
+        subscriber.closed = True
+        for job_id in subscriber.jobs:
+            subscribers = self.jobs.get(job_id)
+            if subscribers:
+                subscribers.discard(subscriber)
+                if not subscribers:
+                    self.jobs.pop(job_id, None)
+        subscriber.jobs.clear()
+        if subscriber.task and subscriber.task is not asyncio.current_task():
+            subscriber.task.cancel()
+
+    def subscribe_job(self, websocket: Any, workflow_id: str, job_id: str):
+        """Also delivers a job's events to this socket, whatever room the job runs in."""
+        subscriber = self.rooms.get(workflow_id, {}).get(websocket)
+        if subscriber and job_id:
+            subscriber.jobs.add(job_id)
+            self.jobs.setdefault(job_id, set()).add(subscriber)
+
+    async def broadcast(self, message: dict, workflow_id: str = "global"):
+        self._send_frame(self._encode(message), self.rooms.get(workflow_id, {}).values())
+
+    async def send_to_user(self, websocket: Any, message: dict):
+        try:
+            await websocket.send_json(message)
+        except Exception:
+            pass
+
+    async def broadcast_all(self, message: dict):
+        """System-wide notices only; execution events go through `publish`."""
+        frame = self._encode(message)
+        for room in self.rooms.values():
+            self._send_frame(frame, room.values())
+
+    async def publish(self, message: dict):
+        """Routes a worker event to its room / job subscribers, coalescing progress events."""
+        self.stats["events"] += 1
+        key = (message.get("room"), message.get("jobId"))
+        if not self._targets(*key):
+            self.stats["unrouted"] += 1
+            return
+
+        interval = settings.WS_COALESCE_INTERVAL
+        if interval > 0 and message.get("type") in COALESCED_EVENTS:
+            pending = self._pending.setdefault(key, [])
+            pending.append(message)
+            if len(pending) >= settings.WS_COALESCE_MAX_EVENTS:
+                self._flush_key(key)
+            else:
+                self._ensure_flusher()
+            return
+
+        # Keep ordering: anything buffered for this job goes out first
+        self._flush_key(key)
+        self._send_frame(self._encode(message), self._targets(*key))
+
+    def _targets(self, room: Optional[str], job_id: Optional[str]) -> Set[_Subscriber]:
+        targets = set(self.rooms.get(room, {}).values()) if room else set()
+        if job_id:
+            targets |= self.jobs.get(job_id, set())
+        return targets
+
+    @staticmethod
+    def _encode(message: dict) -> str:
+        return orjson.dumps(message, default=str).decode()
+
+    def _send_frame(self, frame: str, subscribers):
+        for subscriber in list(subscribers):
+            if subscriber.closed:
+                continue
+            try:
+                subscriber.queue.put_nowait(frame)
+                self.stats["frames"] += 1
+            except asyncio.QueueFull:
+                if settings.WS_SLOW_CONSUMER_POLICY == "close":
+                    self._close_slow(subscriber)
+                else:
+                    self.stats["dropped"] += 1
+
+    def _close_slow(self, subscriber: _Subscriber):
+        self.stats["slow_closed"] += 1
+        self.disconnect(subscriber.websocket, subscriber.room)
+        asyncio.create_task(self._close_socket(subscriber.websocket))
+
+    @staticmethod
+    async def _close_socket(websocket: Any):
+        try:
+            # 1013: try again later
+            await websocket.close(code=1013)
+        except Exception:
+            pass
+
+    async def _sender(self, subscriber: _Subscriber):
+        """Drains one socket's queue; a send that stalls past WS_SEND_TIMEOUT drops the socket."""
+        try:
+            while True:
+                frame = await subscriber.queue.get()
+                await asyncio.wait_for(subscriber.websocket.send_text(frame), timeout=settings.WS_SEND_TIMEOUT)
+        except asyncio.CancelledError:
+            raise
+        except asyncio.TimeoutError:
+            self._close_slow(subscriber)
+        except Exception:
+            # Socket went away; the endpoint's receive loop will see the disconnect too
+            self.disconnect(subscriber.websocket, subscriber.room)
+
+    def _flush_key(self, key):
+        events = self._pending.pop(key, None)
+        if not events:
+            return
+        targets = self._targets(*key)
+        if len(events) == 1:
+            self._send_frame(self._encode(events[0]), targets)
+            return
+        self.stats["batches"] += 1
+        self._send_frame(self._encode({
+            "type": "batch",
+            "room": key[0],
+            "jobId": key[1],
+            "events": events
+        }), targets)
+
+    def _ensure_flusher(self):
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_loop())
+
+    async def _flush_loop(self):
+        while self._pending:
+            await asyncio.sleep(settings.WS_COALESCE_INTERVAL)
+            for key in list(self._pending):
+                self._flush_key(key)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "rooms": len(self.rooms),
+            "connections": sum(len(room) for room in self.rooms.values()),
+            "job_subscriptions": len(self.jobs),
+            "pending_events": sum(len(events) for events in self._pending.values())
+        }
+
+
+manager = ConnectionManager()
@@ -1,7 +1,19 @@
-import js2py
+import asyncio
+import contextlib
+import hashlib
+import io
+import json
 import multiprocessing
 import traceback
-from typing import Any, Dict, Optional
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional
+import orjson
+from app.core.config import settings
+
+try:
+    import resource
+except ImportError:  # Not available on Windows: limits are then time-only
+    resource = None
 
 def _execute_python_restricted(code: str, inputs: Dict[str, Any], output_dict: Dict[str, Any]):
     """Executes Python code in a restricted global environment."""
@@ -28,6 +40,9 @@ def _execute_python_restricted(code: str, inputs: Dict[str, Any], output_dict: D
         exec(code, safe_globals)
         output_dict["result"] = safe_globals.get("output")
         output_dict["success"] = True
+    except MemoryError:
+        # Handled by the worker loop (recycles the worker)
+        raise
     except Exception as e:
         output_dict["success"] = False
         output_dict["error"] = str(e)
@@ -35,42 +50,363 @@ def _execute_python_restricted(code: str, inputs: Dict[str, Any], output_dict: D
 def _execute_js_restricted(code: str, inputs: Dict[str, Any], output_dict: Dict[str, Any]):
     """Executes JavaScript code using js2py."""
     try:
+        import js2py
         context = js2py.EvalJs()
         context.inputs = inputs
         # User code should set 'output' variable
         context.execute(code)
-        output_dict["result"] = context.output
+        output = context.output
+        output_dict["result"] = output.to_python() if hasattr(output, "to_python") else output
         output_dict["success"] = True
+    except MemoryError:
+        # Handled by the worker loop (recycles the worker)
+        raise
     except Exception as e:
         output_dict["success"] = False
         output_dict["error"] = str(e)
 
+# Compiled user code per worker process, keyed by code hash
+_code_cache: "OrderedDict[str, Any]" = OrderedDict()
+CODE_CACHE_SIZE = 256
+
+def _compile_cached(code: str):
+    digest = hashlib.blake2b(code.encode("utf-8"), digest_size=16).hexdigest()
+    compiled = _code_cache.get(digest)
+    if compiled is None:
+        compiled = compile(code, "<python_code>", "exec")
+        _code_cache[digest] = compiled
+        if len(_code_cache) > CODE_CACHE_SIZE:
+            _code_cache.popitem(last=False)
+    else:
+        _code_cache.move_to_end(digest)
+    return compiled
+
+def _execute_python_code(code: str, inputs: Any, output_dict: Dict[str, Any], imports: str = ""):
+    """
+    Executes a Python Code node (full builtins, optional imports).
+    The result comes from main(inputs), an `output` variable, or stdout.
+    """
+    stdout_capture = io.StringIO()
+    local_scope = {"inputs": inputs, "output": None}
+    global_scope = {"__builtins__": __builtins__}
+
+    for mod_name in (imports or "").split(","):
+        mod_name = mod_name.strip()
+        if mod_name:
+            try:
+                global_scope[mod_name] = __import__(mod_name)
+            except ImportError as e:
+                output_dict.update(success=False, error=f"Failed to import '{mod_name}': {str(e)}", stdout="")
+                return
+
+    try:
+        # One task per process at a time, so redirecting stdout is safe here
+        with contextlib.redirect_stdout(stdout_capture):
+            exec(_compile_cached(code), global_scope, local_scope)
+
+            if "main" in local_scope and callable(local_scope["main"]):
+                result = local_scope["main"](inputs)
+            elif local_scope.get("output") is not None:
+                result = local_scope["output"]
+            else:
+                # Provide stdout as result if no structured return
+                result = stdout_capture.getvalue()
+        output_dict.update(success=True, result=result, stdout=stdout_capture.getvalue())
+    except MemoryError:
+        raise
+    except Exception:
+        output_dict.update(success=False, error=traceback.format_exc(), stdout=stdout_capture.getvalue())
+
+EXECUTORS = {
+    "python": _execute_python_restricted,
+    "js": _execute_js_restricted,
+    "python_code": _execute_python_code
+}
+
+# Kinds whose only guard is a builtins whitelist: every escape from it goes
+# through dunder attributes (__class__, __subclasses__, __globals__, ...)
+RESTRICTED_KINDS = ("python", "js")
+
+# Reply frames: 1-byte marker + chunk ("+" more follows, "." last)
+FRAME_MORE = b"+"
+FRAME_LAST = b"."
+# Replies orjson cannot encode (e.g. ints beyond 64 bits) fall back to the json module
+STDLIB_JSON = b"J"
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, (set, frozenset, tuple)):
+        return list(value)
+    return str(value)
+
+def _dumps(value: Any) -> bytes:
+    return orjson.dumps(value, default=_json_default, option=orjson.OPT_NON_STR_KEYS)
+
+def _cpu_seconds() -> float:
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    return usage.ru_utime + usage.ru_stime
+
+def _send_chunked(conn, payload: bytes, chunk_size: int):
+    """Sends a reply in bounded frames so the parent never blocks on one huge read."""
+    view = memoryview(payload)
+    for start in range(0, max(len(payload), 1), chunk_size):
+        end = start + chunk_size
+        conn.send_bytes((FRAME_LAST if end >= len(payload) else FRAME_MORE) + bytes(view[start:end]))
+
+def _worker_main(conn, kind: str, memory_limit_mb: int, cpu_limit: int, chunk_size: int):
+    """
+    Sandbox worker loop: one JSON request in, one JSON result out, over a pipe.
+    Address space is capped once; the CPU limit is re-armed before every task
+    (RLIMIT_CPU counts the whole process, so each task gets `cpu_limit` more,
+    or the request's own `cpu_limit`).
+    """
+    executor = EXECUTORS[kind]
+    if resource is not None and memory_limit_mb > 0:
+        limit = memory_limit_mb * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+    while True:
+        try:
+            request = orjson.loads(conn.recv_bytes())
+        except (EOFError, OSError):
+            # Pool closed our pipe: recycle
+            return
+
+        task_cpu_limit = request.get("cpu_limit") or cpu_limit
+        if resource is not None and task_cpu_limit > 0:
+            _, hard = resource.getrlimit(resource.RLIMIT_CPU)
+            soft = int(_cpu_seconds()) + task_cpu_limit
+            if hard != resource.RLIM_INFINITY:
+                soft = min(soft, hard)
+            resource.setrlimit(resource.RLIMIT_CPU, (soft, hard))
+
+        output: Dict[str, Any] = {}
+        try:
+            executor(request["code"], request.get("inputs"), output, **request.get("options", {}))
+        except MemoryError:
+            output = {"success": False, "error": "Memory limit exceeded", "recycle": True}
+        except BaseException as e:
+            output = {"success": False, "error": f"{type(e).__name__}: {e}"}
+
+        try:
+            try:
+                payload = _dumps(output)
+            except TypeError:
+                payload = STDLIB_JSON + json.dumps(output, default=_json_default).encode("utf-8")
+        except MemoryError:
+            payload = _dumps({"success": False, "error": "Memory limit exceeded", "recycle": True})
+        except Exception as e:
+            payload = _dumps({"success": False, "error": f"Result is not serializable: {e}"})
+        _send_chunked(conn, payload, chunk_size)
+
+
+class _Worker:
+    """A pre-forked sandbox process and the parent end of its pipe."""
+
+    def __init__(self, process, conn):
+        self.process = process
+        self.conn = conn
+        self.tasks = 0
+
+    def kill(self):
+        try:
+            self.conn.close()
+        except OSError:
+            pass
+        if self.process.is_alive():
+            self.process.kill()
+
+
+class SandboxPool:
+    """
+    Warm pools of sandbox worker processes, one per language.
+    Workers are started up front (from a forkserver, so they do not inherit
+    the event loop or open sockets) and reused for many evaluations; a task
+    costs a pipe round-trip instead of two process spawns. Each task runs
+    under a time limit (worker killed on expiry) and CPU / address-space
+    rlimits; workers are recycled after SANDBOX_MAX_TASKS_PER_WORKER tasks,
+    as soon as they breach a limit, and after any task that failed or (for
+    the restricted kinds) touched dunder attributes, since such code may have
+    left state behind for the next caller.
+    """
+
+    def __init__(self):
+        self.size = settings.SANDBOX_POOL_SIZE
+        self._ctx = None
+        self._idle: Dict[str, asyncio.Queue] = {}
+        self._counts: Dict[str, int] = {kind: 0 for kind in EXECUTORS}
+        self.stats = {
+            "tasks": 0,
+            "spawned": 0,
+            "recycled": 0,
+            "timeouts": 0,
+            "limit_breaches": 0,
+            "tainted": 0
+        }
+
+    def _context(self):
+        if self._ctx is None:
+            method = settings.SANDBOX_START_METHOD
+            if method not in multiprocessing.get_all_start_methods():
+                method = "spawn"
+            self._ctx = multiprocessing.get_context(method)
+        return self._ctx
+
+    def _queue(self, kind: str) -> asyncio.Queue:
+        if kind not in self._idle:
+            self._idle[kind] = asyncio.Queue()
+        return self._idle[kind]
+
+    def _spawn(self, kind: str) -> _Worker:
+        ctx = self._context()
+        parent_conn, child_conn = ctx.Pipe(duplex=True)
+        memory_limit = settings.PYTHON_CODE_MEMORY_LIMIT_MB if kind == "python_code" else settings.SANDBOX_MEMORY_LIMIT_MB
+        process = ctx.Process(
+            target=_worker_main,
+            args=(child_conn, kind, memory_limit, settings.SANDBOX_CPU_LIMIT, settings.SANDBOX_CHUNK_BYTES),
+            daemon=True
+        )
+        process.start()
+        child_conn.close()
+        self.stats["spawned"] += 1
+        return _Worker(process, parent_conn)
+
+    async def _new_worker(self, kind: str) -> _Worker:
+        # Reserve the slot first so concurrent callers never over-spawn
+        self._counts[kind] += 1
+        try:
+            return await asyncio.to_thread(self._spawn, kind)
+        except BaseException:
+            self._counts[kind] -= 1
+            raise
+
+    async def start(self, kinds: Iterable[str] = ("python", "python_code")):
+        """Pre-forks the pools (called by API/worker startup)."""
+        for kind in kinds:
+            queue = self._queue(kind)
+            while self._counts[kind] < self.size:
+                queue.put_nowait(await self._new_worker(kind))
+        print(f" Sandbox pool started ({self.size} workers per language, {self._context().get_start_method()})")
+
+    async def stop(self):
+        for kind, queue in self._idle.items():
+            while not queue.empty():
+                queue.get_nowait().kill()
+                self._counts[kind] -= 1
+
+    async def _acquire(self, kind: str) -> _Worker:
+        queue = self._queue(kind)
+        while True:
+            if queue.empty() and self._counts[kind] < self.size:
+                return await self._new_worker(kind)
+            worker = await queue.get()
+            if worker.process.is_alive():
+                return worker
+            self._discard(kind, worker)
+
+    def _discard(self, kind: str, worker: _Worker):
+        worker.kill()
+        self._counts[kind] -= 1
+        self.stats["recycled"] += 1
+
+    def _release(self, kind: str, worker: _Worker, recycle: bool = False):
+        if recycle or worker.tasks >= settings.SANDBOX_MAX_TASKS_PER_WORKER:
+            self._discard(kind, worker)
+            # Keep the pool warm: replace the worker off the request path
+            asyncio.get_running_loop().create_task(self._replenish(kind))
+        else:
+            self._queue(kind).put_nowait(worker)
+
+    async def _replenish(self, kind: str):
+        if self._counts[kind] < self.size:
+            try:
+                self._queue(kind).put_nowait(await self._new_worker(kind))
+            except Exception as e:
+                print(f" Sandbox pool: failed to start {kind} worker: {e}")
+
+    @staticmethod
+    async def _receive(worker: _Worker) -> bytes:
+        """Reads the worker's (chunked) reply without blocking the event loop."""
+        loop = asyncio.get_running_loop()
+        fd = worker.conn.fileno()
+        chunks = []
+        while True:
+            ready = loop.create_future()
+            loop.add_reader(fd, lambda: ready.done() or ready.set_result(None))
+            try:
+                await ready
+            finally:
+                loop.remove_reader(fd)
+            frame = worker.conn.recv_bytes()
+            chunks.append(frame[1:])
+            if frame[:1] == FRAME_LAST:
+                return chunks[0] if len(chunks) == 1 else b"".join(chunks)
+
+    @staticmethod
+    def _decode(reply: bytes) -> Dict[str, Any]:
+        if reply[:1] == STDLIB_JSON:
+            return json.loads(reply[1:])
+        return orjson.loads(reply)
+
+    async def run(self, kind: str, code: str, inputs: Any, timeout: float = 5, options: Optional[Dict[str, Any]] = None, cpu_limit: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Evaluates `code` on a pooled worker of the given kind.
+        `options` are passed to the executor; `cpu_limit` overrides SANDBOX_CPU_LIMIT for this task.
+        """
+        self.stats["tasks"] += 1
+        worker = await self._acquire(kind)
+        worker.tasks += 1
+        request = {"code": code, "inputs": inputs}
+        if options:
+            request["options"] = options
+        if cpu_limit:
+            request["cpu_limit"] = cpu_limit
+        try:
+            worker.conn.send_bytes(_dumps(request))
+            result = self._decode(await asyncio.wait_for(self._receive(worker), timeout=timeout))
+        except asyncio.TimeoutError:
+            self.stats["timeouts"] += 1
+            self._release(kind, worker, recycle=True)
+            return {"success": False, "error": f"Execution timed out after {timeout}s"}
+        except (EOFError, OSError):
+            # Worker died mid-task: SIGXCPU (CPU limit) or killed by the OS (memory)
+            self.stats["limit_breaches"] += 1
+            self._release(kind, worker, recycle=True)
+            return {"success": False, "error": "Execution exceeded the sandbox resource limits"}
+        except BaseException:
+            self._release(kind, worker, recycle=True)
+            raise
+
+        recycle = result.pop("recycle", False)
+        if recycle:
+            self.stats["limit_breaches"] += 1
+        elif not result.get("success") or (kind in RESTRICTED_KINDS and "__" in code):
+            # Workers are shared across executions and workspaces: never reuse one that may be tampered with
+            recycle = True
+            self.stats["tainted"] += 1
+        self._release(kind, worker, recycle=recycle)
+        return result
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "workers": dict(self._counts),
+            "idle": {kind: queue.qsize() for kind, queue in self._idle.items()}
+        }
+
+
+sandbox_pool = SandboxPool()
+
 class Sandbox:
     """
     Runs user-provided code (Python/JS) in a separate process with limited globals.
+    Evaluations go to the warm worker pool (see SandboxPool).
     """
     @staticmethod
     async def run_python(code: str, inputs: Dict[str, Any], timeout: int = 5) -> Dict[str, Any]:
-        return await Sandbox._run_in_process(_execute_python_restricted, code, inputs, timeout)
+        return await sandbox_pool.run("python", code, inputs, timeout)
 
     @staticmethod
     async def run_js(code: str, inputs: Dict[str, Any], timeout: int = 5) -> Dict[str, Any]:
-        return await Sandbox._run_in_process(_execute_js_restricted, code, inputs, timeout)
-
-    @staticmethod
-    async def _run_in_process(target_func, code, inputs, timeout):
-        manager = multiprocessing.Manager()
-        output_dict = manager.dict()
-        
-        process = multiprocessing.Process(target=target_func, args=(code, inputs, output_dict))
-        process.start()
-        process.join(timeout=timeout)
-        
-        if process.is_alive():
-            process.terminate()
-            return {"success": False, "error": f"Execution timed out after {timeout}s"}
-            
-        return dict(output_dict)
+        return await sandbox_pool.run("js", code, inputs, timeout)
 
 sandbox = Sandbox()
-
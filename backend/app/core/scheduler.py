@@ -1,117 +1,458 @@
 import asyncio
+import heapq
 import time
 from datetime import datetime, timedelta
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from sqlmodel import select
 from app.db.session import async_session
 from app.db.models import Schedule, Workflow
+from app.core.cron import parse_cron
 from app.core.engine import engine
 from app.core.config import settings
+import redis.asyncio as aioredis
 import uuid
-import json
+
+LEADER_KEY = "scheduler:leader"
+CHANGES_CHANNEL = "scheduler:changes"
+
+# Extend the lease only while we still own it
+RENEW_LEASE_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('PEXPIRE', KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+RELEASE_LEASE_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+MISFIRE_POLICIES = ("fire_once", "fire_all", "skip")
+
+
+def _ts(value: datetime) -> float:
+    return (value - datetime(1970, 1, 1)).total_seconds()
+
 
 class WorkflowScheduler:
     """
-    Lightweight dynamic scheduler for recurring workflows.
-    Polls the database for 'due' schedules and triggers them via the engine.
+    Distributed scheduler for recurring workflows.
+    One instance holds a Redis leader lease and keeps a min-heap of the next
+    fire times due within SCHEDULER_LOOKAHEAD, loaded incrementally through
+    the (enabled, next_run_at) index instead of scanning every schedule.
+    Due schedules are dispatched to the ARQ queue with a deterministic job id
+    (so a leader handover never double-fires), applying the misfire policy to
+    runs that are late: fire_once, fire_all (catch up) or skip.
+    Schedule edits are announced on a pub/sub channel so the leader picks
+    them up without waiting for the next window.
     """
-    def __init__(self, poll_interval: int = 60):
-        self.poll_interval = poll_interval
+    def __init__(self):
+        self.redis: Optional[aioredis.Redis] = None
+        self.arq_pool = None
+        self.instance_id = str(uuid.uuid4())
         self.running = False
+        self.is_leader = False
+        # (fire timestamp, schedule id); stale entries are skipped via _due
+        self._heap: List[Tuple[float, str]] = []
+        self._due: Dict[str, float] = {}
+        self._loaded_until: Optional[datetime] = None
+        self._changed: set = set()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._listener_task: Optional[asyncio.Task] = None
+        self._renew_script = None
+        self._release_script = None
+        self.stats = {
+            "fired": 0,
+            "misfired_skipped": 0,
+            "duplicates": 0,
+            "loaded": 0,
+            "leader_changes": 0
+        }
+
+    async def init_redis(self, redis_client: aioredis.Redis, arq_pool=None):
+        """Initialize with the app's Redis instance and ARQ pool (for dispatch)."""
+        self.redis = redis_client
+        self.arq_pool = arq_pool
+        self._renew_script = redis_client.register_script(RENEW_LEASE_SCRIPT)
+        self._release_script = redis_client.register_script(RELEASE_LEASE_SCRIPT)
 
     async def start(self):
-        """Starts the scheduler loop."""
+        """Starts the scheduler loop (every API replica runs it; only the leader schedules)."""
         if self.running:
             return
-        
+
         self.running = True
-        print(f"[INFO] Workflow Scheduler started (Poll Interval: {self.poll_interval}s)")
-        
+        self._wakeup = asyncio.Event()
+        if self.redis is not None:
+            self._listener_task = asyncio.create_task(self._listen_changes())
+        print(f"[INFO] Workflow Scheduler started (instance {self.instance_id[:8]}, lookahead {settings.SCHEDULER_LOOKAHEAD}s)")
+
         while self.running:
+            self._wakeup.clear()
             try:
-                await self.check_and_trigger()
+                if await self._hold_lease():
+                    if not self.is_leader:
+                        await self._become_leader()
+                    await self._apply_changes()
+                    if self._loaded_until is None or datetime.utcnow() + timedelta(seconds=settings.SCHEDULER_LOOKAHEAD / 2) >= self._loaded_until:
+                        await self._load_window()
+                    await self._fire_due()
+                else:
+                    if self.is_leader:
+                        self._step_down()
+                    self._changed.clear()
             except Exception as e:
                 print(f"[ERROR] Scheduler Loop Error: {e}")
-            
-            await asyncio.sleep(self.poll_interval)
 
-    def stop(self):
+            await self._sleep()
+
+    async def stop(self):
         self.running = False
+        if self._wakeup:
+            self._wakeup.set()
+        if self._listener_task:
+            self._listener_task.cancel()
+            try:
+                await self._listener_task
+            except asyncio.CancelledError:
+                pass
+            self._listener_task = None
+        if self.is_leader and self.redis is not None:
+            try:
+                await self._release_script(keys=[LEADER_KEY], args=[self.instance_id])
+            except Exception:
+                pass
+        self._step_down()
+
+    # --- Leadership ---
+
+    async def _hold_lease(self) -> bool:
+        """Acquires or renews the leader lease. Without Redis this instance is the only scheduler."""
+        if self.redis is None:
+            return True
+        ttl_ms = int(settings.SCHEDULER_LEASE_TTL * 1000)
+        if self.is_leader:
+            if await self._renew_script(keys=[LEADER_KEY], args=[self.instance_id, ttl_ms]):
+                return True
+        return bool(await self.redis.set(LEADER_KEY, self.instance_id, nx=True, px=ttl_ms))
 
-    async def check_and_trigger(self):
-        """Checks for all enabled schedules which are due for execution."""
+    async def _become_leader(self):
+        print(f"[SCHEDULER] Instance {self.instance_id[:8]} is now the scheduling leader")
+        self.is_leader = True
+        self.stats["leader_changes"] += 1
+        self._heap.clear()
+        self._due.clear()
+        self._changed.clear()
+        self._loaded_until = None
+        await self._ensure_index()
+
+    def _step_down(self):
+        if self.is_leader:
+            print(f"[SCHEDULER] Instance {self.instance_id[:8]} lost scheduling leadership")
+        self.is_leader = False
+        self._heap.clear()
+        self._due.clear()
+        self._loaded_until = None
+
+    async def _ensure_index(self):
+        """create_all only indexes new tables; make sure the due index exists on older databases too."""
+        from app.db.session import engine as db_engine
+        try:
+            async with db_engine.begin() as conn:
+                for index in Schedule.__table__.indexes:
+                    if index.name == "ix_schedule_due":
+                        await conn.run_sync(lambda sync_conn: index.create(sync_conn, checkfirst=True))
+        except Exception as e:
+            print(f"[WARN] Scheduler could not ensure due index: {e}")
+
+    async def _sleep(self):
+        """Sleeps until the next fire time, a lease renewal, a window refresh or a change notice."""
+        timeout = settings.SCHEDULER_LEASE_TTL / 3
+        if self.is_leader:
+            self._prune_heap()
+            if self._heap:
+                timeout = min(timeout, max(0.0, self._heap[0][0] - time.time()))
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+
+    # --- Heap ---
+
+    def _push(self, schedule_id: str, fire_at: datetime):
+        fire_ts = _ts(fire_at)
+        if self._due.get(schedule_id) == fire_ts:
+            return
+        self._due[schedule_id] = fire_ts
+        heapq.heappush(self._heap, (fire_ts, schedule_id))
+
+    def _forget(self, schedule_id: str):
+        self._due.pop(schedule_id, None)
+
+    def _prune_heap(self):
+        while self._heap and self._due.get(self._heap[0][1]) != self._heap[0][0]:
+            heapq.heappop(self._heap)
+
+    async def _load_window(self):
+        """Loads schedules firing before now + lookahead (keyset-paginated over the due index)."""
         now = datetime.utcnow()
-        
+        window_end = now + timedelta(seconds=settings.SCHEDULER_LOOKAHEAD)
+        await self._initialize_new(now)
+
+        lower = self._loaded_until
+        cursor: Optional[Tuple[datetime, str]] = None
         async with async_session() as db:
-            # Query for enabled schedules where next_run_at <= now
-            # Note: For the first run, next_run_at might be None, so we handle that.
-            query = select(Schedule).where(Schedule.enabled == True)
-            result = await db.execute(query)
+            if lower is not None:
+                # Overdue rows we never saw (e.g. a lost change notice); normally empty
+                overdue = await db.execute(
+                    select(Schedule.id, Schedule.next_run_at).where(
+                        Schedule.enabled == True,
+                        Schedule.next_run_at <= now
+                    ).order_by(Schedule.next_run_at).limit(settings.SCHEDULER_BATCH_SIZE)
+                )
+                for schedule_id, next_run_at in overdue.all():
+                    self._push(schedule_id, next_run_at)
+
+            while True:
+                query = select(Schedule.id, Schedule.next_run_at).where(
+                    Schedule.enabled == True,
+                    Schedule.next_run_at != None,
+                    Schedule.next_run_at <= window_end
+                )
+                if lower is not None:
+                    query = query.where(Schedule.next_run_at > lower)
+                if cursor is not None:
+                    query = query.where(
+                        (Schedule.next_run_at > cursor[0]) |
+                        ((Schedule.next_run_at == cursor[0]) & (Schedule.id > cursor[1]))
+                    )
+                query = query.order_by(Schedule.next_run_at, Schedule.id).limit(settings.SCHEDULER_BATCH_SIZE)
+                rows = (await db.execute(query)).all()
+                for schedule_id, next_run_at in rows:
+                    self._push(schedule_id, next_run_at)
+                self.stats["loaded"] += len(rows)
+                if len(rows) < settings.SCHEDULER_BATCH_SIZE:
+                    break
+                cursor = (rows[-1][1], rows[-1][0])
+
+        self._loaded_until = window_end
+
+    async def _initialize_new(self, now: datetime):
+        """Computes next_run_at for enabled schedules that have none yet (created before this scheduler)."""
+        async with async_session() as db:
+            result = await db.execute(
+                select(Schedule).where(Schedule.enabled == True, Schedule.next_run_at == None).limit(settings.SCHEDULER_BATCH_SIZE)
+            )
             schedules = result.scalars().all()
-            
             for schedule in schedules:
-                if self._is_due(schedule, now):
-                    await self._trigger_schedule(schedule, db)
-
-    def _is_due(self, schedule: Schedule, now: datetime) -> bool:
-        """Determines if a schedule is due. Simple implementation using polling logic."""
-        if not schedule.next_run_at:
-            # First time initialization
-            schedule.next_run_at = self._calculate_next_run(schedule.cron, now)
-            return False
-        
-        return schedule.next_run_at <= now
-
-    def _calculate_next_run(self, cron_expr: str, current_time: datetime) -> datetime:
+                self._set_next_run(schedule, now)
+                db.add(schedule)
+            if schedules:
+                await db.commit()
+
+    def _set_next_run(self, schedule: Schedule, after: datetime) -> Optional[datetime]:
+        try:
+            schedule.next_run_at = parse_cron(schedule.cron).next(after)
+        except ValueError as e:
+            print(f"[WARN] Disabling schedule {schedule.id}: {e}")
+            schedule.enabled = False
+            schedule.next_run_at = None
+        schedule.updated_at = datetime.utcnow()
+        return schedule.next_run_at
+
+    # --- Changes ---
+
+    def notify_changed(self, schedule_id: str):
+        """Local hook for schedule edits in this process (the API also publishes them)."""
+        self._changed.add(schedule_id)
+        if self._wakeup:
+            self._wakeup.set()
+
+    async def publish_change(self, schedule_id: str):
+        """Announces a created/edited/deleted schedule to the leader, wherever it runs."""
+        if self.redis is None:
+            self.notify_changed(schedule_id)
+            return
+        try:
+            await self.redis.publish(CHANGES_CHANNEL, schedule_id)
+        except Exception as e:
+            print(f"[WARN] Scheduler change notification failed: {e}")
+            self.notify_changed(schedule_id)
+
+    async def _listen_changes(self):
+        pubsub = self.redis.pubsub()
+        try:
+            await pubsub.subscribe(CHANGES_CHANNEL)
+            async for message in pubsub.listen():
+                if message["type"] != "message":
+                    continue
+                data = message["data"]
+                self.notify_changed(data.decode() if isinstance(data, bytes) else data)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            print(f"[ERROR] Scheduler change listener error: {e}")
+        finally:
+            await pubsub.aclose()
+
+    async def _apply_changes(self):
+        if not self._changed:
+            return
+        changed, self._changed = list(self._changed), set()
+        now = datetime.utcnow()
+        async with async_session() as db:
+            result = await db.execute(select(Schedule).where(Schedule.id.in_(changed)))
+            found = {schedule.id: schedule for schedule in result.scalars().all()}
+            dirty = False
+            for schedule_id in changed:
+                schedule = found.get(schedule_id)
+                if schedule is None or not schedule.enabled:
+                    self._forget(schedule_id)
+                    continue
+                if schedule.next_run_at is None:
+                    self._set_next_run(schedule, now)
+                    db.add(schedule)
+                    dirty = True
+                if schedule.enabled and schedule.next_run_at and (self._loaded_until is None or schedule.next_run_at <= self._loaded_until):
+                    self._push(schedule.id, schedule.next_run_at)
+                else:
+                    # Picked up when the window reaches it
+                    self._forget(schedule_id)
+            if dirty:
+                await db.commit()
+
+    # --- Firing ---
+
+    async def _fire_due(self):
+        now_ts = time.time()
+        due: Dict[str, float] = {}
+        while self._heap and self._heap[0][0] <= now_ts:
+            fire_ts, schedule_id = heapq.heappop(self._heap)
+            if self._due.get(schedule_id) == fire_ts:
+                due[schedule_id] = fire_ts
+                del self._due[schedule_id]
+        if not due:
+            return
+
+        now = datetime.utcnow()
+        async with async_session() as db:
+            result = await db.execute(select(Schedule).where(Schedule.id.in_(list(due))))
+            schedules = [s for s in result.scalars().all() if s.enabled and s.next_run_at is not None]
+            wf_ids = {s.workflow_id for s in schedules}
+            workflows = {}
+            if wf_ids:
+                wf_result = await db.execute(select(Workflow).where(Workflow.id.in_(list(wf_ids))))
+                workflows = {wf.id: wf for wf in wf_result.scalars().all()}
+
+            for schedule in schedules:
+                if abs(_ts(schedule.next_run_at) - due[schedule.id]) > 0.001:
+                    # Edited since it was loaded: re-queue at its current time
+                    if self._loaded_until and schedule.next_run_at <= self._loaded_until:
+                        self._push(schedule.id, schedule.next_run_at)
+                    continue
+
+                for fire_at in self._occurrences(schedule, now):
+                    await self._trigger_schedule(schedule, workflows.get(schedule.workflow_id), fire_at)
+                db.add(schedule)
+                if schedule.next_run_at and self._loaded_until and schedule.next_run_at <= self._loaded_until:
+                    self._push(schedule.id, schedule.next_run_at)
+            await db.commit()
+
+    def _occurrences(self, schedule: Schedule, now: datetime) -> List[datetime]:
         """
-        Parses a cron-like string and returns the next occurrence.
-        Limited POC implementation: Supports '@minutely', '@hourly', '@daily'.
-        In production, replace with 'croniter'.
+        Fire times to dispatch now; advances schedule.next_run_at past `now`.
+        Runs within SCHEDULER_MISFIRE_GRACE always fire. Older (missed) runs
+        fire individually (fire_all), collapse into one (fire_once) or are
+        dropped (skip). At most SCHEDULER_MAX_CATCHUP runs fire per pass.
         """
-        if cron_expr == "@minutely":
-            return current_time + timedelta(minutes=1)
-        elif cron_expr == "@hourly":
-            return (current_time + timedelta(hours=1)).replace(minute=0, second=0, microsecond=0)
-        elif cron_expr == "@daily":
-            return (current_time + timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
-        else:
-            # Fallback to daily if unknown
-            return current_time + timedelta(days=1)
-
-    async def _trigger_schedule(self, schedule: Schedule, db):
-        """Triggers the actual workflow execution."""
-        print(f"[SCHEDULER] Triggering '{schedule.name}' (Workflow: {schedule.workflow_id})")
-        
-        # 1. Fetch the workflow definition
-        wf_result = await db.execute(select(Workflow).where(Workflow.id == schedule.workflow_id))
-        workflow = wf_result.scalar_one_or_none()
-        
+        policy = settings.SCHEDULER_MISFIRE_POLICY if settings.SCHEDULER_MISFIRE_POLICY in MISFIRE_POLICIES else "fire_once"
+        grace_start = now - timedelta(seconds=settings.SCHEDULER_MISFIRE_GRACE)
+        fires: List[datetime] = []
+        fire_at = schedule.next_run_at
+        while fire_at is not None and fire_at <= now:
+            if len(fires) >= settings.SCHEDULER_MAX_CATCHUP:
+                fire_at = self._set_next_run(schedule, now)
+                break
+            if fire_at >= grace_start or policy == "fire_all":
+                fires.append(fire_at)
+                fire_at = self._set_next_run(schedule, fire_at)
+                continue
+            if policy == "fire_once":
+                fires.append(fire_at)
+            else:
+                self.stats["misfired_skipped"] += 1
+            # Jump over the rest of the missed runs
+            fire_at = self._set_next_run(schedule, grace_start)
+        return fires
+
+    async def _trigger_schedule(self, schedule: Schedule, workflow: Optional[Workflow], fire_at: datetime):
+        """Dispatches one scheduled run to the ARQ queue (in-process without a queue)."""
         if not workflow:
             print(f"[WARN] Workflow {schedule.workflow_id} not found for schedule {schedule.id}")
             return
 
-        # 2. Trigger in background via Engine
-        execution_id = str(uuid.uuid4())
-        
-        # Fire and forget
-        asyncio.create_task(
-            engine.process_workflow(
-                workflow.definition,
-                message="[Scheduled Trigger]",
-                context={
-                    "schedule_id": schedule.id,
-                    "execution_id": execution_id,
-                    "user_id": schedule.user_id,
-                    "workspace_id": schedule.workspace_id
-                }
+        print(f"[SCHEDULER] Triggering '{schedule.name}' (Workflow: {schedule.workflow_id}, due {fire_at.isoformat()})")
+        # Deterministic per occurrence: a second job with the same id is refused (fair queue + ARQ)
+        job_id = f"sched-{schedule.id}-{int(_ts(fire_at))}"
+        schedule.last_run_at = datetime.utcnow()
+        self.stats["fired"] += 1
+
+        if self.arq_pool is None:
+            asyncio.create_task(
+                engine.process_workflow(
+                    workflow.definition,
+                    message="[Scheduled Trigger]",
+                    context={
+                        "schedule_id": schedule.id,
+                        "execution_id": job_id,
+                        "user_id": schedule.user_id,
+                        "workspace_id": schedule.workspace_id
+                    }
+                )
             )
+            return
+
+        from app.core.rate_limiter import rate_limiter
+        from app.core.workflow_store import workflow_store
+        from app.core.fair_queue import fair_queue
+        from app.core.billing import billing_manager
+        definition_hash = await workflow_store.publish_workflow(workflow)
+        await rate_limiter.acquire(schedule.user_id, schedule.workspace_id, job_id)
+        queued = await fair_queue.submit(
+            'run_workflow_task',
+            dict(
+                workflow_id=workflow.id,
+                definition_hash=definition_hash,
+                message="[Scheduled Trigger]",
+                job_id=job_id,
+                user_id=schedule.user_id,
+                workspace_id=schedule.workspace_id,
+                room=workflow.id
+            ),
+            workspace_id=schedule.workspace_id,
+            user_id=schedule.user_id,
+            tier=await billing_manager.get_tier(schedule.workspace_id),
+            lane="bulk",
+            queue_name=settings.SCHEDULER_QUEUE,
+            job_id=job_id
         )
+        if not queued:
+            # Already enqueued (e.g. by a previous leader): give the slot back
+            self.stats["duplicates"] += 1
+            await rate_limiter.release(schedule.user_id, schedule.workspace_id)
 
-        # 3. Update Schedule Status
-        schedule.last_run_at = datetime.utcnow()
-        schedule.next_run_at = self._calculate_next_run(schedule.cron, schedule.last_run_at)
-        db.add(schedule)
-        await db.commit()
+    def get_stats(self) -> Dict[str, Any]:
+        self._prune_heap()
+        return {
+            **self.stats,
+            "leader": self.is_leader,
+            "instance": self.instance_id,
+            "heap_size": len(self._due),
+            "next_fire_at": datetime.utcfromtimestamp(self._heap[0][0]).isoformat() if self._heap else None,
+            "loaded_until": self._loaded_until.isoformat() if self._loaded_until else None
+        }
 
 scheduler = WorkflowScheduler()
-
@@ -0,0 +1,189 @@
+import asyncio
+import copy
+import uuid
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+import redis.asyncio as aioredis
+from app.core.config import settings
+
+LOCK_PREFIX = "singleflight:lock:"
+DONE_PREFIX = "singleflight:done:"
+
+# Releases the lock only if we still own it and wakes remote followers, in one round-trip.
+RELEASE_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    redis.call('DEL', KEYS[1])
+end
+redis.call('PUBLISH', ARGV[2], '1')
+return 1
+"""
+
+# Marks a leader that did not produce a result (exception / cancellation)
+_FAILED = object()
+
+
+def _snapshot(result: Any) -> Any:
+    """Deep copy for followers; results holding non-copyable objects are shared as-is."""
+    try:
+        return copy.deepcopy(result)
+    except Exception:
+        return result
+
+
+class SingleFlight:
+    """
+    Request coalescing for cacheable node executions, keyed by the cache key.
+    Within a process, concurrent callers share the leader's asyncio future.
+    Across workers, a short Redis lock elects one leader; the others wait for
+    its pub/sub notification and then read the result from the cache.
+    """
+
+    def __init__(self):
+        self.redis: Optional[aioredis.Redis] = None
+        self.lock_ttl = settings.SINGLE_FLIGHT_LOCK_TTL
+        # cache key -> future resolved by the local leader
+        self._inflight: Dict[str, asyncio.Future] = {}
+        # cache key -> number of local followers awaiting it
+        self._followers: Dict[str, int] = {}
+        # cache key -> followers waiting on a leader in another process
+        self._remote_waiters: Dict[str, List[asyncio.Future]] = {}
+        self._pubsub = None
+        self._listener_task: Optional[asyncio.Task] = None
+        self.stats = {
+            "leaders": 0,
+            "local_followers": 0,
+            "remote_followers": 0,
+            "remote_timeouts": 0
+        }
+
+    async def init_redis(self, redis_client: aioredis.Redis):
+        """Initialize with the app's Redis instance."""
+        self.redis = redis_client
+        self._release = redis_client.register_script(RELEASE_SCRIPT)
+        print(f" Single-flight coalescing initialized (lock TTL: {self.lock_ttl}s)")
+
+    async def do(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[Any]],
+        lookup: Callable[[], Awaitable[Any]]
+    ) -> Tuple[Any, bool]:
+        """
+        Runs `compute` once per key across concurrent callers.
+        `compute` must populate the cache on success; `lookup` reads it back
+        for followers of a remote leader.
+        Returns (result, shared) where shared is True if another caller computed it.
+        """
+        future = self._inflight.get(key)
+        if future is not None:
+            self.stats["local_followers"] += 1
+            self._followers[key] = self._followers.get(key, 0) + 1
+            result = await asyncio.shield(future)
+            if result is _FAILED:
+                # Leader failed without a result: compute ourselves
+                return await self.do(key, compute, lookup)
+            return _snapshot(result), True
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        result = _FAILED
+        try:
+            result, shared = await self._lead(key, compute, lookup)
+            return result, shared
+        finally:
+            del self._inflight[key]
+            # Followers get a snapshot so the leader's caller can mutate its own copy
+            if self._followers.pop(key, 0) and result is not _FAILED:
+                future.set_result(_snapshot(result))
+            else:
+                future.set_result(result)
+
+    async def _lead(self, key: str, compute, lookup) -> Tuple[Any, bool]:
+        """Local leader: take the distributed lock, or follow the worker that holds it."""
+        if not self.redis:
+            return await compute(), False
+
+        token = uuid.uuid4().hex
+        try:
+            acquired = await self.redis.set(f"{LOCK_PREFIX}{key}", token, nx=True, ex=self.lock_ttl)
+        except Exception as e:
+            print(f" Single-flight lock error: {e}")
+            return await compute(), False
+
+        if acquired:
+            self.stats["leaders"] += 1
+            try:
+                return await compute(), False
+            finally:
+                try:
+                    await self._release(keys=[f"{LOCK_PREFIX}{key}"], args=[token, f"{DONE_PREFIX}{key}"])
+                except Exception as e:
+                    print(f" Single-flight release error: {e}")
+
+        # Another worker is computing this key
+        self.stats["remote_followers"] += 1
+        waiter = asyncio.get_running_loop().create_future()
+        self._remote_waiters.setdefault(key, []).append(waiter)
+        try:
+            await self._ensure_listener()
+            # The leader may have finished before we subscribed
+            cached = await lookup()
+            if cached is not None:
+                return cached, True
+            try:
+                await asyncio.wait_for(waiter, timeout=self.lock_ttl)
+            except asyncio.TimeoutError:
+                self.stats["remote_timeouts"] += 1
+            cached = await lookup()
+            if cached is not None:
+                return cached, True
+        finally:
+            waiters = self._remote_waiters.get(key, [])
+            if waiter in waiters:
+                waiters.remove(waiter)
+            if not waiters:
+                self._remote_waiters.pop(key, None)
+
+        # Leader produced nothing cacheable (error or timeout): run it here
+        return await compute(), False
+
+    async def _ensure_listener(self):
+        """One pattern subscription per process dispatches completion notices to waiters."""
+        if self._listener_task and not self._listener_task.done():
+            return
+        self._pubsub = self.redis.pubsub()
+        await self._pubsub.psubscribe(f"{DONE_PREFIX}*")
+        self._listener_task = asyncio.create_task(self._listen())
+
+    async def _listen(self):
+        try:
+            async for message in self._pubsub.listen():
+                if message["type"] != "pmessage":
+                    continue
+                channel = message["channel"]
+                if isinstance(channel, bytes):
+                    channel = channel.decode()
+                for waiter in self._remote_waiters.get(channel[len(DONE_PREFIX):], []):
+                    if not waiter.done():
+                        waiter.set_result(True)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            print(f" Single-flight listener error: {e}")
+
+    async def stop(self):
+        if self._listener_task:
+            self._listener_task.cancel()
+            try:
+                await self._listener_task
+            except asyncio.CancelledError:
+                pass
+            self._listener_task = None
+        if self._pubsub:
+            await self._pubsub.aclose()
+            self._pubsub = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {**self.stats, "inflight": len(self._inflight)}
+
+
+single_flight = SingleFlight()
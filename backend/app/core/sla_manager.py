@@ -2,7 +2,6 @@ from typing import Dict, Any, List, Optional
 from datetime import datetime, timedelta
 import asyncio
 import json
-import httpx
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.db.session import async_session
 from app.db.models import SlaMetric, Incident
@@ -59,7 +58,8 @@ class SlaManager:
         }
 
         try:
-            async with httpx.AsyncClient() as client:
+            from app.core.http_client import http_client
+            async with http_client.httpx_client() as client:
                 await client.post(self.alert_webhook_url, json=payload, timeout=5)
         except Exception as e:
             print(f" Failed to send monitoring alert: {e}")
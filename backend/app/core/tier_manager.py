@@ -23,6 +23,7 @@ class TierManager:
                 "analytics_retention_days": 7,
                 "webhook_endpoints": 1,
                 "api_rate_limit": 100,  # requests per hour
+                "queue_weight": 1,  # fair-share weight in the job queues (jobs per dispatch round)
             },
             "features": [
                 "Basic workflow automation",
@@ -44,6 +45,7 @@ class TierManager:
                 "analytics_retention_days": 30,
                 "webhook_endpoints": 10,
                 "api_rate_limit": 1000,
+                "queue_weight": 4,
             },
             "features": [
                 "Advanced workflow automation",
@@ -67,6 +69,7 @@ class TierManager:
                 "analytics_retention_days": 365,
                 "webhook_endpoints": -1,
                 "api_rate_limit": -1,
+                "queue_weight": 16,
             },
             "features": [
                 "Unlimited workflows",
@@ -130,6 +133,11 @@ class TierManager:
         
         return cls.get_limit(tier, "max_concurrent_jobs")
     
+    @classmethod
+    def get_queue_weight(cls, tier: str) -> int:
+        """Fair-share weight of a tier's workspaces in the job queues."""
+        return max(cls.get_limit(tier, "queue_weight"), 1)
+    
     @classmethod
     def compare_tiers(cls) -> Dict:
         """Get comparison table of all tiers."""
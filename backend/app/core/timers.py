@@ -0,0 +1,268 @@
+import asyncio
+import time
+import orjson
+import redis.asyncio as aioredis
+from typing import Any, Dict, List, Optional
+from app.core.config import settings
+from app.core.payload_store import LazyPayload
+
+DUE_KEY = "timers:due"  # timer id -> due time (pushed forward while a poller holds the claim)
+STATE_KEY = "timers:state:{}"  # timer id -> suspended execution state
+
+# Returned by the engine for a suspended run (same convention as "Validation Failed: ...")
+SUSPENDED_PREFIX = "Suspended:"
+
+# 1-byte header on stored state (same scheme as the workflow store)
+FORMAT_RAW = b"\x01"
+FORMAT_ZSTD = b"\x03"
+COMPRESSION_MIN_BYTES = 4096
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Claims due timers by pushing their score past the claim timeout; a poller that
+# dies before handing a timer to the queue therefore only delays it.
+# KEYS: due zset
+# ARGV: now, batch size, claim deadline
+CLAIM_SCRIPT = """
+local due = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, ARGV[2])
+for _, timer_id in ipairs(due) do
+    redis.call('ZADD', KEYS[1], ARGV[3], timer_id)
+end
+return due
+"""
+
+
+def _text(value: Any) -> str:
+    return value.decode() if isinstance(value, bytes) else value
+
+
+def _snapshot_default(value: Any) -> Any:
+    # Payload blobs are only kept alive by running executions, so suspended state carries the value
+    if isinstance(value, LazyPayload):
+        return value.materialize()
+    return str(value)
+
+
+class TimerService:
+    """
+    Durable timers for suspended executions (long Wait nodes).
+    Instead of holding a worker slot for hours, the engine stores the
+    execution's node outputs and resume point under a timer id and adds it
+    to a Redis sorted set scored by its due time. Every worker polls the set;
+    a Lua claim hands each due timer to exactly one poller, which re-enqueues
+    run_workflow_task through the fair queue with the same execution id. The
+    resumed job restarts at the wait node via start_node_id/initial_outputs.
+    """
+
+    def __init__(self):
+        self.redis: Optional[aioredis.Redis] = None
+        self.running = False
+        self.poll_task: Optional[asyncio.Task] = None
+        self._zstd_compressor = zstandard.ZstdCompressor(level=3) if zstandard else None
+        self._zstd_decompressor = zstandard.ZstdDecompressor() if zstandard else None
+        self.stats = {
+            "suspended": 0,
+            "resumed": 0,
+            "deferred": 0,
+            "duplicates": 0,
+            "missing_state": 0,
+            "errors": 0
+        }
+
+    async def init_redis(self, redis_client: aioredis.Redis):
+        """Initialize with the app's Redis instance (state is stored as bytes)."""
+        pool = redis_client.connection_pool
+        connection_kwargs = {**pool.connection_kwargs, "decode_responses": False}
+        self.redis = aioredis.Redis(
+            connection_pool=aioredis.ConnectionPool(connection_class=pool.connection_class, **connection_kwargs)
+        )
+        self._claim = self.redis.register_script(CLAIM_SCRIPT)
+
+    @property
+    def enabled(self) -> bool:
+        return self.redis is not None
+
+    @staticmethod
+    def timer_id(execution_id: str, node_id: str) -> str:
+        return f"{execution_id}:{node_id}"
+
+    def _encode(self, state: Dict[str, Any]) -> bytes:
+        payload = orjson.dumps(state, default=_snapshot_default)
+        if self._zstd_compressor and len(payload) >= COMPRESSION_MIN_BYTES:
+            return FORMAT_ZSTD + self._zstd_compressor.compress(payload)
+        return FORMAT_RAW + payload
+
+    def _decode(self, data: bytes) -> Dict[str, Any]:
+        header, body = data[:1], data[1:]
+        if header == FORMAT_ZSTD:
+            if not self._zstd_decompressor:
+                raise ValueError("zstd-compressed timer state but zstandard is not installed")
+            body = self._zstd_decompressor.decompress(body)
+        return orjson.loads(body)
+
+    # --- Engine side ---
+
+    async def schedule(self, state: Dict[str, Any]) -> str:
+        """
+        Persists a suspended execution and arms its timer. `state` holds
+        execution_id, node_id, resume_at (epoch seconds) and what the resumed
+        job needs (node_outputs, message, definition reference, user/workspace).
+        """
+        timer_id = await self._arm(state)
+        self.stats["suspended"] += 1
+        return timer_id
+
+    async def defer(self, state: Dict[str, Any]) -> float:
+        """
+        Re-arms a fired timer whose resumed run was refused (rate or billing
+        limit) with exponential backoff. Returns the delay in seconds.
+        """
+        attempts = int(state.get("resume_attempts", 0)) + 1
+        delay = min(settings.TIMER_RETRY_DELAY * 2 ** (attempts - 1), settings.TIMER_RETRY_MAX_DELAY)
+        # A new resume_at also gives the next hand-off a job id of its own
+        await self._arm({**state, "resume_attempts": attempts, "resume_at": time.time() + delay})
+        self.stats["deferred"] += 1
+        return delay
+
+    async def _arm(self, state: Dict[str, Any]) -> str:
+        timer_id = self.timer_id(state["execution_id"], state["node_id"])
+        resume_at = float(state["resume_at"])
+        ttl = max(1, int(resume_at - time.time())) + settings.TIMER_STATE_GRACE
+
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.set(STATE_KEY.format(timer_id), self._encode(state), ex=ttl)
+            pipe.zadd(DUE_KEY, {timer_id: resume_at})
+            await pipe.execute()
+        return timer_id
+
+    async def load(self, timer_id: str) -> Optional[Dict[str, Any]]:
+        """State of a fired timer, for the resumed job (None if it expired)."""
+        data = await self.redis.get(STATE_KEY.format(timer_id))
+        return self._decode(data) if data is not None else None
+
+    async def complete(self, timer_id: str):
+        """Drops a timer's state once the resumed run has finished with it."""
+        await self.redis.delete(STATE_KEY.format(timer_id))
+
+    async def cancel(self, timer_id: str) -> bool:
+        """Disarms a pending timer; the suspended execution is never resumed."""
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.zrem(DUE_KEY, timer_id)
+            pipe.delete(STATE_KEY.format(timer_id))
+            removed, _ = await pipe.execute()
+        return bool(removed)
+
+    # --- Poller ---
+
+    async def start(self):
+        """Starts the poller (every worker runs one; claims keep them from double-firing)."""
+        if not self.enabled or self.running:
+            return
+        self.running = True
+        self.poll_task = asyncio.create_task(self._poll_loop())
+        print(f" Durable timers started (poll interval: {settings.TIMER_POLL_INTERVAL}s)")
+
+    async def stop(self):
+        self.running = False
+        if self.poll_task:
+            self.poll_task.cancel()
+            try:
+                await self.poll_task
+            except asyncio.CancelledError:
+                pass
+            self.poll_task = None
+
+    async def _poll_loop(self):
+        while self.running:
+            try:
+                fired = await self.fire_due()
+                if fired >= settings.TIMER_BATCH_SIZE:
+                    continue
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.stats["errors"] += 1
+                print(f" Timer poll error: {e}")
+            await asyncio.sleep(settings.TIMER_POLL_INTERVAL)
+
+    async def fire_due(self) -> int:
+        """Claims the timers that are due and re-enqueues their executions. Returns how many were claimed."""
+        now = time.time()
+        claimed = await self._claim(
+            keys=[DUE_KEY],
+            args=[now, settings.TIMER_BATCH_SIZE, now + settings.TIMER_CLAIM_TIMEOUT]
+        )
+        if not claimed:
+            return 0
+
+        timer_ids = [_text(timer_id) for timer_id in claimed]
+        blobs = await self.redis.mget([STATE_KEY.format(timer_id) for timer_id in timer_ids])
+        handed_off: List[str] = []
+        for timer_id, blob in zip(timer_ids, blobs):
+            if blob is None:
+                # State expired (or the timer was cancelled mid-claim): nothing to resume
+                self.stats["missing_state"] += 1
+                handed_off.append(timer_id)
+                continue
+            try:
+                await self._resume(timer_id, self._decode(blob))
+                handed_off.append(timer_id)
+            except Exception as e:
+                # Left claimed: retried once the claim times out
+                self.stats["errors"] += 1
+                print(f" Failed to resume timer {timer_id}: {e}")
+
+        if handed_off:
+            await self.redis.zrem(DUE_KEY, *handed_off)
+        return len(timer_ids)
+
+    async def _resume(self, timer_id: str, state: Dict[str, Any]):
+        from app.core.fair_queue import fair_queue
+        from app.core.billing import billing_manager
+        from app.core.rate_limiter import rate_limiter
+
+        execution_id = state["execution_id"]
+        workspace_id = state.get("workspace_id")
+        # Same execution id for the run; a job id of its own so ARQ's result of the first part doesn't block it
+        job_id = f"timer-{timer_id}-{int(state['resume_at'])}"
+        # Like every producer: the worker releases this slot when the job ends
+        await rate_limiter.acquire(state.get("user_id"), workspace_id, job_id)
+        queued = await fair_queue.submit(
+            'run_workflow_task',
+            dict(
+                workflow_id=state.get("workflow_id"),
+                definition_hash=state.get("definition_hash"),
+                job_id=execution_id,
+                user_id=state.get("user_id"),
+                workspace_id=workspace_id,
+                room=state.get("room"),
+                queue=state.get("queue_name", "default"),
+                timer_id=timer_id
+            ),
+            workspace_id=workspace_id,
+            user_id=state.get("user_id"),
+            tier=await billing_manager.get_tier(workspace_id),
+            lane="bulk",
+            queue_name=state.get("queue_name", "default"),
+            job_id=job_id
+        )
+        if queued:
+            self.stats["resumed"] += 1
+        else:
+            # Re-claimed after a slow hand-off: the first submission stands
+            self.stats["duplicates"] += 1
+            await rate_limiter.release(state.get("user_id"), workspace_id)
+
+    async def get_stats(self) -> Dict[str, Any]:
+        stats = {**self.stats, "running": self.running}
+        if self.redis:
+            now = time.time()
+            stats["pending"] = await self.redis.zcard(DUE_KEY)
+            stats["overdue"] = await self.redis.zcount(DUE_KEY, "-inf", now)
+        return stats
+
+
+timer_service = TimerService()
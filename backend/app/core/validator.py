@@ -8,7 +8,6 @@ class GraphValidator:
     """
 
     def __init__(self):
-        # We'll trigger a registry scan once when the validator is used
         pass
 
     def validate(self, graph_data: Dict[str, Any]) -> Tuple[bool, List[str]]:
@@ -23,8 +22,7 @@ class GraphValidator:
         if not nodes:
             return False, ["Workflow graph is empty. Add at least one node."]
 
-        # Ensure Registry is scanned
-        NodeRegistry.scan_and_register()
+        # Node classes are resolved lazily below (manifest lookup, full scan only without one)
 
         # 1. Trigger Check (Multiple Triggers)
         # V1 Constraint: Exactly one entry point
@@ -0,0 +1,179 @@
+import time
+import orjson
+from typing import Any, Dict, List, Optional, Tuple
+import redis.asyncio as aioredis
+from sqlmodel import select
+from app.core.config import settings
+from app.db.session import async_session
+from app.db.models import Workflow, Workspace
+
+ROUTES_KEY = "webhook_index:routes"  # webhook_id/slug -> route entry
+BY_WORKFLOW_KEY = "webhook_index:by_workflow"  # workflow_id -> [webhook ids/slugs]
+
+
+class WebhookIndex:
+    """
+    Routing index for inbound webhooks: webhook_id / slug -> workflow id,
+    trigger node id, workspace, owner, secret and verification type.
+    Maintained when workflows are saved, imported or deleted, stored in Redis
+    and cached in-process, so ingress is a single key lookup instead of a scan
+    over every workflow definition.
+    """
+
+    def __init__(self):
+        self.redis: Optional[aioredis.Redis] = None
+        self.cache_ttl = settings.WEBHOOK_INDEX_CACHE_TTL
+        # key -> (expires_at, entry or None)
+        self._local: Dict[str, Tuple[float, Optional[Dict[str, Any]]]] = {}
+        # Authoritative copy when running without Redis
+        self._routes: Dict[str, Dict[str, Any]] = {}
+        self._by_workflow: Dict[str, List[str]] = {}
+        self.stats = {"local_hits": 0, "index_hits": 0, "misses": 0}
+
+    async def init_redis(self, redis_client: aioredis.Redis):
+        """Initialize with the app's Redis instance."""
+        self.redis = redis_client
+
+    @staticmethod
+    def extract_routes(workflow_id: str, workspace_id: str, definition: Dict[str, Any], owner_id: Optional[str]) -> Dict[str, Dict[str, Any]]:
+        """Route entries for every webhook trigger node in a workflow definition."""
+        routes = {}
+        for node in (definition or {}).get("nodes", []) or []:
+            node_data = node.get("data", {}) or {}
+            if node_data.get("id") != "webhook_trigger" and node.get("type") != "webhook_trigger":
+                continue
+            entry = {
+                "workflow_id": workflow_id,
+                "node_id": node.get("id"),
+                "workspace_id": workspace_id,
+                "owner_id": owner_id,
+                "secret": node_data.get("secret"),
+                "verification_type": node_data.get("verification_type", "generic")
+            }
+            for key in (node_data.get("webhook_id"), node_data.get("webhook_slug")):
+                if key and key not in routes:
+                    routes[key] = entry
+        return routes
+
+    async def rebuild(self):
+        """Rebuilds the whole index from the database (startup / repair)."""
+        routes: Dict[str, Dict[str, Any]] = {}
+        by_workflow: Dict[str, List[str]] = {}
+        try:
+            async with async_session() as db:
+                result = await db.execute(
+                    select(Workflow.id, Workflow.workspace_id, Workflow.definition, Workspace.owner_id).join(Workspace)
+                )
+                rows = result.all()
+        except Exception as e:
+            print(f" Webhook index rebuild failed: {e}")
+            return 0
+
+        for workflow_id, workspace_id, definition, owner_id in rows:
+            wf_routes = self.extract_routes(workflow_id, workspace_id, definition, owner_id)
+            if wf_routes:
+                by_workflow[workflow_id] = list(wf_routes)
+                for key, entry in wf_routes.items():
+                    routes.setdefault(key, entry)
+
+        self._routes, self._by_workflow = routes, by_workflow
+        self._local.clear()
+
+        if self.redis:
+            try:
+                pipe = self.redis.pipeline(transaction=True)
+                pipe.delete(ROUTES_KEY, BY_WORKFLOW_KEY)
+                if routes:
+                    pipe.hset(ROUTES_KEY, mapping={k: orjson.dumps(v) for k, v in routes.items()})
+                    pipe.hset(BY_WORKFLOW_KEY, mapping={k: orjson.dumps(v) for k, v in by_workflow.items()})
+                await pipe.execute()
+            except Exception as e:
+                print(f" Webhook index publish to Redis failed: {e}")
+
+        print(f" Webhook index built ({len(routes)} routes across {len(by_workflow)} workflows)")
+        return len(routes)
+
+    async def update_workflow(self, workflow: Workflow, owner_id: Optional[str] = None):
+        """Re-indexes one workflow after it was created or its definition changed."""
+        try:
+            routes = self.extract_routes(workflow.id, workflow.workspace_id, workflow.definition, owner_id)
+            if routes and owner_id is None:
+                async with async_session() as db:
+                    result = await db.execute(select(Workspace.owner_id).where(Workspace.id == workflow.workspace_id))
+                    owner_id = result.scalar_one_or_none()
+                for entry in routes.values():
+                    entry["owner_id"] = owner_id
+            await self._replace(workflow.id, routes)
+        except Exception as e:
+            print(f" Webhook index update error: {e}")
+
+    async def remove_workflow(self, workflow_id: str):
+        """Drops every route of a deleted workflow."""
+        try:
+            await self._replace(workflow_id, {})
+        except Exception as e:
+            print(f" Webhook index removal error: {e}")
+
+    async def _replace(self, workflow_id: str, routes: Dict[str, Dict[str, Any]]):
+        if self.redis:
+            previous = await self.redis.hget(BY_WORKFLOW_KEY, workflow_id)
+            old_keys = orjson.loads(previous) if previous else []
+        else:
+            old_keys = self._by_workflow.get(workflow_id, [])
+
+        stale = [k for k in old_keys if k not in routes]
+
+        # Local state
+        for key in stale:
+            self._routes.pop(key, None)
+        self._routes.update(routes)
+        if routes:
+            self._by_workflow[workflow_id] = list(routes)
+        else:
+            self._by_workflow.pop(workflow_id, None)
+        for key in [*stale, *routes]:
+            self._local.pop(key, None)
+
+        if not self.redis or not (stale or routes):
+            return
+
+        pipe = self.redis.pipeline(transaction=True)
+        if stale:
+            pipe.hdel(ROUTES_KEY, *stale)
+        if routes:
+            pipe.hset(ROUTES_KEY, mapping={k: orjson.dumps(v) for k, v in routes.items()})
+            pipe.hset(BY_WORKFLOW_KEY, workflow_id, orjson.dumps(list(routes)))
+        else:
+            pipe.hdel(BY_WORKFLOW_KEY, workflow_id)
+        await pipe.execute()
+
+    async def lookup(self, webhook_id: str) -> Optional[Dict[str, Any]]:
+        """Resolves a webhook id or slug to its route entry (None if unknown)."""
+        cached = self._local.get(webhook_id)
+        now = time.monotonic()
+        if cached and cached[0] > now:
+            self.stats["local_hits"] += 1
+            return cached[1]
+
+        if self.redis:
+            try:
+                raw = await self.redis.hget(ROUTES_KEY, webhook_id)
+                entry = orjson.loads(raw) if raw else None
+            except Exception as e:
+                print(f" Webhook index lookup error: {e}")
+                entry = self._routes.get(webhook_id)
+        else:
+            entry = self._routes.get(webhook_id)
+
+        self.stats["index_hits" if entry else "misses"] += 1
+        # Negative results are cached too, so floods of unknown ids stay local
+        self._local[webhook_id] = (now + self.cache_ttl, entry)
+        if len(self._local) > settings.WEBHOOK_INDEX_CACHE_SIZE:
+            self._local.clear()
+        return entry
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {**self.stats, "routes": len(self._routes), "cached": len(self._local)}
+
+
+webhook_index = WebhookIndex()
@@ -7,31 +7,74 @@ from arq.connections import RedisSettings
 from app.core.engine import engine
 from app.core.config import settings
 from app.core.timeout import execute_with_timeout, TimeoutError
-from app.core.rate_limiter import rate_limiter
+from app.core.rate_limiter import rate_limiter, RATE_LIMITED_PREFIX
+from app.core.billing import BillingLimitExceeded
 from app.core.dlq import dlq
+from app.core.timers import timer_service, SUSPENDED_PREFIX
 import json
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
-async def run_workflow_task(ctx, graph_data: Dict[str, Any], message: str, job_id: str, start_node_id: str = None, initial_outputs: Dict[str, Any] = None, user_id: str = None, workspace_id: str = None, queue: str = "default"):
+async def run_workflow_task(ctx, graph_data: Optional[Dict[str, Any]] = None, message: str = "", job_id: str = None, start_node_id: str = None, initial_outputs: Dict[str, Any] = None, user_id: str = None, workspace_id: str = None, queue: str = "default", room: str = None, debug_mode: bool = False, workflow_id: str = None, definition_hash: str = None, timer_id: str = None):
     """
     Background task to process a workflow with timeout and rate limiting.
-    Uses Redis to broadcast updates back to the API/UI.
+    Uses Redis to broadcast updates back to the API/UI; `room` is the
+    WebSocket room (workflow) that receives them.
+    Jobs reference the definition by `workflow_id` + `definition_hash`
+    (resolved through workflow_store); an inline `graph_data` is still accepted.
+    `timer_id` marks a run resumed by a durable timer: its resume point and
+    node outputs are loaded from the timer's state.
     """
     print(f"[START] [Worker:{queue}] Starting job {job_id} {'(Resume from '+start_node_id+')' if start_node_id else ''}")
     
     # Create a broadcaster that sends events to Redis Pub/Sub
     redis = ctx['redis']
+    room = room or workflow_id or (graph_data or {}).get("id")
+    plan_hash = None
+    timer_state = None
+    # Refused by the engine before it started (rate or billing limit)
+    rejected = False
     
     async def redis_broadcaster(event_type: str, node_id: str, data: Any = None):
         payload = {
             "type": event_type,
             "nodeId": node_id,
             "data": data,
-            "jobId": job_id
+            "jobId": job_id,
+            "room": room
         }
         await redis.publish(f"workflow_updates_{job_id}", json.dumps(payload))
     
     try:
+        context = {
+            "user_id": user_id,
+            "workspace_id": workspace_id,
+            "debug_mode": debug_mode,
+            # Long waits suspend the run and come back through this queue
+            "suspendable": True,
+            "workflow_id": workflow_id,
+            "definition_hash": definition_hash,
+            "room": room,
+            "queue_name": WorkerSettings.queue_name
+        }
+        if timer_id:
+            timer_state = await timer_service.load(timer_id)
+            if timer_state is None:
+                raise LookupError(f"State of durable timer {timer_id} has expired")
+            graph_data = timer_state.get("graph", graph_data)
+            message = timer_state["message"]
+            start_node_id = timer_state["node_id"]
+            initial_outputs = timer_state["node_outputs"]
+            context["resumed_timer"] = {
+                "node_id": timer_state["node_id"],
+                "suspended_at": timer_state["suspended_at"],
+                "wait_info": timer_state.get("wait_info", {})
+            }
+
+        if graph_data is None:
+            from app.core.workflow_store import workflow_store
+            compiled = await workflow_store.resolve(workflow_id, definition_hash)
+            graph_data, plan_hash = compiled.graph, compiled.plan_hash
+        
         # Execute workflow with global timeout
         result = await execute_with_timeout(
             engine.process_workflow(
@@ -41,15 +84,32 @@ async def run_workflow_task(ctx, graph_data: Dict[str, Any], message: str, job_i
                 execution_id=job_id,
                 start_node_id=start_node_id,
                 initial_outputs=initial_outputs,
-                context={"user_id": user_id, "workspace_id": workspace_id}
+                context=context,
+                plan_hash=plan_hash
             ),
             timeout=settings.WORKFLOW_TIMEOUT
         )
+        rejected = result.startswith(RATE_LIMITED_PREFIX)
+        if rejected and timer_state is not None:
+            # Still suspended: the timer is re-armed below instead of reporting an outcome
+            return
         
+        if result.startswith(SUSPENDED_PREFIX):
+            # Parked on a durable timer; the execution continues in a later job
+            await redis.publish(f"workflow_updates_{job_id}", json.dumps({
+                "type": "workflow_suspended",
+                "jobId": job_id,
+                "room": room,
+                "result": result
+            }))
+            print(f"[WAIT] [Worker:{queue}] Job {job_id} suspended: {result}")
+            return
+
         # Broadcast final result
         await redis.publish(f"workflow_updates_{job_id}", json.dumps({
             "type": "workflow_completed",
             "jobId": job_id,
+            "room": room,
             "result": result
         }))
         print(f"[OK] [Worker:{queue}] Job {job_id} completed successfully.")
@@ -60,6 +120,7 @@ async def run_workflow_task(ctx, graph_data: Dict[str, Any], message: str, job_i
         await redis.publish(f"workflow_updates_{job_id}", json.dumps({
             "type": "workflow_failed",
             "jobId": job_id,
+            "room": room,
             "error": error_msg,
             "error_type": "timeout"
         }))
@@ -76,12 +137,17 @@ async def run_workflow_task(ctx, graph_data: Dict[str, Any], message: str, job_i
             print(f"[DLQ ERROR] Failed to capture timeout: {dlq_err}")
         
     except Exception as e:
+        rejected = isinstance(e, BillingLimitExceeded)
+        if rejected and timer_state is not None:
+            print(f"[LIMIT] [Worker:{queue}] Job {job_id} refused: {e}")
+            return
         import traceback
         error_trace = traceback.format_exc()
         print(f"[ERROR] [Worker:{queue}] Job {job_id} failed: {str(e)}")
         await redis.publish(f"workflow_updates_{job_id}", json.dumps({
             "type": "workflow_failed",
             "jobId": job_id,
+            "room": room,
             "error": str(e),
             "trace": error_trace
         }))
@@ -101,6 +167,23 @@ async def run_workflow_task(ctx, graph_data: Dict[str, Any], message: str, job_i
         # Release rate limit slots
         if user_id:
             await rate_limiter.release(user_id, workspace_id)
+        if timer_state is not None:
+            if rejected:
+                # Never started: keep the suspended state and try again later
+                delay = await timer_service.defer(timer_state)
+                print(f"[WAIT] [Worker:{queue}] Job {job_id} refused by limits, resuming again in {delay:.0f}s")
+            else:
+                # The timer's state was consumed by this run (a later wait node has a timer of its own)
+                await timer_service.complete(timer_id)
+
+async def run_map_shard(ctx, map_id: str):
+    """
+    Shard job of a distributed Parallel Map: claims shards of the map until
+    none are pending and streams each item's outcome back to the parent.
+    """
+    from app.core.map_reduce import map_reduce
+    shards = await map_reduce.run_shards(map_id)
+    print(f"[MAP] Ran {shards} shards of map {map_id}")
 
 async def run_webhook_task(ctx, webhook_data: Dict[str, Any], job_id: str):
     """
@@ -135,22 +218,119 @@ async def startup(ctx):
     await rate_limiter.init_redis(ctx['redis'])
     print(f"[INFO] Rate limiter initialized (User: {settings.MAX_CONCURRENT_JOBS_PER_USER}, Workspace: {settings.MAX_CONCURRENT_JOBS_PER_WORKSPACE})")
     
+    # Share the node result cache and coalesce identical cacheable calls across workers
+    from app.core.cache import cache_manager
+    from app.core.single_flight import single_flight
+    await cache_manager.init_redis(ctx['redis'])
+    await single_flight.init_redis(ctx['redis'])
+    
+    # Workflow definitions referenced by queued jobs
+    from app.core.workflow_store import workflow_store
+    await workflow_store.init_redis(ctx['redis'])
+    
+    # Fair-share dispatcher: one worker holds the lease and feeds the ARQ queues
+    from app.core.fair_queue import fair_queue
+    await fair_queue.init_redis(ctx['redis'], ctx['redis'])
+    await fair_queue.start()
+    
+    # Split In Batches cursors shared by all workers
+    from app.core.batch_cursor import batch_cursors
+    await batch_cursors.init_redis(ctx['redis'])
+    
+    # Distributed Parallel Map shards
+    from app.core.map_reduce import map_reduce
+    await map_reduce.init_redis(ctx['redis'])
+    
+    # Durable timers: resume executions suspended at long Wait nodes
+    await timer_service.init_redis(ctx['redis'])
+    await timer_service.start()
+    
+    # Debugger commands for executions paused in this worker
+    from app.core.debugger import debugger
+    await debugger.init_redis(ctx['redis'])
+    
+    # Usage metering in Redis, reconciled to Postgres in bulk
+    from app.core.billing import billing_manager
+    await billing_manager.init_redis(ctx['redis'])
+    await billing_manager.start()
+    
+    # Node analytics and latency sketches from this worker (merged in Redis)
+    from app.core.analytics import analytics_tracker
+    await analytics_tracker.init_redis(ctx['redis'])
+    
     # Initialize and start worker monitor
     from app.core.worker_monitor import worker_monitor
     await worker_monitor.init_redis(ctx['redis'])
     await worker_monitor.start_heartbeat(worker_type="default")
+    
+    # Start write-behind execution recorder
+    from app.core.execution_recorder import execution_recorder
+    await execution_recorder.start()
+    
+    # Shared outbound HTTP connection pools for node executions
+    from app.core.http_client import http_client
+    await http_client.start()
+    
+    # Content-addressed store for large inter-node payloads (+ its GC)
+    from app.core.payload_store import payload_store
+    await payload_store.start()
+    
+    # Warm code sandbox workers (pre-forked, recycled)
+    from app.core.sandbox import sandbox_pool
+    await sandbox_pool.start()
+    
+    # Persistent Node.js workers for the JavaScript Code node
+    from app.core.js_runtime import js_runtime
+    await js_runtime.start()
+    
+    # Node registry manifest: node modules are imported on first use instead of scanned
+    from app.nodes.registry import NodeRegistry
+    NodeRegistry.load_manifest(validate=settings.NODE_MANIFEST_VALIDATE)
 
 async def shutdown(ctx):
     print("[INFO] Worker shutting down...")
+    # Hand the dispatcher lease over right away
+    from app.core.fair_queue import fair_queue
+    await fair_queue.stop()
+    await timer_service.stop()
+    
     # Stop worker monitor
     from app.core.worker_monitor import worker_monitor
     await worker_monitor.stop_heartbeat()
+    
+    # Flush buffered execution records (crash-safe: nothing in memory is dropped)
+    from app.core.execution_recorder import execution_recorder
+    await execution_recorder.stop()
+    
+    from app.core.single_flight import single_flight
+    await single_flight.stop()
+    
+    from app.core.debugger import debugger
+    await debugger.stop()
+    
+    from app.core.billing import billing_manager
+    await billing_manager.stop()
+    
+    from app.core.analytics import analytics_tracker
+    await analytics_tracker.stop()
+    
+    from app.core.payload_store import payload_store
+    await payload_store.stop()
+    
+    from app.core.sandbox import sandbox_pool
+    await sandbox_pool.stop()
+    
+    from app.core.js_runtime import js_runtime
+    await js_runtime.stop()
+    
+    from app.core.http_client import http_client
+    await http_client.close()
 
 class WorkerSettings:
     """
     ARQ Worker configuration with multi-queue support
     """
-    functions = [run_workflow_task, run_webhook_task]
+    functions = [run_workflow_task, run_webhook_task, run_map_shard]
     redis_settings = RedisSettings(
         host=settings.REDIS_HOST,
         port=int(settings.REDIS_PORT),
@@ -106,7 +106,8 @@ class WorkerMonitor:
             return 0
         
         try:
-            depth = await self.redis.llen(queue_name)
+            # ARQ queues are sorted sets scored by run time
+            depth = await self.redis.zcard(queue_name)
             return depth or 0
         except Exception as e:
             print(f"Error getting queue depth: {e}")
@@ -124,6 +125,29 @@ class WorkerMonitor:
         }
         
         stats["total_pending"] = stats["default_queue"] + stats["webhook_queue"]
+        
+        # Per-tenant backlog of the fair-share queues, with queue wait percentiles
+        try:
+            from app.core.fair_queue import fair_queue
+            from app.core.analytics import analytics_tracker
+            fair_share = await fair_queue.get_stats()
+            waits = await analytics_tracker.get_latency_percentiles("queue_wait", window="15m", limit=1000)
+            fair_share["wait_15m"] = {w.pop("name"): w for w in waits}
+            for target, queue in fair_share.get("queues", {}).items():
+                stats["total_pending"] += queue["pending"]
+                if target not in ("arq:queue", "arq:queue:webhook"):
+                    stats["total_pending"] += queue["ready"]
+            stats["fair_share"] = fair_share
+        except Exception as e:
+            print(f"Error getting fair-share queue stats: {e}")
+        
+        # Executions suspended on durable timers (long Wait nodes)
+        try:
+            from app.core.timers import timer_service
+            stats["timers"] = await timer_service.get_stats()
+        except Exception as e:
+            print(f"Error getting durable timer stats: {e}")
+        
         return stats
     
     async def get_health_status(self) -> Dict[str, Any]:
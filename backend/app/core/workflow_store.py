@@ -0,0 +1,188 @@
+import hashlib
+import time
+import orjson
+import redis.asyncio as aioredis
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+from sqlmodel import select
+from app.core.config import settings
+from app.core.execution_plan import plan_cache
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+DEFINITION_KEY = "workflow:definition:{}"
+
+# 1-byte header on stored definitions (same scheme as the node result cache)
+FORMAT_RAW = b"\x01"
+FORMAT_ZSTD = b"\x03"
+COMPRESSION_MIN_BYTES = 4096
+
+
+class CompiledWorkflow:
+    """A resolved definition plus the hash of its execution plan (already compiled)."""
+
+    __slots__ = ("graph", "definition_hash", "plan_hash")
+
+    def __init__(self, graph: Dict[str, Any], definition_hash: str, plan_hash: str):
+        self.graph = graph
+        self.definition_hash = definition_hash
+        self.plan_hash = plan_hash
+
+
+class WorkflowStore:
+    """
+    Content-addressed workflow definitions for queued jobs.
+    Producers publish a definition once per version (SET in Redis under its
+    hash) and enqueue only {workflow_id, definition_hash}; workers resolve the
+    reference through a local LRU of compiled workflows, then Redis, then
+    Postgres (the saved definition or one of its WorkflowVersions).
+    Thousands of jobs for one workflow version therefore cost one copy of
+    the graph in Redis and one decode + plan compile per worker.
+    """
+
+    def __init__(self, max_size: int = None):
+        self.redis: Optional[aioredis.Redis] = None
+        self.max_size = max_size or settings.WORKFLOW_STORE_CACHE_SIZE
+        self._compiled: "OrderedDict[str, CompiledWorkflow]" = OrderedDict()
+        # definition hash -> time until which Redis is known to hold it
+        self._published: Dict[str, float] = {}
+        # (workflow id, updated_at) -> definition hash, so saved workflows are hashed once
+        self._saved_hashes: "OrderedDict[Tuple[str, str], str]" = OrderedDict()
+        self._zstd_compressor = zstandard.ZstdCompressor(level=3) if zstandard else None
+        self._zstd_decompressor = zstandard.ZstdDecompressor() if zstandard else None
+        self.stats = {
+            "published": 0,
+            "local_hits": 0,
+            "redis_hits": 0,
+            "db_loads": 0,
+            "evictions": 0
+        }
+
+    async def init_redis(self, redis_client: aioredis.Redis):
+        """Initialize with the app's Redis instance (definitions are stored as bytes)."""
+        pool = redis_client.connection_pool
+        connection_kwargs = {**pool.connection_kwargs, "decode_responses": False}
+        self.redis = aioredis.Redis(
+            connection_pool=aioredis.ConnectionPool(connection_class=pool.connection_class, **connection_kwargs)
+        )
+
+    @staticmethod
+    def content_hash(graph_data: Dict[str, Any]) -> str:
+        """Hash of the whole definition (unlike the plan hash, settings and ids count too)."""
+        payload = orjson.dumps(graph_data, option=orjson.OPT_SORT_KEYS, default=str)
+        return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+    def _encode(self, graph_data: Dict[str, Any]) -> bytes:
+        payload = orjson.dumps(graph_data, default=str)
+        if self._zstd_compressor and len(payload) >= COMPRESSION_MIN_BYTES:
+            return FORMAT_ZSTD + self._zstd_compressor.compress(payload)
+        return FORMAT_RAW + payload
+
+    def _decode(self, data: bytes) -> Dict[str, Any]:
+        header, body = data[:1], data[1:]
+        if header == FORMAT_ZSTD:
+            if not self._zstd_decompressor:
+                raise ValueError("zstd-compressed workflow definition but zstandard is not installed")
+            body = self._zstd_decompressor.decompress(body)
+        return orjson.loads(body)
+
+    def _remember(self, definition_hash: str, graph_data: Dict[str, Any]) -> CompiledWorkflow:
+        plan_hash = plan_cache.definition_hash(graph_data)
+        # Compile now so the first execution of this version finds its plan
+        plan_cache.get_plan(graph_data, plan_hash)
+        compiled = CompiledWorkflow(graph_data, definition_hash, plan_hash)
+        self._compiled[definition_hash] = compiled
+        self._compiled.move_to_end(definition_hash)
+        if len(self._compiled) > self.max_size:
+            self._compiled.popitem(last=False)
+            self.stats["evictions"] += 1
+        return compiled
+
+    async def publish(self, graph_data: Dict[str, Any], definition_hash: Optional[str] = None) -> str:
+        """Makes a definition resolvable by workers and returns its hash (the job reference)."""
+        definition_hash = definition_hash or self.content_hash(graph_data)
+        if definition_hash not in self._compiled:
+            self._remember(definition_hash, graph_data)
+
+        if self.redis and self._published.get(definition_hash, 0) <= time.time():
+            # Re-SET at most every half TTL per process; that also keeps hot versions alive
+            await self.redis.set(DEFINITION_KEY.format(definition_hash), self._encode(graph_data), ex=settings.WORKFLOW_STORE_TTL)
+            self._published[definition_hash] = time.time() + settings.WORKFLOW_STORE_TTL / 2
+            if len(self._published) > self.max_size * 4:
+                now = time.time()
+                self._published = {h: t for h, t in self._published.items() if t > now}
+            self.stats["published"] += 1
+        return definition_hash
+
+    async def publish_workflow(self, workflow) -> str:
+        """publish() for a saved Workflow row; hashes each saved version only once."""
+        key = (workflow.id, str(workflow.updated_at))
+        definition_hash = self._saved_hashes.get(key)
+        if definition_hash is None:
+            definition_hash = self.content_hash(workflow.definition)
+            self._saved_hashes[key] = definition_hash
+            if len(self._saved_hashes) > self.max_size:
+                self._saved_hashes.popitem(last=False)
+        return await self.publish(workflow.definition, definition_hash)
+
+    async def resolve(self, workflow_id: Optional[str], definition_hash: str) -> CompiledWorkflow:
+        """
+        Definition referenced by a job: local LRU -> Redis -> Postgres.
+        Raises LookupError if the version cannot be found anywhere.
+        """
+        compiled = self._compiled.get(definition_hash)
+        if compiled is not None:
+            self._compiled.move_to_end(definition_hash)
+            self.stats["local_hits"] += 1
+            return compiled
+
+        if self.redis:
+            try:
+                data = await self.redis.get(DEFINITION_KEY.format(definition_hash))
+            except Exception as e:
+                print(f" Workflow store: Redis lookup failed: {e}")
+                data = None
+            if data is not None:
+                self.stats["redis_hits"] += 1
+                return self._remember(definition_hash, self._decode(data))
+
+        graph_data = await self._load_from_db(workflow_id, definition_hash)
+        if graph_data is None:
+            raise LookupError(f"Workflow definition {definition_hash} (workflow {workflow_id}) is no longer available")
+        self.stats["db_loads"] += 1
+        # Republish so the other workers don't fall through to Postgres too
+        await self.publish(graph_data, definition_hash)
+        return self._compiled[definition_hash]
+
+    async def _load_from_db(self, workflow_id: Optional[str], definition_hash: str) -> Optional[Dict[str, Any]]:
+        if not workflow_id:
+            return None
+        from app.db.session import async_session
+        from app.db.models import Workflow, WorkflowVersion
+
+        async with async_session() as db:
+            workflow = await db.get(Workflow, workflow_id)
+            if workflow is None:
+                return None
+            if self.content_hash(workflow.definition) == definition_hash:
+                return workflow.definition
+            # Edited since the job was queued: look for the exact version
+            result = await db.execute(
+                select(WorkflowVersion)
+                .where(WorkflowVersion.workflow_id == workflow_id)
+                .order_by(WorkflowVersion.created_at.desc())
+                .limit(settings.WORKFLOW_STORE_VERSION_SCAN)
+            )
+            for version in result.scalars().all():
+                if self.content_hash(version.definition) == definition_hash:
+                    return version.definition
+        return None
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {**self.stats, "size": len(self._compiled), "max_size": self.max_size}
+
+
+workflow_store = WorkflowStore()
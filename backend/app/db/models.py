@@ -1,6 +1,7 @@
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 from sqlmodel import SQLModel, Field, Relationship, Column, JSON
+from sqlalchemy import Index, text
 import uuid
 
 class User(SQLModel, table=True):
@@ -172,6 +173,9 @@ class NodeExecution(SQLModel, table=True):
 
 class Schedule(SQLModel, table=True):
     """Recurring workflow triggers based on CRON expressions."""
+    # The scheduler only ever reads enabled schedules by next fire time
+    __table_args__ = (Index("ix_schedule_due", "next_run_at", postgresql_where=text("enabled")),)
+
     id: str = Field(default_factory=lambda: str(uuid.uuid4()), primary_key=True)
     workflow_id: str = Field(foreign_key="workflow.id", index=True)
     workspace_id: str = Field(foreign_key="workspace.id", index=True)
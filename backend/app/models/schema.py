@@ -41,5 +41,7 @@ class ExecutionRequest(BaseModel):
     message: str
     graph: WorkflowGraph
     workspace_id: Optional[str] = None
+    workflow_id: Optional[str] = None  # WebSocket room that receives execution events
+    debug_mode: bool = False  # Honour debugger breakpoints (app/api/debug.py)
     class Config:
         extra = "allow"
@@ -86,10 +86,10 @@ class UniversalAgentNode(BaseNode):
             # 2. Resolve Dependencies
             for p_node in precursors:
                 p_type_orig = str(p_node.get("data", {}).get("node_type") or p_node.get("data", {}).get("id") or p_node.get("type"))
-                p_instance = factory.get_node(p_type_orig, p_node.get("data", {}))
-                if not p_instance: continue
-                
                 child_context = {**context, "node_id": p_node["id"]}
+                # Same instance the engine used for this precursor in this run (pooled)
+                p_instance = await factory.get_instance(p_type_orig, p_node.get("data", {}), child_context)
+                if not p_instance: continue
                 
                 # Check for specific object getters
                 if hasattr(p_instance, "get_langchain_object"):
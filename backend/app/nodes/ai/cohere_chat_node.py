@@ -3,7 +3,6 @@ Cohere Chat Node - Studio Standard (Universal Method)
 Batch 100: AI & LLM (The Grande Finale)
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 import json
 from ..base import BaseNode
 from ..registry import register_node
@@ -138,7 +137,7 @@ class CohereChatNode(BaseNode):
             # 3. Connect to Real API
             url = "https://api.cohere.com/v1/chat"
             
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 async with session.post(url, headers=headers, json=payload) as resp:
                     if resp.status != 200:
                         error_text = await resp.text()
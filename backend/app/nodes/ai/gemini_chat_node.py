@@ -3,7 +3,6 @@ Gemini Chat Node - Studio Standard (Universal Method)
 Batch 100: AI & LLM (The Grande Finale)
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 import json
 from ..base import BaseNode
 from ..registry import register_node
@@ -119,7 +118,7 @@ class GeminiChatNode(BaseNode):
             # 3. Connect to Real API (AI Studio REST)
             url = f"https://generativelanguage.googleapis.com/v1beta/models/{model}:generateContent?key={api_key}"
             
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 async with session.post(url, headers=headers, json=payload) as resp:
                     if resp.status != 200:
                         error_text = await resp.text()
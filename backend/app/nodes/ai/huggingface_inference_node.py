@@ -3,7 +3,6 @@ HuggingFace Inference Node - Studio Standard (Universal Method)
 Batch 100: AI & LLM (The Grande Finale)
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 import json
 from ..base import BaseNode
 from ..registry import register_node
@@ -118,7 +117,7 @@ class HuggingFaceInferenceNode(BaseNode):
             # 3. Connect to Real API
             url = f"https://api-inference.huggingface.co/models/{model_id}"
             
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 async with session.post(url, headers=headers, json=payload) as resp:
                     if resp.status != 200:
                         error_text = await resp.text()
@@ -3,7 +3,6 @@ Hugging Face Node - Studio Standard (Universal Method)
 Batch 118: AI Essentials & Local Inference
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -91,7 +90,7 @@ class HuggingFaceNode(BaseNode):
             }
             payload = {"inputs": inputs}
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 async with session.post(url, headers=headers, json=payload) as response:
                     if response.status != 200:
                         text = await response.text()
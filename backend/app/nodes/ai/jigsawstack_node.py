@@ -3,7 +3,6 @@ JigsawStack Node - Studio Standard (Universal Method)
 Batch 116: Specialized Toolkits
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -95,7 +94,7 @@ class JigsawStackNode(BaseNode):
                 "Content-Type": "application/json"
             }
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "ai_scrape":
                     target = url_cfg or text
                     payload = {"url": target}
@@ -3,7 +3,6 @@ LM Studio Node - Studio Standard (Universal Method)
 Batch 118: AI Essentials & Local Inference
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -104,7 +103,7 @@ class LMStudioNode(BaseNode):
                 "max_tokens": int(self.get_config("max_tokens", 1024))
             }
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 async with session.post(url, headers=headers, json=payload) as response:
                     if response.status != 200:
                         text = await response.text()
@@ -3,7 +3,6 @@ Ollama Node - Studio Standard (Universal Method)
 Batch 114: Advanced AI Frameworks & Memory
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 import json
 from ..base import BaseNode
 from ..registry import register_node
@@ -119,7 +118,7 @@ class OllamaNode(BaseNode):
             if self.get_config("json_mode"):
                 payload["format"] = "json"
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 async with session.post(url, json=payload) as response:
                     if response.status != 200:
                         text = await response.text()
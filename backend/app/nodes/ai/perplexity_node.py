@@ -3,7 +3,6 @@ Perplexity Node - Studio Standard (Universal Method)
 Batch 114: Advanced AI Frameworks & Memory
 """
 from typing import Any, Dict, Optional
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -88,7 +87,7 @@ class PerplexityNode(BaseNode):
                 "messages": [{"role": "user", "content": prompt}]
             }
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 async with session.post(url, headers=headers, json=payload) as response:
                     if response.status != 200:
                         return {"status": "error", "error": f"Perplexity error {response.status}"}
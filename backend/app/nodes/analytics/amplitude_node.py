@@ -3,7 +3,6 @@ Amplitude Node - Studio Standard
 Batch 70: Advanced Analytics
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 import base64
 from ..base import BaseNode
 from ..registry import register_node
@@ -92,7 +91,7 @@ class AmplitudeNode(BaseNode):
             
             action = self.get_config("action", "get_user_profile")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "get_user_profile":
                     user_id = self.get_config("user_id") or str(input_data)
                     # Behavioral Graph API
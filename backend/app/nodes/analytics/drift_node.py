@@ -3,7 +3,6 @@ Drift Node - Studio Standard (Universal Method)
 Batch 109: Analytics & Support
 """
 from typing import Any, Dict, Optional
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -68,7 +67,7 @@ class DriftNode(BaseNode):
             
             action = self.get_config("action", "create_contact")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "create_contact":
                     email = self.get_config("email")
                     if not email: return {"status": "error", "error": "email required"}
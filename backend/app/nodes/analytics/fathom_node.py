@@ -3,7 +3,6 @@ Fathom Node - Studio Standard
 Batch 70: Advanced Analytics
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -84,7 +83,7 @@ class FathomNode(BaseNode):
             base_url = "https://api.usefathom.com/v1"
             action = self.get_config("action", "list_sites")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "list_sites":
                     async with session.get(f"{base_url}/sites", headers=headers) as resp:
                         res_data = await resp.json()
@@ -3,7 +3,6 @@ Google Analytics Node - Studio Standard (Universal Method)
 Batch 109: Analytics & Support
 """
 from typing import Any, Dict, Optional
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -106,7 +105,7 @@ class GoogleAnalyticsNode(BaseNode):
             
             action = self.get_config("action", "run_report")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "run_report":
                     property_id = self.get_config("property_id")
                     if not property_id:
@@ -3,7 +3,6 @@ Heap Node - Studio Standard (Universal Method)
 Batch 98: Analytics (Enterprise Expansion)
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -103,7 +102,7 @@ class HeapNode(BaseNode):
             props_str = self.get_config("properties", "{}")
             props = json.loads(props_str) if isinstance(props_str, str) else props_str
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "track_event":
                     event = self.get_config("event_name")
                     if not event:
@@ -3,7 +3,6 @@ Hotjar Node - Studio Standard (Universal Method)
 Batch 109: Analytics & Support
 """
 from typing import Any, Dict, Optional
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -84,7 +83,7 @@ class HotjarNode(BaseNode):
              
             action = self.get_config("action", "get_surveys")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 # Hotjar API is limited for general data access without specific Enterprise exports
                 # Implementation here is a best-effort structural placeholder for when access is granted
                 
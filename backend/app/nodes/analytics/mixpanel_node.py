@@ -3,7 +3,6 @@ Mixpanel Node - Studio Standard (Universal Method)
 Batch 109: Analytics & Support
 """
 from typing import Any, Dict, Optional
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -80,7 +79,7 @@ class MixpanelNode(BaseNode):
             
             action = self.get_config("action", "track_event")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "track_event":
                     event_name = self.get_config("event_name")
                     distinct_id = self.get_config("distinct_id")
@@ -3,7 +3,6 @@ PostHog Node - Studio Standard (Universal Method)
 Batch 109: Analytics & Support
 """
 from typing import Any, Dict, Optional
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -89,7 +88,7 @@ class PostHogNode(BaseNode):
             
             action = self.get_config("action", "capture_event")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "capture_event":
                     event = self.get_config("event")
                     distinct_id = self.get_config("distinct_id")
@@ -89,7 +89,7 @@ class SegmentNode(BaseNode):
             
             action = self.get_config("action", "track_event")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "track_event":
                     event = self.get_config("event")
                     user_id = self.get_config("user_id")
@@ -3,7 +3,6 @@ Avis Node - Studio Standard (Universal Method)
 Batch 88: Automotive & Fleet
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -74,7 +73,7 @@ class AvisNode(BaseNode):
             base_url = "https://stage.abgapiservices.com:443/cars/catalog/v1"
             action = self.get_config("action", "search_rentals")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "search_rentals":
                     pickup = self.get_config("pickup_location") or str(input_data)
                     url = f"{base_url}/vehicles"
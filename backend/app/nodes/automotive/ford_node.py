@@ -3,7 +3,6 @@ Ford Node - Studio Standard (Universal Method)
 Batch 88: Automotive & Fleet
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -80,7 +79,7 @@ class FordNode(BaseNode):
             action = self.get_config("action", "get_vehicle_status")
             vin = self.get_config("vin")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "get_vehicle_status":
                     url = f"{base_url}/vehicles/v4/{vin}/status"
                     async with session.get(url, headers=headers) as resp:
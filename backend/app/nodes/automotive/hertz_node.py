@@ -3,7 +3,6 @@ Hertz Node - Studio Standard (Universal Method)
 Batch 88: Automotive & Fleet
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -75,7 +74,7 @@ class HertzNode(BaseNode):
             base_url = "https://api.hertz.com/v1"
             action = self.get_config("action", "search_vehicles")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "search_vehicles":
                     location = self.get_config("location") or str(input_data)
                     url = f"{base_url}/vehicles/search"
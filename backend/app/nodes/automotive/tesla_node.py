@@ -3,7 +3,6 @@ Tesla Node - Studio Standard (Universal Method)
 Batch 88: Automotive & Fleet
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -75,7 +74,7 @@ class TeslaNode(BaseNode):
             base_url = "https://owner-api.teslamotors.com/api/1"
             action = self.get_config("action", "list_vehicles")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "list_vehicles":
                     url = f"{base_url}/vehicles"
                     async with session.get(url, headers=headers) as resp:
@@ -1,8 +1,10 @@
 from abc import ABC, abstractmethod
 from typing import Any, Dict, Optional, Type, List, Tuple
+from datetime import datetime
 import time
 from pydantic import BaseModel, ValidationError, Field
 from app.core.credentials import cred_manager
+from app.core.payload_store import LazyPayload, materialize
 
 # Phase 2: Node Law - Mandatory Schema
 class NodeSchema(BaseModel):
@@ -34,6 +36,14 @@ class BaseNode(ABC):
     credentials_required: List[str] = []
     deprecated: bool = False
 
+    # True if the node keeps no per-call state on the instance, so one
+    # instance per config can be reused across executions (see NodeInstancePool)
+    reusable: bool = False
+
+    # True if execute() accepts LazyPayload handles for large inputs (see
+    # PayloadStore) and materializes them itself; others get plain values
+    lazy_inputs: bool = False
+
     node_id: str = "" 
     config_model: Optional[Type[BaseModel]] = None
     input_model: Optional[Type[BaseModel]] = None
@@ -42,7 +52,11 @@ class BaseNode(ABC):
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         self.raw_config = config.copy() if config else {}
         self.config = self._validate_config(self.raw_config)
-        self.metrics = {
+        self.metrics = self._new_metrics()
+
+    @staticmethod
+    def _new_metrics() -> Dict[str, Any]:
+        return {
             "execution_time": 0.0,
             "success": False,
             "error": None,
@@ -153,6 +167,19 @@ class BaseNode(ABC):
 
         return default
 
+    def http_session(self):
+        """
+        Shared pooled aiohttp session (keep-alive, DNS cache, per-host limits).
+        Use as `async with self.http_session() as session:`; the session is not closed on exit.
+        """
+        from app.core.http_client import http_client
+        return http_client.session()
+
+    def httpx_client(self):
+        """Shared pooled httpx client (HTTP/2 when available), used like `http_session()`."""
+        from app.core.http_client import http_client
+        return http_client.httpx_client()
+
     async def get_credential(self, key: str = "credentials_id") -> Optional[Dict[str, Any]]:
         """Retrieves sensitive data associated with the credential ID."""
         cred_id = self.get_config(key)
@@ -202,7 +229,16 @@ class BaseNode(ABC):
         Standardized execution wrapper that tracks metrics and validates pre-conditions.
         """
         start_time = time.time()
-        self.metrics["input_size"] = len(str(input_data))
+        # Pooled instances run many times: metrics/logs describe the latest run only
+        self.metrics = self._new_metrics()
+        if isinstance(input_data, LazyPayload):
+            self.metrics["input_size"] = input_data.size
+        if not self.lazy_inputs:
+            input_data = materialize(input_data)
+            if context and context.get("inputs"):
+                context["inputs"] = materialize(context["inputs"])
+        if not self.metrics["input_size"]:
+            self.metrics["input_size"] = len(str(input_data))
         try:
             # 1. PRE-FLIGHT AUTH VALIDATION
             await self.validate_credentials()
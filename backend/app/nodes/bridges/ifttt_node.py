@@ -3,7 +3,6 @@ IFTTT Node - Studio Standard (Universal Method)
 Batch 101: Automation Bridges (Interoperability)
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -97,7 +96,7 @@ class IFTTTNode(BaseNode):
             
             payload = {"value1": v1, "value2": v2, "value3": v3}
             
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 async with session.post(url, json=payload) as resp:
                     text = await resp.text()
                     if resp.status != 200:
@@ -3,7 +3,6 @@ Make (Integromat) Node - Studio Standard (Universal Method)
 Batch 101: Automation Bridges (Interoperability)
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -70,7 +69,7 @@ class MakeNode(BaseNode):
             
             headers = {"Content-Type": "application/json"}
             
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 async with session.post(webhook_url, headers=headers, json=data) as resp:
                     # Make webhooks return 200 "Accepted" usually
                     text = await resp.text()
@@ -3,7 +3,6 @@ Power Automate Node - Studio Standard (Universal Method)
 Batch 101: Automation Bridges (Interoperability)
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -68,7 +67,7 @@ class PowerAutomateNode(BaseNode):
             except:
                 data = {"content": payload_str}
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 async with session.post(url, json=data) as resp:
                     text = await resp.text()
                     if resp.status not in [200, 201, 202]:
@@ -3,7 +3,6 @@ Workato Node - Studio Standard (Universal Method)
 Batch 101: Automation Bridges (Interoperability)
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -77,7 +76,7 @@ class WorkatoNode(BaseNode):
             except:
                 data = {"data": payload_str}
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 async with session.post(url, headers=headers, json=data) as resp:
                     text = await resp.text()
                     if resp.status not in [200, 201, 202]:
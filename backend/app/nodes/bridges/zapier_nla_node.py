@@ -3,7 +3,6 @@ Zapier NLA Node - Studio Standard (Universal Method)
 Batch 101: Automation Bridges (Interoperability)
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -97,7 +96,7 @@ class ZapierNLANode(BaseNode):
             }
             
             # 3. Connect to Real API
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 async with session.post(url, headers=headers, json=payload) as resp:
                     if resp.status != 200:
                          error_text = await resp.text()
@@ -3,7 +3,6 @@ Ghost Node - Studio Standard
 Batch 71: CMS & Web Engines
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -90,7 +89,7 @@ class GhostNode(BaseNode):
             api_url = f"{base_url}/ghost/api/admin"
             action = self.get_config("action", "list_posts")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "list_posts":
                     async with session.get(f"{api_url}/posts/", headers=headers) as resp:
                         res_data = await resp.json()
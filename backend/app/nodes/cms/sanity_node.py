@@ -3,7 +3,6 @@ Sanity Node - Studio Standard
 Batch 71: CMS & Web Engines
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -122,7 +121,7 @@ class SanityNode(BaseNode):
             base_url = f"https://{p_id}.api.sanity.io/v{v}/data"
             action = self.get_config("action", "query")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "query":
                     groq_query = self.get_config("query") or str(input_data)
                     url = f"{base_url}/query/{dataset}"
@@ -3,7 +3,6 @@ Webflow Node - Studio Standard
 Batch 71: CMS & Web Engines
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -101,7 +100,7 @@ class WebflowNode(BaseNode):
             base_url = "https://api.webflow.com/v2"
             action = self.get_config("action", "list_sites")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "list_sites":
                     async with session.get(f"{base_url}/sites", headers=headers) as resp:
                         res_data = await resp.json()
@@ -1,4 +1,3 @@
-import aiohttp
 from typing import Any, Dict, Optional, List
 from ..base import BaseNode
 from ..registry import register_node
@@ -76,7 +75,7 @@ class WordPressNode(BaseNode):
 
             action = self.get_config("action", "create_post")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "create_post":
                     payload = {
                         "title": self.get_config("title", "Studio Post"),
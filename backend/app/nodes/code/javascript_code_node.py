@@ -4,9 +4,6 @@ Batch 43: Code Execution
 """
 from typing import Any, Dict, Optional
 import json
-import asyncio
-import os
-import tempfile
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -15,7 +12,7 @@ class JavaScriptCodeNode(BaseNode):
     """
     Execute JavaScript code using Node.js.
     Input data is available as 'inputs' variable.
-    Must return JSON via console.log(JSON.stringify(result)).
+    Must return JSON via console.log(JSON.stringify(result)) (or a top-level `return`).
     """
     node_type = "javascript_code"
     version = "1.0.0"
@@ -28,8 +25,7 @@ class JavaScriptCodeNode(BaseNode):
             'displayName': 'Code',
             'name': 'code',
             'type': 'json',
-            'default': 'const result = inputs;
-console.log(JSON.stringify(result));',
+            'default': 'const result = inputs;\nconsole.log(JSON.stringify(result));',
             'description': 'JavaScript code to execute',
         },
         {
@@ -37,7 +33,7 @@ console.log(JSON.stringify(result));',
             'name': 'inputs',
             'type': 'string',
             'default': '',
-            'description': 'Input data available as 'inputs'',
+            'description': "Input data available as 'inputs'",
         },
         {
             'displayName': 'Packages',
@@ -71,6 +67,9 @@ console.log(JSON.stringify(result));',
     }
 
     async def execute(self, input_data: Any, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        from app.core.config import settings
+        from app.core.js_runtime import js_runtime
+
         code = self.get_config("code", "")
         
         # Prepare Inputs
@@ -80,58 +79,33 @@ console.log(JSON.stringify(result));',
         if not user_inputs:
             user_inputs = self.get_config("inputs", {})
 
-        # Wrap user code to inject inputs
-        wrapped_code = f"""
-        const inputs = {json.dumps(user_inputs)};
-        try {{
-            {code}
-        }} catch (e) {{
-            console.error(e);
-            process.exit(1);
-        }}
-        """
-
-        # Write to temp file
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".js", delete=False) as f:
-            f.write(wrapped_code)
-            temp_js_path = f.name
-
+        # Dispatch to the warm Node.js pool (one process per script run)
+        timeout = int(self.get_config("timeout", 0) or 0) or settings.NODE_EXECUTION_TIMEOUT
         try:
-            # Execute Node.js
-            proc = await asyncio.create_subprocess_exec(
-                "node", temp_js_path,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
-            
-            stdout, stderr = await proc.communicate()
-            
-            stdout_str = stdout.decode().strip()
-            stderr_str = stderr.decode().strip()
+            response = await js_runtime.run(code, user_inputs, timeout=timeout)
+        except FileNotFoundError:
+            return {"status": "error", "error": "Node.js not found. Please install Node.js."}
+        except Exception as e:
+            return {"status": "error", "error": f"JS Execution Failed: {str(e)}"}
 
-            if proc.returncode != 0:
-                return {
-                    "status": "error",
-                    "error": stderr_str,
-                    "data": {"stdout": stdout_str}
-                }
+        stdout_str = response.get("stdout", "").strip()
+        if not response.get("ok"):
+            return {
+                "status": "error",
+                "error": response.get("error", ""),
+                "data": {"stdout": stdout_str}
+            }
 
-            # Try to parse last line as JSON result
+        # A top-level `return` value wins; otherwise parse the last stdout line as JSON
+        if response.get("has_result"):
+            result_json = response.get("result")
+        else:
             try:
-                # If multiple lines, take the last one as result
                 lines = stdout_str.splitlines()
                 result_json = json.loads(lines[-1]) if lines else None
+            except json.JSONDecodeError:
                 return {
                     "status": "success",
-                    "data": {
-                        "result": result_json,
-                        "stdout": stdout_str,
-                        "error": None
-                    }
-                }
-            except json.JSONDecodeError:
-                 return {
-                    "status": "success", 
                     "data": {
                         "result": stdout_str, # Fallback to string
                         "stdout": stdout_str,
@@ -139,10 +113,11 @@ console.log(JSON.stringify(result));',
                     }
                 }
 
-        except FileNotFoundError:
-             return {"status": "error", "error": "Node.js not found. Please install Node.js."}
-        except Exception as e:
-             return {"status": "error", "error": f"JS Execution Failed: {str(e)}"}
-        finally:
-            if os.path.exists(temp_js_path):
-                os.remove(temp_js_path)
\ No newline at end of file
+        return {
+            "status": "success",
+            "data": {
+                "result": result_json,
+                "stdout": stdout_str,
+                "error": None
+            }
+        }
@@ -3,10 +3,6 @@ Python Code Execution Node - Studio Standard
 Batch 43: Code Execution
 """
 from typing import Any, Dict, Optional, List
-import sys
-import io
-import contextlib
-import traceback
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -27,8 +23,7 @@ class PythonCodeNode(BaseNode):
             'displayName': 'Code',
             'name': 'code',
             'type': 'json',
-            'default': 'def main(inputs):
-    return inputs',
+            'default': 'def main(inputs):\n    return inputs',
             'description': 'Python code to execute',
         },
         {
@@ -36,14 +31,14 @@ class PythonCodeNode(BaseNode):
             'name': 'imports',
             'type': 'string',
             'default': '',
-            'description': 'Comma-separated list of modules to import (e.g., 'math, json')',
+            'description': "Comma-separated list of modules to import (e.g., 'math, json')",
         },
         {
             'displayName': 'Inputs',
             'name': 'inputs',
             'type': 'string',
             'default': '',
-            'description': 'Input data available as 'inputs' variable',
+            'description': "Input data available as 'inputs' variable",
         },
     ]
     inputs = {
@@ -70,6 +65,9 @@ class PythonCodeNode(BaseNode):
     }
 
     async def execute(self, input_data: Any, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        from app.core.config import settings
+        from app.core.sandbox import sandbox_pool
+
         code = self.get_config("code", "")
         # Handle input data
         user_inputs = input_data
@@ -81,56 +79,33 @@ class PythonCodeNode(BaseNode):
              user_inputs = self.get_config("inputs", {})
 
         imports_str = self.get_config("imports", "")
-        
-        # Prepare environment
-        local_scope = {"inputs": user_inputs, "output": None}
-        global_scope = {"__builtins__": __builtins__}
-
-        # Handle imports
-        if imports_str:
-            for mod_name in imports_str.split(","):
-                mod_name = mod_name.strip()
-                if mod_name:
-                    try:
-                        mod = __import__(mod_name)
-                        global_scope[mod_name] = mod
-                    except ImportError as e:
-                        return {"status": "error", "error": f"Failed to import '{mod_name}': {str(e)}"}
 
-        stdout_capture = io.StringIO()
-        result = None
-        error = None
+        # Run in the dedicated Python Code worker pool: user code never blocks
+        # the event loop, and stdout is captured per task in the worker
+        timeout = int(self.get_config("timeout", 0) or 0) or settings.NODE_EXECUTION_TIMEOUT
+        outcome = await sandbox_pool.run(
+            "python_code",
+            code,
+            user_inputs,
+            timeout=timeout,
+            options={"imports": imports_str} if imports_str else None,
+            cpu_limit=timeout
+        )
 
-        try:
-            with contextlib.redirect_stdout(stdout_capture):
-                # Execute the code
-                exec(code, global_scope, local_scope)
-                
-                # Check for 'main' function
-                if "main" in local_scope and callable(local_scope["main"]):
-                    result = local_scope["main"](user_inputs)
-                # Check for 'output' variable
-                elif local_scope.get("output") is not None:
-                    result = local_scope["output"]
-                else:
-                    # Provide stdout as result if no structured return
-                    result = stdout_capture.getvalue()
-
-        except Exception:
-            error = traceback.format_exc()
+        if not outcome.get("success"):
             return {
                 "status": "error",
-                "error": error,
+                "error": outcome.get("error"),
                 "data": {
-                    "stdout": stdout_capture.getvalue()
+                    "stdout": outcome.get("stdout", "")
                 }
             }
 
         return {
             "status": "success",
             "data": {
-                "result": result,
-                "stdout": stdout_capture.getvalue(),
+                "result": outcome.get("result"),
+                "stdout": outcome.get("stdout", ""),
                 "error": None
             }
-        }
\ No newline at end of file
+        }
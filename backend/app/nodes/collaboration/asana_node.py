@@ -3,7 +3,6 @@ Asana Node - Studio Standard
 Batch 69: Project Collaboration
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -124,7 +123,7 @@ class AsanaNode(BaseNode):
             base_url = "https://app.asana.com/api/1.0"
             action = self.get_config("action", "list_tasks")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "list_workspaces":
                     async with session.get(f"{base_url}/workspaces", headers=headers) as resp:
                         res_data = await resp.json()
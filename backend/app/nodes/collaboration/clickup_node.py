@@ -3,7 +3,6 @@ ClickUp Node - Studio Standard
 Batch 69: Project Collaboration
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -119,7 +118,7 @@ class ClickUpNode(BaseNode):
             base_url = "https://api.clickup.com/api/v2"
             action = self.get_config("action", "list_tasks")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "get_teams":
                     async with session.get(f"{base_url}/team", headers=headers) as resp:
                         res_data = await resp.json()
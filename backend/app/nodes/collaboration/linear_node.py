@@ -3,7 +3,6 @@ Linear Node - Studio Standard
 Batch 69: Project Collaboration
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -98,7 +97,7 @@ class LinearNode(BaseNode):
             base_url = "https://api.linear.app/graphql"
             action = self.get_config("action", "list_issues")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "get_viewer":
                     query = "{ viewer { id name email } }"
                     async with session.post(base_url, headers=headers, json={"query": query}) as resp:
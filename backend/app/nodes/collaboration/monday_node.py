@@ -3,7 +3,6 @@ Monday.com Node - Studio Standard (Universal Method)
 Batch 90: CRM & Marketing (n8n Critical)
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -87,7 +86,7 @@ class MondayNode(BaseNode):
             url = "https://api.monday.com/v2"
             action = self.get_config("action", "create_item")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "create_item":
                     board_id = self.get_config("board_id")
                     item_name = self.get_config("item_name") or str(input_data)
@@ -3,7 +3,6 @@ BigCommerce Node - Studio Standard (Universal Method)
 Batch 86: E-commerce Core
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -80,7 +79,7 @@ class BigCommerceNode(BaseNode):
             base_url = f"https://api.bigcommerce.com/stores/{store_hash}/v3"
             action = self.get_config("action", "list_products")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "list_products":
                     url = f"{base_url}/catalog/products"
                     async with session.get(url, headers=headers) as resp:
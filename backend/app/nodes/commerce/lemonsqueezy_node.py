@@ -3,7 +3,6 @@ LemonSqueezy Node - Studio Standard
 Batch 52: Commerce Expansion
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -80,7 +79,7 @@ class LemonSqueezyNode(BaseNode):
             
             base_api_url = "https://api.lemonsqueezy.com/v1"
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "get_user":
                     url = f"{base_api_url}/users/me"
                     async with session.get(url, headers=headers) as resp:
@@ -3,7 +3,6 @@ Magento Node - Studio Standard (Universal Method)
 Batch 86: E-commerce Core
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -79,7 +78,7 @@ class MagentoNode(BaseNode):
             base_url = self.get_config("base_url").rstrip("/")
             action = self.get_config("action", "list_orders")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 # 3. Clear Actions & 4. Standard i/o
                 if action == "list_orders":
                     url = f"{base_url}/rest/V1/orders"
@@ -71,7 +71,7 @@ class PayPalNode(BaseNode):
         base_url = "https://api-m.sandbox.paypal.com" if mode == "sandbox" else "https://api-m.paypal.com"
         action = self.get_config("action", "create_order")
 
-        async with aiohttp.ClientSession() as session:
+        async with self.http_session() as session:
             try:
                 token = await self._get_access_token(session, client_id, client_secret, base_url)
                 if not token:
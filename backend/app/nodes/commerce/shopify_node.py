@@ -3,7 +3,6 @@ Shopify Node - Studio Standard (Universal Method)
 Batch 102: E-commerce & Payments Expansion
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -119,7 +118,7 @@ class ShopifyNode(BaseNode):
             
             action = self.get_config("action", "list_products")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "list_products":
                     url = f"{base_url}/products.json"
                     async with session.get(url, headers=headers) as resp:
@@ -3,7 +3,6 @@ Square Node - Studio Standard (Universal Method)
 Batch 90: CRM & Marketing (n8n Critical)
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 import uuid
 from ..base import BaseNode
 from ..registry import register_node
@@ -88,7 +87,7 @@ class SquareNode(BaseNode):
             base_url = "https://connect.squareup.com/v2"
             action = self.get_config("action", "list_payments")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "list_payments":
                     url = f"{base_url}/payments"
                     async with session.get(url, headers=headers) as resp:
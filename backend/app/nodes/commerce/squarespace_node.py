@@ -3,7 +3,6 @@ Squarespace Node - Studio Standard (Universal Method)
 Batch 86: E-commerce Core
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -65,7 +64,7 @@ class SquarespaceNode(BaseNode):
             base_url = "https://api.squarespace.com/1.0/commerce"
             action = self.get_config("action", "list_orders")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "list_orders":
                     url = f"{base_url}/orders"
                     async with session.get(url, headers=headers) as resp:
@@ -3,7 +3,6 @@ Wix Node - Studio Standard (Universal Method)
 Batch 86: E-commerce Core
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -78,7 +77,7 @@ class WixNode(BaseNode):
             base_url = "https://www.wixapis.com"
             action = self.get_config("action", "query_orders")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "query_orders":
                     url = f"{base_url}/stores/v2/orders/query"
                     payload = {"query": {"paging": {"limit": 10}}}
@@ -3,7 +3,6 @@ WooCommerce Node - Studio Standard (Universal Method)
 Batch 102: E-commerce & Payments Expansion
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 import base64
 from ..base import BaseNode
 from ..registry import register_node
@@ -135,7 +134,7 @@ class WooCommerceNode(BaseNode):
             
             action = self.get_config("action", "list_products")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "list_products":
                     url = f"{base_url}/products"
                     async with session.get(url, headers=headers) as resp:
@@ -1,5 +1,4 @@
 import json
-import aiohttp
 from typing import Any, Dict, Optional, List
 from ..base import BaseNode
 from ..registry import register_node
@@ -62,7 +61,7 @@ class DiscordNode(BaseNode):
 
             # Strategy A: Webhook (Simpler, no bot invite needed)
             if webhook_url:
-                async with aiohttp.ClientSession() as session:
+                async with self.http_session() as session:
                     async with session.post(webhook_url, json=payload) as resp:
                         if resp.status >= 400:
                              return {"status": "error", "error": f"Discord Webhook Error: {await resp.text()}"}
@@ -72,7 +71,7 @@ class DiscordNode(BaseNode):
             if bot_token and channel_id:
                 api_url = f"https://discord.com/api/v10/channels/{channel_id}/messages"
                 headers = {"Authorization": f"Bot {bot_token}", "Content-Type": "application/json"}
-                async with aiohttp.ClientSession() as session:
+                async with self.http_session() as session:
                     async with session.post(api_url, headers=headers, json=payload) as resp:
                         result = await resp.json()
                         if resp.status >= 400:
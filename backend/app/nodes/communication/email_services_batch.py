@@ -92,7 +92,7 @@ class MailgunNode(BaseNode):
                     "text": text
                 }
                 
-                async with aiohttp.ClientSession() as session:
+                async with self.http_session() as session:
                     async with session.post(url, auth=aiohttp.BasicAuth("api", api_key), data=data) as resp:
                         if resp.status != 200:
                             error_text = await resp.text()
@@ -155,7 +155,7 @@ class PostmarkNode(BaseNode):
                 "TextBody": text_body
             }
             
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 async with session.post(url, headers=headers, json=payload) as resp:
                     if resp.status != 200:
                         error_text = await resp.text()
@@ -217,7 +217,7 @@ class SparkPostNode(BaseNode):
                 }
             }
             
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 async with session.post(url, headers=headers, json=payload) as resp:
                     if resp.status != 200:
                         error_text = await resp.text()
@@ -276,7 +276,7 @@ class MandrillNode(BaseNode):
                 }
             }
             
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 async with session.post(url, json=payload) as resp:
                     if resp.status != 200:
                         error_text = await resp.text()
@@ -337,7 +337,7 @@ class ConstantContactNode(BaseNode):
                     "last_name": last_name
                 }
                 
-                async with aiohttp.ClientSession() as session:
+                async with self.http_session() as session:
                     async with session.post(url, headers=headers, json=payload) as resp:
                         if resp.status not in [200, 201]:
                             error_text = await resp.text()
@@ -347,7 +347,7 @@ class ConstantContactNode(BaseNode):
             
             elif action == "list_contacts":
                 url = f"{base_url}/contacts"
-                async with aiohttp.ClientSession() as session:
+                async with self.http_session() as session:
                     async with session.get(url, headers=headers) as resp:
                         if resp.status != 200:
                             error_text = await resp.text()
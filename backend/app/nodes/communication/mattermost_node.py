@@ -3,7 +3,6 @@ Mattermost Node - Studio Standard (Universal Method)
 Batch 104: Communication Essentials
 """
 from typing import Any, Dict, Optional
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -105,7 +104,7 @@ class MattermostNode(BaseNode):
             
             action = self.get_config("action", "send_message")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "send_message":
                     channel_id = self.get_config("channel_id")
                     message = self.get_config("message") or str(input_data)
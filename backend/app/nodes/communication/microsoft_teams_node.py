@@ -3,7 +3,6 @@ Microsoft Teams Node - Studio Standard (Universal Method)
 Batch 104: Communication Essentials
 """
 from typing import Any, Dict, Optional
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -117,7 +116,7 @@ class MicrosoftTeamsNode(BaseNode):
             
             action = self.get_config("action", "send_message")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "send_channel_message":
                     team_id = self.get_config("team_id")
                     channel_id = self.get_config("channel_id")
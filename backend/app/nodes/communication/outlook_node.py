@@ -3,7 +3,6 @@ Microsoft Outlook Node - Studio Standard (Universal Method)
 Batch 91: Productivity Suite (n8n Critical)
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -95,7 +94,7 @@ class OutlookNode(BaseNode):
             base_url = "https://graph.microsoft.com/v1.0"
             action = self.get_config("action", "send_email")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "send_email":
                     to_email = self.get_config("to_email")
                     subject = self.get_config("subject", "Studio Workflow Email")
@@ -3,7 +3,6 @@ SendGrid Node - Studio Standard (Universal Method)
 Batch 104: Communication Essentials
 """
 from typing import Any, Dict, Optional
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -127,7 +126,7 @@ class SendGridNode(BaseNode):
             
             action = self.get_config("action", "send_email")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "send_email":
                     to_email = self.get_config("to_email")
                     from_email = self.get_config("from_email")
@@ -3,7 +3,6 @@ Microsoft Teams Node - Studio Standard (Universal Method)
 Batch 89: Core Workflow Nodes
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -95,7 +94,7 @@ class TeamsNode(BaseNode):
             base_url = "https://graph.microsoft.com/v1.0"
             action = self.get_config("action", "send_message")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "send_message":
                     team_id = self.get_config("team_id")
                     channel_id = self.get_config("channel_id")
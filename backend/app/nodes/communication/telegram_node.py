@@ -1,4 +1,3 @@
-import aiohttp
 import json
 from typing import Any, Dict, Optional, List
 from ..base import BaseNode
@@ -68,7 +67,7 @@ class TelegramNode(BaseNode):
                 "parse_mode": self.get_config("parse_mode", "Markdown")
             }
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 async with session.post(url, json=payload) as resp:
                     result = await resp.json()
                     if resp.status >= 400:
@@ -140,7 +140,7 @@ class TwilioNode(BaseNode):
 
             url = f"https://api.twilio.com/2010-04-01/Accounts/{account_sid}/Messages.json"
             
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 auth = aiohttp.BasicAuth(account_sid, auth_token)
                 data = {
                     "To": to_phone,
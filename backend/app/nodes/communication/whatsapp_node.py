@@ -3,7 +3,6 @@ WhatsApp Business Node (Meta) - Studio Standard
 Batch 46: Communication & Marketing
 """
 from typing import Any, Dict, Optional
-import aiohttp
 import json
 from ..base import BaseNode
 from ..registry import register_node
@@ -154,7 +153,7 @@ class WhatsAppMetaNode(BaseNode):
                 payload["type"] = "text"
                 payload["text"] = {"body": message}
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 async with session.post(url, headers=headers, json=payload) as resp:
                     result = await resp.json()
                     
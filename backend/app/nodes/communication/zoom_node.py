@@ -3,7 +3,6 @@ Zoom Node - Studio Standard (Universal Method)
 Batch 104: Communication Essentials
 """
 from typing import Any, Dict, Optional
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -106,7 +105,7 @@ class ZoomNode(BaseNode):
             
             action = self.get_config("action", "create_meeting")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "create_meeting":
                     topic = self.get_config("topic", "Studio Meeting")
                     duration = int(self.get_config("duration", 60))
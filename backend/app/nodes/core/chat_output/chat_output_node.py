@@ -4,6 +4,8 @@ from typing import Any, Dict, Optional
 
 @register_node("chatOutput")
 class ChatOutputNode(BaseNode):
+    reusable = True
+
     async def execute(self, input_data: Any, context: Optional[Dict[str, Any]] = None) -> Any:
         # ChatOutput returns the final result
         return str(input_data)
@@ -471,7 +471,9 @@ class APIRequestComponent(Component):
         body = self._process_body(body)
         url = self.add_query_params(url, query_params)
 
-        async with httpx.AsyncClient() as client:
+        from app.core.http_client import http_client
+
+        async with http_client.httpx_client() as client:
             result = await self.make_request(
                 client,
                 method,
@@ -3,7 +3,6 @@ Airtable Node - Studio Standard (Universal Method)
 Batch 91: Productivity Suite (n8n Critical)
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -112,7 +111,7 @@ class AirtableNode(BaseNode):
             base_url = f"https://api.airtable.com/v0/{base_id}/{table_name}"
             action = self.get_config("action", "list_records")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "list_records":
                     async with session.get(base_url, headers=headers) as resp:
                         if resp.status != 200:
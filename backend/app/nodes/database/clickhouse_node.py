@@ -3,7 +3,6 @@ Clickhouse Node - Studio Standard (Universal Method)
 Batch 113: Intelligent Infrastructure & IoT
 """
 from typing import Any, Dict, Optional
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -73,7 +72,7 @@ class ClickhouseNode(BaseNode):
                 "default_format": "JSON"
             }
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 async with session.post(url, params=params) as response:
                     if response.status != 200:
                         text = await response.text()
@@ -3,7 +3,6 @@ Google BigQuery Node - Studio Standard
 Batch 116: Data & Warehouse
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -110,7 +109,7 @@ class BigQueryNode(BaseNode):
             
             action = self.get_config("action", "query")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "query":
                     sql = self.get_config("query") or str(input_data)
                     if not sql:
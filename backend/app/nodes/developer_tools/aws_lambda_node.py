@@ -3,7 +3,6 @@ AWS Lambda Node - Studio Standard (Universal Method)
 Batch 110: Developer Tools & Databases
 """
 from typing import Any, Dict, Optional
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -82,7 +81,7 @@ class AWSLambdaNode(BaseNode):
             
             action = self.get_config("action", "invoke")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "invoke":
                     payload_str = self.get_config("payload", "{}")
                     import json
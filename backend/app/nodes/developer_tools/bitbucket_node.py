@@ -91,7 +91,7 @@ class BitbucketNode(BaseNode):
             
             action = self.get_config("action", "create_issue")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "create_issue":
                     workspace = self.get_config("workspace")
                     repo_slug = self.get_config("repo_slug")
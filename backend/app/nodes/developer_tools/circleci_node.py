@@ -3,7 +3,6 @@ CircleCI Node - Studio Standard (Universal Method)
 Batch 96: Developer Tools (n8n Critical - The Final Push)
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -86,7 +85,7 @@ class CircleCINode(BaseNode):
             base_url = "https://circleci.com/api/v2"
             action = self.get_config("action", "trigger_pipeline")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "trigger_pipeline":
                     slug = self.get_config("project_slug")
                     branch = self.get_config("branch")
@@ -3,7 +3,6 @@ Docker Node - Studio Standard (Universal Method)
 Batch 110: Developer Tools & Databases
 """
 from typing import Any, Dict, Optional
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -71,7 +70,7 @@ class DockerNode(BaseNode):
             # Direct socket access via aiohttp requires UnixConnector (linux) or named pipe (windows).
             # Simplified for TCP HTTP access.
             
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "list_containers":
                     url = f"{docker_host}/containers/json"
                     async with session.get(url) as resp:
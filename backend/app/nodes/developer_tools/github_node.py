@@ -3,7 +3,6 @@ GitHub Node - Studio Standard (Universal Method)
 Batch 110: Developer Tools & Databases
 """
 from typing import Any, Dict, Optional
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -102,7 +101,7 @@ class GitHubNode(BaseNode):
 
             action = self.get_config("action", "create_issue")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "create_issue":
                     owner = self.get_config("owner")
                     repo = self.get_config("repo")
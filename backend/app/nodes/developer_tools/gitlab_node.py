@@ -3,7 +3,6 @@ GitLab Node - Studio Standard (Universal Method)
 Batch 110: Developer Tools & Databases
 """
 from typing import Any, Dict, Optional
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -91,7 +90,7 @@ class GitLabNode(BaseNode):
             
             action = self.get_config("action", "create_issue")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "create_issue":
                     project_id = self.get_config("project_id")
                     title = self.get_config("title")
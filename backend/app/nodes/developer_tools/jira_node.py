@@ -106,7 +106,7 @@ class JiraNode(BaseNode):
             
             action = self.get_config("action", "create_issue")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "create_issue":
                     project_key = self.get_config("project_key")
                     summary = self.get_config("summary")
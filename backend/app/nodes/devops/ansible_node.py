@@ -3,7 +3,6 @@ Ansible Node - Studio Standard
 Batch 82: Agile & DevOps
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -85,7 +84,7 @@ class AnsibleNode(BaseNode):
             base_url = self.get_config("base_url").rstrip('/')
             action = self.get_config("action", "list_jobs")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "list_jobs":
                     url = f"{base_url}/api/v2/jobs/"
                     async with session.get(url, headers=headers) as resp:
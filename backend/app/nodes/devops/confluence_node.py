@@ -3,7 +3,6 @@ Confluence DevOps Node - Studio Standard
 Batch 47: Developer Tools & Ops
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 import base64
 import json
 from ..base import BaseNode
@@ -131,7 +130,7 @@ class ConfluenceNode(BaseNode):
             action = self.get_config("action", "get_page")
             base_url = f"https://{domain}/wiki/rest/api"
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "create_page":
                     url = f"{base_url}/content"
                     space = self.get_config("space_key")
@@ -3,7 +3,6 @@ GitHub DevOps Node - Studio Standard
 Batch 45: DevOps & Infrastructure
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 import json
 import base64
 from ..base import BaseNode
@@ -133,7 +132,7 @@ class GitHubDevOpsNode(BaseNode):
                 "User-Agent": "Studio-DevOps-Agent"
             }
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "get_repo_info":
                     async with session.get(base_url, headers=headers) as resp:
                         result = await resp.json()
@@ -3,7 +3,6 @@ GitLab DevOps Node - Studio Standard
 Batch 45: DevOps & Infrastructure
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 import json
 import base64
 from urllib.parse import quote_plus
@@ -148,7 +147,7 @@ class GitLabDevOpsNode(BaseNode):
                 "Content-Type": "application/json"
             }
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "get_project_info":
                     async with session.get(project_api_url, headers=headers) as resp:
                         result = await resp.json()
@@ -3,7 +3,6 @@ Jira DevOps Node - Studio Standard
 Batch 47: Developer Tools & Ops
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 import base64
 import json
 from ..base import BaseNode
@@ -132,7 +131,7 @@ class JiraNode(BaseNode):
             action = self.get_config("action", "create_issue")
             base_url = f"https://{domain}/rest/api/3"
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "create_issue":
                     url = f"{base_url}/issue"
                     proj_key = self.get_config("project_key")
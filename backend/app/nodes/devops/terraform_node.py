@@ -3,7 +3,6 @@ Terraform Node - Studio Standard
 Batch 82: Agile & DevOps
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -87,7 +86,7 @@ class TerraformNode(BaseNode):
             action = self.get_config("action", "list_workspaces")
             org = self.get_config("organization")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "list_workspaces":
                     url = f"{base_url}/organizations/{org}/workspaces"
                     async with session.get(url, headers=headers) as resp:
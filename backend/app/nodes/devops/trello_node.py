@@ -3,7 +3,6 @@ Trello Ops Node - Studio Standard
 Batch 47: Developer Tools & Ops
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 import json
 from ..base import BaseNode
 from ..registry import register_node
@@ -120,7 +119,7 @@ class TrelloNode(BaseNode):
             base_url = "https://api.trello.com/1"
             auth_params = {"key": key, "token": token}
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "create_card":
                     list_id = self.get_config("list_id")
                     if not list_id:
@@ -3,7 +3,6 @@ from typing import Any, Dict, Optional
 from pydantic import Field
 from app.nodes.base import BaseNode, NodeConfig
 from app.nodes.registry import register_node
-import aiohttp
 
 class DiscordConfig(NodeConfig):
     bot_name: str = Field("Studio Automation", description="Bot display name")
@@ -35,7 +34,7 @@ class DiscordWebhookNode(BaseNode):
         else:
             payload["content"] = str(input_data)
 
-        async with aiohttp.ClientSession() as session:
+        async with self.http_session() as session:
             async with session.post(webhook_url, json=payload) as response:
                 if response.status >= 400:
                     text = await response.text()
@@ -3,7 +3,6 @@ Canvas LMS Node - Studio Standard
 Batch 75: Education & EdTech
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -88,7 +87,7 @@ class CanvasNode(BaseNode):
             api_url = f"{domain}/api/v1"
             action = self.get_config("action", "list_courses")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "list_courses":
                     url = f"{api_url}/courses"
                     async with session.get(url, headers=headers) as resp:
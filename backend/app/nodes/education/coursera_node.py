@@ -3,7 +3,6 @@ Coursera Node - Studio Standard
 Batch 75: Education & EdTech
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -82,7 +81,7 @@ class CourseraNode(BaseNode):
             base_url = "https://api.coursera.org/api/catalog.v1"
             action = self.get_config("action", "search_courses")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "search_courses":
                     query = self.get_config("query") or str(input_data)
                     url = f"{base_url}/courses"
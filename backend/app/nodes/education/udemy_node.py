@@ -3,7 +3,6 @@ Udemy Node - Studio Standard
 Batch 81: Leisure, Health & Education
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -71,7 +70,7 @@ class UdemyNode(BaseNode):
             base_url = "https://www.udemy.com/api-2.0"
             action = self.get_config("action", "search_courses")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "search_courses":
                     q = self.get_config("query") or str(input_data)
                     url = f"{base_url}/courses/"
@@ -3,7 +3,6 @@ Eventbrite Node - Studio Standard
 Batch 68: Event Management
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -86,7 +85,7 @@ class EventbriteNode(BaseNode):
             base_url = "https://www.eventbriteapi.com/v3"
             action = self.get_config("action", "list_events")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "list_organizations":
                     url = f"{base_url}/users/me/organizations/"
                     async with session.get(url, headers=headers) as resp:
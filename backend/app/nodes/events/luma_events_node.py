@@ -3,7 +3,6 @@ Luma Events Node - Studio Standard
 Batch 68: Event Management
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -75,7 +74,7 @@ class LumaEventsNode(BaseNode):
             base_url = "https://api.lu.ma/v1"
             action = self.get_config("action", "list_events")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "list_events":
                     url = f"{base_url}/event/list"
                     async with session.get(url, headers=headers) as resp:
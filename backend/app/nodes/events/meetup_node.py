@@ -3,7 +3,6 @@ Meetup Node - Studio Standard
 Batch 68: Event Management
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -74,7 +73,7 @@ class MeetupNode(BaseNode):
             base_url = "https://api.meetup.com/gql"
             action = self.get_config("action", "get_self")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "get_self":
                     query = """
                     query {
@@ -378,64 +378,52 @@ class NodeFactory:
 
         # 4. Smart Auto-Discovery from Library
         try:
-            lib_path = os.path.join(project_root, "backend", "data", "node_library.json")
-            if os.path.exists(lib_path):
-                import json
-                with open(lib_path, "r", encoding="utf-8") as f:
-                    library = json.load(f)
+            from app.core.node_library import node_library
+            node_info = node_library.get_node_info(node_type)
+            if node_info:
+                category = node_info.get("category", "")
+                node_id = node_info.get("id", "")
                 
-                # Find node info in library
-                node_info = None
-                for cat_nodes in library.values():
-                    found = next((n for n in cat_nodes if n["id"] == node_type), None)
-                    if found:
-                        node_info = found
-                        break
+                # Routing Logic based on Category or ID patterns
+                # 1. Models, Embeddings & Agents
+                if category in ["Models & AI Providers", "Aiml", "Assemblyai", "Twelvelabs", "AI Services & Agents"] or any(x in node_id.lower() for x in ["openai_", "anthropic_", "google_", "embedding", "transcription", "agent"]):
+                    from .models.litellm.litellm_node import LiteLLMNode
+                    print(f"[NodeFactory]: Auto-routing '{node_id}' ({category}) to LiteLLMNode")
+                    return LiteLLMNode(config=config)
                 
-                if node_info:
-                    category = node_info.get("category", "")
-                    node_id = node_info.get("id", "")
-                    
-                    # Routing Logic based on Category or ID patterns
-                    # 1. Models, Embeddings & Agents
-                    if category in ["Models & AI Providers", "Aiml", "Assemblyai", "Twelvelabs", "AI Services & Agents"] or any(x in node_id.lower() for x in ["openai_", "anthropic_", "google_", "embedding", "transcription", "agent"]):
-                        from .models.litellm.litellm_node import LiteLLMNode
-                        print(f"[NodeFactory]: Auto-routing '{node_id}' ({category}) to LiteLLMNode")
-                        return LiteLLMNode(config=config)
-                    
-                    # 2. API Integrations & Tools
-                    if category in ["CRM Systems", "ERP & Accounting", "Productivity", "Dev Tools", "Search & Scraping", "Tools & Utilities", "Cloudflare", "Wolframalpha", "IoT & Home", "Prototypes", "Tools & Analytics"] or "composio" in node_id.lower() or "integration" in node_id.lower():
-                        from .integrations.universal_api_node import UniversalAPIConnectorNode
-                        print(f"[NodeFactory]: Auto-routing '{node_id}' ({category}) to UniversalAPIConnectorNode")
-                        return UniversalAPIConnectorNode(config=config)
+                # 2. API Integrations & Tools
+                if category in ["CRM Systems", "ERP & Accounting", "Productivity", "Dev Tools", "Search & Scraping", "Tools & Utilities", "Cloudflare", "Wolframalpha", "IoT & Home", "Prototypes", "Tools & Analytics"] or "composio" in node_id.lower() or "integration" in node_id.lower():
+                    from .integrations.universal_api_node import UniversalAPIConnectorNode
+                    print(f"[NodeFactory]: Auto-routing '{node_id}' ({category}) to UniversalAPIConnectorNode")
+                    return UniversalAPIConnectorNode(config=config)
 
-                    # 3. Vector Stores & Databases
-                    if category in ["Vector Stores & Databases", "Data Sources", "Data & Knowledge"]:
-                        if "memory" in node_id.lower():
-                            from .core.memory_node import MemoryNode
-                            print(f"[NodeFactory]: Auto-routing '{node_id}' to MemoryNode")
-                            return MemoryNode(config=config)
-                            
-                        if "supabase" in node_id.lower() or "vector" in node_id.lower():
-                            from .storage.supabase.supabase_node import SupabaseStoreNode
-                            print(f"[NodeFactory]: Auto-routing '{node_id}' to SupabaseStoreNode")
-                            return SupabaseStoreNode(config=config)
-                        else:
-                            from .storage.nocodb.nocodb_node import SmartDBNode
-                            print(f"[NodeFactory]: Auto-routing '{node_id}' to SmartDBNode")
-                            return SmartDBNode(config=config)
-                            
-                    # 4. Data Processing
-                    if category == "Data Processing" or "formatter" in node_id.lower() or "parser" in node_id.lower():
-                        if "extractor" in node_id.lower() or "classifier" in node_id.lower() or "matcher" in node_id.lower():
-                            from .processing.ai_extractor import AIExtractorNode
-                            print(f"[NodeFactory]: Auto-routing '{node_id}' to AIExtractorNode")
-                            return AIExtractorNode(config=config)
+                # 3. Vector Stores & Databases
+                if category in ["Vector Stores & Databases", "Data Sources", "Data & Knowledge"]:
+                    if "memory" in node_id.lower():
+                        from .core.memory_node import MemoryNode
+                        print(f"[NodeFactory]: Auto-routing '{node_id}' to MemoryNode")
+                        return MemoryNode(config=config)
                         
-                    # 5. Logic & Flow
-                    if category == "Logic & Flow" or category == "Input / Output":
-                         from .generic_node import GenericNode
-                         return GenericNode(node_type=node_type, config=config)
+                    if "supabase" in node_id.lower() or "vector" in node_id.lower():
+                        from .storage.supabase.supabase_node import SupabaseStoreNode
+                        print(f"[NodeFactory]: Auto-routing '{node_id}' to SupabaseStoreNode")
+                        return SupabaseStoreNode(config=config)
+                    else:
+                        from .storage.nocodb.nocodb_node import SmartDBNode
+                        print(f"[NodeFactory]: Auto-routing '{node_id}' to SmartDBNode")
+                        return SmartDBNode(config=config)
+                        
+                # 4. Data Processing
+                if category == "Data Processing" or "formatter" in node_id.lower() or "parser" in node_id.lower():
+                    if "extractor" in node_id.lower() or "classifier" in node_id.lower() or "matcher" in node_id.lower():
+                        from .processing.ai_extractor import AIExtractorNode
+                        print(f"[NodeFactory]: Auto-routing '{node_id}' to AIExtractorNode")
+                        return AIExtractorNode(config=config)
+                    
+                # 5. Logic & Flow
+                if category == "Logic & Flow" or category == "Input / Output":
+                     from .generic_node import GenericNode
+                     return GenericNode(node_type=node_type, config=config)
 
         except Exception as e:
             print(f"NodeFactory Auto-Discovery Error: {e}")
@@ -453,11 +441,21 @@ class NodeFactory:
     async def get_instance(cls, node_type: str, config: Dict[str, Any], context: Optional[Dict[str, Any]] = None) -> Optional[BaseNode]:
         """
         Master factory method (Async). 
-        Checks Standard Registry first, then Private Registry (Database).
+        Reuses a pooled instance for the same type + config when possible,
+        otherwise checks Standard Registry first, then Private Registry (Database).
         """
+        from app.core.node_pool import node_pool
+        execution_id = context.get("execution_id") if context else None
+        node_id = context.get("node_id") if context else None
+        pool_key = node_pool.key(node_type, config)
+        node = node_pool.get(pool_key, execution_id, node_id)
+        if node:
+            return node
+
         # 1. Try Standard (Sync) Factory first
         node = cls.get_node(node_type, config)
         if node:
+            node_pool.put(pool_key, node, execution_id, node_id=node_id)
             return node
 
         # 2. Try Private Registry (Async DB Load)
@@ -467,7 +465,10 @@ class NodeFactory:
             private_class = await PrivateRegistry.get_node_class(node_type, workspace_id)
             if private_class:
                 try:
-                    return private_class(config=config)
+                    node = private_class(config=config)
+                    # Private classes are per workspace: never share them across executions
+                    node_pool.put(pool_key, node, execution_id, shareable=False, node_id=node_id)
+                    return node
                 except Exception as e:
                     print(f"NodeFactory Error: Failed to instantiate private node {node_type}: {e}")
 
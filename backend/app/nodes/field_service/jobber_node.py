@@ -3,7 +3,6 @@ Jobber Node - Studio Standard
 Batch 80: Industrial & Service Ops
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -30,7 +29,7 @@ class JobberNode(BaseNode):
             query = "{ jobs(first: 10) { nodes { id title status } } }"
             payload = {"query": query}
             
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 async with session.post(url, headers=headers, json=payload) as resp:
                     res_data = await resp.json()
                     return {"status": "success", "data": {"result": res_data}}
@@ -3,7 +3,6 @@ ServiceTitan Node - Studio Standard
 Batch 80: Industrial & Service Ops
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -70,7 +69,7 @@ class ServiceTitanNode(BaseNode):
             base_url = "https://api.servicetitan.io/v2"
             action = self.get_config("action", "list_jobs")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "list_jobs":
                     url = f"{base_url}/jcm/v2/jobs"
                     async with session.get(url, headers=headers) as resp:
@@ -3,7 +3,6 @@ Brex Node - Studio Standard (Universal Method)
 Batch 85: SMB Finance
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -67,7 +66,7 @@ class BrexNode(BaseNode):
             # Brex uses different subdomains for different APIs
             action = self.get_config("action", "list_accounts")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "list_accounts":
                     url = "https://platform.brexapis.com/v2/accounts"
                     async with session.get(url, headers=headers) as resp:
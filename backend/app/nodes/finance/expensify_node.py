@@ -3,7 +3,6 @@ Expensify Node - Studio Standard (Universal Method)
 Batch 85: SMB Finance
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 import json
 from ..base import BaseNode
 from ..registry import register_node
@@ -61,7 +60,7 @@ class ExpensifyNode(BaseNode):
             url = "https://integrations.expensify.com/Integration-Server/ExpensifyIntegrations"
             action = self.get_config("action", "get_reports")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "get_reports":
                     # Expensify uses a specific 'requestJobDescription' JSON
                     job_desc = {
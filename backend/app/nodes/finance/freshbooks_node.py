@@ -3,7 +3,6 @@ FreshBooks Node - Studio Standard (Universal Method)
 Batch 85: SMB Finance
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -80,7 +79,7 @@ class FreshBooksNode(BaseNode):
             action = self.get_config("action", "get_identity")
             acc_id = self.get_config("account_id")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 # Action: Get Identity (to find account_id if not provided)
                 if action == "get_identity":
                     url = f"{base_url}/auth/api/v1/users/me"
@@ -3,7 +3,6 @@ Mollie Node - Studio Standard (Universal Method)
 Batch 102: E-commerce & Payments Expansion
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -175,7 +174,7 @@ class MollieNode(BaseNode):
             
             action = self.get_config("action", "create_payment")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "create_payment":
                     amount = self.get_config("amount")
                     currency = self.get_config("currency", "EUR")
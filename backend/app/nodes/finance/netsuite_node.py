@@ -3,7 +3,6 @@ NetSuite Node - Studio Standard
 Batch 84: Enterprise Finance
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -79,7 +78,7 @@ class NetSuiteNode(BaseNode):
             base_url = f"https://{account_id}.suitetalk.api.netsuite.com/services/rest/record/v1"
             action = self.get_config("action", "list_invoices")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "list_invoices":
                     url = f"{base_url}/invoice"
                     async with session.get(url, headers=headers) as resp:
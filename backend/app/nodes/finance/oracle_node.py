@@ -3,7 +3,6 @@ Oracle Node - Studio Standard
 Batch 84: Enterprise Finance
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -83,7 +82,7 @@ class OracleNode(BaseNode):
             action = self.get_config("action", "list_instances")
             comp_id = self.get_config("compartment_id")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "list_instances":
                     url = f"{base_url}/instances"
                     params = {"compartmentId": comp_id}
@@ -3,7 +3,6 @@ Plaid Node - Studio Standard (Universal Method)
 Batch 102: E-commerce & Payments Expansion
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -134,7 +133,7 @@ class PlaidNode(BaseNode):
             
             action = self.get_config("action", "create_link_token")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "create_link_token":
                     user_id = self.get_config("user_id", "default_user")
                     
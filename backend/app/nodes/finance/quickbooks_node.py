@@ -3,7 +3,6 @@ QuickBooks Node - Studio Standard
 Batch 58: Financial Services
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -93,7 +92,7 @@ class QuickBooksNode(BaseNode):
                 "Content-Type": "application/json"
             }
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "get_company_info":
                     url = f"{base_url}/v3/company/{realm_id}/companyinfo/{realm_id}"
                     async with session.get(url, headers=headers) as resp:
@@ -3,7 +3,6 @@ Ramp Node - Studio Standard (Universal Method)
 Batch 85: SMB Finance
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -66,7 +65,7 @@ class RampNode(BaseNode):
             base_url = "https://api.ramp.com/developer/v1"
             action = self.get_config("action", "list_transactions")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "list_transactions":
                     url = f"{base_url}/transactions"
                     async with session.get(url, headers=headers) as resp:
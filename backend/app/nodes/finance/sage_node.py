@@ -3,7 +3,6 @@ Sage Node - Studio Standard
 Batch 84: Enterprise Finance
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -63,7 +62,7 @@ class SageNode(BaseNode):
             base_url = "https://api.columbus.sage.com/sagebusinesscloud/v3.1"
             action = self.get_config("action", "get_sales_invoices")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "get_sales_invoices":
                     url = f"{base_url}/sales_invoices"
                     async with session.get(url, headers=headers) as resp:
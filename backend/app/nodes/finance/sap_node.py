@@ -3,7 +3,6 @@ SAP Node - Studio Standard
 Batch 84: Enterprise Finance
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -81,7 +80,7 @@ class SAPNode(BaseNode):
             base_url = self.get_config("base_url").rstrip("/")
             action = self.get_config("action", "get_purchase_orders")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "get_purchase_orders":
                     url = f"{base_url}/API_PURCHASEORDER_PROCESS_SRV/A_PurchaseOrder"
                     async with session.get(url, headers=headers) as resp:
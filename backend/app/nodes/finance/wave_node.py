@@ -3,7 +3,6 @@ Wave Node - Studio Standard (Universal Method)
 Batch 85: SMB Finance
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -80,7 +79,7 @@ class WaveNode(BaseNode):
             action = self.get_config("action", "list_businesses")
             biz_id = self.get_config("business_id") or (str(input_data) if isinstance(input_data, str) else None)
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 # 3. Clear Actions & 4. Standard i/o
                 if action == "list_businesses":
                     query = "{ businesses(page: 1, pageSize: 10) { edges { node { id name isPersonal } } } }"
@@ -3,7 +3,6 @@ Wise Node - Studio Standard
 Batch 58: Financial Services
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -91,7 +90,7 @@ class WiseNode(BaseNode):
                 "Content-Type": "application/json"
             }
             
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "list_profiles":
                     url = f"{base_url}/v1/profiles"
                     async with session.get(url, headers=headers) as resp:
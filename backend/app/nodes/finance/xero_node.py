@@ -3,7 +3,6 @@ Xero Node - Studio Standard
 Batch 84: Enterprise Finance
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -78,7 +77,7 @@ class XeroNode(BaseNode):
             base_url = "https://api.xero.com/api.xro/2.0"
             action = self.get_config("action", "get_invoices")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "get_invoices":
                     url = f"{base_url}/Invoices"
                     async with session.get(url, headers=headers) as resp:
@@ -3,7 +3,6 @@ Motive Node - Studio Standard
 Batch 80: Industrial & Service Ops
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -58,7 +57,7 @@ class MotiveNode(BaseNode):
             base_url = "https://api.keeptruckin.com/v1"
             action = self.get_config("action", "get_vehicles")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "get_vehicles":
                     url = f"{base_url}/vehicles"
                     async with session.get(url, headers=headers) as resp:
@@ -14,6 +14,7 @@ class FilterNode(BaseNode):
     node_type = "filter_node"
     version = "1.0.0"
     category = "flow_control"
+    reusable = True
     credentials_required = []
 
 
@@ -14,6 +14,7 @@ class ItemListsNode(BaseNode):
     node_type = "item_lists_node"
     version = "1.0.0"
     category = "flow_controls"
+    reusable = True
     credentials_required = []
 
 
@@ -14,6 +14,7 @@ class MergeNode(BaseNode):
     node_type = "merge_node"
     version = "1.0.0"
     category = "flow_controls"
+    reusable = True
     credentials_required = []
 
 
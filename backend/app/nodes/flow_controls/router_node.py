@@ -6,6 +6,7 @@ class RouterNode(BaseNode):
     """
     BaseNode compatible implementation of the Conditional Router.
     """
+    reusable = True
     
     async def execute(self, input_data: Any, context: Optional[Dict[str, Any]] = None) -> Any:
         # Extract configuration
@@ -17,6 +17,7 @@ class SetNode(BaseNode):
     node_type = "set_node"
     version = "1.0.0"
     category = "flow_controls"
+    reusable = True
     credentials_required = []
 
 
@@ -10,6 +10,8 @@ from ..registry import register_node
 class SplitInBatchesNode(BaseNode):
     """
     Loop over items in batches for processing large datasets.
+    The item source is spilled to a shared cursor on the first batch, so
+    each call holds one batch and the loop can move between workers.
     """
     node_type = "split_in_batches_node"
     version = "1.0.0"
@@ -65,86 +67,61 @@ class SplitInBatchesNode(BaseNode):
         "batch_info": {"type": "object"}
     }
 
-    # Class-level state for batch processing
-    _batch_state = {}
-
     async def execute(self, input_data: Any, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         try:
-            batch_size = int(self.get_config("batch_size", 10))
+            # Cursor lives in Redis (see app.core.batch_cursor); only this batch is held in memory
+            from app.core.batch_cursor import batch_cursors
+
+            batch_size = max(1, int(self.get_config("batch_size", 10)))
             reset = self.get_config("reset", False)
             
             # Get workflow/execution ID for state management
             execution_id = context.get("execution_id", "default") if context else "default"
+            node_id = (context or {}).get("node_id") or self.node_type
             
             # Reset state if requested
             if reset:
-                if execution_id in self._batch_state:
-                    del self._batch_state[execution_id]
+                await batch_cursors.reset(execution_id, node_id)
                 return {"status": "success", "data": {"result": [], "batch_info": {"reset": True}}}
             
-            # Get items to process
+            # Items to process (list, generator or async stream; only read for the first batch)
             items = self.get_config("items")
-            if items is None:
+            if items is None or items == "":
                 items = input_data
             
-            # Ensure items is a list
-            if not isinstance(items, list):
-                items = [items] if items else []
-            
-            # Initialize state for this execution if not exists
-            if execution_id not in self._batch_state:
-                self._batch_state[execution_id] = {
-                    "items": items,
-                    "current_index": 0,
-                    "total_items": len(items),
-                    "total_batches": (len(items) + batch_size - 1) // batch_size if batch_size > 0 else 0,
-                    "current_batch": 0
-                }
-            
-            state = self._batch_state[execution_id]
+            cursor = await batch_cursors.next_batch(execution_id, node_id, items, batch_size)
             
             # Check if we've processed all items
-            if state["current_index"] >= state["total_items"]:
-                # Clean up state
-                del self._batch_state[execution_id]
+            if cursor.completed:
                 return {
                     "status": "success",
                     "data": {
                         "result": [],
                         "batch_info": {
                             "completed": True,
-                            "total_batches_processed": state["current_batch"]
+                            "total_batches_processed": cursor.batch
                         }
                     }
                 }
             
-            # Get current batch
-            start_index = state["current_index"]
-            end_index = min(start_index + batch_size, state["total_items"])
-            current_batch = state["items"][start_index:end_index]
-            
-            # Update state
-            state["current_index"] = end_index
-            state["current_batch"] += 1
-            
             # Prepare batch info
             batch_info = {
-                "batch_number": state["current_batch"],
-                "total_batches": state["total_batches"],
-                "batch_size": len(current_batch),
-                "items_processed": end_index,
-                "total_items": state["total_items"],
-                "has_more": end_index < state["total_items"],
-                "progress_percentage": round((end_index / state["total_items"]) * 100, 2)
+                "batch_number": cursor.batch,
+                "total_batches": cursor.total_batches,
+                "batch_size": len(cursor.items),
+                "items_processed": cursor.index,
+                "total_items": cursor.total,
+                "has_more": cursor.index < cursor.total,
+                "progress_percentage": round((cursor.index / cursor.total) * 100, 2)
             }
             
             return {
                 "status": "success",
                 "data": {
-                    "result": current_batch,
+                    "result": cursor.items,
                     "batch_info": batch_info
                 }
             }
 
         except Exception as e:
-            return {"status": "error", "error": f"Split In Batches Node Failed: {str(e)}"}
\ No newline at end of file
+            return {"status": "error", "error": f"Split In Batches Node Failed: {str(e)}"}
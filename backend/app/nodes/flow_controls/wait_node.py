@@ -4,6 +4,7 @@ Batch 103: Core Workflow Nodes
 """
 from typing import Any, Dict, Optional
 import asyncio
+import time
 from datetime import datetime, timedelta
 from ..base import BaseNode
 from ..registry import register_node
@@ -12,6 +13,9 @@ from ..registry import register_node
 class WaitNode(BaseNode):
     """
     Pause workflow execution for a specified duration or until a specific time.
+    Long waits in a queued run suspend the execution on a durable timer
+    (see app.core.timers) instead of holding the worker; the engine resumes
+    it at this node, which then completes with the original input.
     """
     node_type = "wait_node"
     version = "1.0.0"
@@ -107,6 +111,13 @@ class WaitNode(BaseNode):
 
     async def execute(self, input_data: Any, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         try:
+            resumed = (context or {}).get("resumed_timer")
+            if resumed and resumed.get("node_id") == (context or {}).get("node_id"):
+                wait_info = dict(resumed.get("wait_info") or {})
+                wait_info["waited_seconds"] = round(time.time() - resumed["suspended_at"], 3)
+                wait_info["resumed"] = True
+                return {"status": "success", "data": {"result": input_data, "wait_info": wait_info}}
+
             mode = self.get_config("mode", "duration")
             
             wait_seconds = 0
@@ -127,19 +138,11 @@ class WaitNode(BaseNode):
                     wait_seconds = duration
                 
                 # Perform the wait
-                await asyncio.sleep(wait_seconds)
-                
-                return {
-                    "status": "success",
-                    "data": {
-                        "result": input_data,
-                        "wait_info": {
-                            "mode": "duration",
-                            "waited_seconds": wait_seconds,
-                            "waited_duration": f"{duration} {unit}"
-                        }
-                    }
-                }
+                return await self._wait(wait_seconds, input_data, context, {
+                    "mode": "duration",
+                    "waited_seconds": wait_seconds,
+                    "waited_duration": f"{duration} {unit}"
+                })
             
             elif mode == "until_time":
                 until_time_str = self.get_config("until_time", "00:00")
@@ -161,19 +164,11 @@ class WaitNode(BaseNode):
                     if wait_seconds > 86400:
                         wait_seconds = 86400
                     
-                    await asyncio.sleep(wait_seconds)
-                    
-                    return {
-                        "status": "success",
-                        "data": {
-                            "result": input_data,
-                            "wait_info": {
-                                "mode": "until_time",
-                                "target_time": target_time.isoformat(),
-                                "waited_seconds": wait_seconds
-                            }
-                        }
-                    }
+                    return await self._wait(wait_seconds, input_data, context, {
+                        "mode": "until_time",
+                        "target_time": target_time.isoformat(),
+                        "waited_seconds": wait_seconds
+                    })
                 
                 except ValueError:
                     return {"status": "error", "error": "Invalid time format. Use HH:MM"}
@@ -208,19 +203,11 @@ class WaitNode(BaseNode):
                     if wait_seconds > 604800:
                         wait_seconds = 604800
                     
-                    await asyncio.sleep(wait_seconds)
-                    
-                    return {
-                        "status": "success",
-                        "data": {
-                            "result": input_data,
-                            "wait_info": {
-                                "mode": "until_date",
-                                "target_datetime": target_datetime.isoformat(),
-                                "waited_seconds": wait_seconds
-                            }
-                        }
-                    }
+                    return await self._wait(wait_seconds, input_data, context, {
+                        "mode": "until_date",
+                        "target_datetime": target_datetime.isoformat(),
+                        "waited_seconds": wait_seconds
+                    })
                 
                 except ValueError:
                     return {"status": "error", "error": "Invalid date format. Use YYYY-MM-DD HH:MM"}
@@ -228,4 +215,18 @@ class WaitNode(BaseNode):
             return {"status": "error", "error": f"Unsupported wait mode: {mode}"}
 
         except Exception as e:
-            return {"status": "error", "error": f"Wait Node Failed: {str(e)}"}
\ No newline at end of file
+            return {"status": "error", "error": f"Wait Node Failed: {str(e)}"}
+
+    async def _wait(self, wait_seconds: float, input_data: Any, context: Optional[Dict[str, Any]], wait_info: Dict[str, Any]) -> Dict[str, Any]:
+        """Sleeps through short waits; asks the engine to suspend the run for long ones."""
+        from app.core.config import settings
+
+        if (context or {}).get("suspendable") and wait_seconds >= settings.WAIT_SUSPEND_MIN_SECONDS:
+            return {
+                "status": "suspended",
+                "resume_at": time.time() + wait_seconds,
+                "data": {"result": input_data, "wait_info": wait_info}
+            }
+
+        await asyncio.sleep(wait_seconds)
+        return {"status": "success", "data": {"result": input_data, "wait_info": wait_info}}
@@ -3,7 +3,6 @@ DoorDash Node - Studio Standard
 Batch 80: Industrial & Service Ops
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -71,7 +70,7 @@ class DoorDashNode(BaseNode):
             base_url = "https://openapi.doordash.com/drive/v2"
             action = self.get_config("action", "create_delivery")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "get_delivery_status":
                     d_id = self.get_config("external_delivery_id") or str(input_data)
                     url = f"{base_url}/deliveries/{d_id}"
@@ -3,7 +3,6 @@ UberEats Node - Studio Standard
 Batch 80: Industrial & Service Ops
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -69,7 +68,7 @@ class UberEatsNode(BaseNode):
             base_url = "https://api.uber.com/v1/eats"
             action = self.get_config("action", "get_active_orders")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "get_active_orders":
                     url = f"{base_url}/order/active_orders"
                     async with session.get(url, headers=headers) as resp:
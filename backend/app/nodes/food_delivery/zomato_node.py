@@ -3,7 +3,6 @@ Zomato Node - Studio Standard
 Batch 80: Industrial & Service Ops
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -68,7 +67,7 @@ class ZomatoNode(BaseNode):
             base_url = "https://developers.zomato.com/api/v2.1"
             action = self.get_config("action", "search_restaurants")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "search_restaurants":
                     q = self.get_config("query") or str(input_data)
                     url = f"{base_url}/search"
@@ -3,7 +3,6 @@ JotForm Node - Studio Standard
 Batch 57: Forms & Surveys
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -86,7 +85,7 @@ class JotFormNode(BaseNode):
             base_url = "https://api.jotform.com"
             params = {"apiKey": api_key, "limit": limit}
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "get_forms":
                     url = f"{base_url}/user/forms"
                     async with session.get(url, params=params) as resp:
@@ -3,7 +3,6 @@ SurveyMonkey Node - Studio Standard
 Batch 57: Forms & Surveys
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -90,7 +89,7 @@ class SurveyMonkeyNode(BaseNode):
             
             base_url = "https://api.surveymonkey.com/v3"
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "list_surveys":
                     url = f"{base_url}/surveys"
                     async with session.get(url, headers=headers) as resp:
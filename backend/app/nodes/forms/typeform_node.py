@@ -3,7 +3,6 @@ Typeform Node - Studio Standard
 Batch 57: Forms & Surveys
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -105,7 +104,7 @@ class TypeformNode(BaseNode):
             
             base_url = "https://api.typeform.com"
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "list_forms":
                     url = f"{base_url}/forms"
                     params = {"page_size": page_size}
@@ -3,7 +3,6 @@ Roblox Node - Studio Standard
 Batch 76: Gaming & Meta
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -84,7 +83,7 @@ class RobloxNode(BaseNode):
             base_url = "https://apis.roblox.com"
             action = self.get_config("action", "get_universe")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "get_universe":
                     u_id = self.get_config("universe_id") or str(input_data)
                     url = f"{base_url}/universes/v1/universes/{u_id}"
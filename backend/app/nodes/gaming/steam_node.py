@@ -3,7 +3,6 @@ Steam Node - Studio Standard
 Batch 76: Gaming & Meta
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -82,7 +81,7 @@ class SteamNode(BaseNode):
             base_url = "https://api.steampowered.com"
             action = self.get_config("action", "get_player_summary")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "get_player_summary":
                     s_id = self.get_config("steam_id") or str(input_data)
                     url = f"{base_url}/ISteamUser/GetPlayerSummaries/v0002/"
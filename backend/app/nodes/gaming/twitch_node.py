@@ -3,7 +3,6 @@ Twitch Node - Studio Standard
 Batch 76: Gaming & Meta
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -81,7 +80,7 @@ class TwitchNode(BaseNode):
             if not client_id or not client_secret:
                 return {"status": "error", "error": "Twitch Client ID and Secret are required."}
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 # 1. Get Access Token (Client Credentials Flow)
                 auth_url = "https://id.twitch.tv/oauth2/token"
                 auth_params = {
@@ -3,7 +3,6 @@ Fitbit Node - Studio Standard
 Batch 77: Health & Fitness
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -75,7 +74,7 @@ class FitbitNode(BaseNode):
             action = self.get_config("action", "get_profile")
             date = self.get_config("date", "today")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "get_profile":
                     url = f"{base_url}/user/-/profile.json"
                     async with session.get(url, headers=headers) as resp:
@@ -3,7 +3,6 @@ Garmin Node - Studio Standard
 Batch 81: Leisure, Health & Education
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -59,7 +58,7 @@ class GarminNode(BaseNode):
             base_url = "https://healthapi.garmin.com/wellness-api/rest"
             action = self.get_config("action", "get_daily_summary")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "get_daily_summary":
                     url = f"{base_url}/dailies"
                     async with session.get(url, headers=headers) as resp:
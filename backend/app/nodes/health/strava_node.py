@@ -3,7 +3,6 @@ Strava Node - Studio Standard
 Batch 77: Health & Fitness
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -75,7 +74,7 @@ class StravaNode(BaseNode):
             base_url = "https://www.strava.com/api/v3"
             action = self.get_config("action", "list_activities")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "list_activities":
                     url = f"{base_url}/athlete/activities"
                     async with session.get(url, headers=headers) as resp:
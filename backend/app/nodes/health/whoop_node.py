@@ -3,7 +3,6 @@ Whoop Node - Studio Standard
 Batch 81: Leisure, Health & Education
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -59,7 +58,7 @@ class WhoopNode(BaseNode):
             base_url = "https://api.prod.whoop.com/developer/v1"
             action = self.get_config("action", "get_recovery_data")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "get_recovery_data":
                     url = f"{base_url}/recovery"
                     async with session.get(url, headers=headers) as resp:
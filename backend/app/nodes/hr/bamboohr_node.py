@@ -3,7 +3,6 @@ BambooHR Node - Studio Standard
 Batch 64: HR & Recruiting
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 import base64
 from ..base import BaseNode
 from ..registry import register_node
@@ -96,7 +95,7 @@ class BambooHRNode(BaseNode):
             base_url = f"https://api.bamboohr.com/api/gateway.php/{subdomain}/v1"
             action = self.get_config("action", "get_employee_directory")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "get_employee_directory":
                     url = f"{base_url}/employees/directory"
                     async with session.get(url, headers=headers) as resp:
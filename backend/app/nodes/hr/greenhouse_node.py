@@ -3,7 +3,6 @@ Greenhouse Node - Studio Standard
 Batch 64: HR & Recruiting
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 import base64
 from ..base import BaseNode
 from ..registry import register_node
@@ -93,7 +92,7 @@ class GreenhouseNode(BaseNode):
             action = self.get_config("action", "list_candidates")
             per_page = int(self.get_config("per_page", 100))
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "list_candidates":
                     url = f"{base_url}/candidates"
                     params = {"per_page": per_page}
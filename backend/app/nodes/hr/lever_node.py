@@ -3,7 +3,6 @@ Lever Node - Studio Standard
 Batch 64: HR & Recruiting
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 import base64
 from ..base import BaseNode
 from ..registry import register_node
@@ -101,7 +100,7 @@ class LeverNode(BaseNode):
             action = self.get_config("action", "list_candidates")
             limit = int(self.get_config("limit", 10))
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "list_candidates":
                     url = f"{base_url}/candidates"
                     params = {"limit": limit}
@@ -3,7 +3,6 @@ Cloudflare Node - Studio Standard (Universal Method)
 Batch 113: Intelligent Infrastructure & IoT
 """
 from typing import Any, Dict, Optional
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -88,7 +87,7 @@ class CloudflareNode(BaseNode):
                 "Content-Type": "application/json"
             }
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "list_zones":
                     async with session.get(f"{base_url}/zones", headers=headers) as response:
                         data = await response.json()
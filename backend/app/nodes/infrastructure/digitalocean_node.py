@@ -3,7 +3,6 @@ DigitalOcean Node - Studio Standard
 Batch 66: DevOps & Cloud Infrastructure
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -107,7 +106,7 @@ class DigitalOceanNode(BaseNode):
             base_url = "https://api.digitalocean.com/v2"
             action = self.get_config("action", "list_droplets")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "list_droplets":
                     async with session.get(f"{base_url}/droplets", headers=headers) as resp:
                         res_data = await resp.json()
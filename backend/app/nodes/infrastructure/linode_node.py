@@ -3,7 +3,6 @@ Linode Node - Studio Standard
 Batch 66: DevOps & Cloud Infrastructure
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -105,7 +104,7 @@ class LinodeNode(BaseNode):
             base_url = "https://api.linode.com/v4"
             action = self.get_config("action", "list_instances")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "list_instances":
                     async with session.get(f"{base_url}/linode/instances", headers=headers) as resp:
                         res_data = await resp.json()
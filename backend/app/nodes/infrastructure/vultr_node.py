@@ -3,7 +3,6 @@ Vultr Node - Studio Standard
 Batch 66: DevOps & Cloud Infrastructure
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -107,7 +106,7 @@ class VultrNode(BaseNode):
             base_url = "https://api.vultr.com/v2"
             action = self.get_config("action", "list_instances")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "list_instances":
                     async with session.get(f"{base_url}/instances", headers=headers) as resp:
                         res_data = await resp.json()
@@ -2,7 +2,6 @@
 Home Assistant Control Node - Studio Standard (Universal Method)
 """
 from typing import Any, Dict, Optional
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -79,7 +78,7 @@ class HomeAssistantControlNode(BaseNode):
             }
             payload = {"entity_id": entity_id}
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 async with session.post(url, headers=headers, json=payload) as response:
                     if response.status != 200:
                         text = await response.text()
@@ -3,7 +3,6 @@ Confluence Node - Studio Standard
 Batch 60: Knowledge Management
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 import base64
 import json
 from ..base import BaseNode
@@ -137,7 +136,7 @@ class ConfluenceNode(BaseNode):
             base_url = f"https://{domain}/wiki/rest/api"
             action = self.get_config("action", "get_page")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "get_page":
                     page_id = self.get_config("page_id") or str(input_data)
                     url = f"{base_url}/content/{page_id}?expand=body.storage"
@@ -3,7 +3,6 @@ GitBook Node - Studio Standard
 Batch 60: Knowledge Management
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -104,7 +103,7 @@ class GitBookNode(BaseNode):
             action = self.get_config("action", "list_spaces")
             space_id = self.get_config("space_id")
             
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "list_spaces":
                     url = f"{base_url}/orgs" # Or user spaces? Let's check orgs first or list root spaces
                     # For users, it's often better to check spaces directly
@@ -3,7 +3,6 @@ Clio Node - Studio Standard
 Batch 67: Legal & Compliance
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -87,7 +86,7 @@ class ClioNode(BaseNode):
             action = self.get_config("action", "list_matters")
             limit = int(self.get_config("limit", 20))
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "list_matters":
                     url = f"{base_url}/matters"
                     params = {"limit": limit, "fields": "id,display_number,client{name},status"}
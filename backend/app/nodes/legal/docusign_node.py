@@ -3,7 +3,6 @@ DocuSign Node - Studio Standard
 Batch 67: Legal & Compliance
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -111,7 +110,7 @@ class DocuSignNode(BaseNode):
             account_id = self.get_config("account_id")
             action = self.get_config("action", "list_envelopes")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "list_envelopes":
                     # Requires from_date filter usually
                     url = f"{base_url}/accounts/{account_id}/envelopes"
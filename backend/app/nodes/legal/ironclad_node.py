@@ -3,7 +3,6 @@ Ironclad Node - Studio Standard
 Batch 67: Legal & Compliance
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -85,7 +84,7 @@ class IroncladNode(BaseNode):
             base_url = "https://ironcladapp.com/api/v1"
             action = self.get_config("action", "list_workflows")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "list_workflows":
                     url = f"{base_url}/workflows"
                     async with session.get(url, headers=headers) as resp:
@@ -3,7 +3,6 @@ Yelp Node - Studio Standard
 Batch 81: Leisure, Health & Education
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -68,7 +67,7 @@ class YelpNode(BaseNode):
             headers = {"Authorization": f"Bearer {api_key}"}
             base_url = "https://api.yelp.com/v3"
             
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 url = f"{base_url}/businesses/search"
                 params = {"location": self.get_config("location", "NYC"), "term": self.get_config("term", "food")}
                 async with session.get(url, headers=headers, params=params) as resp:
@@ -3,7 +3,6 @@ AfterShip Node - Studio Standard
 Batch 65: Logistics & Shipping
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -86,7 +85,7 @@ class AfterShipNode(BaseNode):
             base_url = "https://api.aftership.com/v4"
             action = self.get_config("action", "list_trackings")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "list_trackings":
                     async with session.get(f"{base_url}/trackings", headers=headers) as resp:
                         res_data = await resp.json()
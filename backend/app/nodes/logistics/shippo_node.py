@@ -3,7 +3,6 @@ Shippo Node - Studio Standard
 Batch 65: Logistics & Shipping
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -64,7 +63,7 @@ class ShippoNode(BaseNode):
             base_url = "https://api.goshippo.com"
             action = self.get_config("action", "list_shipments")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "list_shipments":
                     async with session.get(f"{base_url}/shipments/", headers=headers) as resp:
                         res_data = await resp.json()
@@ -3,7 +3,6 @@ ShipStation Node - Studio Standard
 Batch 65: Logistics & Shipping
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 import base64
 from ..base import BaseNode
 from ..registry import register_node
@@ -81,7 +80,7 @@ class ShipStationNode(BaseNode):
             base_url = "https://ssapi.shipstation.com"
             action = self.get_config("action", "list_orders")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "list_orders":
                     async with session.get(f"{base_url}/orders", headers=headers) as resp:
                         res_data = await resp.json()
@@ -3,7 +3,6 @@ ActiveCampaign Node - Studio Standard (Universal Method)
 Batch 108: Marketing & CRM
 """
 from typing import Any, Dict, Optional
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -80,7 +79,7 @@ class ActiveCampaignNode(BaseNode):
             
             action = self.get_config("action", "create_contact")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "create_contact":
                     email = self.get_config("email")
                     first_name = self.get_config("first_name")
@@ -3,7 +3,6 @@ Attentive Node - Studio Standard
 Batch 62: Marketing Automation
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -103,7 +102,7 @@ class AttentiveNode(BaseNode):
             base_url = "https://api.attentivemobile.com/v1"
             action = self.get_config("action", "list_subscribers")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "list_subscribers":
                     url = f"{base_url}/subscribers"
                     async with session.get(url, headers=headers) as resp:
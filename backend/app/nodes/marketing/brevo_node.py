@@ -3,7 +3,6 @@ Brevo (Sendinblue) Node - Studio Standard
 Batch 62: Marketing Automation
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -115,7 +114,7 @@ class BrevoNode(BaseNode):
             base_url = "https://api.brevo.com/v3"
             action = self.get_config("action", "get_contacts")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "get_contacts":
                     url = f"{base_url}/contacts"
                     async with session.get(url, headers=headers) as resp:
@@ -3,7 +3,6 @@ Copper Node - Studio Standard (Universal Method)
 Batch 108: Marketing & CRM
 """
 from typing import Any, Dict, Optional
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -86,7 +85,7 @@ class CopperNode(BaseNode):
             
             action = self.get_config("action", "create_person")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "create_person":
                     name = self.get_config("name")
                     contact_email = self.get_config("email")
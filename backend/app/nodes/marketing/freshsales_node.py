@@ -3,7 +3,6 @@ Freshsales Node - Studio Standard (Universal Method)
 Batch 108: Marketing & CRM
 """
 from typing import Any, Dict, Optional
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -80,7 +79,7 @@ class FreshsalesNode(BaseNode):
             
             action = self.get_config("action", "create_contact")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "create_contact":
                     first_name = self.get_config("first_name")
                     last_name = self.get_config("last_name")
@@ -79,7 +79,7 @@ class InsightlyNode(BaseNode):
             
             action = self.get_config("action", "create_contact")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "create_contact":
                     first_name = self.get_config("first_name")
                     last_name = self.get_config("last_name")
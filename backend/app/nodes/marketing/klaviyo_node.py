@@ -3,7 +3,6 @@ Klaviyo Node - Studio Standard
 Batch 62: Marketing Automation
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -104,7 +103,7 @@ class KlaviyoNode(BaseNode):
             base_url = "https://a.klaviyo.com/api"
             action = self.get_config("action", "get_profiles")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "get_profiles":
                     url = f"{base_url}/profiles"
                     async with session.get(url, headers=headers) as resp:
@@ -99,7 +99,7 @@ class MailchimpNode(BaseNode):
             
             action = self.get_config("action", "add_subscriber")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "add_subscriber":
                     list_id = self.get_config("list_id")
                     email = self.get_config("email_address")
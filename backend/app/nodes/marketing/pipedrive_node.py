@@ -3,7 +3,6 @@ Pipedrive Node - Studio Standard (Universal Method)
 Batch 108: Marketing & CRM
 """
 from typing import Any, Dict, Optional
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -92,7 +91,7 @@ class PipedriveNode(BaseNode):
             
             action = self.get_config("action", "create_deal")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "create_deal":
                     title = self.get_config("title")
                     value = self.get_config("value")
@@ -3,7 +3,6 @@ Salesforce Node - Studio Standard (Universal Method)
 Batch 108: Marketing & CRM
 """
 from typing import Any, Dict, Optional
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -111,7 +110,7 @@ class SalesforceNode(BaseNode):
             
             action = self.get_config("action", "create_record")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "create_record":
                     sobject = self.get_config("sobject", "Account")
                     data_str = self.get_config("data_json", "{}")
@@ -3,7 +3,6 @@ Zoho CRM Node - Studio Standard (Universal Method)
 Batch 108: Marketing & CRM
 """
 from typing import Any, Dict, Optional
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -99,7 +98,7 @@ class ZohoCRMNode(BaseNode):
             action = self.get_config("action", "create_record")
             module = self.get_config("module", "Leads")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "create_record":
                     data_str = self.get_config("data_json", "{}")
                     import json
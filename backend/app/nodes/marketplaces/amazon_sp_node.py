@@ -3,7 +3,6 @@ Amazon SP-API Node - Studio Standard (Universal Method)
 Batch 87: Retail & Marketplaces
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -85,7 +84,7 @@ class AmazonSPNode(BaseNode):
             action = self.get_config("action", "get_orders")
             mkt_id = self.get_config("marketplace_id")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "get_orders":
                     url = f"{base_url}/orders/v0/orders"
                     params = {"MarketplaceIds": mkt_id, "CreatedAfter": "2023-01-01"}
@@ -3,7 +3,6 @@ eBay Node - Studio Standard (Universal Method)
 Batch 87: Retail & Marketplaces
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -65,7 +64,7 @@ class EbayNode(BaseNode):
             base_url = "https://api.ebay.com/sell/fulfillment/v1"
             action = self.get_config("action", "get_orders")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "get_orders":
                     url = f"{base_url}/order"
                     async with session.get(url, headers=headers) as resp:
@@ -3,7 +3,6 @@ Etsy Node - Studio Standard (Universal Method)
 Batch 87: Retail & Marketplaces
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -80,7 +79,7 @@ class EtsyNode(BaseNode):
             action = self.get_config("action", "get_shop_receipts")
             shop_id = self.get_config("shop_id")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "get_shop_receipts":
                     url = f"{base_url}/shops/{shop_id}/receipts"
                     async with session.get(url, headers=headers) as resp:
@@ -3,7 +3,6 @@ Target Node - Studio Standard (Universal Method)
 Batch 87: Retail & Marketplaces
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -75,7 +74,7 @@ class TargetNode(BaseNode):
             action = self.get_config("action", "search_products")
             query = self.get_config("query") or str(input_data)
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "search_products":
                     url = f"{base_url}/web/lp_search_v1"
                     params = {
@@ -3,7 +3,6 @@ Walmart Node - Studio Standard (Universal Method)
 Batch 87: Retail & Marketplaces
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 import uuid
 from ..base import BaseNode
 from ..registry import register_node
@@ -68,7 +67,7 @@ class WalmartNode(BaseNode):
             base_url = "https://marketplace.walmartapis.com/v3"
             action = self.get_config("action", "list_orders")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "list_orders":
                     url = f"{base_url}/orders"
                     async with session.get(url, headers=headers) as resp:
@@ -3,7 +3,6 @@ ElevenLabs Text-to-Speech Node - Studio Standard
 Batch 42: Image & Audio
 """
 from typing import Any, Dict, Optional
-import aiohttp
 import base64
 from ..base import BaseNode
 from ..registry import register_node
@@ -136,7 +135,7 @@ class ElevenLabsNode(BaseNode):
                 }
             }
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 async with session.post(url, json=payload, headers=headers) as resp:
                     if resp.status >= 400:
                          err_text = await resp.text()
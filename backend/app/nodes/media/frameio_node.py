@@ -3,7 +3,6 @@ Frame.io Node - Studio Standard
 Batch 79: Media Production
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -94,7 +93,7 @@ class FrameioNode(BaseNode):
             base_url = "https://api.frame.io/v2"
             action = self.get_config("action", "get_me")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "get_me":
                     url = f"{base_url}/me"
                     async with session.get(url, headers=headers) as resp:
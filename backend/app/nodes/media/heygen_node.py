@@ -3,7 +3,6 @@ Heygen Node - Studio Standard
 Batch 112: AI Video & Media
 """
 from typing import Any, Dict, Optional
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -113,7 +112,7 @@ class HeygenNode(BaseNode):
             action = self.get_config("action", "generate_video")
             base_url = "https://api.heygen.com/v2"
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "generate_video":
                     text = self.get_config("input_text") or str(input_data)
                     avatar_id = self.get_config("avatar_id")
@@ -3,7 +3,6 @@ Leonardo AI Node - Studio Standard
 Batch 53: Advanced AI (Visual & Generative)
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 import asyncio
 from ..base import BaseNode
 from ..registry import register_node
@@ -135,7 +134,7 @@ class LeonardoAINode(BaseNode):
             
             base_url = "https://cloud.leonardo.ai/api/rest/v1"
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 payload = {
                     "prompt": prompt,
                     "modelId": self.get_config("model_id"),
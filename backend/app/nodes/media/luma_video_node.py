@@ -3,7 +3,6 @@ Luma AI Video Generation Node - Studio Standard
 Batch 53: Advanced AI (Visual & Generative)
 """
 from typing import Any, Dict, Optional
-import aiohttp
 import asyncio
 from ..base import BaseNode
 from ..registry import register_node
@@ -141,7 +140,7 @@ class LumaVideoNode(BaseNode):
                     }
                 }
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 # 2. Start Generation
                 async with session.post("https://api.lumalabs.ai/dream-machine/v1/generations", headers=headers, json=payload) as resp:
                     if resp.status >= 400:
@@ -3,7 +3,6 @@ Stability AI Ultra Node - Studio Standard
 Batch 53: Advanced AI (Visual & Generative)
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 import base64
 from ..base import BaseNode
 from ..registry import register_node
@@ -144,7 +143,7 @@ class StabilityUltraNode(BaseNode):
             # Stability uses multipart/form-data for many advanced actions
             # We'll use the v2stable API for Ultra/Inpaint if possible or v1
             
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "text_to_image":
                     url = "https://api.stability.ai/v1/generation/stable-diffusion-v1-6/text-to-image"
                     payload = {"text_prompts": [{"text": prompt}], "cfg_scale": 7, "samples": 1}
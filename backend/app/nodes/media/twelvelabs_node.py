@@ -3,7 +3,6 @@ TwelveLabs Node - Studio Standard (Universal Method)
 Batch 116: Specialized Toolkits
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 import json
 from ..base import BaseNode
 from ..registry import register_node
@@ -102,7 +101,7 @@ class TwelveLabsNode(BaseNode):
                 "Content-Type": "application/json"
             }
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "search":
                     payload = {
                         "index_id": index_id,
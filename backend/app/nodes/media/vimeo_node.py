@@ -3,7 +3,6 @@ Vimeo Node - Studio Standard
 Batch 79: Media Production
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -88,7 +87,7 @@ class VimeoNode(BaseNode):
             base_url = "https://api.vimeo.com"
             action = self.get_config("action", "list_videos")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "list_videos":
                     url = f"{base_url}/me/videos"
                     async with session.get(url, headers=headers) as resp:
@@ -4,7 +4,6 @@ Batch 42: Image & Audio
 """
 from typing import Any, Dict, Optional
 import os
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -134,7 +133,7 @@ class WhisperTranscribeNode(BaseNode):
                     from urllib.parse import urlparse
                     
                     # Download to temp file
-                    async with aiohttp.ClientSession() as session:
+                    async with self.http_session() as session:
                         async with session.get(file_path) as resp:
                             if resp.status != 200:
                                 return {"status": "error", "error": f"Failed to download audio: {resp.status}"}
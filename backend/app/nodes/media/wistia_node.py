@@ -3,7 +3,6 @@ Wistia Node - Studio Standard
 Batch 79: Media Production
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -88,7 +87,7 @@ class WistiaNode(BaseNode):
             base_url = "https://api.wistia.com/v1"
             action = self.get_config("action", "list_projects")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "list_projects":
                     url = f"{base_url}/projects.json"
                     async with session.get(url, headers=headers) as resp:
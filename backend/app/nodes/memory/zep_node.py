@@ -3,7 +3,6 @@ Zep Memory Node - Studio Standard (Universal Method)
 Batch 115: Specialized Tools
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -102,7 +101,7 @@ class ZepNode(BaseNode):
             text = self.get_config("text") or str(input_data)
             role = self.get_config("role", "user")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "get_messages":
                     async with session.get(f"{api_url}/api/v1/sessions/{session_id}/messages", headers=headers) as response:
                         data = await response.json()
@@ -3,7 +3,6 @@ Datadog Node - Studio Standard
 Batch 83: Observability & SRE
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 import time
 from ..base import BaseNode
 from ..registry import register_node
@@ -106,7 +105,7 @@ class DatadogNode(BaseNode):
             base_url = base_urls.get(region, "https://api.datadoghq.com")
             action = self.get_config("action", "list_monitors")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "list_monitors":
                     url = f"{base_url}/api/v1/monitor"
                     async with session.get(url, headers=headers) as resp:
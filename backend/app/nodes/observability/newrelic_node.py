@@ -3,7 +3,6 @@ NewRelic Node - Studio Standard
 Batch 83: Observability & SRE
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -30,7 +29,7 @@ class NewRelicNode(BaseNode):
             query = "{ actor { accounts { name id } entitySearch(query: \"domain = 'APM'\") { results { entities { name guid } } } } }"
             payload = {"query": query}
             
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 async with session.post(url, headers=headers, json=payload) as resp:
                     res_data = await resp.json()
                     return {"status": "success", "data": {"result": res_data}}
@@ -3,7 +3,6 @@ PagerDuty Node - Studio Standard
 Batch 83: Observability & SRE
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -75,7 +74,7 @@ class PagerDutyNode(BaseNode):
             base_url = "https://api.pagerduty.com"
             action = self.get_config("action", "list_incidents")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "list_incidents":
                     url = f"{base_url}/incidents"
                     async with session.get(url, headers=headers) as resp:
@@ -1,16 +1,21 @@
 import asyncio
 from typing import Any, Dict, List, Optional
 from app.nodes.base import BaseNode
-from app.nodes.factory import register_node
+from app.nodes.registry import register_node
 from pydantic import BaseModel, Field
 from sqlmodel import select
 from app.db.session import async_session
 from app.db.models import Workflow
+from app.core.config import settings
 import json
 
 class ParallelMapConfig(BaseModel):
     sub_workflow_id: str = Field(..., description="The ID of the workflow to run for each item")
-    concurrency_limit: int = Field(default=5, ge=1, le=20, description="Max number of parallel executions")
+    concurrency_limit: int = Field(default=5, ge=1, le=20, description="Max number of parallel executions (local mode)")
+    mode: str = Field(default="local", description="local: run items in this process; distributed: shard them across the workers (failed items come back as {error, item_index}); auto: distributed for large inputs when workers are available")
+    chunk_size: int = Field(default=0, ge=0, description="Items per shard in distributed mode (0 = server default)")
+    max_retries: int = Field(default=2, ge=0, le=10, description="Retries per failed item in distributed mode")
+    fail_on_item_error: bool = Field(default=False, description="Fail the node if any item still fails after its retries (distributed mode)")
 
 class ParallelMapInput(BaseModel):
     items: List[Any] = Field(..., description="The list of data items to process in parallel")
@@ -21,6 +26,8 @@ class ParallelMapNode(BaseNode):
     High-Performance Orchestration: Parallel Map.
     Processes an array of items concurrently using a sub-workflow.
     Equivalent to a 'Map/Reduce' pattern in data engineering.
+    Distributed mode shards the items across the worker fleet (see
+    app.core.map_reduce) and returns the sub-graph results in item order.
     """
     name = "Parallel Map"
     description = "Process a list of items concurrently across multiple workers."
@@ -34,6 +41,8 @@ class ParallelMapNode(BaseNode):
         sub_wf_id = self.get_config("sub_workflow_id")
         concurrency = self.get_config("concurrency_limit")
         items = input_data.items
+        # Opt-in only: distributed results carry per-item error dicts instead of raising
+        mode = self.get_config("mode") or "local"
         
         # 1. Fetch Workflow
         async with async_session() as db:
@@ -44,6 +53,13 @@ class ParallelMapNode(BaseNode):
             
             wf_definition = workflow.definition
 
+        from app.core.map_reduce import map_reduce
+        if mode == "distributed" or (mode == "auto" and len(items) >= settings.MAP_REDUCE_MIN_ITEMS):
+            if map_reduce.available:
+                return await self._run_distributed(map_reduce, workflow, items, context)
+            if mode == "distributed":
+                raise ValueError("Distributed mode needs Redis and the worker queue; neither is configured here.")
+
         # 2. Parallel Execution with Semaphore to respect concurrency limit
         semaphore = asyncio.Semaphore(concurrency)
         from app.core.engine import engine
@@ -69,3 +85,17 @@ class ParallelMapNode(BaseNode):
         results = await asyncio.gather(*tasks)
         
         return results
+
+    async def _run_distributed(self, map_reduce, workflow, items: List[Any], context: Optional[Dict[str, Any]]) -> List[Any]:
+        results = await map_reduce.run(
+            workflow,
+            items,
+            context=context,
+            chunk_size=self.get_config("chunk_size") or 0,
+            max_retries=self.get_config("max_retries")
+        )
+        if self.get_config("fail_on_item_error"):
+            failed = [r for r in results if isinstance(r, dict) and "error" in r and "item_index" in r]
+            if failed:
+                raise ValueError(f"{len(failed)} of {len(items)} items failed (first: item {failed[0]['item_index']}: {failed[0]['error']})")
+        return results
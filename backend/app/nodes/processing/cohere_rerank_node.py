@@ -3,7 +3,6 @@ Cohere Rerank Node - Studio Standard (Universal Method)
 Batch 118: AI Essentials & Local Inference
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -127,7 +126,7 @@ class CohereRerankNode(BaseNode):
                 "top_n": int(self.get_config("top_n", 3))
             }
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 async with session.post(url, headers=headers, json=payload) as response:
                     if response.status != 200:
                         text = await response.text()
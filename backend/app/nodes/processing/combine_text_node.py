@@ -15,6 +15,7 @@ class CombineTextNode(BaseNode):
     node_type = "combine_text"
     version = "1.0.0"
     category = "text_processing"
+    reusable = True
     credentials_required = []
 
 
@@ -16,6 +16,7 @@ class ParseJSONDataNode(BaseNode):
     node_type = "parse_json_data"
     version = "1.0.0"
     category = "data_processing"
+    reusable = True
     credentials_required = []
 
 
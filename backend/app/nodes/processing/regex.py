@@ -11,6 +11,7 @@ class RegexNode(BaseNode):
     node_type = "regex_extract"
     version = "1.0.0"
     category = "processing"
+    reusable = True
 
 
     properties = [
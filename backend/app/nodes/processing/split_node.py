@@ -11,6 +11,7 @@ class SplitTextNode(BaseNode):
     node_type = "text_splitter"
     version = "1.0.0"
     category = "processing"
+    reusable = True
 
 
     properties = [
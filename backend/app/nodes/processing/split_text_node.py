@@ -15,6 +15,7 @@ class SplitTextNode(BaseNode):
     node_type = "split_text"
     version = "1.0.0"
     category = "text_processing"
+    reusable = True
     credentials_required = []
 
 
@@ -3,7 +3,6 @@ Unstructured Node - Studio Standard (Universal Method)
 Batch 117: Advanced Document Processing
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -101,7 +100,7 @@ class UnstructuredNode(BaseNode):
                 "chunking_strategy": strategy
             }
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 async with session.post(url, headers=headers, json=payload) as response:
                     if response.status != 200:
                         text = await response.text()
@@ -3,7 +3,6 @@ Agile & Task Management Nodes - Studio Standard (Universal Method)
 Batch 105: Productivity Suite
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -127,7 +126,7 @@ class LinearNode(BaseNode):
             
             action = self.get_config("action", "create_issue")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "create_issue":
                     team_id = self.get_config("team_id")
                     title = self.get_config("title")
@@ -296,7 +295,7 @@ class BasecampNode(BaseNode):
             
             action = self.get_config("action", "create_todo")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "create_todo":
                     project_id = self.get_config("project_id")
                     todolist_id = self.get_config("todolist_id")
@@ -396,7 +395,7 @@ class TodoistNode(BaseNode):
             
             action = self.get_config("action", "create_task")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "create_task":
                     content = self.get_config("content")
                     if not content:
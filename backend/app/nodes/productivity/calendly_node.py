@@ -3,7 +3,6 @@ Calendly Node - Studio Standard (Universal Method)
 Batch 91: Productivity Suite (n8n Critical)
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -75,7 +74,7 @@ class CalendlyNode(BaseNode):
             base_url = "https://api.calendly.com"
             action = self.get_config("action", "list_events")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "get_user":
                     url = f"{base_url}/users/me"
                     async with session.get(url, headers=headers) as resp:
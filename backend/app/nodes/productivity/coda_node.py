@@ -3,7 +3,6 @@ Coda Node - Studio Standard
 Batch 113: Productivity & Docs
 """
 from typing import Any, Dict, Optional
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -111,7 +110,7 @@ class CodaNode(BaseNode):
             action = self.get_config("action", "list_docs")
             base_url = "https://coda.io/apis/v1"
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "list_docs":
                     url = f"{base_url}/docs"
                     async with session.get(url, headers=headers) as resp:
@@ -3,7 +3,6 @@ Microsoft Excel Node - Studio Standard (Universal Method)
 Batch 91: Productivity Suite (n8n Critical)
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -102,7 +101,7 @@ class ExcelNode(BaseNode):
             if not workbook_id:
                 return {"status": "error", "error": "workbook_id required"}
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "add_row":
                     worksheet = self.get_config("worksheet_name", "Sheet1")
                     values = self.get_config("values") or str(input_data)
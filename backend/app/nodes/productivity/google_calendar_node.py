@@ -3,7 +3,6 @@ Google Calendar Node - Studio Standard (Universal Method)
 Batch 90: CRM & Marketing (n8n Critical)
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from datetime import datetime, timedelta
 from ..base import BaseNode
 from ..registry import register_node
@@ -125,7 +124,7 @@ class GoogleCalendarNode(BaseNode):
             action = self.get_config("action", "create_event")
             calendar_id = self.get_config("calendar_id", "primary")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "create_event":
                     summary = self.get_config("summary") or str(input_data)
                     description = self.get_config("description", "")
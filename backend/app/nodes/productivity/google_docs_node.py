@@ -3,7 +3,6 @@ Google Docs Node - Studio Standard (Universal Method)
 Batch 91: Productivity Suite (n8n Critical)
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -96,7 +95,7 @@ class GoogleDocsNode(BaseNode):
             docs_url = "https://docs.googleapis.com/v1/documents"
             action = self.get_config("action", "create_document")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "create_document":
                     title = self.get_config("title", "Studio Document")
                     
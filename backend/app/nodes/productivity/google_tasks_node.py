@@ -3,7 +3,6 @@ Google Tasks Node - Studio Standard
 Batch 115: Productivity Suite
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -123,7 +122,7 @@ class GoogleTasksNode(BaseNode):
             action = self.get_config("action", "list_tasks")
             tasklist_id = self.get_config("tasklist_id", "@default")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "list_tasks":
                     url = f"{base_url}/lists/{tasklist_id}/tasks"
                     async with session.get(url, headers=headers) as resp:
@@ -3,7 +3,6 @@ Google Productivity Nodes - Studio Standard (Universal Method)
 Batch 105: Productivity Suite
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -148,7 +147,7 @@ class GoogleCalendarNode(BaseNode):
             action = self.get_config("action", "list_events")
             calendar_id = self.get_config("calendar_id", "primary")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "list_events":
                     url = f"{base_url}/calendars/{calendar_id}/events"
                     async with session.get(url, headers=headers) as resp:
@@ -285,7 +284,7 @@ class GoogleDocsNode(BaseNode):
             
             action = self.get_config("action", "create_document")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "create_document":
                     title = self.get_config("title", "Untitled Document")
                     payload = {"title": title}
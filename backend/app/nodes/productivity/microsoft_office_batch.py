@@ -3,7 +3,6 @@ Microsoft Productivity Nodes - Studio Standard (Universal Method)
 Batch 105: Productivity Suite
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -119,7 +118,7 @@ class MicrosoftOutlookNode(BaseNode):
             
             action = self.get_config("action", "send_email")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "send_email":
                     to = self.get_config("to_recipients")
                     subject = self.get_config("subject")
@@ -263,7 +262,7 @@ class MicrosoftExcelNode(BaseNode):
             # Production usually involves drive/item discovery first
             base_url = f"https://graph.microsoft.com/v1.0/me/drive/items/{item_id}/workbook"
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "list_rows":
                     if not item_id:
                         return {"status": "error", "error": "item_id (workbook ID) required"}
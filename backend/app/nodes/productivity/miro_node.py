@@ -3,7 +3,6 @@ Miro Node - Studio Standard
 Batch 113: Productivity & Collaboration
 """
 from typing import Any, Dict, Optional
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -88,7 +87,7 @@ class MiroNode(BaseNode):
             action = self.get_config("action", "list_boards")
             base_url = "https://api.miro.com/v2"
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "list_boards":
                     url = f"{base_url}/boards"
                     async with session.get(url, headers=headers) as resp:
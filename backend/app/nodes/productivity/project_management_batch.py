@@ -3,7 +3,6 @@ Project Management Nodes - Studio Standard (Universal Method)
 Batch 105: Productivity Suite
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -97,7 +96,7 @@ class MondayComNode(BaseNode):
             
             action = self.get_config("action", "create_item")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "create_item":
                     board_id = self.get_config("board_id")
                     item_name = self.get_config("item_name")
@@ -167,7 +166,7 @@ class AsanaNode(BaseNode):
             
             action = self.get_config("action", "create_task")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "create_task":
                     workspace = self.get_config("workspace_id")
                     name = self.get_config("name")
@@ -238,7 +237,7 @@ class ClickUpNode(BaseNode):
             
             action = self.get_config("action", "create_task")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "create_task":
                     list_id = self.get_config("list_id")
                     name = self.get_config("name")
@@ -1,4 +1,3 @@
-import aiohttp
 from typing import Any, Dict, Optional, List
 from ..base import BaseNode
 from ..registry import register_node
@@ -67,7 +66,7 @@ class TrelloNode(BaseNode):
             base_url = "https://api.trello.com/1"
             auth_params = {"key": key, "token": token}
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "create_card":
                     list_id = self.get_config("list_id")
                     if not list_id:
@@ -3,7 +3,6 @@ Upwork Node - Studio Standard
 Batch 74: Professional Services
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -88,7 +87,7 @@ class UpworkNode(BaseNode):
             base_url = "https://www.upwork.com/api"
             action = self.get_config("action", "search_jobs")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "get_user_info":
                     url = f"{base_url}/auth/v1/info.json"
                     async with session.get(url, headers=headers) as resp:
@@ -1,11 +1,18 @@
+import hashlib
 import importlib
+import json
 import pkgutil
 import inspect
 import os
 import sys
-from typing import Dict, Type, Any, Optional, List
+import time
+from typing import Dict, Type, Any, Optional, List, Tuple
 from .base import BaseNode
 
+MANIFEST_VERSION = 1
+EXCLUDE_DIRS = ["__pycache__", "deactivated", "agentql", "vendor", "custom_component", "node_system"]
+EXCLUDE_FILES = ["__init__.py", "base.py", "registry.py"]
+
 def register_node(node_id: str):
     """
     Decorator to explicitly register a node with a specific ID.
@@ -16,13 +23,35 @@ def register_node(node_id: str):
         return cls
     return decorator
 
+def _file_hash(path: str) -> str:
+    with open(path, "rb") as f:
+        return hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+
+
+def _node_files(nodes_dir: str):
+    """Yields every candidate node source file under app/nodes."""
+    for root, dirs, files in os.walk(nodes_dir):
+        # Prune directories to skip
+        dirs[:] = sorted(d for d in dirs if d not in EXCLUDE_DIRS)
+        for file in sorted(files):
+            if file.endswith(".py") and file not in EXCLUDE_FILES:
+                yield os.path.join(root, file)
+
+
 class NodeRegistry:
     """
     Automated registry for nodes. Scans the app.nodes directory and 
     registers all classes inheriting from BaseNode.
+    When a manifest (node_id -> module/class, built by `studio node manifest`)
+    is present, modules are imported lazily on first request instead.
     """
     _nodes: Dict[str, Type[BaseNode]] = {}
     _is_scanned = False
+    # node_id -> {"module", "class", "kind", "version", "file", "hash"}
+    _manifest: Optional[Dict[str, Dict[str, Any]]] = None
+    _manifest_loaded = False
+    # True when node files changed since the manifest was built
+    _manifest_stale = False
 
     @classmethod
     def scan_and_register(cls):
@@ -33,6 +62,39 @@ class NodeRegistry:
             return
         
         # Start scanning from the app.nodes directory
+        nodes_dir, package_root = cls._ensure_paths()
+
+        # Scan all directories in nodes root
+        module_count = 0
+        for file_path in _node_files(nodes_dir):
+            # Optimization: Only import if the file looks like a Node
+            try:
+                with open(file_path, "r", encoding="utf-8") as f:
+                    content = f.read()
+                    # Now also scan for legacy Components
+                    if not any(x in content for x in ["BaseNode", "@register_node", "Component", "LCModelComponent"]):
+                        continue
+            except Exception:
+                continue
+
+            # Convert file path to module path
+            module_name = cls._module_name(file_path, package_root)
+            
+            try:
+                module = importlib.import_module(module_name)
+                module_count += 1
+                cls._extract_nodes_from_module(module)
+            except (ImportError, ModuleNotFoundError):
+                pass
+            except Exception:
+                pass
+
+        cls._is_scanned = True
+        print(f"NodeRegistry: Scanned {module_count} modules. Registered {len(cls._nodes)} nodes.")
+
+    @staticmethod
+    def _ensure_paths() -> Tuple[str, str]:
+        """Returns (nodes_dir, package_root) and makes legacy import roots importable."""
         nodes_dir = os.path.dirname(os.path.abspath(__file__))
         package_root = os.path.abspath(os.path.join(nodes_dir, "..", ".."))
         
@@ -43,48 +105,24 @@ class NodeRegistry:
         agents_path = os.path.join(package_root, "app", "agents")
         if agents_path not in sys.path:
             sys.path.append(agents_path)
+        return nodes_dir, package_root
 
-        # Scan all directories in nodes root
-        module_count = 0
-        EXCLUDE_DIRS = ["__pycache__", "deactivated", "agentql", "vendor", "custom_component", "node_system"]
-        
-        for root, dirs, files in os.walk(nodes_dir):
-            # Prune directories to skip
-            dirs[:] = [d for d in dirs if d not in EXCLUDE_DIRS]
-            
-            for file in files:
-                if file.endswith(".py") and file not in ["__init__.py", "base.py", "registry.py"]:
-                    # Optimization: Only import if the file looks like a Node
-                    file_path = os.path.join(root, file)
-                    try:
-                        with open(file_path, "r", encoding="utf-8") as f:
-                            content = f.read()
-                            # Now also scan for legacy Components
-                            if not any(x in content for x in ["BaseNode", "@register_node", "Component", "LCModelComponent"]):
-                                continue
-                    except Exception:
-                        continue
+    @staticmethod
+    def _module_name(file_path: str, package_root: str) -> str:
+        rel_path = os.path.relpath(file_path, package_root)
+        return rel_path.replace(os.sep, ".")[:-len(".py")]
 
-                    # Convert file path to module path
-                    rel_path = os.path.relpath(file_path, package_root)
-                    module_name = rel_path.replace(os.sep, ".").replace(".py", "")
-                    
-                    try:
-                        module = importlib.import_module(module_name)
-                        module_count += 1
-                        cls._extract_nodes_from_module(module)
-                    except (ImportError, ModuleNotFoundError):
-                        pass
-                    except Exception:
-                        pass
-
-        cls._is_scanned = True
-        print(f"NodeRegistry: Scanned {module_count} modules. Registered {len(cls._nodes)} nodes.")
+    @staticmethod
+    def manifest_path() -> str:
+        from app.core.config import settings
+        path = settings.NODE_MANIFEST_PATH
+        if not os.path.isabs(path):
+            backend_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+            path = os.path.join(backend_root, path)
+        return path
 
     @classmethod
     def _extract_nodes_from_module(cls, module):
-        import inspect
-        from .base import LangflowComponentAdapter
         count = 0
         for name, obj in inspect.getmembers(module, inspect.isclass):
             if obj.__name__ in ["BaseNode", "Component", "LCModelComponent", "LangflowComponentAdapter"]:
@@ -108,26 +146,175 @@ class NodeRegistry:
                     node_id = getattr(obj, "name", None) or getattr(obj, "display_name", obj.__name__)
                     
                     if node_id not in cls._nodes:
-                        # Create a factory that returns an instance of the adapter for THIS specific class
-                        # Because our system expects a class that can be instantiated with config
-                        class DynamicAdapter(LangflowComponentAdapter):
-                            def __init__(self, config=None):
-                                super().__init__(obj, config)
-                        
-                        DynamicAdapter.__name__ = f"Adapter_{obj.__name__}"
-                        cls._nodes[node_id] = DynamicAdapter
+                        cls._nodes[node_id] = cls._adapt_component(obj)
                         count += 1
                         
             except Exception:
                 continue
         return count
 
+    @staticmethod
+    def _adapt_component(component_class):
+        """
+        Create a factory that returns an instance of the adapter for THIS specific class
+        Because our system expects a class that can be instantiated with config
+        """
+        from .base import LangflowComponentAdapter
+
+        class DynamicAdapter(LangflowComponentAdapter):
+            def __init__(self, config=None):
+                super().__init__(component_class, config)
+
+        DynamicAdapter.__name__ = f"Adapter_{component_class.__name__}"
+        DynamicAdapter.wrapped_component = component_class
+        return DynamicAdapter
+
+    # --- Manifest (lazy loading) ---
+
+    @classmethod
+    def build_manifest(cls, path: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Runs a full scan and persists node_id -> module/class (+ version and
+        source hash) so later processes can import node modules on demand.
+        """
+        cls.scan_and_register()
+        nodes_dir, package_root = cls._ensure_paths()
+
+        nodes = {}
+        hashes: Dict[str, str] = {}
+        for node_id, node_class in sorted(cls._nodes.items()):
+            target = getattr(node_class, "wrapped_component", None) or node_class
+            try:
+                source = inspect.getsourcefile(target)
+            except TypeError:
+                source = None
+            if not source or not os.path.abspath(source).startswith(nodes_dir + os.sep):
+                continue
+            source = os.path.abspath(source)
+            rel_file = os.path.relpath(source, package_root).replace(os.sep, "/")
+            if rel_file not in hashes:
+                hashes[rel_file] = _file_hash(source)
+            nodes[node_id] = {
+                "module": cls._module_name(source, package_root),
+                "class": target.__name__,
+                "kind": "component" if target is not node_class else "node",
+                "version": str(getattr(target, "version", "") or ""),
+                "file": rel_file,
+                "hash": hashes[rel_file]
+            }
+
+        files = {}
+        for file_path in _node_files(nodes_dir):
+            rel_file = os.path.relpath(file_path, package_root).replace(os.sep, "/")
+            files[rel_file] = hashes.get(rel_file) or _file_hash(file_path)
+
+        manifest = {
+            "version": MANIFEST_VERSION,
+            "generated_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "nodes": nodes,
+            "files": files
+        }
+        path = path or cls.manifest_path()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=1, sort_keys=True)
+
+        cls._manifest = nodes
+        cls._manifest_loaded = True
+        cls._manifest_stale = False
+        return manifest
+
+    @classmethod
+    def load_manifest(cls, path: Optional[str] = None, validate: bool = True) -> bool:
+        """
+        Loads the persisted manifest (startup). With `validate`, source hashes
+        are checked: if node files were added, changed or removed since it was
+        built, the manifest is still used as a hint but unknown node types
+        fall back to a full scan. Returns True if a usable manifest was loaded.
+        """
+        cls._manifest_loaded = True
+        path = path or cls.manifest_path()
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+        except FileNotFoundError:
+            print(f"NodeRegistry: No manifest at {path}, falling back to full scans. Run `python -m app.cli.main node manifest` to build one.")
+            return False
+        except Exception as e:
+            print(f"NodeRegistry: Unreadable manifest {path} ({e}), falling back to full scans.")
+            return False
+
+        if manifest.get("version") != MANIFEST_VERSION:
+            print(f"NodeRegistry: Manifest version {manifest.get('version')} not supported, falling back to full scans.")
+            return False
+
+        cls._manifest = manifest.get("nodes", {})
+        cls._manifest_stale = False
+        if validate:
+            changed = cls.validate_manifest(manifest)
+            if changed:
+                cls._manifest_stale = True
+                print(f"NodeRegistry: Manifest is stale ({len(changed)} node files changed, e.g. {changed[0]}). Rebuild it with `python -m app.cli.main node manifest`.")
+        print(f"NodeRegistry: Loaded manifest with {len(cls._manifest)} nodes (lazy loading).")
+        return True
+
+    @classmethod
+    def validate_manifest(cls, manifest: Dict[str, Any]) -> List[str]:
+        """Returns the node files added, changed or removed since the manifest was built."""
+        nodes_dir, package_root = cls._ensure_paths()
+        recorded = manifest.get("files", {})
+        current = {}
+        for file_path in _node_files(nodes_dir):
+            rel_file = os.path.relpath(file_path, package_root).replace(os.sep, "/")
+            try:
+                current[rel_file] = _file_hash(file_path)
+            except OSError:
+                continue
+        return sorted(
+            rel_file for rel_file in set(recorded) | set(current)
+            if recorded.get(rel_file) != current.get(rel_file)
+        )
+
+    @classmethod
+    def _load_from_manifest(cls, node_type: str) -> Optional[Type[BaseNode]]:
+        """Imports the module declaring `node_type` (and registers everything it defines)."""
+        if not cls._manifest_loaded:
+            cls.load_manifest()
+        entry = (cls._manifest or {}).get(node_type)
+        if not entry:
+            return None
+
+        cls._ensure_paths()
+        try:
+            module = importlib.import_module(entry["module"])
+            target = getattr(module, entry["class"])
+        except Exception as e:
+            print(f"NodeRegistry: Failed to load '{node_type}' from {entry.get('module')}: {e}")
+            return None
+
+        # Decorators / bulk_register calls ran on import; keep any explicit registration
+        if node_type not in cls._nodes:
+            cls._nodes[node_type] = cls._adapt_component(target) if entry.get("kind") == "component" else target
+        return cls._nodes[node_type]
+
     @classmethod
     def get_node_class(cls, node_type: str, scan: bool = True) -> Optional[Type[BaseNode]]:
         if node_type in cls._nodes:
             return cls._nodes[node_type]
-            
-        if scan and not cls._is_scanned:
+
+        if not scan:
+            return None
+
+        # Manifest: import just the module that declares this node type
+        node_class = cls._load_from_manifest(node_type)
+        if node_class:
+            return node_class
+
+        # A fresh manifest lists every node, so a miss means the type does not exist
+        if cls._manifest is not None and not cls._manifest_stale:
+            return None
+
+        if not cls._is_scanned:
             cls.scan_and_register()
             return cls._nodes.get(node_type)
         return None
@@ -140,6 +327,12 @@ class NodeRegistry:
 
     @classmethod
     def get_all_nodes(cls) -> Dict[str, Type[BaseNode]]:
-        if not cls._is_scanned:
+        if not cls._manifest_loaded:
+            cls.load_manifest()
+        if cls._manifest is not None and not cls._manifest_stale:
+            for node_type in cls._manifest:
+                if node_type not in cls._nodes:
+                    cls._load_from_manifest(node_type)
+        elif not cls._is_scanned:
             cls.scan_and_register()
         return cls._nodes
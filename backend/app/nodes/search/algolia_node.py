@@ -5,7 +5,6 @@ Batch 56: Enterprise Search & Discovery
 from typing import Any, Dict, Optional, List
 from ..base import BaseNode
 from ..registry import register_node
-import aiohttp
 import json
 
 @register_node("algolia_node")
@@ -134,7 +133,7 @@ class AlgoliaNode(BaseNode):
             read_host = f"https://{app_id}-dsn.algolia.net"
             write_host = f"https://{app_id}.algolia.net"
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "search":
                     url = f"{read_host}/1/indexes/{index_name}/query"
                     payload = {
@@ -101,7 +101,7 @@ class ArXivNode(BaseNode):
             # Use aiohttp for async if possible, but keeping logic consistent with their component
             # Actually, standard Studio uses aiohttp. 
             import aiohttp
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 async with session.get(url) as response:
                     response_text = await response.text()
             
@@ -3,7 +3,6 @@ Bing Search Node - Studio Standard (Universal Method)
 Batch 112: Advanced Search & Knowledge
 """
 from typing import Any, Dict, Optional
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -87,7 +86,7 @@ class BingSearchNode(BaseNode):
                 "safesearch": "Moderate"
             }
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 async with session.get(url, headers=headers, params=params) as response:
                     if response.status != 200:
                         return {"status": "error", "error": f"Bing API error {response.status}"}
@@ -5,7 +5,6 @@ Batch 56: Enterprise Search & Discovery
 from typing import Any, Dict, Optional, List
 from ..base import BaseNode
 from ..registry import register_node
-import aiohttp
 import json
 
 @register_node("elasticsearch_node")
@@ -149,7 +148,7 @@ class ElasticSearchNode(BaseNode):
 
             url = url.rstrip("/")
             
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "search":
                     query_val = self.get_config("query") or str(input_data)
                     # Check if query is JSON DSL
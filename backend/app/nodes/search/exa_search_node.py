@@ -3,7 +3,6 @@ Exa Search Node - Studio Standard (Universal Method)
 Batch 112: Advanced Search & Knowledge
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -102,7 +101,7 @@ class ExaSearchNode(BaseNode):
                 "Content-Type": "application/json"
             }
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "search":
                     payload = {
                         "query": query,
@@ -3,7 +3,6 @@ Glean Search Node - Studio Standard (Universal Method)
 Batch 115: Specialized Tools
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 import json
 from ..base import BaseNode
 from ..registry import register_node
@@ -90,7 +89,7 @@ class GleanSearchNode(BaseNode):
                 "pageSize": page_size
             }
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 async with session.post(url, headers=headers, json=payload) as response:
                     if response.status != 200:
                         text = await response.text()
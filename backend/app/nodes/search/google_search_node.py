@@ -3,7 +3,6 @@ Google Search Node - Studio Standard (Universal Method)
 Batch 112: Advanced Search & Knowledge
 """
 from typing import Any, Dict, Optional
-import aiohttp
 from pydantic import BaseModel, Field
 from ..base import BaseNode
 from ..registry import register_node
@@ -83,7 +82,7 @@ class GoogleSearchNode(BaseNode):
                 "num": num_results
             }
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 async with session.get(url, params=params) as response:
                     if response.status != 200:
                         return {"status": "error", "error": f"Google Search API error {response.status}"}
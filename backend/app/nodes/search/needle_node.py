@@ -3,7 +3,6 @@ Needle Retriever Node - Studio Standard (Universal Method)
 Batch 115: Specialized Tools
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -88,7 +87,7 @@ class NeedleNode(BaseNode):
                 "top_k": top_k
             }
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 async with session.post(url, headers=headers, json=payload) as response:
                     if response.status != 200:
                         text = await response.text()
@@ -3,7 +3,6 @@ ScrapeGraph Node - Studio Standard (Universal Method)
 Batch 117: Advanced Document Processing
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -104,7 +103,7 @@ class ScrapeGraphNode(BaseNode):
                 endpoint = "/markdownify"
                 payload = {"website_url": url}
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 async with session.post(f"{base_url}{endpoint}", headers=headers, json=payload) as response:
                     if response.status != 200:
                         text = await response.text()
@@ -3,7 +3,6 @@ SearchAPI Node - Studio Standard (Universal Method)
 Batch 112: Advanced Search & Knowledge
 """
 from typing import Any, Dict, Optional
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -79,7 +78,7 @@ class SearchAPINode(BaseNode):
                 "api_key": api_key
             }
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 async with session.get(url, params=params) as response:
                     if response.status != 200:
                         return {"status": "error", "error": f"SearchAPI Error: {response.status}"}
@@ -3,7 +3,6 @@ Serper Search Node - Studio Standard (Universal Method)
 Batch 112: Advanced Search & Knowledge
 """
 from typing import Any, Dict, Optional
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -95,7 +94,7 @@ class SerperSearchNode(BaseNode):
                 "num": num_results
             }
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 async with session.post(url, headers=headers, json=payload) as response:
                     if response.status != 200:
                         return {"status": "error", "error": f"Serper API error {response.status}"}
@@ -3,7 +3,6 @@ Universal Web Search Node - Studio Standard
 Batch 48: Browsing & Search
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -102,7 +101,7 @@ class WebSearchNode(BaseNode):
         max_results = int(self.get_config("max_results", 5))
         
         try:
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if engine == "tavily":
                     creds = await self.get_credential("search_auth")
                     api_key = creds.get("tavily_api_key") or self.get_config("api_key")
@@ -2,7 +2,6 @@
 WolframAlpha Node - Studio Standard (Universal Method)
 """
 from typing import Any, Dict, Optional
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -84,7 +83,7 @@ class WolframAlphaNode(BaseNode):
                 # Let's use the Query API as in their component.
                 pass
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 async with session.get(url, params=params) as response:
                     if response.status != 200:
                         return {"status": "error", "error": f"WolframAlpha API returned status {response.status}"}
@@ -3,7 +3,6 @@ Auth0 Node - Studio Standard
 Batch 61: Identity & Security
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -106,7 +105,7 @@ class Auth0Node(BaseNode):
             base_url = f"https://{domain}/api/v2"
             action = self.get_config("action", "get_users")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "get_users":
                     url = f"{base_url}/users"
                     async with session.get(url, headers=headers) as resp:
@@ -3,7 +3,6 @@ Clerk Node - Studio Standard
 Batch 61: Identity & Security
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -76,7 +75,7 @@ class ClerkNode(BaseNode):
             base_url = "https://api.clerk.com/v1"
             action = self.get_config("action", "list_users")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "list_users":
                     url = f"{base_url}/users"
                     async with session.get(url, headers=headers) as resp:
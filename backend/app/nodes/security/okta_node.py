@@ -3,7 +3,6 @@ Okta Node - Studio Standard
 Batch 61: Identity & Security
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -91,7 +90,7 @@ class OktaNode(BaseNode):
             base_url = f"https://{domain}/api/v1"
             action = self.get_config("action", "list_users")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "list_users":
                     url = f"{base_url}/users"
                     async with session.get(url, headers=headers) as resp:
@@ -3,7 +3,6 @@ Facebook Node - Studio Standard (Universal Method)
 Batch 92: Social Media Integration (n8n Critical)
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -81,7 +80,7 @@ class FacebookNode(BaseNode):
             action = self.get_config("action", "create_post")
             page_id = self.get_config("page_id")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "create_post":
                     message = self.get_config("message") or str(input_data)
                     
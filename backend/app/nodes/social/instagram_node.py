@@ -3,7 +3,6 @@ Instagram Business Node - Studio Standard
 Batch 54: Social Engagement & Influence
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 import asyncio
 from ..base import BaseNode
 from ..registry import register_node
@@ -108,7 +107,7 @@ class InstagramNode(BaseNode):
 
             base_url = f"https://graph.facebook.com/v19.0/{business_id}"
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 # 2. Step 1: Create Media Container
                 container_url = f"{base_url}/media"
                 payload = {
@@ -3,7 +3,6 @@ Instagram Node - Studio Standard (Universal Method)
 Batch 92: Social Media Integration (n8n Critical)
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -91,7 +90,7 @@ class InstagramV2Node(BaseNode):
             ig_user_id = self.get_config("ig_user_id")
             action = self.get_config("action", "get_media")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "get_account_info":
                     url = f"{base_url}/{ig_user_id}"
                     params = {
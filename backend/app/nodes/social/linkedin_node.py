@@ -3,7 +3,6 @@ LinkedIn Node - Studio Standard (Universal Method)
 Batch 92: Social Media Integration (n8n Critical)
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -88,7 +87,7 @@ class LinkedInNode(BaseNode):
             base_url = "https://api.linkedin.com/v2"
             action = self.get_config("action", "get_me")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "get_me":
                     url = f"{base_url}/me"
                     async with session.get(url, headers=headers) as resp:
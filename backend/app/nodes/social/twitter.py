@@ -1,4 +1,3 @@
-import aiohttp
 import json
 from typing import Any, Dict, Optional, List
 from ..base import BaseNode
@@ -67,7 +66,7 @@ class TwitterNode(BaseNode):
                 headers = {"Authorization": f"Bearer {bearer_token}"}
                 params = {"query": query, "max_results": max_res}
 
-                async with aiohttp.ClientSession() as session:
+                async with self.http_session() as session:
                     async with session.get(url, headers=headers, params=params) as response:
                         result = await response.json()
                         if response.status >= 400:
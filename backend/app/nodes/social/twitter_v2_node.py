@@ -3,7 +3,6 @@ Twitter v2 Node - Studio Standard (Universal Method)
 Batch 92: Social Media Integration (n8n Critical)
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -78,7 +77,7 @@ class TwitterV2Node(BaseNode):
             base_url = "https://api.twitter.com/2"
             action = self.get_config("action", "create_tweet")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "create_tweet":
                     text = self.get_config("query") or str(input_data)
                     url = f"{base_url}/tweets"
@@ -3,7 +3,6 @@ X (Twitter) Social Node - Studio Standard
 Batch 54: Social Engagement & Influence
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -110,7 +109,7 @@ class XNode(BaseNode):
             
             base_url = "https://api.twitter.com/2"
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "post_tweet":
                     if not text:
                          return {"status": "error", "error": "Tweet text is required."}
@@ -3,7 +3,6 @@ YouTube Node - Studio Standard (Universal Method)
 Batch 92: Social Media Integration (n8n Critical)
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -90,7 +89,7 @@ class YouTubeNode(BaseNode):
             base_url = "https://www.googleapis.com/youtube/v3"
             action = self.get_config("action", "get_channel_stats")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 headers = {"Authorization": f"Bearer {access_token}"}
                 
                 if action == "get_channel_stats":
@@ -3,7 +3,6 @@ Blogging Platform Nodes - Studio Standard (Universal Method)
 Batch 106: Social Media
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -148,7 +147,7 @@ class MediumNode(BaseNode):
             
             action = self.get_config("action", "create_post")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "get_user":
                     url = f"{base_url}/me"
                     async with session.get(url, headers=headers) as resp:
@@ -283,7 +282,7 @@ class TumblrNode(BaseNode):
             if not blog_identifier and action != "get_user_info":
                  return {"status": "error", "error": "blog_identifier required"}
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "create_post":
                     post_type = self.get_config("type", "text")
                     
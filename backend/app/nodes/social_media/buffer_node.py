@@ -3,7 +3,6 @@ Buffer Node - Studio Standard (Universal Method)
 Batch 106: Social Media
 """
 from typing import Any, Dict, Optional
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -114,7 +113,7 @@ class BufferNode(BaseNode):
             
             action = self.get_config("action", "create_update")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "create_update":
                     profile_ids = self.get_config("profile_ids")
                     text = self.get_config("text")
@@ -3,7 +3,6 @@ Core Social Media Nodes - Studio Standard (Universal Method)
 Batch 106: Social Media
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -103,7 +102,7 @@ class FacebookPagesNode(BaseNode):
             action = self.get_config("action", "create_post")
             page_id = self.get_config("page_id", "me")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "create_post":
                     message = self.get_config("message")
                     link = self.get_config("link")
@@ -218,7 +217,7 @@ class LinkedInNode(BaseNode):
             
             action = self.get_config("action", "create_post")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "create_post":
                     author = self.get_config("author_urn")
                     text = self.get_config("text")
@@ -338,7 +337,7 @@ class RedditNode(BaseNode):
             
             action = self.get_config("action", "submit_post")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "submit_post":
                     subreddit = self.get_config("subreddit")
                     title = self.get_config("title")
@@ -445,7 +444,7 @@ class PinterestNode(BaseNode):
             
             action = self.get_config("action", "create_pin")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "create_pin":
                     board_id = self.get_config("board_id")
                     image_url = self.get_config("image_url")
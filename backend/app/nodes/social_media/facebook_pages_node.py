@@ -3,7 +3,6 @@ Facebook Pages Node - Studio Standard (Universal Method)
 Batch 106: Social Media
 """
 from typing import Any, Dict, Optional
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -100,7 +99,7 @@ class FacebookPagesNode(BaseNode):
             action = self.get_config("action", "create_post")
             page_id = self.get_config("page_id", "me")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "create_post":
                     message = self.get_config("message")
                     link = self.get_config("link")
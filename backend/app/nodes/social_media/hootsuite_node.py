@@ -3,7 +3,6 @@ Hootsuite Node - Studio Standard (Universal Method)
 Batch 106: Social Media
 """
 from typing import Any, Dict, Optional
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -80,7 +79,7 @@ class HootsuiteNode(BaseNode):
             
             action = self.get_config("action", "create_message")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "create_message":
                     social_profile_ids = self.get_config("social_profile_ids")
                     text = self.get_config("text")
@@ -3,7 +3,6 @@ Later Node - Studio Standard (Universal Method)
 Batch 106: Social Media
 """
 from typing import Any, Dict, Optional
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -68,7 +67,7 @@ class LaterNode(BaseNode):
             
             action = self.get_config("action", "upload_media")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "upload_media":
                     image_url = self.get_config("image_url")
                     if not image_url:
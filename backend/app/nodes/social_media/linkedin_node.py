@@ -3,7 +3,6 @@ LinkedIn Node - Studio Standard (Universal Method)
 Batch 106: Social Media
 """
 from typing import Any, Dict, Optional
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -94,7 +93,7 @@ class LinkedInNode(BaseNode):
             
             action = self.get_config("action", "create_post")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "create_post":
                     author = self.get_config("author_urn")
                     text = self.get_config("text")
@@ -3,7 +3,6 @@ Medium Node - Studio Standard (Universal Method)
 Batch 106: Social Media
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -145,7 +144,7 @@ class MediumNode(BaseNode):
             
             action = self.get_config("action", "create_post")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "get_user":
                     url = f"{base_url}/me"
                     async with session.get(url, headers=headers) as resp:
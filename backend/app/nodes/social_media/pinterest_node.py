@@ -3,7 +3,6 @@ Pinterest Node - Studio Standard (Universal Method)
 Batch 106: Social Media
 """
 from typing import Any, Dict, Optional
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -102,7 +101,7 @@ class PinterestNode(BaseNode):
             
             action = self.get_config("action", "create_pin")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "create_pin":
                     board_id = self.get_config("board_id")
                     image_url = self.get_config("image_url")
@@ -3,7 +3,6 @@ Reddit Node - Studio Standard (Universal Method)
 Batch 106: Social Media
 """
 from typing import Any, Dict, Optional
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -114,7 +113,7 @@ class RedditNode(BaseNode):
             
             action = self.get_config("action", "submit_post")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "submit_post":
                     subreddit = self.get_config("subreddit")
                     title = self.get_config("title")
@@ -3,7 +3,6 @@ Sprout Social Node - Studio Standard (Universal Method)
 Batch 106: Social Media
 """
 from typing import Any, Dict, Optional
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -68,7 +67,7 @@ class SproutSocialNode(BaseNode):
             
             action = self.get_config("action", "get_customer_metrics")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "get_customer_metrics":
                     customer_id = self.get_config("customer_id")
                     if not customer_id:
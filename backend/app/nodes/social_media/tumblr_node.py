@@ -3,7 +3,6 @@ Tumblr Node - Studio Standard (Universal Method)
 Batch 106: Social Media
 """
 from typing import Any, Dict, Optional
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -143,7 +142,7 @@ class TumblrNode(BaseNode):
             if not blog_identifier and action != "get_user_info":
                  return {"status": "error", "error": "blog_identifier required"}
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "create_post":
                     post_type = self.get_config("type", "text")
                     
@@ -2,7 +2,6 @@ import json
 from typing import Any, Dict, Optional, List
 from ..base import BaseNode
 from ..registry import register_node
-import aiohttp
 
 @register_node("airtable_action")
 class AirtableNode(BaseNode):
@@ -75,7 +74,7 @@ class AirtableNode(BaseNode):
             action = self.get_config("action", "read_records")
             url = f"https://api.airtable.com/v0/{base_id}/{table_name}"
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "read_records":
                     async with session.get(url, headers=headers) as resp:
                         result = await resp.json()
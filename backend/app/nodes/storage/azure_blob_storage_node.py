@@ -3,7 +3,6 @@ Azure Blob Storage Node - Studio Standard (Universal Method)
 Batch 107: Cloud Storage
 """
 from typing import Any, Dict, Optional
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -91,7 +90,7 @@ class AzureBlobStorageNode(BaseNode):
             
             action = self.get_config("action", "upload_blob")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "upload_blob":
                     container = self.get_config("container_name")
                     blob = self.get_config("blob_name")
@@ -87,7 +87,7 @@ class BackblazeB2Node(BaseNode):
 
             action = self.get_config("action", "upload_file")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 # 1. Authorize Account
                 auth_url = "https://api.backblazeb2.com/b2api/v2/b2_authorize_account"
                 auth = aiohttp.BasicAuth(account_id, application_key)
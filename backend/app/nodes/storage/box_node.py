@@ -98,7 +98,7 @@ class BoxNode(BaseNode):
             action = self.get_config("action", "upload_file")
             folder_id = self.get_config("folder_id", "0")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "upload_file":
                     file_name = self.get_config("file_name")
                     file_content = self.get_config("file_content")
@@ -3,7 +3,6 @@ Dropbox Node - Studio Standard (Universal Method)
 Batch 107: Cloud Storage
 """
 from typing import Any, Dict, Optional
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -91,7 +90,7 @@ class DropboxNode(BaseNode):
             if not path and action != "list_folder": # list_folder can list root with empty path
                  return {"status": "error", "error": "path required"}
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "upload_file":
                     file_content = self.get_config("file_content")
                     if file_content is None:
@@ -1,7 +1,6 @@
 from ..base import BaseNode
 from ..registry import register_node
 from typing import Any, Dict, Optional, List
-import aiohttp
 import json
 from supabase import create_client
 from langchain_community.vectorstores import SupabaseVectorStore
@@ -59,7 +58,7 @@ class DualIngestorNode(BaseNode):
 
             # 4. Storage 1: NocoDB
             if nocodb_url and nocodb_key and nocodb_project and nocodb_table:
-                async with aiohttp.ClientSession() as session:
+                async with self.http_session() as session:
                     headers = {"xc-token": nocodb_key, "Content-Type": "application/json"}
                     endpoint = f"{nocodb_url.rstrip('/')}/api/v1/db/data/noco/{nocodb_project}/{nocodb_table}"
                     async with session.post(endpoint, headers=headers, json=data) as resp:
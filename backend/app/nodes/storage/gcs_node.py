@@ -3,7 +3,6 @@ Google Cloud Storage Node - Studio Standard (Universal Method)
 Batch 94: Cloud Storage (n8n Critical)
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -98,7 +97,7 @@ class GCSNode(BaseNode):
             upload_url = "https://storage.googleapis.com/upload/storage/v1"
             action = self.get_config("action", "list_buckets")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "list_buckets":
                     if not project_id:
                         return {"status": "error", "error": "project_id required"}
@@ -3,7 +3,6 @@ OneDrive Node - Studio Standard (Universal Method)
 Batch 107: Cloud Storage
 """
 from typing import Any, Dict, Optional
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -94,7 +93,7 @@ class OneDriveNode(BaseNode):
             
             action = self.get_config("action", "upload_file")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "upload_file":
                     file_name = self.get_config("file_name")
                     file_content = self.get_config("file_content")
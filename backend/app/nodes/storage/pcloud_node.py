@@ -107,7 +107,7 @@ class PCloudNode(BaseNode):
 
             params = {"access_token": access_token}
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "upload_file":
                     # Uses uploadfile endpoint
                     upload_url = f"{base_url}/uploadfile"
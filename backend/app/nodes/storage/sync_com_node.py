@@ -87,7 +87,7 @@ class SyncComNode(BaseNode):
             action = self.get_config("action", "list_folder")
             path = self.get_config("path", "/").lstrip("/")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 url = f"{webdav_url}/{path}"
                 
                 if action == "list_folder":
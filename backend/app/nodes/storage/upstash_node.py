@@ -3,7 +3,6 @@ Upstash Node - Studio Standard (Universal Method)
 Batch 118: AI Essentials & Local Inference
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -100,7 +99,7 @@ class UpstashNode(BaseNode):
                 "Content-Type": "application/json"
             }
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "vec_search":
                     # For Upstash Vector search
                     payload = {"data": query, "topK": top_k, "includeMetadata": True}
@@ -3,7 +3,6 @@ Vectara Node - Studio Standard (Universal Method)
 Batch 115: Specialized Tools
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -101,7 +100,7 @@ class VectaraNode(BaseNode):
                 "Content-Type": "application/json"
             }
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "search":
                     payload = {
                         "query": [{
@@ -3,7 +3,6 @@ Help Scout Node - Studio Standard (Universal Method)
 Batch 109: Analytics & Support
 """
 from typing import Any, Dict, Optional
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -79,7 +78,7 @@ class HelpScoutNode(BaseNode):
             
             action = self.get_config("action", "create_conversation")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "create_conversation":
                     mailbox_id = self.get_config("mailbox_id")
                     subject = self.get_config("subject")
@@ -3,7 +3,6 @@ HubSpot Service Node - Studio Standard (Universal Method)
 Batch 97: Support & Ticketing (Deepening Parity)
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -119,7 +118,7 @@ class HubSpotServiceNode(BaseNode):
             base_url = "https://api.hubapi.com/crm/v3/objects/tickets"
             action = self.get_config("action", "list_tickets")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "list_tickets":
                     async with session.get(base_url, headers=headers) as resp:
                         if resp.status != 200:
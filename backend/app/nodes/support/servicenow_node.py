@@ -3,7 +3,6 @@ ServiceNow Node - Studio Standard (Universal Method)
 Batch 97: Support & Ticketing (Deepening Parity)
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 import base64
 from ..base import BaseNode
 from ..registry import register_node
@@ -127,7 +126,7 @@ class ServiceNowNode(BaseNode):
             action = self.get_config("action", "list_incidents")
             table = self.get_config("table", "incident")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "list_incidents" or action == "list_records": # Generalized
                     url = f"{base_url}/{table}"
                     params = {"sysparm_limit": 10}
@@ -94,7 +94,7 @@ class ZendeskNode(BaseNode):
             
             action = self.get_config("action", "create_ticket")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "create_ticket":
                     subject = self.get_config("subject")
                     description = self.get_config("description") # Often comment.body
@@ -3,7 +3,6 @@ Amadeus Node - Studio Standard
 Batch 72: Travel & Hospitality
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -103,7 +102,7 @@ class AmadeusNode(BaseNode):
             if not api_key or not api_secret:
                 return {"status": "error", "error": "Amadeus API Key and Secret are required."}
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 # 1. Get Access Token
                 auth_url = "https://test.api.amadeus.com/v1/security/oauth2/token"
                 auth_data = {
@@ -3,7 +3,6 @@ Expedia Node - Studio Standard
 Batch 72: Travel & Hospitality
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 from ..base import BaseNode
 from ..registry import register_node
 
@@ -87,7 +86,7 @@ class ExpediaNode(BaseNode):
             base_url = "https://test.api.ean.com/v3" # Rapid API Test Endpoint
             action = self.get_config("action", "search_properties")
 
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 if action == "list_regions":
                     url = f"{base_url}/regions"
                     async with session.get(url, headers=headers) as resp:
@@ -3,7 +3,6 @@ HTTP Request Node - Studio Standard (Universal Method)
 Batch 99: Web & Utilities (Deepening Parity)
 """
 from typing import Any, Dict, Optional, List
-import aiohttp
 import json
 from ..base import BaseNode
 from ..registry import register_node
@@ -166,7 +165,7 @@ class HTTPRequestNode(BaseNode):
                     data = body_input
                 # form-data is complex with aiohttp in this generic context, skipping for brevity or treating as raw/dict
             
-            async with aiohttp.ClientSession() as session:
+            async with self.http_session() as session:
                 response = None
                 
                 # Simple Auth handling (Basic/Bearer can be added to headers)
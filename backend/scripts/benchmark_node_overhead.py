@@ -0,0 +1,156 @@
+"""
+Measures the Redis overhead the engine adds around every node execution
+(circuit breaker check/record + node analytics) and around every workflow
+(rate limiter acquire/release).
+
+Runs the legacy sequential command pattern and the current pipelined/Lua
+implementation against the same Redis and prints round-trips and latency.
+
+Usage:
+    python scripts/benchmark_node_overhead.py --nodes 2000 --rtt-ms 0.5
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+# Add backend to path
+backend_path = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if backend_path not in sys.path:
+    sys.path.insert(0, backend_path)
+
+import redis.asyncio as aioredis
+from app.core.config import settings
+
+
+class RoundTripCounter:
+    """Counts client round-trips and optionally adds simulated network latency to each."""
+
+    def __init__(self, client: aioredis.Redis, rtt_ms: float):
+        self.count = 0
+        self.delay = rtt_ms / 1000.0
+        execute_command = client.execute_command
+        make_pipeline = client.pipeline
+
+        async def counted_execute_command(*args, **kwargs):
+            await self._tick()
+            return await execute_command(*args, **kwargs)
+
+        def counted_pipeline(*args, **kwargs):
+            pipe = make_pipeline(*args, **kwargs)
+            execute = pipe.execute
+
+            async def counted_execute(*a, **kw):
+                await self._tick()
+                return await execute(*a, **kw)
+
+            pipe.execute = counted_execute
+            return pipe
+
+        client.execute_command = counted_execute_command
+        client.pipeline = counted_pipeline
+
+    async def _tick(self):
+        self.count += 1
+        if self.delay:
+            await asyncio.sleep(self.delay)
+
+
+async def legacy_node(r: aioredis.Redis, node_type: str, duration: float):
+    """The per-node command sequence before pipelining (closed circuit, success)."""
+    # circuit_breaker.can_execute
+    await r.get(f"circuit:state:{node_type}")
+    # analytics_tracker.track_node_execution
+    await r.hincrby("analytics:node_usage", node_type, 1)
+    await r.hincrby(f"analytics:node_status:{node_type}", "success", 1)
+    await r.lpush(f"analytics:node_durations:{node_type}", duration)
+    await r.ltrim(f"analytics:node_durations:{node_type}", 0, 99)
+    # circuit_breaker.record_success
+    await r.delete(f"circuit:failures:{node_type}")
+    await r.get(f"circuit:state:{node_type}")
+
+
+async def legacy_workflow(r: aioredis.Redis, user_id: str, workspace_id: str, execution_id: str):
+    """The per-workflow rate limiter sequence before pipelining."""
+    user_key = f"rate_limit:user:{user_id}:concurrent"
+    ws_key = f"rate_limit:workspace:{workspace_id}:concurrent"
+    await r.get(user_key)
+    await r.incr(user_key)
+    await r.expire(user_key, settings.WORKFLOW_TIMEOUT)
+    await r.incr(ws_key)
+    await r.expire(ws_key, settings.WORKFLOW_TIMEOUT)
+    await r.setex(f"execution:{execution_id}:limits", settings.WORKFLOW_TIMEOUT, f"{user_id}:{workspace_id}")
+    for key in (user_key, ws_key):
+        current = await r.get(key)
+        if current and int(current) > 0:
+            await r.decr(key)
+
+
+async def run(args):
+    from app.core.analytics import AnalyticsTracker
+    from app.core.circuit_breaker import CircuitBreaker
+    from app.core.rate_limiter import RateLimiter
+
+    r = aioredis.from_url(args.redis_url, decode_responses=True)
+    try:
+        await r.ping()
+    except Exception as e:
+        print(f"Redis not reachable at {args.redis_url}: {e}")
+        return
+
+    counter = RoundTripCounter(r, args.rtt_ms)
+    node_types = [f"bench_node_{i}" for i in range(args.node_types)]
+    results = {}
+
+    # Legacy
+    counter.count = 0
+    start = time.perf_counter()
+    for i in range(args.nodes):
+        await legacy_node(r, node_types[i % len(node_types)], 0.01)
+    for i in range(args.workflows):
+        await legacy_workflow(r, "bench_user", "bench_ws", f"bench-{i}")
+    results["legacy"] = (counter.count, time.perf_counter() - start)
+
+    # Pipelined / Lua
+    analytics, breaker, limiter = AnalyticsTracker(), CircuitBreaker(), RateLimiter()
+    await analytics.init_redis(r)
+    await breaker.init_redis(r)
+    await limiter.init_redis(r)
+
+    counter.count = 0
+    start = time.perf_counter()
+    for i in range(args.nodes):
+        node_type = node_types[i % len(node_types)]
+        await breaker.can_execute(node_type)
+        await analytics.track_node_execution(node_type, "bench_user", "bench_ws", "bench", 0.01, True)
+        await breaker.record_success(node_type)
+    for i in range(args.workflows):
+        await limiter.try_acquire("bench_user", "bench_ws", f"bench-{i}", tier="enterprise")
+        await limiter.release("bench_user", "bench_ws")
+    await analytics.stop()
+    results["pipelined"] = (counter.count, time.perf_counter() - start)
+
+    print(f"{args.nodes} nodes / {args.workflows} workflows, simulated RTT {args.rtt_ms}ms")
+    for name, (round_trips, elapsed) in results.items():
+        print(
+            f"  {name:<10} round-trips: {round_trips:>7}  "
+            f"({round_trips / max(args.nodes, 1):.2f} per node)  "
+            f"total: {elapsed * 1000:.1f}ms  per node: {elapsed / max(args.nodes, 1) * 1e6:.1f}us"
+        )
+
+    # Cleanup benchmark keys
+    async for key in r.scan_iter(match="*bench*"):
+        await r.delete(key)
+    await r.hdel("analytics:node_usage", *node_types)
+    await r.aclose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark per-node Redis overhead")
+    parser.add_argument("--redis-url", default=settings.REDIS_URL)
+    parser.add_argument("--nodes", type=int, default=2000)
+    parser.add_argument("--workflows", type=int, default=200)
+    parser.add_argument("--node-types", type=int, default=20)
+    parser.add_argument("--rtt-ms", type=float, default=0.0, help="Simulated network latency per round-trip")
+    asyncio.run(run(parser.parse_args()))
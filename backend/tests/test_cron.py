@@ -0,0 +1,48 @@
+from datetime import datetime
+import pytest
+from backend.app.core.cron import parse_cron
+
+
+@pytest.mark.parametrize("expression, after, expected", [
+    # 5 fields
+    ("*/15 * * * *", datetime(2024, 1, 1, 10, 7, 30), datetime(2024, 1, 1, 10, 15)),
+    ("0 9 * * 1-5", datetime(2024, 1, 5, 9, 0), datetime(2024, 1, 8, 9, 0)),  # Friday -> Monday
+    ("30 2 1 * *", datetime(2024, 1, 31), datetime(2024, 2, 1, 2, 30)),
+    ("0 0 29 2 *", datetime(2024, 3, 1), datetime(2028, 2, 29)),  # next leap year
+    ("59 23 31 12 *", datetime(2024, 12, 31, 23, 59), datetime(2025, 12, 31, 23, 59)),  # strictly after
+    ("0 12 * jan,jul sun", datetime(2024, 1, 1), datetime(2024, 1, 7, 12, 0)),  # names
+    ("0 0 * * 7", datetime(2024, 1, 1), datetime(2024, 1, 7)),  # 7 is Sunday
+    ("0 0 1 * mon", datetime(2024, 1, 1), datetime(2024, 1, 8)),  # day of month OR day of week
+    ("0 8-18/4 * * *", datetime(2024, 1, 1, 12, 0), datetime(2024, 1, 1, 16, 0)),
+    # 6 fields (leading seconds)
+    ("*/10 * * * * *", datetime(2024, 1, 1, 10, 0, 5), datetime(2024, 1, 1, 10, 0, 10)),
+    ("30 0 0 * * *", datetime(2024, 1, 1, 0, 0, 30), datetime(2024, 1, 2, 0, 0, 30)),
+    # Macros and intervals
+    ("@hourly", datetime(2024, 1, 1, 10, 59, 59, 500000), datetime(2024, 1, 1, 11, 0)),
+    ("@weekly", datetime(2024, 1, 3), datetime(2024, 1, 7)),
+    ("@yearly", datetime(2024, 6, 1), datetime(2025, 1, 1)),
+    ("@every 90s", datetime(2024, 1, 1, 10, 0, 0, 700000), datetime(2024, 1, 1, 10, 1, 30)),
+    ("@every 2h", datetime(2024, 1, 1, 23, 0), datetime(2024, 1, 2, 1, 0)),
+])
+def test_next_fire_time(expression, after, expected):
+    assert parse_cron(expression).next(after) == expected
+
+
+@pytest.mark.parametrize("expression", [
+    "* * *",
+    "* * * * * * *",
+    "60 * * * *",
+    "* 24 * * *",
+    "*/0 * * * *",
+    "5-1 * * * *",
+    "0 0 * foo *",
+    "@every 0m",
+])
+def test_invalid_expressions(expression):
+    with pytest.raises(ValueError):
+        parse_cron(expression)
+
+
+def test_impossible_date_never_fires():
+    with pytest.raises(ValueError, match="never fires"):
+        parse_cron("0 0 30 2 *").next(datetime(2024, 1, 1))
@@ -0,0 +1,45 @@
+import pytest
+from backend.app.core.engine import AgentEngine
+
+GRAPH = {
+    "id": "wf-graph",
+    "nodes": [{"id": "n1", "data": {"id": "chatInput", "label": "Start"}}],
+    "edges": []
+}
+
+
+@pytest.fixture
+def workflow_events(monkeypatch):
+    """Runs process_workflow without Redis/Postgres and records the analytics workflow events."""
+    events = []
+
+    async def allow(*args, **kwargs):
+        return True
+
+    async def noop(*args, **kwargs):
+        return None
+
+    async def track_workflow_execution(**kwargs):
+        events.append(kwargs)
+
+    monkeypatch.setattr("app.core.billing.billing_manager.check_limits", allow)
+    monkeypatch.setattr("app.core.rate_limiter.rate_limiter.try_acquire", allow)
+    monkeypatch.setattr("app.core.rate_limiter.rate_limiter.release", noop)
+    for method in ("start_execution", "record_node", "finish_execution"):
+        monkeypatch.setattr(f"app.core.execution_recorder.execution_recorder.{method}", noop)
+    monkeypatch.setattr("app.core.audit.audit_logger.log", noop)
+    monkeypatch.setattr("app.core.analytics.analytics_tracker.track_workflow_execution", track_workflow_execution)
+    return events
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("context, expected", [
+    ({"workflow_id": "wf-context"}, "wf-context"),
+    ({}, "wf-graph"),
+    (None, "wf-graph"),
+])
+async def test_workflow_id_reaches_analytics(workflow_events, context, expected):
+    await AgentEngine().process_workflow(GRAPH, "hello", execution_id="e1", context=context)
+
+    assert [event["status"] for event in workflow_events] == ["started", "completed"]
+    assert all(event["workflow_id"] == expected for event in workflow_events)
@@ -0,0 +1,60 @@
+from backend.app.core.execution_plan import ExecutionPlan, ExecutionPlanCache
+
+GRAPH = {
+    "id": "wf-1",
+    "nodes": [
+        {"id": "n1", "data": {"id": "chatInput"}},
+        {"id": "n2", "data": {"id": "mockSplitter"}},
+        {"id": "n3", "data": {"id": "mockSuccess"}},
+        {"id": "n4", "data": {"id": "mockSuccess"}},
+        {"id": "n5", "data": {"id": "mockSuccess"}},
+    ],
+    "edges": [
+        {"source": "n1", "target": "n2"},
+        {"source": "n2", "target": "n3", "sourceHandle": "error"},
+        {"source": "n2", "target": "n4", "sourceHandle": "b"},
+        {"source": "n2", "target": "n5", "sourceHandle": "default"},
+    ]
+}
+
+def test_entry_and_node_lookup():
+    plan = ExecutionPlan(GRAPH, "h")
+    assert plan.entry_node_id == "n1"
+    assert plan.get_node("n4")["id"] == "n4"
+    assert [e["target"] for e in plan.outgoing("n2")] == ["n3", "n4", "n5"]
+    assert [e["source"] for e in plan.incoming("n3")] == ["n2"]
+
+def test_routing_priority_matches_engine_rules():
+    plan = ExecutionPlan(GRAPH, "h")
+    # Handle present in result keys wins
+    assert plan.resolve_next_edge("n2", {"b": "right"})["target"] == "n4"
+    # Status based routing
+    assert plan.resolve_next_edge("n2", {"status": "error", "data": 1})["target"] == "n3"
+    # Generic fallback
+    assert plan.resolve_next_edge("n2", "plain")["target"] == "n5"
+    assert plan.resolve_next_edge("n1", "hello")["target"] == "n2"
+    assert plan.resolve_next_edge("n5", "done") is None
+
+def test_plan_cache_reuses_and_versions_plans():
+    cache = ExecutionPlanCache(max_size=2)
+    first = cache.get_plan(GRAPH)
+    assert cache.get_plan(dict(GRAPH)) is first
+
+    changed = {**GRAPH, "edges": GRAPH["edges"][:1]}
+    assert cache.get_plan(changed) is not first
+
+    cache.invalidate("wf-1")
+    assert cache.get_stats()["size"] == 0
+
+def test_dag_routing_fans_out_and_skips_unmatched_handles():
+    plan = ExecutionPlan(GRAPH, "h")
+    routed = {e["target"]: active for e, active in plan.route_edges("n2", {"b": "right"})}
+    assert routed == {"n3": False, "n4": True, "n5": True}
+
+    routed = {e["target"]: active for e, active in plan.route_edges("n2", {"error": "boom"}, is_error=True)}
+    assert routed == {"n3": True, "n4": False, "n5": False}
+
+    layout = plan.dag_layout("n1")
+    assert layout.reachable == {"n1", "n2", "n3", "n4", "n5"}
+    assert layout.indegree["n2"] == 1 and layout.indegree["n1"] == 0
+    assert plan.dag_layout("n1") is layout
@@ -0,0 +1,114 @@
+import asyncio
+import pytest
+from backend.app.core import execution_recorder as recorder_module
+from backend.app.core.execution_recorder import ExecutionRecorder, json_safe
+
+NodeExecution = recorder_module.NodeExecution
+
+
+class FakeStore:
+    def preview(self, digest, length=500):
+        return "preview"
+
+
+def make_recorder(batch_size=3, flush_interval=60.0):
+    recorder = ExecutionRecorder()
+    recorder.batch_size = batch_size
+    recorder.flush_interval = flush_interval
+    return recorder
+
+
+def capture_writes(recorder):
+    batches = []
+
+    async def write(inserts, updates):
+        if inserts or updates:
+            batches.append((list(inserts), list(updates)))
+
+    recorder._write = write
+    return batches
+
+
+def node_record(i, output=None):
+    return NodeExecution(execution_id="e1", node_id=f"n{i}", node_type="t", input={}, output=output or {"i": i})
+
+
+def test_json_safe_converts_payloads_and_objects():
+    payload = recorder_module.LazyPayload(FakeStore(), "abc", 10, b"s")
+    value = json_safe({"big": payload, "obj": object(), 1: [payload]})
+    assert value["big"] == {"$payload": "payload://abc", "size": 10, "preview": "preview"}
+    assert isinstance(value["obj"], str)
+    assert value["1"][0]["$payload"] == "payload://abc"
+
+
+@pytest.mark.asyncio
+async def test_flushes_when_batch_size_is_reached():
+    recorder = make_recorder(batch_size=3)
+    batches = capture_writes(recorder)
+    for i in range(3):
+        await recorder.record_node(node_record(i))
+    await asyncio.sleep(0.05)
+    assert len(batches) == 1 and len(batches[0][0]) == 3
+    await recorder.stop()
+
+
+@pytest.mark.asyncio
+async def test_flushes_after_interval():
+    recorder = make_recorder(batch_size=100, flush_interval=0.05)
+    batches = capture_writes(recorder)
+    await recorder.record_node(node_record(1))
+    await asyncio.sleep(0.01)
+    assert batches == []
+    await asyncio.sleep(0.1)
+    assert len(batches) == 1
+    await recorder.stop()
+
+
+@pytest.mark.asyncio
+async def test_records_are_serialized_before_queueing():
+    recorder = make_recorder()
+    capture_writes(recorder)
+    record = node_record(1, output={"data": object()})
+    await recorder.record_node(record)
+    assert isinstance(record.output["data"], str)
+    await recorder.stop()
+
+
+class FailingBulkSession:
+    committed = []
+
+    def __init__(self):
+        self.pending = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def add_all(self, records):
+        self.pending.extend(records)
+
+    def add(self, record):
+        self.pending.append(record)
+
+    async def flush(self):
+        raise RuntimeError("bulk insert failed")
+
+    async def execute(self, statement):
+        pass
+
+    async def commit(self):
+        FailingBulkSession.committed.extend(self.pending)
+
+
+@pytest.mark.asyncio
+async def test_bulk_failure_falls_back_to_row_by_row(monkeypatch):
+    monkeypatch.setattr(recorder_module, "async_session", FailingBulkSession)
+    FailingBulkSession.committed = []
+    recorder = make_recorder()
+    records = [node_record(i) for i in range(2)]
+    await recorder._write(records, [("e1", {"status": "completed"})])
+    assert FailingBulkSession.committed == records
+    assert recorder.stats["flushed"] == 3
+    assert recorder.stats["flushes"] == 0
@@ -0,0 +1,44 @@
+import shutil
+import pytest
+import pytest_asyncio
+from backend.app.core.js_runtime import NodeRuntimePool
+
+pytestmark = pytest.mark.skipif(shutil.which("node") is None, reason="Node.js is not installed")
+
+
+@pytest_asyncio.fixture
+async def pool():
+    pool = NodeRuntimePool()
+    pool.size = 1
+    await pool.start()
+    yield pool
+    await pool.stop()
+
+
+@pytest.mark.asyncio
+async def test_script_cannot_tamper_with_later_runs(pool):
+    # Reaches the worker's own realm (a vm context is no boundary); its own reply is garbled too
+    planted = await pool.run(
+        'this.constructor.constructor("return globalThis")().JSON.stringify = () => \'"pwned"\'; return 1',
+        {"tenant": "a"}
+    )
+    assert not planted["ok"]
+
+    response = await pool.run("return inputs.value * 2", {"value": 21})
+    assert response["ok"] and response["result"] == 42
+
+
+@pytest.mark.asyncio
+async def test_process_shim_and_exit(pool):
+    response = await pool.run('process.stdout.write("a"); console.log("b"); process.exit(0)', None)
+    assert response["ok"] and not response["has_result"] and response["stdout"] == "ab"
+
+    response = await pool.run("process.exit(3)", None)
+    assert not response["ok"] and "code 3" in response["error"]
+
+
+@pytest.mark.asyncio
+async def test_direct_stdout_write_fails_fast(pool):
+    response = await pool.run('require("fs").writeSync(1, "garbage\\n"); return 1', None, timeout=10)
+    assert not response["ok"] and "stdout" in response["error"]
+    assert pool.stats["bad_frames"] == 1
@@ -0,0 +1,32 @@
+import random
+from backend.app.core.latency import LatencySketch, RELATIVE_ACCURACY
+
+def _exact(values, q):
+    ordered = sorted(values)
+    return ordered[int(q * (len(ordered) - 1))]
+
+def test_quantiles_within_relative_accuracy():
+    rng = random.Random(7)
+    values = [rng.lognormvariate(-3, 1.5) for _ in range(20000)]
+    sketch = LatencySketch()
+    for v in values:
+        sketch.add(v)
+    for q in (0.5, 0.9, 0.99):
+        assert abs(sketch.quantile(q) - _exact(values, q)) <= _exact(values, q) * RELATIVE_ACCURACY * 1.01
+    assert sketch.quantile(1.0) == max(values)
+    assert sketch.summary()["count"] == len(values)
+
+def test_merge_matches_single_sketch_and_redis_round_trip():
+    rng = random.Random(3)
+    values = [rng.expovariate(20) for _ in range(5000)] + [0.0]
+    whole, left, right = LatencySketch(), LatencySketch(), LatencySketch()
+    for i, v in enumerate(values):
+        whole.add(v)
+        (left if i % 2 else right).add(v)
+    # As stored in Redis: HINCRBY counters plus sum/max (bytes when decode_responses is off)
+    fields = {k.encode(): str(c).encode() for k, c in left.fields()}
+    fields[b"sum"], fields[b"max"] = str(left.total).encode(), str(left.max).encode()
+    merged = LatencySketch.from_fields(fields)
+    merged.merge(right)
+    assert merged.buckets == whole.buckets and merged.zero == whole.zero == 1
+    assert merged.summary() == whole.summary()
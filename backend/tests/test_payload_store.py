@@ -0,0 +1,45 @@
+import copy
+import pickle
+import pytest
+from backend.app.core import payload_store as payload_module
+
+LazyPayload = payload_module.LazyPayload
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    store = payload_module.PayloadStore()
+    store.root = str(tmp_path)
+    monkeypatch.setattr(payload_module, "payload_store", store)
+    return store
+
+
+@pytest.mark.parametrize("value", ["x" * 5000, {"items": list(range(100))}])
+@pytest.mark.parametrize("clone", [copy.copy, copy.deepcopy, lambda p: pickle.loads(pickle.dumps(p))])
+def test_clone_keeps_handle_without_materializing(store, value, clone):
+    payload = store.put(value, "exec-1")
+    loads = store.stats["loads"]
+
+    cloned = clone(payload)
+
+    assert isinstance(cloned, LazyPayload)
+    assert cloned.digest == payload.digest and cloned.size == payload.size
+    assert store.stats["loads"] == loads
+    assert cloned.materialize() == value
+
+
+def test_protocol_and_slot_lookups_do_not_materialize(store):
+    payload = LazyPayload(store, "0" * 40, 10, payload_module.KIND_TEXT)
+    del payload._value
+
+    with pytest.raises(AttributeError):
+        payload.__setstate__
+    with pytest.raises(AttributeError):
+        payload._value
+    assert store.stats["loads"] == 0
+
+
+def test_attribute_access_still_reaches_value(store):
+    payload = store.put("hello " * 1000)
+
+    assert payload.startswith("hello")
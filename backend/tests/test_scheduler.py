@@ -0,0 +1,65 @@
+from datetime import datetime
+import pytest
+from backend.app.core import scheduler as scheduler_module
+
+NOW = datetime(2024, 1, 1, 12, 0, 30)
+
+
+def every_five_minutes(minute, hour=11):
+    return [datetime(2024, 1, 1, hour, m) for m in range(minute, 60, 5)]
+
+
+@pytest.fixture
+def occurrences(monkeypatch):
+    """_occurrences of a schedule (every 5 minutes by default) due at `next_run_at`, under `policy`."""
+    monkeypatch.setattr(scheduler_module.settings, "SCHEDULER_MISFIRE_GRACE", 60)
+    monkeypatch.setattr(scheduler_module.settings, "SCHEDULER_MAX_CATCHUP", 10)
+
+    def run(policy, next_run_at, cron="*/5 * * * *"):
+        monkeypatch.setattr(scheduler_module.settings, "SCHEDULER_MISFIRE_POLICY", policy)
+        scheduler = scheduler_module.WorkflowScheduler()
+        schedule = scheduler_module.Schedule(
+            workflow_id="wf", workspace_id="ws", user_id="u", name="test",
+            cron=cron, next_run_at=next_run_at
+        )
+        return scheduler._occurrences(schedule, NOW), schedule, scheduler
+
+    return run
+
+
+@pytest.mark.parametrize("policy, next_run_at, expected", [
+    # On time (within the grace period): every policy fires it
+    ("fire_once", datetime(2024, 1, 1, 12, 0), [datetime(2024, 1, 1, 12, 0)]),
+    ("fire_all", datetime(2024, 1, 1, 12, 0), [datetime(2024, 1, 1, 12, 0)]),
+    ("skip", datetime(2024, 1, 1, 12, 0), [datetime(2024, 1, 1, 12, 0)]),
+    # 30 minutes behind: six missed runs, then the on-time 12:00 run
+    ("fire_all", datetime(2024, 1, 1, 11, 30), every_five_minutes(30) + [datetime(2024, 1, 1, 12, 0)]),
+    ("fire_once", datetime(2024, 1, 1, 11, 30), [datetime(2024, 1, 1, 11, 30), datetime(2024, 1, 1, 12, 0)]),
+    ("skip", datetime(2024, 1, 1, 11, 30), [datetime(2024, 1, 1, 12, 0)]),
+    # Unknown policies behave like fire_once
+    ("bogus", datetime(2024, 1, 1, 11, 30), [datetime(2024, 1, 1, 11, 30), datetime(2024, 1, 1, 12, 0)]),
+    # Not due yet
+    ("fire_all", datetime(2024, 1, 1, 12, 5), []),
+])
+def test_misfire_policies(occurrences, policy, next_run_at, expected):
+    fires, schedule, _ = occurrences(policy, next_run_at)
+    assert fires == expected
+    assert schedule.next_run_at == datetime(2024, 1, 1, 12, 5)
+
+
+def test_skip_counts_dropped_catch_up(occurrences):
+    _, _, scheduler = occurrences("skip", datetime(2024, 1, 1, 11, 30))
+    assert scheduler.stats["misfired_skipped"] == 1
+
+
+def test_fire_all_stops_at_max_catchup(occurrences):
+    fires, schedule, _ = occurrences("fire_all", datetime(2024, 1, 1, 10, 0))
+    assert fires == every_five_minutes(0, hour=10)[:10]
+    # The rest of the backlog is dropped
+    assert schedule.next_run_at == datetime(2024, 1, 1, 12, 5)
+
+
+def test_schedule_that_never_fires_again_is_disabled(occurrences):
+    fires, schedule, _ = occurrences("fire_once", datetime(2024, 1, 1, 12, 0), cron="0 0 30 2 *")
+    assert fires == [datetime(2024, 1, 1, 12, 0)]
+    assert schedule.next_run_at is None and schedule.enabled is False
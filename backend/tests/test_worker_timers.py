@@ -0,0 +1,103 @@
+import pytest
+from backend.app.core import worker as worker_module
+from backend.app.core.timers import TimerService
+
+STATE = {
+    "execution_id": "e1",
+    "node_id": "wait",
+    "resume_at": 1000.0,
+    "suspended_at": 900.0,
+    "message": "hi",
+    "node_outputs": {},
+    "graph": {"id": "wf", "nodes": [], "edges": []}
+}
+
+
+class FakeRedis:
+    def __init__(self):
+        self.published = []
+
+    async def publish(self, channel, message):
+        self.published.append(message)
+
+
+@pytest.fixture
+def resumed_run(monkeypatch):
+    """Runs run_workflow_task for a fired timer with the engine outcome `outcome` (a result or an exception)."""
+    calls = {"deferred": [], "completed": [], "released": 0}
+
+    async def load(timer_id):
+        return dict(STATE)
+
+    async def defer(state):
+        calls["deferred"].append(state)
+        return 5.0
+
+    async def complete(timer_id):
+        calls["completed"].append(timer_id)
+
+    async def release(*args, **kwargs):
+        calls["released"] += 1
+
+    monkeypatch.setattr(worker_module.timer_service, "load", load)
+    monkeypatch.setattr(worker_module.timer_service, "defer", defer)
+    monkeypatch.setattr(worker_module.timer_service, "complete", complete)
+    monkeypatch.setattr(worker_module.rate_limiter, "release", release)
+    monkeypatch.setattr(worker_module.dlq, "capture", lambda **kwargs: None)
+
+    async def run(outcome):
+        async def process_workflow(*args, **kwargs):
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+
+        monkeypatch.setattr(worker_module.engine, "process_workflow", process_workflow)
+        await worker_module.run_workflow_task(
+            {"redis": FakeRedis()}, job_id="e1", user_id="u1", workspace_id="w1", timer_id="e1:wait"
+        )
+        return calls
+
+    return run
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("outcome", [
+    f"{worker_module.RATE_LIMITED_PREFIX} Parallel execution limit reached for user u1",
+    worker_module.BillingLimitExceeded("Monthly task limit exceeded for this workspace."),
+])
+async def test_refused_resume_keeps_the_timer(resumed_run, outcome):
+    calls = await resumed_run(outcome)
+    assert calls["completed"] == []
+    assert [state["node_id"] for state in calls["deferred"]] == ["wait"]
+    # The slot taken when the timer handed the job off is given back
+    assert calls["released"] == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("outcome", ["done", RuntimeError("node crashed")])
+async def test_started_resume_completes_the_timer(resumed_run, outcome):
+    calls = await resumed_run(outcome)
+    assert calls["completed"] == ["e1:wait"]
+    assert calls["deferred"] == []
+
+
+@pytest.mark.asyncio
+async def test_defer_backs_off_exponentially(monkeypatch):
+    service = TimerService()
+    armed = []
+
+    async def arm(state):
+        armed.append(state)
+        return "e1:wait"
+
+    monkeypatch.setattr(service, "_arm", arm)
+    monkeypatch.setattr("app.core.timers.settings.TIMER_RETRY_DELAY", 5.0)
+    monkeypatch.setattr("app.core.timers.settings.TIMER_RETRY_MAX_DELAY", 30.0)
+
+    state = dict(STATE)
+    delays = []
+    for _ in range(5):
+        delays.append(await service.defer(state))
+        state = armed[-1]
+    assert delays == [5.0, 10.0, 20.0, 30.0, 30.0]
+    assert state["resume_attempts"] == 5 and state["resume_at"] > STATE["resume_at"]
@@ -299,6 +299,10 @@ const App = () => {
         // but typically we'd check if msg.jobId === activeJobId
 
         switch (msg.type) {
+            case 'batch':
+                // Coalesced node progress events, in order
+                msg.events.forEach(handleWebSocketMessage);
+                break;
             case 'node_start':
                 updateNodeExecutionState(msg.nodeId, true);
                 break;
@@ -611,7 +615,8 @@ const App = () => {
             const res = await axios.post(`${API_BASE_URL}/run/async`, {
                 message: msg,
                 graph: reactFlowInstance.toObject(),
-                workspace_id: currentWorkspaceId
+                workspace_id: currentWorkspaceId,
+                workflow_id: workflowId || 'default-room'
             });
 
             if (res.data.job_id) {